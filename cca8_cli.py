@@ -236,6 +236,8 @@ MENU_ALIASES = {
     "planner": "26",
     "strategy": "26",
     "dijkstra": "26",
+    "astar": "26",
+    "bidirectional": "26",
     "bfs": "26",
     "pyvis": "27",
     "graph": "27",
@@ -64,6 +64,7 @@ import cca8_maternal_temporal
 import cca8_navmap_memory
 import cca8_navmap_runtime
 import cca8_predictive
+import cca8_stage_profile
 import cca8_terrain
 import cca8_wnm_runtime
 from cca8_controller import (
@@ -772,7 +773,7 @@ def build_cognitive_scope_snapshot_v1(
             )
         ports.append(sample)
 
-    return {
+    snapshot: dict[str, Any] = {
         "schema": "cognitive_scope_snapshot_v1",
         "capture_kind": str(capture_kind),
         "snapshot_no": snapshot_no,
@@ -793,6 +794,10 @@ def build_cognitive_scope_snapshot_v1(
         "measurement_only": True,
         "injection_enabled": False,
     }
+    stage_profile = cca8_stage_profile.stage_profile_cycle_record_v1(ctx)
+    if stage_profile is not None:
+        snapshot["stage_profile"] = stage_profile
+    return snapshot
 
 
 def _trace_capacity(ctx: Any) -> int:
@@ -1302,6 +1307,23 @@ def cognitive_scope_find_port_v1(snapshot: Mapping[str, Any], port_id: Any) -> O
     return None
 
 
+def _stage_profile_compact_text(value: Any, *, limit: int = 4) -> str:
+    """Summarize the cycle's stage timings (up to the capture point), slowest first."""
+    if not isinstance(value, Mapping):
+        return ""
+    stages = value.get("stages")
+    if not isinstance(stages, Mapping) or not stages:
+        return ""
+    rows = sorted(
+        ((str(name), float(sample.get("ms", 0.0) or 0.0)) for name, sample in stages.items() if isinstance(sample, Mapping)),
+        key=lambda item: (-item[1], item[0]),
+    )
+    slowest = ", ".join(f"{name} {ms:.2f}ms" for name, ms in rows[:limit])
+    cycle_ms = value.get("cycle_ms")
+    cycle_txt = f"{float(cycle_ms):.2f}ms" if isinstance(cycle_ms, (int, float)) else "?"
+    return f"cycle_so_far={cycle_txt} slowest: {slowest}"
+
+
 def render_cognitive_scope_compact_snapshot_lines_v1(snapshot: Mapping[str, Any]) -> list[str]:
     """Render the complete DP00-DP18 circuit as a concise technician front panel."""
     lines = [
@@ -1343,6 +1365,10 @@ def render_cognitive_scope_compact_snapshot_lines_v1(snapshot: Mapping[str, Any]
         )
         lines.extend(wrapped or [prefix.rstrip()])
 
+    timing = _stage_profile_compact_text(snapshot.get("stage_profile"))
+    if timing:
+        lines.append(f"{'TIMING':<18} {timing}")
+
     lines.extend(
         [
             "-" * 78,
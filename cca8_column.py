@@ -14,6 +14,29 @@ Design notes
 - Retrieval helpers should be fast and typed (vision/smell/touch/sound/time).
 - Keep schemas compact and version them if they evolve (e.g., "v": "1").
 
+Persistence
+-----------
+By default the store is a plain in-RAM dict (lost at exit, so WorldGraph engram
+pointers dangle after a restart). `ColumnMemory.open_store(dir)` switches a column,
+in place, to a disk-backed store (`_DiskRecordStore`):
+
+    <dir>/<name>.seg   append-only payload bodies, read through mmap
+                       (TensorPayload.to_bytes layout; NavMapV2 canonical bytes;
+                        JSON for plain dict/list payloads)
+    <dir>/<name>.idx   append-only JSON lines: {"op": "put", id, name, v, meta,
+                       codec, off, len} or {"op": "del", id}
+
+Opening reads only the small index; payloads are decoded on first access and kept
+in a bounded cache. Meta is stored JSON-normalized (tuples/sets -> lists, other
+non-JSON values -> str) and is returned that way from the first read on, whether or
+not the record was evicted or the store reopened. Payloads of other types cannot be
+persisted and stay in RAM for the life of the process. Deleted and replaced records
+leave dead bytes in the append-only files; the store compacts itself (rewrites only the
+live records) once they reach half of the segment, and `compact_store()` does it on
+demand. `close_store()` detaches the
+files and leaves an empty in-RAM store; it does not copy records back. The runner opens the store from --column-store or
+CCA8_COLUMN_STORE.
+
 Traceability-Lite
 -----------------
 - REQ-BIND-02: Bindings may hold `engrams` pointers (not heavy content).
@@ -21,12 +44,17 @@ Traceability-Lite
 """
 
 from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+import json
+import mmap
+import os
 import uuid
 
-__version__ = "0.2.0"
+__version__ = "0.3.0"
 __all__ = ["ColumnMemory", "mem", "__version__"]
 
 
@@ -35,6 +63,421 @@ try:
 except ImportError as e:
     raise RuntimeError("Place cca8_features.py alongside cca8_column.py") from e
 
+# --- secondary indexes ---------------------------------------------------------------
+
+class _RecordIndex:
+    """Secondary indexes over a column's records, kept in step by the record stores.
+
+        by_name:  name       -> {eid: None}   (insertion order, so reversed() is newest-first)
+        by_attr:  attr key   -> {eid: None}   (meta.attrs keys, e.g. 'sig')
+        by_epoch: attrs epoch -> {eid: None}
+        by_sig:   attrs sig  -> {eid: None}
+        ordinal:  eid        -> insertion number (merges buckets back into store order)
+        revision: count of add/remove/clear calls (never reset), so readers can tell
+                  whether a derived structure built over these records is still current
+
+    Records are treated as immutable once asserted: editing meta.attrs in place afterwards
+    is not re-indexed.
+    """
+
+    def __init__(self) -> None:
+        self.by_name: Dict[str, Dict[str, None]] = {}
+        self.by_attr: Dict[str, Dict[str, None]] = {}
+        self.by_epoch: Dict[Any, Dict[str, None]] = {}
+        self.by_sig: Dict[Any, Dict[str, None]] = {}
+        self.ordinal: Dict[str, int] = {}
+        self._keys: Dict[str, tuple] = {}
+        self._next = 0
+        self.revision = 0
+
+    @staticmethod
+    def _bucket_add(table: dict, key, eid: str) -> None:
+        try:
+            table.setdefault(key, {})[eid] = None
+        except TypeError:
+            pass   # unhashable attr value: left to the linear fallback in find()
+
+    @staticmethod
+    def _bucket_remove(table: dict, key, eid: str) -> None:
+        try:
+            bucket = table.get(key)
+        except TypeError:
+            return
+        if bucket is not None:
+            bucket.pop(eid, None)
+            if not bucket:
+                del table[key]
+
+    def add(self, eid: str, rec: dict) -> None:
+        self.revision += 1
+        ordinal = self.ordinal.get(eid)
+        if eid in self._keys:
+            self.remove(eid)   # re-assigning an id keeps its original position, as a dict does
+        name = rec.get("name") or ""
+        meta = rec.get("meta")
+        attrs = meta.get("attrs") if isinstance(meta, dict) else None
+        attrs = attrs if isinstance(attrs, dict) else {}
+        epoch, sig = attrs.get("epoch"), attrs.get("sig")
+        keys = (name, tuple(attrs), epoch, sig)
+        self._keys[eid] = keys
+        if ordinal is None:
+            ordinal = self._next
+            self._next += 1
+        self.ordinal[eid] = ordinal
+        self._bucket_add(self.by_name, name, eid)
+        for k in keys[1]:
+            self._bucket_add(self.by_attr, k, eid)
+        if epoch is not None:
+            self._bucket_add(self.by_epoch, epoch, eid)
+        if sig is not None:
+            self._bucket_add(self.by_sig, sig, eid)
+
+    def remove(self, eid: str) -> None:
+        keys = self._keys.pop(eid, None)
+        if keys is None:
+            return
+        self.revision += 1
+        name, attr_keys, epoch, sig = keys
+        self.ordinal.pop(eid, None)
+        self._bucket_remove(self.by_name, name, eid)
+        for k in attr_keys:
+            self._bucket_remove(self.by_attr, k, eid)
+        if epoch is not None:
+            self._bucket_remove(self.by_epoch, epoch, eid)
+        if sig is not None:
+            self._bucket_remove(self.by_sig, sig, eid)
+
+    def clear(self) -> None:
+        revision = self.revision
+        self.__init__()
+        self.revision = revision + 1
+
+    def candidates(self, *, name_contains: str = "", epoch: Any = None,
+                   has_attr: Optional[str] = None) -> Optional[List[str]]:
+        """Ids satisfying every given filter, in insertion order; None if the index cannot answer."""
+        sets: List[Dict[str, None]] = []
+        if name_contains:
+            names = [n for n in self.by_name if name_contains in str(n).lower()]
+            if len(names) == 1:
+                sets.append(self.by_name[names[0]])
+            else:
+                merged: Dict[str, None] = {}
+                for n in names:
+                    merged.update(self.by_name[n])
+                sets.append(merged)
+        if epoch is not None:
+            try:
+                sets.append(self.by_epoch.get(epoch, {}))
+            except TypeError:
+                return None
+        if has_attr:
+            sets.append(self.by_attr.get(has_attr, {}))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        rest = sets[1:]
+        out = [eid for eid in sets[0] if all(eid in s for s in rest)]
+        order = self.ordinal
+        out.sort(key=order.__getitem__)
+        return out
+
+
+class _RecordStore(dict):
+    """The default in-RAM engram store: a plain eid -> record dict that maintains a _RecordIndex."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self.index = _RecordIndex()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, eid: str, rec: dict) -> None:
+        super().__setitem__(eid, rec)
+        if isinstance(rec, dict):
+            self.index.add(eid, rec)
+        else:
+            self.index.remove(eid)
+
+    def __delitem__(self, eid: str) -> None:
+        super().__delitem__(eid)
+        self.index.remove(eid)
+
+    def pop(self, eid, *default):
+        if eid in self:
+            self.index.remove(eid)
+        return super().pop(eid, *default)
+
+    def popitem(self):
+        eid, rec = super().popitem()
+        self.index.remove(eid)
+        return eid, rec
+
+    def clear(self) -> None:
+        super().clear()
+        self.index.clear()
+
+    def update(self, *args, **kwargs) -> None:
+        for eid, rec in dict(*args, **kwargs).items():
+            self[eid] = rec
+
+    def setdefault(self, eid, default=None):
+        if eid not in self:
+            self[eid] = default
+        return self[eid]
+
+
+# --- disk-backed record store -------------------------------------------------------
+
+def _navmap_v2_cls():
+    """NavMapV2 class, imported lazily (the kernel is only needed when such payloads are stored)."""
+    from cca8_navmap_kernel import NavMapV2  # pylint: disable=import-outside-toplevel
+    return NavMapV2
+
+
+def _encode_payload(payload: Any) -> Tuple[str, Optional[bytes]]:
+    """Return (codec, body bytes) for a payload; ('ram', None) if it cannot be persisted."""
+    if isinstance(payload, TensorPayload):
+        return "tensor", payload.to_bytes()
+    if getattr(payload, "kind", None) == "navmap" and isinstance(payload, _navmap_v2_cls()):
+        return "navmap_v2", payload.to_bytes()
+    if isinstance(payload, (dict, list)):
+        try:
+            return "json", json.dumps(payload, ensure_ascii=False, separators=(",", ":"), allow_nan=True).encode("utf-8")
+        except (TypeError, ValueError):
+            return "ram", None
+    return "ram", None
+
+
+def _decode_payload(codec: str, body: bytes) -> Any:
+    if codec == "tensor":
+        return TensorPayload.from_bytes(body)
+    if codec == "navmap_v2":
+        return _navmap_v2_cls().from_bytes(body)
+    if codec == "json":
+        return json.loads(body.decode("utf-8"))
+    raise ValueError(f"unknown column payload codec {codec!r}")
+
+
+def _json_meta_default(obj: Any) -> Any:
+    """json.dumps fallback for meta values (sets/tuples -> lists, anything else -> str)."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    if isinstance(obj, tuple):
+        return list(obj)
+    return str(obj)
+
+
+class _DiskRecordStore(MutableMapping):
+    """engram_id -> record mapping backed by a segment file (mmap) and a JSON-lines index.
+
+    Only the index entries (id, name, meta, location) live in RAM. Records come back
+    shaped exactly like the in-RAM store's: {"id", "name", "payload", "meta", "v"}.
+
+    Deleting or replacing a record only drops it from the index; its body stays in the
+    append-only segment as dead bytes. compact() rewrites both files with the live
+    records only. It runs by itself once dead bytes reach `compact_ratio` of the segment
+    (and at least `compact_min_bytes`); compact_ratio=None leaves it to explicit calls.
+    """
+
+    def __init__(self, directory: str, name: str, *, cache_size: int = 4096,
+                 compact_ratio: Optional[float] = 0.5, compact_min_bytes: int = 1 << 20) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.seg_path = os.path.join(directory, f"{name}.seg")
+        self.idx_path = os.path.join(directory, f"{name}.idx")
+        self.cache_size = int(cache_size)
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = int(compact_min_bytes)
+        self.dead_bytes = 0
+        self._finish_compaction()
+        self._index: Dict[str, dict] = {}
+        self._ram: Dict[str, dict] = {}                     # records with non-persistable payloads
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._mm: Optional[mmap.mmap] = None
+        self.index = _RecordIndex()
+        self._load_index()
+        self._seg = open(self.seg_path, "ab")               # pylint: disable=consider-using-with
+        self._idx = open(self.idx_path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self.idx_path):
+            return
+        with open(self.idx_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break   # torn final line (crash mid-append)
+                if entry.get("op") == "del":
+                    old = self._index.pop(entry.get("id"), None)
+                    if old is not None:
+                        self.dead_bytes += int(old.get("len") or 0)
+                    self.index.remove(entry.get("id"))
+                elif entry.get("op") == "put":
+                    old = self._index.get(entry["id"])
+                    if old is not None:
+                        self.dead_bytes += int(old.get("len") or 0)
+                    self._index[entry["id"]] = entry
+                    self.index.add(entry["id"], entry)
+
+    def _body(self, off: int, length: int) -> bytes:
+        mm = self._mm
+        if mm is None or off + length > len(mm):
+            self._seg.flush()
+            if mm is not None:
+                mm.close()
+            with open(self.seg_path, "rb") as f:
+                mm = self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return mm[off:off + length]
+
+    def _remember(self, eid: str, rec: dict) -> None:
+        cache = self._cache
+        cache[eid] = rec
+        cache.move_to_end(eid)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    # --- mapping protocol ---
+
+    def __getitem__(self, eid: str) -> dict:
+        rec = self._cache.get(eid)
+        if rec is not None:
+            self._cache.move_to_end(eid)
+            return rec
+        rec = self._ram.get(eid)
+        if rec is not None:
+            return rec
+        entry = self._index[eid]
+        rec = self._record(eid, entry, _decode_payload(entry["codec"], self._body(entry["off"], entry["len"])))
+        self._remember(eid, rec)
+        return rec
+
+    @staticmethod
+    def _record(eid: str, entry: dict, payload: Any) -> dict:
+        """Build the record for an index entry; meta is the entry's JSON-normalized copy."""
+        return {
+            "id": eid,
+            "name": entry.get("name"),
+            "payload": payload,
+            "meta": entry.get("meta") or {},
+            "v": entry.get("v", "1"),
+        }
+
+    def __setitem__(self, eid: str, rec: dict) -> None:
+        if eid in self:
+            del self[eid]
+        codec, body = _encode_payload(rec.get("payload"))
+        if body is None:
+            self._ram[eid] = rec
+            self.index.add(eid, rec)
+            return
+        off = self._seg.tell()
+        self._seg.write(body)
+        self._seg.flush()
+        entry = {"op": "put", "id": eid, "name": rec.get("name"), "v": rec.get("v", "1"),
+                 "meta": rec.get("meta") or {}, "codec": codec, "off": off, "len": len(body)}
+        line = json.dumps(entry, ensure_ascii=False, default=_json_meta_default)
+        self._idx.write(line + "\n")
+        self._idx.flush()
+        # Normalize once (tuples -> lists, other non-JSON values -> str) so the cached record,
+        # the secondary index and every later reload all see the same meta.
+        entry = json.loads(line)
+        self._index[eid] = entry
+        self.index.add(eid, entry)
+        self._remember(eid, self._record(eid, entry, rec.get("payload")))
+
+    def __delitem__(self, eid: str) -> None:
+        if eid in self._ram:
+            del self._ram[eid]
+            self.index.remove(eid)
+            return
+        entry = self._index.pop(eid)
+        self.index.remove(eid)
+        self._cache.pop(eid, None)
+        self._idx.write(json.dumps({"op": "del", "id": eid}) + "\n")
+        self._idx.flush()
+        self.dead_bytes += int(entry.get("len") or 0)
+        ratio = self.compact_ratio
+        if (ratio is not None and self.dead_bytes >= self.compact_min_bytes
+                and self.dead_bytes >= ratio * self._seg.tell()):
+            self.compact()
+
+    def __contains__(self, eid) -> bool:
+        return eid in self._index or eid in self._ram
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._index)
+        yield from list(self._ram)
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._ram)
+
+    def clear(self) -> None:
+        """Drop every record and truncate both files."""
+        self.close()
+        for path in (self.seg_path, self.idx_path):
+            with open(path, "wb"):
+                pass
+        self._index.clear()
+        self._ram.clear()
+        self._cache.clear()
+        self.index.clear()
+        self.dead_bytes = 0
+        self._seg = open(self.seg_path, "ab")               # pylint: disable=consider-using-with
+        self._idx = open(self.idx_path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+
+    def _finish_compaction(self) -> None:
+        """Settle a compaction interrupted by a crash (see compact()).
+
+        Both temporary files present: the segment was never swapped, so the old pair is
+        intact and the temporaries are dropped. Only the index temporary present: the new
+        segment is already in place, so the matching index is moved in after it.
+        """
+        seg_tmp, idx_tmp = self.seg_path + ".compact", self.idx_path + ".compact"
+        if os.path.exists(seg_tmp):
+            for path in (seg_tmp, idx_tmp):
+                if os.path.exists(path):
+                    os.remove(path)
+        elif os.path.exists(idx_tmp):
+            os.replace(idx_tmp, self.idx_path)
+
+    def compact(self) -> int:
+        """Rewrite the segment and index with live records only; return the bytes reclaimed.
+
+        Both files are written to '.compact' temporaries and fsynced, then the segment and
+        the index are renamed over the originals in that order; reopening after a crash
+        between the renames completes the swap (_finish_compaction).
+        """
+        before = self._seg.tell()
+        seg_tmp, idx_tmp = self.seg_path + ".compact", self.idx_path + ".compact"
+        moved: Dict[str, dict] = {}
+        with open(seg_tmp, "wb") as seg, open(idx_tmp, "w", encoding="utf-8") as idx:
+            for eid, entry in self._index.items():
+                body = self._body(entry["off"], entry["len"])
+                new_entry = dict(entry, off=seg.tell())
+                seg.write(body)
+                idx.write(json.dumps(new_entry, ensure_ascii=False, default=_json_meta_default) + "\n")
+                moved[eid] = new_entry
+            for f in (seg, idx):
+                f.flush()
+                os.fsync(f.fileno())
+        self.close()
+        os.replace(seg_tmp, self.seg_path)
+        os.replace(idx_tmp, self.idx_path)
+        for eid, entry in moved.items():
+            self._index[eid] = entry
+        self.dead_bytes = 0
+        self._seg = open(self.seg_path, "ab")               # pylint: disable=consider-using-with
+        self._idx = open(self.idx_path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+        return before - self._seg.tell()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        for f in (self._seg, self._idx):
+            if not f.closed:
+                f.close()
+
+
 @dataclass
 class ColumnMemory:
     """Stores this column's engrams (facts/scenes/etc.) in RAM.
@@ -42,7 +485,8 @@ class ColumnMemory:
     point to it without copying heavy payloads.
     """
     name: str = "column01"
-    _store: Dict[str, dict] = field(default_factory=dict)
+    _store: Dict[str, dict] = field(default_factory=_RecordStore)
+    _revision_base: int = field(default=0, repr=False)
 
 
     def assert_fact(self, name: str, payload: FeaturePayload, meta: Optional[FactMeta] = None) -> str:
@@ -86,12 +530,82 @@ class ColumnMemory:
         ids = list(self._store.keys())
         return ids[:limit] if isinstance(limit, int) else ids
 
+    def open_store(self, directory: str) -> None:
+        """Switch this column to the disk-backed store in `directory` (see module docstring).
+
+        Existing on-disk records become visible immediately (only their index is read);
+        records already held in RAM are written through. Works in place, so modules that
+        imported `mem` keep seeing the same object.
+        """
+        disk = _DiskRecordStore(directory, self.name)
+        for eid, rec in list(self._store.items()):
+            if eid not in disk:
+                disk[eid] = rec
+        self.close_store()
+        self._swap_store(disk)
+
+    def close_store(self) -> None:
+        """Close the disk store (if any) and fall back to an empty in-RAM store.
+
+        Records are not copied back into RAM: after closing, this column sees none of the
+        persisted engrams until open_store() is called again (the files are left intact).
+        Records held only in RAM by the disk store (non-persistable payloads) are dropped.
+        """
+        store = self._store
+        if isinstance(store, _DiskRecordStore):
+            store.close()
+            self._swap_store(_RecordStore())
+
+    def _swap_store(self, store: Dict[str, dict]) -> None:
+        """Install a new record store, keeping revision() increasing across the swap."""
+        revision = self.revision()
+        self._store = store
+        self._revision_base = 0
+        if revision is not None:
+            self._revision_base = revision + 1
+
+    def compact_store(self) -> int:
+        """Reclaim the file space of deleted/replaced records in the disk store; return bytes freed.
+
+        The disk store also does this on its own once dead bytes pass its compact_ratio.
+        Returns 0 for the in-RAM store.
+        """
+        store = self._store
+        return store.compact() if isinstance(store, _DiskRecordStore) else 0
+
+    def is_persistent(self) -> bool:
+        """True while records are backed by files (open_store)."""
+        return isinstance(self._store, _DiskRecordStore)
+
+    def _index(self) -> Optional[_RecordIndex]:
+        return getattr(self._store, "index", None)
+
+    def revision(self) -> Optional[int]:
+        """Counter that grows with every record write, delete, clear, or store switch.
+
+        Callers that cache something derived from this column's records compare it to
+        the value they built against. None when the store is a plain dict swapped in by
+        hand (no index to count changes); treat that as "always changed".
+        """
+        index = self._index()
+        return None if index is None else self._revision_base + index.revision
+
     def find(self, *, name_contains: Optional[str] = None,
              epoch: Optional[int] = None, has_attr: Optional[str] = None,
              limit: Optional[int] = None) -> List[dict]:
-        """Light search over records by name substring / epoch / attr key."""
+        """Light search over records by name substring / epoch / attr key (insertion order).
+
+        Answered from the secondary indexes (cost ~ number of matches); a full scan is only
+        used when no filter is given or the store is a plain dict swapped in by hand.
+        """
         out: List[dict] = []
         needle = (name_contains or "").lower()
+        index = self._index()
+        ids = index.candidates(name_contains=needle, epoch=epoch, has_attr=has_attr) if index is not None else None
+        if ids is not None:
+            if isinstance(limit, int):
+                ids = ids[:max(0, limit)]
+            return [self._store[eid] for eid in ids]
         for rec in self._store.values():
             if needle and needle not in (rec.get("name") or "").lower():
                 continue
@@ -108,6 +622,38 @@ class ColumnMemory:
                 break
         return out
 
+    def find_ids(self, *, name_contains: Optional[str] = None,
+                 epoch: Optional[int] = None, has_attr: Optional[str] = None) -> List[str]:
+        """Like find(), but return engram ids only, so a disk store decodes no payloads."""
+        index = self._index()
+        needle = (name_contains or "").lower()
+        ids = index.candidates(name_contains=needle, epoch=epoch, has_attr=has_attr) if index is not None else None
+        if ids is not None:
+            return ids
+        return [rec["id"] for rec in self.find(name_contains=name_contains, epoch=epoch, has_attr=has_attr)]
+
+    def iter_newest(self, name: str, limit: Optional[int] = None) -> Iterator[dict]:
+        """Yield records whose name is exactly `name`, newest first (from the per-name bucket)."""
+        index = self._index()
+        if index is None:
+            ids = [eid for eid, rec in self._store.items() if rec.get("name") == name]
+        else:
+            ids = list(index.by_name.get(name, ()))
+        for n, eid in enumerate(reversed(ids)):
+            if isinstance(limit, int) and n >= limit:
+                return
+            yield self._store[eid]
+
+    def find_by_sig(self, sig: str, *, name: Optional[str] = None) -> List[dict]:
+        """Return records whose meta.attrs['sig'] equals `sig` (optionally with exact `name`), oldest first."""
+        index = self._index()
+        if index is None:
+            recs = [r for r in self._store.values()
+                    if isinstance(r.get("meta"), dict) and (r["meta"].get("attrs") or {}).get("sig") == sig]
+        else:
+            recs = [self._store[eid] for eid in index.by_sig.get(sig, ())]
+        return [r for r in recs if name is None or r.get("name") == name]
+
     def count(self) -> int:
         """Number of engrams in memory."""
         return len(self._store)
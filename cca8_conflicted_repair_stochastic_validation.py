@@ -59,7 +59,9 @@ CCA8 controller, environment, WorkingMap, and Column-memory modules.
 
 Before each trial, the worker clears RAM-local Column records and the global
 skill ledger. By default, the multiprocessing pool uses one task per child
-process so state cannot carry from one trial into the next. A small set of
+process so state cannot carry from one trial into the next. Where the pool
+forks its children, the parent imports the runtime first so each child starts
+from the already imported modules instead of paying the import cost again. A small set of
 representative schedules can also be rerun with full cycle logging for manual
 mechanism inspection.
 
@@ -645,6 +647,11 @@ def main() -> int:
     rows: list[dict[str, Any]] = []
     maxtasks = None if args.no_fresh_process_per_episode else 1
     context = mp.get_context("spawn" if platform.system() == "Windows" else "fork")
+    if context.get_start_method() == "fork":
+        # Import the runtime once here so every forked child starts warm
+        # instead of re-importing cca8_run; the children still clear Column
+        # memory and the skill ledger before their single trial.
+        import cca8_run  # pylint: disable=import-outside-toplevel,unused-import
     with context.Pool(processes=max(1, int(args.jobs)), maxtasksperchild=maxtasks) as pool:
         for index, row in enumerate(pool.imap_unordered(_run_one_episode, tasks, chunksize=1), 1):
             rows.append(row)
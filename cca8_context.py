@@ -225,6 +225,10 @@ class Ctx:
     # This is intentionally pragmatic and subject to change as Phase IX evolves.
     env_loop_cycle_summary: bool = True
     env_loop_cycle_summary_max_items: int = 6
+    # Headless mode (batch experiments): skip console rendering in the env-loop,
+    # reporting, and WorkingMap display paths. State updates and cycle JSON
+    # records are unchanged; only text nobody reads is no longer built.
+    headless: bool = False
 
     posture_discrepancy_history: list[str] = field(default_factory=list) #per-session list of discrepancies motor command vs what environment reports
 
@@ -280,6 +284,16 @@ class Ctx:
     navpatch_store_to_column: bool = True
     navpatch_verbose: bool = False
     navpatch_sig_to_eid: dict[str, str] = field(default_factory=dict)  # sig(hex) -> engram_id
+    navpatch_feature_cache_v1: dict[str, Any] = field(default_factory=dict)  # interned tag bits + per-engram match features
+    # Optional MinHash/LSH prototype recall (off by default: the bounded exact scan is the reference).
+    # - Bucketed by role; candidates sharing any band are re-scored exactly (top navpatch_lsh_max_candidates).
+    # - navpatch_lsh_benchmark adds per-patch recall@k against a full exact scan to the match trace.
+    navpatch_lsh_enabled: bool = False
+    navpatch_lsh_bands: int = 16
+    navpatch_lsh_rows: int = 2
+    navpatch_lsh_max_candidates: int = 64
+    navpatch_lsh_benchmark: bool = False
+    navpatch_lsh_index_v1: dict[str, Any] = field(default_factory=dict)  # MinHash buckets for one Column (rebuilt on change)
     navpatch_last_log: dict[str, Any] = field(default_factory=dict)
 
     # WorkingMap SurfaceGrid (Phase X v5.9): composed topological grid + derived slot-families
@@ -917,7 +931,8 @@ class Ctx:
     navmap_memory_query_no_v1: int = 0
     navmap_memory_index_v1: dict[str, NavMapMemoryIndexEntryV1] = field(default_factory=dict)
     navmap_memory_ref_index_v1: dict[str, str] = field(default_factory=dict)
-    navmap_memory_token_index_v1: dict[str, list[str]] = field(default_factory=dict)
+    navmap_memory_token_index_v1: dict[str, set[str]] = field(default_factory=dict)
+    navmap_memory_score_sets_v1: dict[str, Any] = field(default_factory=dict)
     navmap_memory_eligibility_v1: dict[str, NavMapConsolidationEligibilityV1] = field(default_factory=dict)
     navmap_memory_pending_maps_v1: dict[str, NavMapV2] = field(default_factory=dict)
     navmap_memory_previous_operative_ref_v1: Optional[NavMapRefV1] = None
@@ -962,6 +977,22 @@ class Ctx:
     cognitive_scope_trace_v1: list[dict[str, Any]] = field(default_factory=list)
     cognitive_scope_last_capture_v1: dict[str, Any] = field(default_factory=dict)
 
+    # Per-stage cognitive-cycle profiler (cca8_stage_profile). Off by default;
+    # when enabled, each cycle's per-stage wall time and call counts are kept
+    # in a bounded ring and copied into the cycle JSON record and scope snapshot.
+    stage_profile_enabled_v1: bool = False
+    stage_profile_capacity_v1: int = 256
+    stage_profile_ring_v1: list[dict[str, Any]] = field(default_factory=list)
+    stage_profile_current_v1: dict[str, list[float]] = field(default_factory=dict)
+    stage_profile_cycle_started_v1: Optional[float] = None
+
+    # Declared-input memo for pure derivations inside the NavMap observation
+    # stages (cca8_stage_memo). One slot per derivation holds the last input
+    # fingerprint and result; the per-tick stage bookkeeping always runs.
+    stage_memo_enabled_v1: bool = True
+    stage_memo_slots_v1: dict[str, tuple[Any, ...]] = field(default_factory=dict)
+    stage_memo_stats_v1: dict[str, list[int]] = field(default_factory=dict)
+
     # Per-cycle JSON log record (Phase X): minimal, replayable trace contract
     # ---------------------------------------------------------------------
     # When enabled, each closed-loop env step appends a JSON-safe dict record to ctx.cycle_json_records,
@@ -284,6 +284,7 @@ def _add_tag_to_binding(world, bid: str, full_tag: str) -> None:
     -will add "full_tag" to binding "bid" assuming a binding exists for "bid", and then adds "full_tag"
       to whatever binding.tags exists
     -doesn't return anything since mutates binding.tags in place
+    -on a real WorldGraph the binding's tag set is observed, so the add also updates the tag index
     """
     try:
         b = getattr(world, "_bindings", {}).get(bid) #if world._bindings exists look up bid
@@ -681,19 +682,22 @@ def skill_q(name: str, default: float = 0.0) -> float:
         return float(default)
 
 # -----------------------------------------------------------------------------
-# Helper queries (controller-local; simple global scans)
+# Helper queries (controller-local; tag-index lookups with a scan fallback)
 # -----------------------------------------------------------------------------
-# Note: world._bindings is an internal/private attribute of world object instance of WorldGraph, meaning it shouldn't
-#   really be accessed from outside the class (or immediate subclasses), i.e., "peeking" is occurring
-#   -however, these helper queries are considered a trusted-friend shortcut and we allow access rather than
-#      implementing a more formal public API in WorldGraph (can be considered in the future if WorldGraph internal changes,
-#      graph size exceeds 50K bindings, we introduce tag indices/aliasing that really belong inside WorldGraph)
+# Note: a real WorldGraph keeps an incrementally maintained tag index and exposes it through
+#   has_tag(...) / has_tag_family(...), so these gate checks are O(1) rather than O(bindings).
+#   -duck-typed worlds (e.g., FakeWorld in tests) do not have the index; for those we fall back
+#      to the original trusted-friend scan of world._bindings
 #   -scope guard: do not access world._bindings anywhere else in the codebase
 
 def _any_tag(world, full_tag: str) -> bool:
     """Return True if any binding carries the exact tag (e.g., 'pred:...')
-    -checks to see if full_tag argument is in the set/list/tuple attributes found
+    -uses WorldGraph.has_tag(...) (tag index) when available
+    -otherwise checks to see if full_tag argument is in the set/list/tuple attributes found
     """
+    has_tag = getattr(world, "has_tag", None)
+    if callable(has_tag):
+        return bool(has_tag(full_tag))
     try:
         for b in world._bindings.values():  # pylint: disable=protected-access
             tags = getattr(b, "tags", ())
@@ -725,7 +729,11 @@ def _any_cue_present(world) -> bool:
     -scans through tags in world._bindings.values() to see if any starts with "cue" and
       if so returns True
     -used as a coarse perception gate to tell the controller if a cue present
+    -uses WorldGraph.has_tag_family("cue") (tag index) when available
     """
+    has_family = getattr(world, "has_tag_family", None)
+    if callable(has_family):
+        return bool(has_family("cue"))
     try:
         for b in world._bindings.values():  # pylint: disable=protected-access
             tags = getattr(b, "tags", ())
@@ -782,6 +790,12 @@ def _fallen_near_now(world, ctx, max_hops: int = 3) -> bool:
         return False
 
     fallen_tags = {f"pred:{STATE_POSTURE_FALLEN}", "pred:posture:fallen"}
+
+    # WorldGraph: one cached bounded sweep from NOW (see WorldGraph.tags_within)
+    tags_within = getattr(world, "tags_within", None)
+    if callable(tags_within):
+        return bool(tags_within(now_id, fallen_tags, max_hops=max_hops))
+
     q = deque([now_id])
     seen = {now_id}
     depth: Dict[str, int] = {now_id: 0}
@@ -139,7 +139,7 @@ from __future__ import annotations
 
 # Standard Library Imports
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # PyPI and Third-Party Imports
 # --none at this time at program startup --
@@ -160,6 +160,7 @@ __all__ = [
     "FsmBackend",
     "PerceptionAdapter",
     "HybridEnvironment",
+    "HybridEnvironmentBatch",
 ]
 
 # Global constants
@@ -2386,6 +2387,133 @@ class HybridEnvironment:
         return self._episode_steps
 
 
+# ---------------------------------------------------------------------------
+# HybridEnvironmentBatch: several independent environments stepped together
+# ---------------------------------------------------------------------------
+
+class HybridEnvironmentBatch:
+    """
+    Hold N independent HybridEnvironments and advance them with one call.
+
+        obs_list, info_list = batch.reset(seeds)
+        obs_list, rewards, dones, info_list = batch.step(actions, ctxs)
+
+    Each environment keeps its own EnvState, episode counters, and (optionally)
+    its own EnvConfig, so one member's actions never leak into another. The
+    backends are stateless with respect to an episode (every per-episode field
+    lives on EnvState), so a single FsmBackend and a single PerceptionAdapter
+    are shared by all members instead of being rebuilt N times.
+
+    Results are returned as plain lists in member order. Member i of a batch
+    produces exactly what a standalone HybridEnvironment would produce for the
+    same action/ctx sequence; the batch only removes per-environment setup and
+    lets a caller drive a seed sweep from one loop.
+
+    Observations are freshly built per member and per step rather than
+    recycled buffers: CCA8 keeps references to EnvObservation objects (cycle
+    records, WorkingMap ingestion), so reusing them would alias past ticks.
+    """
+
+    def __init__(
+        self,
+        num_envs: Optional[int] = None,
+        config: Optional[EnvConfig] = None,
+        *,
+        configs: Optional[Sequence[EnvConfig]] = None,
+        fsm_backend: Optional[FsmBackend] = None,
+        perception: Optional[PerceptionAdapter] = None,
+    ) -> None:
+        if configs is not None:
+            member_configs = list(configs)
+            if num_envs is not None and int(num_envs) != len(member_configs):
+                raise ValueError("num_envs does not match len(configs)")
+        else:
+            if num_envs is None:
+                raise ValueError("HybridEnvironmentBatch needs num_envs or configs")
+            shared = config or EnvConfig()
+            member_configs = [shared] * int(num_envs)
+        if not member_configs:
+            raise ValueError("HybridEnvironmentBatch needs at least one environment")
+
+        self._fsm: FsmBackend = fsm_backend or FsmBackend()
+        self._perception: PerceptionAdapter = perception or PerceptionAdapter()
+        self._envs: List[HybridEnvironment] = [
+            HybridEnvironment(cfg, fsm_backend=self._fsm, perception=self._perception)
+            for cfg in member_configs
+        ]
+
+    def __len__(self) -> int:
+        return len(self._envs)
+
+    def _per_env(self, values: Any, name: str) -> List[Any]:
+        """Broadcast a single value/None to every member, or check a per-member list/tuple."""
+        if not isinstance(values, (list, tuple)):
+            return [values] * len(self._envs)
+        out = list(values)
+        if len(out) != len(self._envs):
+            raise ValueError(f"{name} has {len(out)} entries for {len(self._envs)} environments")
+        return out
+
+    def reset(
+        self,
+        seeds: Any = None,
+        configs: Any = None,
+    ) -> Tuple[List[EnvObservation], List[Dict[str, Any]]]:
+        """
+        Start a new episode in every member.
+
+        seeds and configs are either None (applies to all members) or one entry
+        per member, passed through to HybridEnvironment.reset(...).
+        """
+        obs_list: List[EnvObservation] = []
+        info_list: List[Dict[str, Any]] = []
+        for env, seed, cfg in zip(self._envs, self._per_env(seeds, "seeds"), self._per_env(configs, "configs")):
+            obs, info = env.reset(seed, cfg)
+            obs_list.append(obs)
+            info_list.append(info)
+        return obs_list, info_list
+
+    def step(
+        self,
+        actions: Sequence[Optional[str]],
+        ctxs: Any = None,
+    ) -> Tuple[List[EnvObservation], List[float], List[bool], List[Dict[str, Any]]]:
+        """
+        Advance every member by one tick.
+
+        actions holds one action per member. ctxs is either one ctx per member
+        or a single ctx/None shared by all (members that consult ctx for their
+        stochastic schedule need their own ctx).
+        """
+        if isinstance(actions, str) or len(actions) != len(self._envs):
+            raise ValueError(f"step() needs one action per environment ({len(self._envs)})")
+        ctx_list = self._per_env(ctxs, "ctxs")
+
+        obs_list: List[EnvObservation] = []
+        rewards: List[float] = []
+        dones: List[bool] = []
+        info_list: List[Dict[str, Any]] = []
+        for env, action, ctx in zip(self._envs, actions, ctx_list):
+            obs, reward, done, info = env.step(action, ctx)
+            obs_list.append(obs)
+            rewards.append(reward)
+            dones.append(done)
+            info_list.append(info)
+        return obs_list, rewards, dones, info_list
+
+    # ----- Introspection helpers (optional) -----
+
+    @property
+    def envs(self) -> List[HybridEnvironment]:
+        """The member environments, in batch order (debugging / unit tests)."""
+        return list(self._envs)
+
+    @property
+    def states(self) -> List[EnvState]:
+        """Current EnvState of every member (debugging / unit tests only)."""
+        return [env.state for env in self._envs]
+
+
 # ---------------------------------------------------------------------------
 # Tiny debug driver (manual storyboard inspection)
 # ---------------------------------------------------------------------------
@@ -4357,6 +4357,8 @@ def experiment_run_one_episode_v1(
     captured_stdout = ""
     try:
         if suppress_output:
+            # Headless skips console formatting; the redirect only catches stray lines.
+            run_ctx.headless = True
             buf = io.StringIO()
             with redirect_stdout(buf):
                 runtime.run_closed_loop(env, world, drives, run_ctx, policy_rt, int(cfg.max_cycles))
@@ -4633,6 +4635,7 @@ def run_autonomous_newborn_survival_demo_v1(
         if show_timeline:
             runtime.run_closed_loop(env, world, drives, run_ctx, policy_rt, cycles)
         else:
+            run_ctx.headless = True
             buf = io.StringIO()
             with redirect_stdout(buf):
                 runtime.run_closed_loop(env, world, drives, run_ctx, policy_rt, cycles)
@@ -31,8 +31,8 @@ from array import array
 #nb version number of different modules are unique to that module
 #nb the public API index specifies what downstream code should import from this module
 
-__version__ = "0.2.0"
-__all__ = ["FeaturePayload", "TensorPayload", "FactMeta", "__version__"]
+__version__ = "0.3.0"
+__all__ = ["FeaturePayload", "TensorPayload", "TensorView", "FactMeta", "__version__"]
 
 
 # --- Module Code  -----------------------------------------------------------------------
@@ -126,6 +126,9 @@ class TensorPayload:
     4. link to the graph: store eid on the binding that the policy just wrote
     5. later retrieval/analysis: load payloads from Column, compare by cosine, display meta() in snapshots
 
+    Decoding with from_bytes() returns a TensorView, a zero-copy subclass that keeps the floats in
+      the source buffer and only builds the `data` list when a legacy caller asks for it.
+
     """
     data: list[float]
     shape: tuple[int, ...]
@@ -146,7 +149,7 @@ class TensorPayload:
           MAGIC(5) | VER(u32) | NDIMS(u32) | DIMS[NDIMS](u32…) | DATA(float32…)
 
         - Header uses `struct.pack` with '<I' fields.
-        - DATA uses `array('f', data).tobytes()` for float32 semantics.
+        - DATA uses `array('f', data).tobytes()` for float32 semantics (float32 buffers are written as-is).
         Returns the concatenated header+body bytes.
 
         note -- python array.array() mirrors a low-level C array and is thus often
@@ -157,18 +160,20 @@ class TensorPayload:
         ndims = len(self.shape)
         header = self._MAGIC + struct.pack("<I", self._VER) + struct.pack("<I", ndims)
         header += struct.pack("<" + "I" * ndims, *self.shape)
-        arr = array("f", self.data)
-        body = arr.tobytes()
-        return header + body
+        return header + _f32_bytes(self.values())
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "TensorPayload":
         """Decode bytes produced by :meth:`to_bytes`.
 
         Validates MAGIC and version, reads NDIMS and DIMS from the header,
-        then reconstructs the float32 payload via array('f').frombytes(...) .
-        Returns a new `TensorPayload` with `data` list and `shape` tuple.
-        Raises `ValueError` on bad magic or unsupported version.
+        then views the float32 body in place as a read-only memoryview cast to 'f'.
+        Returns a `TensorView` (a TensorPayload) over that view -- no float bytes are copied;
+        `.data` becomes a list only when first read.
+        The view keeps a `bytes` input alive for as long as the payload lives. Mutable inputs
+        (bytearray, mmap, writable memoryviews) are copied into `bytes` first, so the payload
+        neither pins a resizable buffer nor changes when the caller reuses it.
+        Raises `ValueError` on bad magic, unsupported version or a truncated body.
 
         note -- python array.array() mirrors a low-level C array and is thus often
           used as a thin-wrapper over C arrays for reading and writing data
@@ -181,6 +186,8 @@ class TensorPayload:
           data items without making any copies, thus, quite efficient
                 note that writing it (but not reading it) will mutate the original object
         """
+        if not isinstance(data, bytes):
+            data = bytes(data)
         mv = memoryview(data)
         if mv[:5].tobytes() != cls._MAGIC:
             raise ValueError("Bad magic for TensorPayload")
@@ -190,10 +197,14 @@ class TensorPayload:
             raise ValueError(f"Unsupported version {ver}")
         ndims = struct.unpack_from("<I", mv, off)[0]; off += 4
         dims = struct.unpack_from("<" + "I" * ndims, mv, off); off += 4 * ndims
-        float_bytes = mv[off:].tobytes()
-        arr = array("f"); arr.frombytes(float_bytes)
-        data_list = arr.tolist()
-        return cls(data=data_list, shape=tuple(int(d) for d in dims))
+        body = mv[off:]
+        if len(body) % 4:
+            raise ValueError("Truncated TensorPayload body")
+        return TensorView(body.toreadonly().cast("f"), shape=tuple(int(d) for d in dims))
+
+    def values(self) -> array | memoryview | list[float]:
+        """Return the floats in their current storage (list here; array/memoryview for TensorView)."""
+        return self.data
 
     def meta(self) -> dict[str, Any]:
         """Lightweight descriptor for indexing and logging.
@@ -202,7 +213,75 @@ class TensorPayload:
           dict with keys: 'kind', 'fmt', 'shape', 'len' (number of scalars).
         Useful when you need to describe a payload without decoding bytes.
         """
-        return {"kind": self.kind, "fmt": self.fmt, "shape": self.shape, "len": len(self.data)}
+        return {"kind": self.kind, "fmt": self.fmt, "shape": self.shape, "len": len(self.values())}
+
+
+def _f32_bytes(values: Any) -> bytes:
+    """Native float32 bytes of `values`; float32 arrays/memoryviews are dumped without conversion."""
+    if isinstance(values, memoryview) and values.format == "f":
+        return values.tobytes()
+    if isinstance(values, array) and values.typecode == "f":
+        return values.tobytes()
+    return array("f", values).tobytes()
+
+
+class TensorView(TensorPayload):
+    """TensorPayload whose floats live in an `array('f')` or a read-only float32 memoryview.
+
+    This is the zero-copy variant returned by TensorPayload.from_bytes() and built by
+      WorldGraph.capture_scene(..., precision="float32"): the numbers stay in one compact float32
+      buffer and to_bytes() writes that buffer directly.  Legacy callers that read `.data` still
+      get a list[float]; it is built lazily on first access and cached.  Values are float32, so
+      they read back rounded to float32 precision.
+
+    note -- from_bytes() views an immutable `bytes` object (copying mutable inputs first), so the
+      view keeps that object alive but never sees later changes to the caller's buffer.
+    The buffer itself is treated as immutable.  Once `.data` has been materialized (or assigned),
+      that list is the payload's contents, so legacy in-place edits still serialize correctly.
+    """
+    # pylint: disable=super-init-not-called
+    def __init__(self, buffer: Any, shape: tuple[int, ...],
+                 kind: str = "embedding", fmt: str = "tensor/list-f32") -> None:
+        if isinstance(buffer, memoryview):
+            if buffer.format != "f":
+                raise ValueError("TensorView memoryview must have format 'f'")
+        elif not (isinstance(buffer, array) and buffer.typecode == "f"):
+            buffer = array("f", buffer)
+        self._buf: array | memoryview = buffer
+        self._list: Optional[list[float]] = None
+        self.shape = shape
+        self.kind = kind
+        self.fmt = fmt
+
+    @property
+    def data(self) -> list[float]:  # type: ignore[override]
+        """Legacy list view of the floats (materialized once, on first access)."""
+        if self._list is None:
+            self._list = self._buf.tolist()
+        return self._list
+
+    @data.setter
+    def data(self, value: list[float]) -> None:
+        self._list = value
+
+    def values(self) -> array | memoryview | list[float]:
+        return self._list if self._list is not None else self._buf
+
+    def __reduce__(self):
+        # memoryviews do not pickle/deepcopy; ship an owned float32 array instead
+        return (TensorView, (array("f", self.values()), self.shape, self.kind, self.fmt))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TensorPayload):
+            return NotImplemented
+        return (list(self.values()) == list(other.values()) and self.shape == other.shape
+                and self.kind == other.kind and self.fmt == other.fmt)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (f"TensorView(len={len(self.values())}, shape={self.shape!r}, "
+                f"kind={self.kind!r}, fmt={self.fmt!r})")
 
 
 @dataclass
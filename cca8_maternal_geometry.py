@@ -80,11 +80,13 @@ from cca8_navmap_kernel import (
     apply_revision,
     bearing_between_centroids,
     centroid_distance_between,
+    derive_navmap_revision,
     follow_link,
     match_navmaps,
     propose_revision,
     structured_residual,
 )
+from cca8_stage_memo import stage_memo_v1
 
 __version__ = "0.2.0"
 
@@ -729,7 +731,8 @@ def _stable_map_from_evidence(
     parent_ref: Optional[NavMapRefV1],
 ) -> NavMapV2:
     """Copy complete evidence content into the stable maternal map family."""
-    return NavMapV2(
+    return derive_navmap_revision(
+        evidence_map,
         map_id=_SELF_MATERNAL_MAP_ID,
         revision=revision,
         parent_ref=parent_ref,
@@ -1028,7 +1031,19 @@ def maternal_geometry_shadow_observation_step_v1(ctx: Any, env_obs: EnvObservati
         env_obs,
         observation_no=observation_no,
     )
-    evidence_readout = maternal_geometry_readout_v1(evidence_map)
+    # Evidence content is fixed by the classification and the element
+    # geometry (the relative maternal point); only the per-observation map
+    # identity varies, so the pure derivations below are memoized on that
+    # fingerprint and rebound to this observation's evidence ref.
+    evidence_ref = _map_ref(evidence_map)
+    evidence_key = (classification, tuple(element.geometry for element in evidence_map.elements))
+    evidence_readout = stage_memo_v1(
+        ctx,
+        "maternal_geometry.evidence_readout",
+        evidence_key,
+        lambda: maternal_geometry_readout_v1(evidence_map),
+        ref=evidence_ref,
+    )
     legacy_distance = _bodymap_mom_distance_from_ctx(ctx)
     evidence_comparison = _comparison(evidence_readout, legacy_distance)
 
@@ -1053,7 +1068,13 @@ def maternal_geometry_shadow_observation_step_v1(ctx: Any, env_obs: EnvObservati
         status = "created"
         changed = True
     elif evidence_readout.valid and previous_map is not None:
-        residual, proposal = _compare_complete_evidence(previous_map, evidence_map)
+        residual, proposal = stage_memo_v1(
+            ctx,
+            "maternal_geometry.evidence_compare",
+            (previous_map, evidence_key),
+            lambda: _compare_complete_evidence(previous_map, evidence_map),
+            ref=evidence_ref,
+        )
         if proposal.decision is NavRevisionDecisionV1.KEEP:
             stable_map = previous_map
             maintained = True
@@ -1108,16 +1129,28 @@ def maternal_geometry_shadow_observation_step_v1(ctx: Any, env_obs: EnvObservati
         )
         evidence_relation = "missing"
 
-    stable_readout = maternal_geometry_readout_v1(stable_map) if stable_map is not None else None
     if stable_map is not None:
+        maintained_map = stable_map
+        stable_readout = stage_memo_v1(
+            ctx,
+            "maternal_geometry.stable_readout",
+            (maintained_map,),
+            lambda: maternal_geometry_readout_v1(maintained_map),
+        )
         base_root = getattr(ctx, "navmap_v2_shadow_root", None)
         base_root = base_root if isinstance(base_root, NavMapV2) else None
-        root_view, root_view_changed = _updated_root_view(
-            stable_map=stable_map,
-            base_root=base_root,
-            previous_root_view=previous_root_view,
+        root_view, root_view_changed = stage_memo_v1(
+            ctx,
+            "maternal_geometry.root_view",
+            (maintained_map, base_root, previous_root_view),
+            lambda: _updated_root_view(
+                stable_map=maintained_map,
+                base_root=base_root,
+                previous_root_view=previous_root_view,
+            ),
         )
     else:
+        stable_readout = None
         root_view = None
 
     if maintained and stable_readout is not None:
@@ -59,18 +59,24 @@ Design invariants
   counters, and arbitrary mutable metadata.
 - ``content_signature()`` identifies decoded content while excluding map
   identity and lineage; ``record_signature()`` identifies the exact revision.
+  Both, and the canonical bytes, are memoized per immutable revision.
+- ``derive_navmap_revision()`` builds a revision from an already-validated
+  base map and validates only the changed content.  Setting the environment
+  variable ``CCA8_NAVMAP_FULL_VALIDATION=1`` forces the full ``NavMapV2`` checks;
+  ``from_dict()``/``from_bytes()`` always perform them.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
 import hashlib
 import json
 import math
+import os
 from pathlib import PurePosixPath, PureWindowsPath
 import re
-from typing import Any, Callable, Mapping, Optional, TypeVar
+from typing import Any, Callable, Iterable, Mapping, Optional, TypeVar
 
 __version__ = "0.7.0"
 
@@ -102,6 +108,7 @@ __all__ = [
     "NavRelationV1",
     "NavMapLinkV1",
     "NavMapV2",
+    "derive_navmap_revision",
     "get_element",
     "element_centroid",
     "centroid_distance_between",
@@ -138,6 +145,7 @@ __all__ = [
     "align_navmaps",
     "match_navmaps",
     "match_rank",
+    "match_score_upper_bound",
     "structured_residual",
     "propose_revision",
     "apply_revision",
@@ -1335,6 +1343,19 @@ class NavMapV2:
     fmt: str = field(default=NAVMAP_FORMAT_V2, init=False, repr=False, compare=False)
     shape: tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
 
+    # Per-revision memo of canonical bytes and digests.  The record is frozen, so
+    # each value is computed at most once; ``replace()`` starts a fresh, empty memo.
+    _canonical_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _content_digest: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _record_digest: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _element_table: Optional[dict[str, "NavElementV1"]] = field(default=None, init=False, repr=False, compare=False)
+    _match_profile: Optional["_NavMatchProfile"] = field(default=None, init=False, repr=False, compare=False)
+    # Pure derived evidence (support/body-state) keyed by its declared inputs:
+    # operator name, element ids, and the immutable threshold record.
+    _derived_evidence: Optional[dict[tuple[Any, ...], Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         _require_instance(self.frame, NavFrameV1, field_name="frame")
         _require_instance(self.provenance, NavProvenanceV1, field_name="provenance")
@@ -1443,18 +1464,31 @@ class NavMapV2:
 
     def to_bytes(self) -> bytes:
         """Serialize the exact revision to deterministic canonical UTF-8 JSON."""
-        return _canonical_json_bytes(self.as_dict())
+        data = self._canonical_bytes
+        if data is None:
+            data = _canonical_json_bytes(self.as_dict())
+            object.__setattr__(self, "_canonical_bytes", data)
+        return data
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "NavMapV2":
-        """Decode and validate one record produced by :meth:`to_bytes`."""
+        """Decode and validate one record produced by :meth:`to_bytes`.
+
+        When the input already is the canonical encoding of the decoded revision,
+        it seeds the byte memo, so ``to_bytes()`` and the signatures return or hash
+        the input object without rebuilding ``as_dict()``.  The layout check runs
+        on the decoded JSON first, so non-canonical input skips the record rebuild.
+        """
         if not isinstance(data, bytes):
             raise TypeError("NavMapV2.from_bytes requires bytes")
         try:
             decoded = json.loads(data.decode("utf-8"))
         except (UnicodeDecodeError, json.JSONDecodeError) as exc:
             raise ValueError("invalid NavMapV2 UTF-8 JSON payload") from exc
-        return cls.from_dict(_as_mapping(decoded, record_name=cls.__name__))
+        navmap = cls.from_dict(_as_mapping(decoded, record_name=cls.__name__))
+        if _canonical_json_bytes(decoded) == data and navmap.as_dict() == decoded:
+            object.__setattr__(navmap, "_canonical_bytes", data)
+        return navmap
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "NavMapV2":
@@ -1510,11 +1544,19 @@ class NavMapV2:
 
     def content_signature(self) -> str:
         """Return SHA-256 for decoded content, excluding identity and lineage."""
-        return _sha256_hex(_canonical_json_bytes(self.content_dict()))
+        digest = self._content_digest
+        if digest is None:
+            digest = _sha256_hex(_canonical_json_bytes(self.content_dict()))
+            object.__setattr__(self, "_content_digest", digest)
+        return digest
 
     def record_signature(self) -> str:
         """Return SHA-256 for the complete exact map revision record."""
-        return _sha256_hex(self.to_bytes())
+        digest = self._record_digest
+        if digest is None:
+            digest = _sha256_hex(self.to_bytes())
+            object.__setattr__(self, "_record_digest", digest)
+        return digest
 
     def meta(self) -> dict[str, Any]:
         """Return a lightweight JSON-safe descriptor for Column indexing."""
@@ -1532,6 +1574,137 @@ class NavMapV2:
             "link_count": len(self.links),
         }
 
+
+_NAVMAP_V2_FIELD_DEFAULTS = tuple(
+    (item.name, item.default) for item in fields(NavMapV2) if not item.init
+)
+
+
+def _navmap_full_validation_forced() -> bool:
+    """Return whether the debug switch disables the derived-revision fast path."""
+    return os.environ.get("CCA8_NAVMAP_FULL_VALIDATION", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _derived_content_matches_base(
+    base: NavMapV2,
+    *,
+    frame: NavFrameV1,
+    elements: tuple[NavElementV1, ...],
+    relations: tuple[NavRelationV1, ...],
+    links: tuple[NavMapLinkV1, ...],
+) -> bool:
+    """Validate only content that differs from ``base``; return ``False`` when a full check is needed.
+
+    The fast path applies while element ids, element order, part-of parents,
+    and relation/link structural keys are unchanged, because the base already
+    proved ordering, uniqueness, endpoint, and cycle invariants for them.
+    """
+    if len(elements) != len(base.elements):
+        return False
+    frame_changed = frame is not base.frame and frame != base.frame
+    for element, base_element in zip(elements, base.elements):
+        if element is not base_element:
+            if not isinstance(element, NavElementV1):
+                return False
+            if (
+                element.element_id != base_element.element_id
+                or element.parent_element_id != base_element.parent_element_id
+            ):
+                return False
+        elif not frame_changed:
+            continue
+        for point in element.geometry.points:
+            if not frame.contains(point):
+                raise ValueError(f"element {element.element_id!r} contains geometry outside the declared frame")
+
+    for items, base_items, record_type in (
+        (relations, base.relations, NavRelationV1),
+        (links, base.links, NavMapLinkV1),
+    ):
+        if items is base_items:
+            continue
+        if len(items) != len(base_items):
+            return False
+        for item, base_item in zip(items, base_items):
+            if item is base_item:
+                continue
+            if not isinstance(item, record_type) or item.structural_key() != base_item.structural_key():
+                return False
+    return True
+
+
+def derive_navmap_revision(
+    base: NavMapV2,
+    *,
+    map_id: str,
+    revision: int,
+    role: str,
+    frame: NavFrameV1,
+    provenance: NavProvenanceV1,
+    parent_ref: Optional[NavMapRefV1] = None,
+    elements: Iterable[NavElementV1] = (),
+    relations: Iterable[NavRelationV1] = (),
+    links: Iterable[NavMapLinkV1] = (),
+    schema: str = NAVMAP_SCHEMA_V2,
+) -> NavMapV2:
+    """Construct a ``NavMapV2`` whose content is derived from validated ``base``.
+
+    Arguments mirror the ``NavMapV2`` constructor.  Identity, lineage, frame,
+    and provenance are checked as usual, but element/relation/link content is
+    validated only where it differs from ``base``: changed elements are
+    type- and frame-checked, and reused records are trusted.  Any structural
+    change (added, removed, reordered, or re-parented elements, or changed
+    relation/link keys) falls back to full ``NavMapV2`` validation, so the
+    result always equals the record the constructor would produce.
+    """
+    _require_instance(base, NavMapV2, field_name="base")
+    elements = tuple(elements)
+    relations = tuple(relations)
+    links = tuple(links)
+    if not _navmap_full_validation_forced():
+        _require_instance(frame, NavFrameV1, field_name="frame")
+        _require_instance(provenance, NavProvenanceV1, field_name="provenance")
+        if _derived_content_matches_base(base, frame=frame, elements=elements, relations=relations, links=links):
+            normalized_map_id = _normalize_identifier(map_id, field_name="map_id")
+            normalized_revision = _positive_revision(revision)
+            normalized_role = _normalize_identifier(role, field_name="role")
+            if schema != NAVMAP_SCHEMA_V2:
+                raise ValueError(f"schema must be {NAVMAP_SCHEMA_V2!r}")
+            if parent_ref is not None:
+                _require_instance(parent_ref, NavMapRefV1, field_name="parent_ref")
+                if parent_ref.map_id != normalized_map_id:
+                    raise ValueError("parent_ref map_id must match the child map_id")
+                if parent_ref.revision >= normalized_revision:
+                    raise ValueError("parent_ref revision must be lower than the child revision")
+            navmap = object.__new__(NavMapV2)
+            for name, value in (
+                ("map_id", normalized_map_id),
+                ("revision", normalized_revision),
+                ("role", normalized_role),
+                ("frame", frame),
+                ("provenance", provenance),
+                ("parent_ref", parent_ref),
+                ("elements", elements),
+                ("relations", relations),
+                ("links", links),
+                ("schema", NAVMAP_SCHEMA_V2),
+                *_NAVMAP_V2_FIELD_DEFAULTS,
+            ):
+                object.__setattr__(navmap, name, value)
+            return navmap
+    return NavMapV2(
+        map_id=map_id,
+        revision=revision,
+        parent_ref=parent_ref,
+        role=role,
+        frame=frame,
+        provenance=provenance,
+        elements=elements,
+        relations=relations,
+        links=links,
+        schema=schema,
+    )
+
 # --- Phase 1B-A pure geometry queries -----------------------------------------------
 
 
@@ -1540,11 +1713,20 @@ def _source_map_ref(navmap: NavMapV2) -> NavMapRefV1:
     return NavMapRefV1(map_id=navmap.map_id, revision=navmap.revision)
 
 
+def _navmap_element_table(navmap: NavMapV2) -> dict[str, NavElementV1]:
+    """Return the memoized element-id table for one map revision."""
+    table = navmap._element_table  # pylint: disable=protected-access
+    if table is None:
+        table = {element.element_id: element for element in navmap.elements}
+        object.__setattr__(navmap, "_element_table", table)
+    return table
+
+
 def get_element(navmap: NavMapV2, element_id: str) -> NavElementV1:
     """Return one local element by canonical id or fail explicitly.
 
-    Lookup is intentionally pure and linear for the small Phase 1 kernel.  A
-    future backend may add an index without changing this public contract.
+    Lookup goes through the revision's memoized id table, so repeated queries
+    against the same map do not rescan its elements.
 
     Raises
     ------
@@ -1556,10 +1738,10 @@ def get_element(navmap: NavMapV2, element_id: str) -> NavElementV1:
     """
     _require_instance(navmap, NavMapV2, field_name="navmap")
     normalized_id = _normalize_identifier(element_id, field_name="element_id")
-    for element in navmap.elements:
-        if element.element_id == normalized_id:
-            return element
-    raise KeyError(f"element {normalized_id!r} does not exist in {navmap.map_id}@r{navmap.revision}")
+    element = _navmap_element_table(navmap).get(normalized_id)
+    if element is None:
+        raise KeyError(f"element {normalized_id!r} does not exist in {navmap.map_id}@r{navmap.revision}")
+    return element
 
 
 def _geometry_centroid(geometry: NavGeometryV1) -> tuple[NavPointV1, str]:
@@ -1846,6 +2028,17 @@ def minimum_distance_between(
     """
     source = get_element(navmap, source_element_id)
     target = get_element(navmap, target_element_id)
+    return _distance_result(navmap, source, target, operator="minimum_distance_between")
+
+
+def _distance_result(
+    navmap: NavMapV2,
+    source: NavElementV1,
+    target: NavElementV1,
+    *,
+    operator: str,
+) -> NavScalarQueryResultV1:
+    """Measure one element pair and wrap it as a revision-linked scalar result."""
     value, method = _minimum_geometry_distance(source.geometry, target.geometry)
     # Remove only machine-scale residue from projection/intersection arithmetic.
     # The biologically/engineering-relevant contact tolerance remains explicit.
@@ -1853,7 +2046,7 @@ def minimum_distance_between(
     return NavScalarQueryResultV1(
         source_map_ref=_source_map_ref(navmap),
         frame_id=navmap.frame.frame_id,
-        operator="minimum_distance_between",
+        operator=operator,
         element_ids=(source.element_id, target.element_id),
         value=normalized_value,
         units=navmap.frame.units,
@@ -1889,6 +2082,7 @@ def geometries_contact(
         distance_method=distance.method,
     )
 
+
 def _linear_value_interval(
     start_value: float,
     delta_value: float,
@@ -2119,6 +2313,32 @@ def support_evidence(
     """
     _require_instance(navmap, NavMapV2, field_name="navmap")
     _require_instance(thresholds, NavBodyStateThresholdsV1, field_name="thresholds")
+    memo = _navmap_derived_evidence(navmap)
+    key = ("support_evidence", body_element_id, head_element_id, foot_element_id, ground_element_id, thresholds)
+    cached = memo.get(key)
+    if cached is None:
+        cached = _support_evidence(
+            navmap,
+            body_element_id=body_element_id,
+            head_element_id=head_element_id,
+            foot_element_id=foot_element_id,
+            ground_element_id=ground_element_id,
+            thresholds=thresholds,
+        )
+        memo[key] = cached
+    return cached
+
+
+def _support_evidence(
+    navmap: NavMapV2,
+    *,
+    body_element_id: str,
+    head_element_id: str,
+    foot_element_id: str,
+    ground_element_id: str,
+    thresholds: NavBodyStateThresholdsV1,
+) -> NavSupportEvidenceV1:
+    """Compute :func:`support_evidence` for one map revision without the memo."""
     body = get_element(navmap, body_element_id)
     head = get_element(navmap, head_element_id)
     foot = get_element(navmap, foot_element_id)
@@ -2196,7 +2416,9 @@ def body_state_evidence(
     ``STANDING_LIKE`` requires a coherent upright support pattern.
     ``FALLEN_LIKE`` requires a coherent lateral-ground pattern.  Complete but
     mixed evidence returns ``AMBIGUOUS``.  Missing elements or unsupported
-    geometry return ``UNKNOWN``.  No result is written back into ``NavMapV2``.
+    geometry return ``UNKNOWN``.  No result is written back into ``NavMapV2``
+    content; the record is memoized per revision, keyed by the normalized
+    element ids and the threshold record, so repeated calls return it.
     """
     _require_instance(navmap, NavMapV2, field_name="navmap")
     _require_instance(thresholds, NavBodyStateThresholdsV1, field_name="thresholds")
@@ -2206,6 +2428,22 @@ def body_state_evidence(
         _normalize_identifier(foot_element_id, field_name="foot_element_id"),
         _normalize_identifier(ground_element_id, field_name="ground_element_id"),
     )
+    memo = _navmap_derived_evidence(navmap)
+    key = ("body_state_evidence", element_ids, thresholds)
+    cached = memo.get(key)
+    if cached is None:
+        cached = _body_state_evidence(navmap, element_ids=element_ids, thresholds=thresholds)
+        memo[key] = cached
+    return cached
+
+
+def _body_state_evidence(
+    navmap: NavMapV2,
+    *,
+    element_ids: tuple[str, str, str, str],
+    thresholds: NavBodyStateThresholdsV1,
+) -> NavBodyStateEvidenceV1:
+    """Compute :func:`body_state_evidence` from normalized element ids without the memo."""
     available_ids = {element.element_id for element in navmap.elements}
     missing_ids = tuple(element_id for element_id in element_ids if element_id not in available_ids)
     if missing_ids:
@@ -3396,7 +3634,8 @@ def transform_navmap(
         else element
         for element in navmap.elements
     )
-    result_map = NavMapV2(
+    result_map = derive_navmap_revision(
+        navmap,
         map_id=navmap.map_id,
         revision=revision,
         parent_ref=_source_map_ref(navmap),
@@ -3511,6 +3750,45 @@ def _feature_structure_key(navmap: NavMapV2, element: NavElementV1) -> tuple[str
     )
 
 
+class _NavMatchProfile:
+    """Per-revision matching inputs extracted once: structure keys and centroids.
+
+    ``match_rank`` compares one query against many candidates, and library maps
+    are compared against many queries; both sides reuse this memoized profile
+    instead of re-deriving parent roles and centroids for every pair.
+    """
+
+    __slots__ = ("feature_keys", "centroids")
+
+    def __init__(self, navmap: NavMapV2) -> None:
+        self.feature_keys = {
+            element.element_id: _feature_structure_key(navmap, element)
+            for element in navmap.elements
+        }
+        self.centroids = {
+            element.element_id: _geometry_centroid(element.geometry)[0]
+            for element in navmap.elements
+        }
+
+
+def _navmap_derived_evidence(navmap: NavMapV2) -> dict[tuple[Any, ...], Any]:
+    """Return the per-revision memo of pure derived evidence records."""
+    memo = navmap._derived_evidence  # pylint: disable=protected-access
+    if memo is None:
+        memo = {}
+        object.__setattr__(navmap, "_derived_evidence", memo)
+    return memo
+
+
+def _navmap_match_profile(navmap: NavMapV2) -> _NavMatchProfile:
+    """Return the memoized matching profile for one map revision."""
+    profile = navmap._match_profile  # pylint: disable=protected-access
+    if profile is None:
+        profile = _NavMatchProfile(navmap)
+        object.__setattr__(navmap, "_match_profile", profile)
+    return profile
+
+
 def _unique_group_pairs(
     source_items: tuple[NavElementV1, ...],
     target_items: tuple[NavElementV1, ...],
@@ -3564,27 +3842,19 @@ def _element_pairs(source_map: NavMapV2, target_map: NavMapV2) -> tuple[NavEleme
         del source_remaining[pair.source_element_id]
         del target_remaining[pair.target_element_id]
 
+    source_keys = _navmap_match_profile(source_map).feature_keys
+    target_keys = _navmap_match_profile(target_map).feature_keys
     feature_pairs = _unique_group_pairs(
         tuple(source_remaining.values()),
         tuple(target_remaining.values()),
-        source_key=lambda item: _feature_structure_key(source_map, item),
-        target_key=lambda item: _feature_structure_key(target_map, item),
+        source_key=lambda item: source_keys[item.element_id],
+        target_key=lambda item: target_keys[item.element_id],
         method="unique_feature_structure",
     )
     pairs.extend(feature_pairs)
     return tuple(sorted(pairs, key=lambda item: (item.source_element_id, item.target_element_id)))
 
 
-def _mean_point(points: tuple[NavPointV1, ...]) -> NavPointV1:
-    """Return the arithmetic mean of a non-empty point tuple."""
-    if not points:
-        raise ValueError("mean point requires at least one point")
-    return NavPointV1(
-        x=math.fsum(point.x for point in points) / len(points),
-        y=math.fsum(point.y for point in points) / len(points),
-    )
-
-
 def _alignment_unknown(
     source_map: NavMapV2,
     target_map: NavMapV2,
@@ -3618,26 +3888,29 @@ def _alignment_unknown(
     )
 
 
-def _fit_rigid_transform(
-    source_map: NavMapV2,
-    target_map: NavMapV2,
-    source_points: tuple[NavPointV1, ...],
-    target_points: tuple[NavPointV1, ...],
+def _rigid_fit_xy(
+    source_xy: tuple[tuple[float, float], ...],
+    target_xy: tuple[tuple[float, float], ...],
     indices: tuple[int, ...],
-    *,
-    method: str,
-) -> tuple[NavRigidTransformV1, bool]:
-    """Fit one least-squares rigid transform to a selected correspondence subset."""
-    selected_source = tuple(source_points[index] for index in indices)
-    selected_target = tuple(target_points[index] for index in indices)
-    source_mean = _mean_point(selected_source)
-    target_mean = _mean_point(selected_target)
-    centered_source = tuple((point.x - source_mean.x, point.y - source_mean.y) for point in selected_source)
-    centered_target = tuple((point.x - target_mean.x, point.y - target_mean.y) for point in selected_target)
+) -> tuple[float, float, float, float, float, bool]:
+    """Return ``(source mean x/y, target mean x/y, rotation degrees, rotation determined)``.
+
+    This is the least-squares rigid fit over one correspondence subset, on plain
+    coordinates so the robust search can rank many subsets without building records.
+    """
+    count = len(indices)
+    if not count:
+        raise ValueError("mean point requires at least one point")
+    source_mean_x = _finite_float(math.fsum(source_xy[index][0] for index in indices) / count, field_name="x")
+    source_mean_y = _finite_float(math.fsum(source_xy[index][1] for index in indices) / count, field_name="y")
+    target_mean_x = _finite_float(math.fsum(target_xy[index][0] for index in indices) / count, field_name="x")
+    target_mean_y = _finite_float(math.fsum(target_xy[index][1] for index in indices) / count, field_name="y")
+    centered_source = tuple((source_xy[i][0] - source_mean_x, source_xy[i][1] - source_mean_y) for i in indices)
+    centered_target = tuple((target_xy[i][0] - target_mean_x, target_xy[i][1] - target_mean_y) for i in indices)
     source_spread = math.fsum(x * x + y * y for x, y in centered_source)
     target_spread = math.fsum(x * x + y * y for x, y in centered_target)
     rotation_determined = (
-        len(indices) >= 2
+        count >= 2
         and source_spread > _GEOMETRY_NUMERICAL_EPSILON
         and target_spread > _GEOMETRY_NUMERICAL_EPSILON
     )
@@ -3653,13 +3926,54 @@ def _fit_rigid_transform(
         rotation_degrees = math.degrees(math.atan2(cross_sum, dot_sum))
     else:
         rotation_degrees = 0.0
+    return source_mean_x, source_mean_y, target_mean_x, target_mean_y, rotation_degrees, rotation_determined
+
+
+def _rigid_errors_xy(
+    rotation_degrees: float,
+    pivot_x: float,
+    pivot_y: float,
+    translation_x: float,
+    translation_y: float,
+    source_xy: tuple[tuple[float, float], ...],
+    target_xy: tuple[tuple[float, float], ...],
+) -> tuple[float, ...]:
+    """Return per-pair distances after applying one rigid transform (``apply_point`` math)."""
+    radians = math.radians(rotation_degrees)
+    cosine = math.cos(radians)
+    sine = math.sin(radians)
+    errors: list[float] = []
+    for (source_x, source_y), (target_x, target_y) in zip(source_xy, target_xy):
+        offset_x = source_x - pivot_x
+        offset_y = source_y - pivot_y
+        mapped_x = pivot_x + cosine * offset_x - sine * offset_y + translation_x
+        mapped_y = pivot_y + sine * offset_x + cosine * offset_y + translation_y
+        errors.append(math.hypot(target_x - mapped_x, target_y - mapped_y))
+    return tuple(errors)
+
+
+def _fit_rigid_transform(
+    source_map: NavMapV2,
+    target_map: NavMapV2,
+    source_points: tuple[NavPointV1, ...],
+    target_points: tuple[NavPointV1, ...],
+    indices: tuple[int, ...],
+    *,
+    method: str,
+) -> tuple[NavRigidTransformV1, bool]:
+    """Fit one least-squares rigid transform to a selected correspondence subset."""
+    source_xy = tuple((point.x, point.y) for point in source_points)
+    target_xy = tuple((point.x, point.y) for point in target_points)
+    source_mean_x, source_mean_y, target_mean_x, target_mean_y, rotation_degrees, rotation_determined = (
+        _rigid_fit_xy(source_xy, target_xy, indices)
+    )
     transform = NavRigidTransformV1(
         source_frame_id=source_map.frame.frame_id,
         target_frame_id=target_map.frame.frame_id,
         rotation_degrees=rotation_degrees,
-        translation_x=target_mean.x - source_mean.x,
-        translation_y=target_mean.y - source_mean.y,
-        pivot=source_mean,
+        translation_x=target_mean_x - source_mean_x,
+        translation_y=target_mean_y - source_mean_y,
+        pivot=NavPointV1(x=source_mean_x, y=source_mean_y),
         method=method,
     )
     return transform, rotation_determined
@@ -3671,9 +3985,14 @@ def _alignment_errors(
     target_points: tuple[NavPointV1, ...],
 ) -> tuple[float, ...]:
     """Return centroid errors for all current correspondence hypotheses."""
-    return tuple(
-        _point_distance(transform.apply_point(source_point), target_point)
-        for source_point, target_point in zip(source_points, target_points)
+    return _rigid_errors_xy(
+        transform.rotation_degrees,
+        transform.pivot.x,
+        transform.pivot.y,
+        transform.translation_x,
+        transform.translation_y,
+        tuple((point.x, point.y) for point in source_points),
+        tuple((point.x, point.y) for point in target_points),
     )
 
 
@@ -3686,6 +4005,28 @@ def _median(values: tuple[float, ...]) -> float:
     return (ordered[midpoint - 1] + ordered[midpoint]) / 2.0
 
 
+def _subset_fit_errors(
+    source_xy: tuple[tuple[float, float], ...],
+    target_xy: tuple[tuple[float, float], ...],
+    indices: tuple[int, ...],
+) -> tuple[float, tuple[float, ...]]:
+    """Return (normalized rotation, centroid errors) for one candidate subset fit.
+
+    Same helpers as ``_fit_rigid_transform`` + ``_alignment_errors``, minus the
+    validated transform and point records built for every hypothesis.
+    """
+    source_mean_x, source_mean_y, target_mean_x, target_mean_y, rotation_degrees, _determined = (
+        _rigid_fit_xy(source_xy, target_xy, indices)
+    )
+    rotation_degrees = _normalized_rotation_degrees(rotation_degrees)
+    translation_x = _finite_float(target_mean_x - source_mean_x, field_name="translation_x")
+    translation_y = _finite_float(target_mean_y - source_mean_y, field_name="translation_y")
+    errors = _rigid_errors_xy(
+        rotation_degrees, source_mean_x, source_mean_y, translation_x, translation_y, source_xy, target_xy
+    )
+    return rotation_degrees, errors
+
+
 def _robust_alignment_fit(
     source_map: NavMapV2,
     target_map: NavMapV2,
@@ -3708,26 +4049,11 @@ def _robust_alignment_fit(
     index_sets.extend((index,) for index in range(count))
     index_sets.extend((first, second) for first in range(count) for second in range(first + 1, count))
     unique_index_sets = tuple(dict.fromkeys(index_sets))
-    candidates: list[
-        tuple[
-            tuple[float, ...],
-            NavRigidTransformV1,
-            bool,
-            tuple[int, ...],
-            tuple[float, ...],
-        ]
-    ] = []
+    candidates: list[tuple[tuple[float, ...], tuple[int, ...]]] = []
+    source_xy = tuple((point.x, point.y) for point in source_points)
+    target_xy = tuple((point.x, point.y) for point in target_points)
     for indices in unique_index_sets:
-        method = "candidate_rigid_subset" if len(indices) >= 2 else "candidate_translation_subset"
-        transform, rotation_determined = _fit_rigid_transform(
-            source_map,
-            target_map,
-            source_points,
-            target_points,
-            indices,
-            method=method,
-        )
-        errors = _alignment_errors(transform, source_points, target_points)
+        rotation_degrees, errors = _subset_fit_errors(source_xy, target_xy, indices)
         inliers = tuple(index for index, error in enumerate(errors) if error <= inlier_tolerance)
         if not inliers:
             continue
@@ -3739,10 +4065,10 @@ def _robust_alignment_fit(
             _median(errors),
             inlier_rms,
             total_rms,
-            abs(transform.rotation_degrees),
+            abs(rotation_degrees),
             float(len(indices)),
         )
-        candidates.append((key, transform, rotation_determined, inliers, errors))
+        candidates.append((key, inliers))
     if not candidates:
         transform, rotation_determined = _fit_rigid_transform(
             source_map,
@@ -3754,7 +4080,7 @@ def _robust_alignment_fit(
         )
         errors = _alignment_errors(transform, source_points, target_points)
         return transform, rotation_determined, (), errors
-    _key, _transform, _rotation_determined, inliers, _errors = min(candidates, key=lambda row: row[0])
+    _key, inliers = min(candidates, key=lambda row: row[0])
     method = "robust_inlier_rigid_2d" if len(inliers) >= 2 else "robust_inlier_translation_only"
     transform, rotation_determined = _fit_rigid_transform(
         source_map,
@@ -3907,14 +4233,10 @@ def align_navmaps(
             overlap_fraction=0.0,
         )
 
-    source_points = tuple(
-        _geometry_centroid(get_element(source_map, pair.source_element_id).geometry)[0]
-        for pair in pairs
-    )
-    target_points = tuple(
-        _geometry_centroid(get_element(target_map, pair.target_element_id).geometry)[0]
-        for pair in pairs
-    )
+    source_centroids = _navmap_match_profile(source_map).centroids
+    target_centroids = _navmap_match_profile(target_map).centroids
+    source_points = tuple(source_centroids[pair.source_element_id] for pair in pairs)
+    target_points = tuple(target_centroids[pair.target_element_id] for pair in pairs)
     inlier_tolerance = max(thresholds.maximum_geometry_point_error, _GEOMETRY_NUMERICAL_EPSILON)
     if source_map.frame.frame_id == target_map.frame.frame_id:
         transform = NavRigidTransformV1(
@@ -4241,6 +4563,75 @@ def match_navmaps(
     )
 
 
+def _typed_jaccard_bound(source_types: tuple[str, ...], target_types: frozenset[str]) -> float:
+    """Return the largest keyed Jaccard score compatible with type sets alone.
+
+    A mapped source key can only meet a target key of the same type, and every
+    distinct source type absent from the target adds at least one union member.
+    """
+    shared = sum(1 for item in source_types if item in target_types)
+    unshared = len({item for item in source_types if item not in target_types})
+    return shared / (shared + unshared)
+
+
+def match_score_upper_bound(
+    query_map: NavMapV2,
+    *,
+    map_roles: Iterable[str],
+    element_roles: Iterable[str],
+    relation_types: Iterable[str],
+    link_types: Iterable[str],
+) -> float:
+    """Return a score that ``match_navmaps(query_map, candidate)`` cannot exceed.
+
+    The candidate is described only by role and type sets, so the bound needs
+    no payload, alignment, or correspondence search.  The sets may be supersets
+    of what the candidate actually contains; extra members only loosen the
+    bound.  Component presence that the sets cannot settle is maximized over.
+    """
+    _require_instance(query_map, NavMapV2, field_name="query_map")
+    candidate_map_roles = frozenset(map_roles)
+    candidate_element_roles = frozenset(element_roles)
+    candidate_relation_types = frozenset(relation_types)
+    candidate_link_types = frozenset(link_types)
+    map_role_score = 1.0 if query_map.role in candidate_map_roles else 0.0
+    # Union count is never below the source element count, and only elements
+    # whose role exists in the candidate can become matched correspondences.
+    element_score = 1.0
+    if query_map.elements:
+        element_score = sum(
+            1 for element in query_map.elements if element.role in candidate_element_roles
+        ) / len(query_map.elements)
+
+    def component_options(source_types: tuple[str, ...], target_types: frozenset[str]) -> tuple[tuple[bool, float], ...]:
+        if source_types:
+            return ((True, _typed_jaccard_bound(source_types, target_types)),)
+        if target_types:
+            return ((True, 0.0), (False, 0.0))
+        return ((False, 0.0),)
+
+    relation_options = component_options(
+        tuple(relation.relation_type for relation in query_map.relations),
+        candidate_relation_types,
+    )
+    link_options = component_options(
+        tuple(link.link_type for link in query_map.links),
+        candidate_link_types,
+    )
+    return max(
+        _weighted_match_score(
+            map_role_score,
+            element_score,
+            relation_score,
+            link_score,
+            relations_present=relations_present,
+            links_present=links_present,
+        )
+        for relations_present, relation_score in relation_options
+        for links_present, link_score in link_options
+    )
+
+
 def match_rank(
     query_map: NavMapV2,
     candidates: tuple[NavMapV2, ...],
@@ -4659,7 +5050,8 @@ def apply_revision(
             raise ValueError("CREATE new_map_id must differ from the base map_id")
         if new_revision not in (None, 1):
             raise ValueError("CREATE begins a new map family at revision 1")
-        return NavMapV2(
+        return derive_navmap_revision(
+            evidence_map,
             map_id=normalized_map_id,
             revision=1,
             parent_ref=None,
@@ -4684,7 +5076,8 @@ def apply_revision(
         evidence_map,
         proposal.residual.match_result,
     )
-    return NavMapV2(
+    return derive_navmap_revision(
+        evidence_map,
         map_id=base_map.map_id,
         revision=revision,
         parent_ref=_source_map_ref(base_map),
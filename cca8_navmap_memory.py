@@ -54,6 +54,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 from enum import Enum
+import heapq
 import math
 from typing import Any, Iterable, Optional, Sequence, TypeVar
 
@@ -71,6 +72,7 @@ from cca8_navmap_kernel import (
     NavMapRefV1,
     NavMapV2,
     NavMatchRankStatusV1,
+    NavMatchStatusV1,
     NavMatchThresholdsV1,
     NavPointV1,
     NavProvenanceV1,
@@ -79,6 +81,7 @@ from cca8_navmap_kernel import (
     NavStructuredResidualV1,
     match_navmaps,
     match_rank,
+    match_score_upper_bound,
     structured_residual,
 )
 from cca8_wnm_runtime import (
@@ -122,6 +125,7 @@ __all__ = [
 
 _DEFAULT_CANDIDATE_REF_LIMIT = 8
 _DEFAULT_REINSTATEMENT_LIMIT = 3
+_MATCH_BOUND_SLACK = 1.0e-9
 _DEFAULT_HISTORY_LIMIT = 25
 _DEFAULT_ELIGIBILITY_LIMIT = 16
 _DEFAULT_PENDING_MAP_LIMIT = 16
@@ -1011,19 +1015,76 @@ def _source_classes(navmap: NavMapV2) -> tuple[str, ...]:
 
 
 def _rebuild_sparse_indexes(ctx: Any, entries: dict[str, NavMapMemoryIndexEntryV1]) -> None:
-    """Rebuild lightweight inverted/ref indexes without touching Column payloads."""
-    token_index: dict[str, list[str]] = {}
+    """Rebuild lightweight inverted/ref indexes without touching Column payloads.
+
+    Only needed when ctx carries no usable sparse indexes (fresh or legacy state);
+    routine store/retrieval updates go through ``_reindex_entry``.
+    """
+    token_index: dict[str, set[str]] = {}
     ref_index: dict[str, str] = {}
-    for engram_id, entry in sorted(entries.items()):
+    for engram_id, entry in entries.items():
         ref_index[_ref_key(entry.map_ref)] = engram_id
         for token in entry.all_index_tokens:
-            token_index.setdefault(token, []).append(engram_id)
+            token_index.setdefault(token, set()).add(engram_id)
     ctx.navmap_memory_index_v1 = dict(entries)
     ctx.navmap_memory_ref_index_v1 = ref_index
-    ctx.navmap_memory_token_index_v1 = {
-        token: sorted(set(ids))
-        for token, ids in token_index.items()
-    }
+    ctx.navmap_memory_token_index_v1 = token_index
+    ctx.navmap_memory_score_sets_v1 = {}
+
+
+def _live_sparse_indexes(ctx: Any) -> tuple[dict[str, NavMapMemoryIndexEntryV1], dict[str, str], dict[str, Any]]:
+    """Return the ctx-owned entry, ref, and token indexes for in-place maintenance.
+
+    Missing or malformed indexes are rebuilt once from the valid typed entries.
+    """
+    entries = getattr(ctx, "navmap_memory_index_v1", None)
+    refs = getattr(ctx, "navmap_memory_ref_index_v1", None)
+    tokens = getattr(ctx, "navmap_memory_token_index_v1", None)
+    if (
+        not isinstance(entries, dict)
+        or not isinstance(refs, dict)
+        or not isinstance(tokens, dict)
+        or (entries and not tokens)
+    ):
+        _rebuild_sparse_indexes(ctx, _memory_index(ctx))
+        entries = ctx.navmap_memory_index_v1
+        refs = ctx.navmap_memory_ref_index_v1
+        tokens = ctx.navmap_memory_token_index_v1
+    return entries, refs, tokens
+
+
+def _reindex_entry(
+    ctx: Any,
+    previous: Optional[NavMapMemoryIndexEntryV1],
+    entry: NavMapMemoryIndexEntryV1,
+) -> None:
+    """Patch the sparse indexes for one changed entry in O(tokens of that entry)."""
+    entries, refs, tokens = _live_sparse_indexes(ctx)
+    engram_id = entry.engram_id
+    new_tokens = set(entry.all_index_tokens)
+    old_tokens = set(previous.all_index_tokens) if previous is not None else set()
+    for token in old_tokens - new_tokens:
+        posting = tokens.get(token)
+        if posting is None:
+            continue
+        if not isinstance(posting, set):
+            posting = tokens[token] = set(posting)
+        posting.discard(engram_id)
+        if not posting:
+            del tokens[token]
+    for token in new_tokens - old_tokens:
+        posting = tokens.get(token)
+        if not isinstance(posting, set):
+            # legacy sorted-list postings are converted the first time they are touched
+            posting = tokens[token] = set(posting or ())
+        posting.add(engram_id)
+    if previous is not None and _ref_key(previous.map_ref) != _ref_key(entry.map_ref):
+        refs.pop(_ref_key(previous.map_ref), None)
+    refs[_ref_key(entry.map_ref)] = engram_id
+    entries[engram_id] = entry
+    score_sets = getattr(ctx, "navmap_memory_score_sets_v1", None)
+    if isinstance(score_sets, dict):
+        score_sets.pop(engram_id, None)
 
 
 def _append_history(ctx: Any, field_name: str, limit_field_name: str, row: dict[str, Any]) -> None:
@@ -1152,10 +1213,11 @@ def navmap_memory_store_map_v1(
     memory = _column_memory(column_memory)
     ref = _map_ref(navmap)
     ref_key = _ref_key(ref)
-    entries = _memory_index(ctx)
-    refs = _ref_index(ctx)
+    entries, refs, _tokens = _live_sparse_indexes(ctx)
     existing_engram_id = refs.get(ref_key)
-    existing = entries.get(existing_engram_id) if existing_engram_id is not None else None
+    existing = entries.get(existing_engram_id) if isinstance(existing_engram_id, str) else None
+    if not isinstance(existing, NavMapMemoryIndexEntryV1):
+        existing = None
     payload_stored = False
     duplicate_avoided = False
     status = "stored_new"
@@ -1180,7 +1242,6 @@ def navmap_memory_store_map_v1(
             transition_action=transition_action,
             transition_to_ref=transition_to_ref,
         )
-        entries[existing.engram_id] = updated_entry
         engram_id = existing.engram_id
         duplicate_avoided = True
         status = "supported_existing"
@@ -1241,10 +1302,9 @@ def navmap_memory_store_map_v1(
             last_supported_observation_no=observation_no,
             stored_controller_step=_controller_step(ctx),
         )
-        entries[engram_id] = updated_entry
         payload_stored = True
 
-    _rebuild_sparse_indexes(ctx, entries)
+    _reindex_entry(ctx, existing, updated_entry)
     strength = eligibility.strength if isinstance(eligibility, NavMapConsolidationEligibilityV1) else 1.0
     record = NavMapConsolidationRecordV1(
         transaction_no=_next_store_transaction_no(ctx),
@@ -1356,43 +1416,54 @@ def _query_tokens_from_map(navmap: Optional[NavMapV2]) -> tuple[str, ...]:
     return _normalized_tokens(values)
 
 
-def _candidate_ids_from_sparse_index(ctx: Any, query_tokens: tuple[str, ...]) -> tuple[str, ...]:
-    """Return candidate engram ids through inverted-token lookup only."""
-    raw = getattr(ctx, "navmap_memory_token_index_v1", None)
-    if not isinstance(raw, dict):
-        return ()
-    ids: set[str] = set()
-    for token in query_tokens:
-        values = raw.get(token)
-        if isinstance(values, list):
-            ids.update(item for item in values if isinstance(item, str) and item)
-    return tuple(sorted(ids))
+_ScoreTokenSets = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
 
 
-def _fraction_overlap(query: tuple[str, ...], stored: tuple[str, ...]) -> tuple[float, tuple[str, ...]]:
-    """Return bounded query-token coverage and exact matched tokens."""
-    if not query:
-        return 0.0, ()
-    query_set = set(query)
-    stored_set = set(stored)
-    matched = tuple(sorted(query_set.intersection(stored_set)))
-    return len(matched) / len(query_set), matched
+def _entry_score_sets(ctx: Any, entry: NavMapMemoryIndexEntryV1) -> _ScoreTokenSets:
+    """Return the cue/context/task/structure token sets an entry is scored against.
+
+    The sets are cached on ctx per engram id and reused while the entry object is unchanged.
+    """
+    cache = getattr(ctx, "navmap_memory_score_sets_v1", None)
+    if not isinstance(cache, dict):
+        cache = {}
+        ctx.navmap_memory_score_sets_v1 = cache
+    cached = cache.get(entry.engram_id)
+    if cached is not None and cached[0] is entry:
+        return cached[1]
+    structure = frozenset(entry.structure_tokens)
+    sets = (
+        structure.union(entry.cue_tokens),
+        structure.union(entry.context_tokens),
+        structure.union(entry.task_tokens),
+        structure,
+    )
+    cache[entry.engram_id] = (entry, sets)
+    return sets
 
 
-def _candidate_score(
+def _posting_union(postings: dict[str, Any], tokens: Iterable[str]) -> set[str]:
+    """Return the engram ids found under any of ``tokens`` in the inverted index."""
+    ids: set[str] = set()
+    for token in tokens:
+        values = postings.get(token)
+        if isinstance(values, (set, frozenset, list)):
+            ids.update(item for item in values if isinstance(item, str) and item)
+    return ids
+
+
+def _activation_components(
     entry: NavMapMemoryIndexEntryV1,
+    counts: Sequence[int],
+    group_sizes: Sequence[int],
     *,
-    cue_tokens: tuple[str, ...],
-    context_tokens: tuple[str, ...],
-    task_tokens: tuple[str, ...],
-    structure_tokens: tuple[str, ...],
     strategic: bool,
-) -> tuple[float, float, float, float, float, float, float, tuple[str, ...], tuple[str, ...]]:
-    """Return cheap associative activation components for one index entry."""
-    cue_score, cue_match = _fraction_overlap(cue_tokens, entry.cue_tokens + entry.structure_tokens)
-    context_score, context_match = _fraction_overlap(context_tokens, entry.context_tokens + entry.structure_tokens)
-    task_score, task_match = _fraction_overlap(task_tokens, entry.task_tokens + entry.structure_tokens)
-    structure_score, structure_match = _fraction_overlap(structure_tokens, entry.structure_tokens)
+) -> tuple[float, float, float, float, float, float, float]:
+    """Return activation and its components from per-group query-token overlap counts."""
+    cue_score, context_score, task_score, structure_score = (
+        count / size if size else 0.0
+        for count, size in zip(counts, group_sizes)
+    )
     support_score = min(1.0, math.log2(entry.support_count + 1) / 4.0) if entry.support_count > 0 else 0.0
     exception_penalty = min(1.0, entry.exception_count / max(1, entry.support_count + entry.exception_count))
     if strategic:
@@ -1412,20 +1483,6 @@ def _candidate_score(
             + 0.10 * support_score
         )
     activation = min(1.0, max(0.0, activation * (1.0 - 0.50 * exception_penalty)))
-    matched = _normalized_tokens(cue_match + context_match + task_match + structure_match)
-    reasons: list[str] = []
-    if cue_match:
-        reasons.append("cue_overlap")
-    if context_match:
-        reasons.append("context_overlap")
-    if task_match:
-        reasons.append("task_bias_overlap")
-    if structure_match:
-        reasons.append("partial_structure_overlap")
-    if support_score > 0.0:
-        reasons.append("prior_support")
-    if exception_penalty > 0.0:
-        reasons.append("exception_penalty")
     return (
         activation,
         cue_score,
@@ -1434,8 +1491,6 @@ def _candidate_score(
         structure_score,
         support_score,
         exception_penalty,
-        matched,
-        _normalized_tokens(reasons),
     )
 
 
@@ -1445,8 +1500,16 @@ def _candidate_refs(
     *,
     query_map: Optional[NavMapV2],
 ) -> tuple[NavMapCandidateRefV1, ...]:
-    """Generate a bounded candidate-reference set without payload access."""
-    entries = _memory_index(ctx)
+    """Generate a bounded candidate-reference set without payload access.
+
+    Scoring is term-at-a-time: each query token's posting set is walked once and
+    per-entry overlap counts are accumulated against cached entry token sets. Only
+    the top ``candidate_ref_limit`` rows are materialized as candidate references.
+    """
+    entries = getattr(ctx, "navmap_memory_index_v1", None)
+    postings = getattr(ctx, "navmap_memory_token_index_v1", None)
+    if not isinstance(entries, dict) or not isinstance(postings, dict):
+        return ()
     structure_tokens = _query_tokens_from_map(query_map)
     kind_tokens = tuple(f"kind:{item.value}" for item in request.requested_memory_kinds)
     form_tokens = tuple(f"form:{item.value}" for item in request.requested_memory_forms)
@@ -1458,31 +1521,84 @@ def _candidate_refs(
         + kind_tokens
         + form_tokens
     )
-    candidate_ids = _candidate_ids_from_sparse_index(ctx, query_tokens)
+    candidate_ids = _posting_union(postings, query_tokens)
+    if kind_tokens:
+        candidate_ids.intersection_update(_posting_union(postings, kind_tokens))
+    if form_tokens:
+        candidate_ids.intersection_update(_posting_union(postings, form_tokens))
+    live: dict[str, NavMapMemoryIndexEntryV1] = {}
+    for engram_id in candidate_ids:
+        entry = entries.get(engram_id)
+        if isinstance(entry, NavMapMemoryIndexEntryV1):
+            live[engram_id] = entry
+
+    groups = (
+        frozenset(request.cue_tokens),
+        frozenset(request.context_tokens),
+        frozenset(request.task_bias_tokens),
+        frozenset(structure_tokens),
+    )
+    counts: dict[str, list[int]] = {}
+    for slot, group in enumerate(groups):
+        for token in group:
+            values = postings.get(token)
+            if not isinstance(values, (set, frozenset, list)):
+                continue
+            for engram_id in values:
+                entry = live.get(engram_id)
+                if entry is None or token not in _entry_score_sets(ctx, entry)[slot]:
+                    continue
+                row = counts.get(engram_id)
+                if row is None:
+                    row = counts[engram_id] = [0, 0, 0, 0]
+                row[slot] += 1
+
     minimum_score = max(
         0.0,
         min(1.0, _ctx_float(ctx, "navmap_memory_minimum_activation_score_v1", _DEFAULT_MINIMUM_ACTIVATION_SCORE)),
     )
-    candidates: list[NavMapCandidateRefV1] = []
-    for engram_id in candidate_ids:
-        entry = entries.get(engram_id)
-        if entry is None:
-            continue
-        if request.requested_memory_kinds and not set(request.requested_memory_kinds).intersection(entry.memory_kinds):
-            continue
-        if request.requested_memory_forms and not set(request.requested_memory_forms).intersection(entry.memory_forms):
-            continue
-        values = _candidate_score(
+    strategic = request.mode is NavMapRetrievalModeV1.STRATEGIC
+    group_sizes = tuple(len(group) for group in groups)
+    no_overlap = (0, 0, 0, 0)
+    scored: list[tuple[NavMapMemoryIndexEntryV1, tuple[float, float, float, float, float, float, float]]] = []
+    for engram_id, entry in live.items():
+        values = _activation_components(
             entry,
-            cue_tokens=request.cue_tokens,
-            context_tokens=request.context_tokens,
-            task_tokens=request.task_bias_tokens,
-            structure_tokens=structure_tokens,
-            strategic=request.mode is NavMapRetrievalModeV1.STRATEGIC,
+            counts.get(engram_id, no_overlap),
+            group_sizes,
+            strategic=strategic,
         )
-        activation = values[0]
-        if activation < minimum_score:
+        if values[0] < minimum_score:
             continue
+        scored.append((entry, values))
+    top = heapq.nsmallest(
+        request.candidate_ref_limit,
+        scored,
+        key=lambda item: (
+            -item[1][0],
+            -item[1][3],
+            -item[1][4],
+            item[0].map_ref.map_id,
+            item[0].map_ref.revision,
+            item[0].engram_id,
+        ),
+    )
+
+    candidates: list[NavMapCandidateRefV1] = []
+    for entry, values in top:
+        matches = tuple(group.intersection(stored) for group, stored in zip(groups, _entry_score_sets(ctx, entry)))
+        reasons: list[str] = [
+            reason
+            for reason, matched in zip(
+                ("cue_overlap", "context_overlap", "task_bias_overlap", "partial_structure_overlap"),
+                matches,
+            )
+            if matched
+        ]
+        if values[5] > 0.0:
+            reasons.append("prior_support")
+        if values[6] > 0.0:
+            reasons.append("exception_penalty")
         candidates.append(
             NavMapCandidateRefV1(
                 query_no=request.query_no,
@@ -1491,28 +1607,18 @@ def _candidate_refs(
                 map_role=entry.map_role,
                 memory_kinds=entry.memory_kinds,
                 memory_forms=entry.memory_forms,
-                activation_score=activation,
+                activation_score=values[0],
                 cue_score=values[1],
                 context_score=values[2],
                 task_score=values[3],
                 structure_score=values[4],
                 support_score=values[5],
                 exception_penalty=values[6],
-                matched_tokens=values[7],
-                activation_reasons=values[8],
+                matched_tokens=_normalized_tokens(token for matched in matches for token in matched),
+                activation_reasons=_normalized_tokens(reasons),
             )
         )
-    candidates.sort(
-        key=lambda item: (
-            -item.activation_score,
-            -item.task_score,
-            -item.structure_score,
-            item.map_ref.map_id,
-            item.map_ref.revision,
-            item.engram_id,
-        )
-    )
-    return tuple(candidates[: request.candidate_ref_limit])
+    return tuple(candidates)
 
 
 def _reliable_current_evidence(query_map: Optional[NavMapV2], ctx: Any) -> bool:
@@ -1567,6 +1673,24 @@ def _load_candidate(
     return payload
 
 
+def _entry_match_bound(query_map: NavMapV2, entry: Optional[NavMapMemoryIndexEntryV1]) -> float:
+    """Return the detailed-match score ceiling implied by one index row alone."""
+    if not isinstance(entry, NavMapMemoryIndexEntryV1):
+        return 1.0
+    typed: dict[str, set[str]] = {"role": {entry.map_role}, "element_role": set(), "relation": set(), "link": set()}
+    for token in entry.structure_tokens:
+        prefix, _sep, value = token.partition(":")
+        if prefix in typed and value:
+            typed[prefix].add(value)
+    return match_score_upper_bound(
+        query_map,
+        map_roles=typed["role"],
+        element_roles=typed["element_role"],
+        relation_types=typed["relation"],
+        link_types=typed["link"],
+    )
+
+
 def _reinstatements(
     ctx: Any,
     request: NavMapRetrievalRequestV1,
@@ -1575,16 +1699,20 @@ def _reinstatements(
     query_map: Optional[NavMapV2],
     column_memory: ColumnMemory,
 ) -> tuple[NavMapReinstatementV1, ...]:
-    """Selectively load only the bounded candidate subset needed for inspection."""
+    """Selectively load only the bounded candidate subset needed for inspection.
+
+    With a query map, candidates are visited in descending index-only score
+    bound.  A candidate whose bound is already more than the ambiguity margin
+    below the best detailed score can neither win nor make the ranking
+    ambiguous, so its payload is never loaded.
+    """
     selected = candidates[: request.reinstatement_limit]
-    loaded: list[tuple[NavMapCandidateRefV1, NavMapV2]] = []
-    for candidate in selected:
-        navmap = _load_candidate(column_memory, candidate)
-        if navmap is not None:
-            loaded.append((candidate, navmap))
-    if not loaded:
-        return ()
     if query_map is None:
+        loaded: list[tuple[NavMapCandidateRefV1, NavMapV2]] = []
+        for candidate in selected:
+            navmap = _load_candidate(column_memory, candidate)
+            if navmap is not None:
+                loaded.append((candidate, navmap))
         return tuple(
             NavMapReinstatementV1(
                 candidate_ref=candidate,
@@ -1598,24 +1726,35 @@ def _reinstatements(
             for candidate, navmap in loaded
         )
 
-    thresholds = navmap_memory_match_thresholds_v1(ctx, maximum_candidates=len(loaded))
-    ranking = match_rank(query_map, tuple(navmap for _candidate, navmap in loaded), thresholds=thresholds)
-    match_by_ref = {item.target_map_ref: item for item in ranking.ranked_matches}
+    thresholds = navmap_memory_match_thresholds_v1(ctx, maximum_candidates=max(1, len(selected)))
+    entries = _memory_index(ctx)
+    bounds = [_entry_match_bound(query_map, entries.get(candidate.engram_id)) for candidate in selected]
+    visit_order = sorted(range(len(selected)), key=lambda index: (-bounds[index], index))
+    best_score: Optional[float] = None
+    matched: dict[int, tuple[NavMapV2, NavMapMatchResultV1]] = {}
+    for index in visit_order:
+        if best_score is not None and bounds[index] + _MATCH_BOUND_SLACK < best_score - thresholds.ambiguity_margin:
+            break
+        navmap = _load_candidate(column_memory, selected[index])
+        if navmap is None:
+            continue
+        forward = match_navmaps(query_map, navmap, thresholds=thresholds)
+        matched[index] = (navmap, forward)
+        if forward.status is not NavMatchStatusV1.UNKNOWN and (best_score is None or forward.score > best_score):
+            best_score = forward.score
+
     results: list[NavMapReinstatementV1] = []
-    for candidate, navmap in loaded:
-        forward = match_by_ref.get(candidate.map_ref)
-        residual: Optional[NavStructuredResidualV1] = None
-        conflict = False
-        reason = "detailed_match_unavailable"
+    for index in sorted(matched):
+        candidate = selected[index]
+        navmap, forward = matched[index]
+        reverse = match_navmaps(navmap, query_map, thresholds=thresholds)
+        residual = structured_residual(navmap, query_map, match_result=reverse)
+        conflict = _evidence_conflict_from_residual(query_map, residual, ctx)
         status = "reinstated"
-        if forward is not None:
-            reason = forward.reason
-            reverse = match_navmaps(navmap, query_map, thresholds=thresholds)
-            residual = structured_residual(navmap, query_map, match_result=reverse)
-            conflict = _evidence_conflict_from_residual(query_map, residual, ctx)
-            if conflict:
-                status = "reinstated_but_conflicts_with_current_evidence"
-                reason = "reliable_current_evidence_conflicts_with_memory"
+        reason = forward.reason
+        if conflict:
+            status = "reinstated_but_conflicts_with_current_evidence"
+            reason = "reliable_current_evidence_conflicts_with_memory"
         results.append(
             NavMapReinstatementV1(
                 candidate_ref=candidate,
@@ -1649,21 +1788,21 @@ def _winner_from_ranking(
 
 def _update_retrieval_counts(ctx: Any, transaction: NavMapRetrievalTransactionV1) -> None:
     """Update lightweight retrieval counts without modifying payload content."""
-    entries = _memory_index(ctx)
-    changed = False
+    entries, _refs, _tokens = _live_sparse_indexes(ctx)
     reinstated_ids = {item.candidate_ref.engram_id for item in transaction.reinstatements}
-    for engram_id in reinstated_ids:
+    for engram_id in sorted(reinstated_ids):
         entry = entries.get(engram_id)
-        if entry is None:
+        if not isinstance(entry, NavMapMemoryIndexEntryV1):
             continue
-        entries[engram_id] = replace(
+        _reindex_entry(
+            ctx,
             entry,
-            retrieval_count=entry.retrieval_count + 1,
-            last_retrieved_query_no=transaction.request.query_no,
+            replace(
+                entry,
+                retrieval_count=entry.retrieval_count + 1,
+                last_retrieved_query_no=transaction.request.query_no,
+            ),
         )
-        changed = True
-    if changed:
-        _rebuild_sparse_indexes(ctx, entries)
 
 
 def _store_retrieval(ctx: Any, transaction: NavMapRetrievalTransactionV1) -> dict[str, Any]:
@@ -2529,7 +2668,8 @@ def _signal_strengths(
 ) -> tuple[float, tuple[str, ...], bool, bool]:
     """Return strength, reasons, content-change, and unresolved flags."""
     ref_key = _ref_key(_map_ref(descriptor.navmap))
-    already_indexed = ref_key in _ref_index(ctx)
+    refs = getattr(ctx, "navmap_memory_ref_index_v1", None)
+    already_indexed = isinstance(refs, dict) and isinstance(refs.get(ref_key), str)
     reasons: list[str] = []
     strength = 0.0
     content_changed = False
@@ -82,6 +82,8 @@ from cca8_predictive import (
     compact_slot_map_text_v1 as _prediction_compact_map_text_v1,
     prediction_policy_expected_slots_v1,
 )
+from cca8_stage_memo import stage_memo_summary_v1
+from cca8_stage_profile import stage_timer_v1
 from cca8_terrain import terrain_wnm_observation_step_v1
 from cca8_standup_compare import (
     standup_advisory_observation_step_v1,
@@ -93,6 +95,8 @@ __version__ = "0.14.0"
 __all__ = [
     "NAVMAP_SCOPE_MARKER_V1",
     "NAVMAP_SCOPE_PROBES_V1",
+    "NAVMAP_STAGE_MEMO_INPUTS_V1",
+    "navmap_stage_memo_summary_v1",
     "navmap_observation_update_summary_v1",
     "render_navmap_observation_update_lines_v1",
     "navmap_observation_update_mini_line_v1",
@@ -1882,6 +1886,69 @@ def navmap_ctx_transition_from_payloads_v1(
     return transition_dict
 
 
+# Declared-input dependency graph of the NavMap observation stages.  Every stage
+# body runs every tick (it advances its observation/transaction counter, ages
+# support, stamps controller_steps/ticks, and appends a bounded history row), so
+# no stage is skipped.  Each entry names the pure derivations a stage memoizes
+# through cca8_stage_memo and the inputs its fingerprint is built from; the
+# result is reused while those inputs are unchanged and per-tick evidence refs
+# are rebound.  Stages mapped to an empty dict derive records that embed
+# per-tick identity (transaction or observation numbers, the sliding seqerr
+# sample window, WNM transactions), so there is nothing tick-invariant to reuse.
+NAVMAP_STAGE_MEMO_INPUTS_V1: dict[str, dict[str, tuple[str, ...]]] = {
+    "navmap.scene_body": {},
+    "navmap.v2_shadow": {
+        "navmap_v2_shadow.evidence_body_state": ("input_classification",),
+        "navmap_v2_shadow.evidence_compare": ("navmap_v2_shadow_body_ground", "input_classification"),
+    },
+    "navmap.maternal_geometry": {
+        "maternal_geometry.evidence_readout": ("input_classification", "evidence_element_geometry"),
+        "maternal_geometry.evidence_compare": (
+            "navmap_maternal_map",
+            "input_classification",
+            "evidence_element_geometry",
+        ),
+        "maternal_geometry.stable_readout": ("navmap_maternal_map",),
+        "maternal_geometry.root_view": (
+            "navmap_maternal_map",
+            "navmap_v2_shadow_root",
+            "navmap_maternal_root_view",
+        ),
+    },
+    "navmap.maternal_temporal": {},
+    "navmap.maternal_continuity": {},
+    "navmap.followmom_compare": {},
+    "navmap.followmom_advisory": {},
+    "navmap.terrain": {},
+    "navmap.feeding": {},
+    "navmap.live_dynamics": {},
+    "navmap.memory": {},
+    "navmap.standup_compare": {},
+    "navmap.standup_advisory": {},
+}
+
+
+def navmap_stage_memo_summary_v1(ctx: Any) -> dict[str, Any]:
+    """Return the declared stage dependency graph joined with memo hit/miss counters."""
+    memo = stage_memo_summary_v1(ctx)
+    counters = memo["derivations"]
+    stages: dict[str, Any] = {}
+    for stage, derivations in NAVMAP_STAGE_MEMO_INPUTS_V1.items():
+        stages[stage] = {
+            name: {
+                "inputs": list(inputs),
+                "hits": counters.get(name, {}).get("hits", 0),
+                "misses": counters.get(name, {}).get("misses", 0),
+            }
+            for name, inputs in derivations.items()
+        }
+    return {
+        "schema": "navmap_stage_memo_summary_v1",
+        "status": memo["status"],
+        "stages": stages,
+    }
+
+
 def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) -> dict[str, Any]:
     """Run the ordered NavMap observation pipeline and store runtime records.
 
@@ -1889,6 +1956,11 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     ctx-local diagnostic. Later bounded domains add operative-WNM transitions,
     temporal overlays, and Phase 8 sparse Column consolidation/retrieval. The
     function never writes WorldGraph truth or changes policy selection directly.
+
+    Every stage runs on every call.  Within a stage, the pure derivations
+    declared in :data:`NAVMAP_STAGE_MEMO_INPUTS_V1` are reused while their
+    input fingerprint is unchanged, so records match an unmemoized run tick
+    for tick (``ctx.stage_memo_enabled_v1 = False`` disables the reuse).
     """
     if ctx is None or env_obs is None:
         return {}
@@ -1911,12 +1983,13 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
         "profile": getattr(ctx, "profile", None),
     }
 
-    update = navmap_observation_update_from_env_obs_v1(
-        env_obs,
-        candidate_store,
-        basis=basis,
-        max_candidates=max_candidates,
-    )
+    with stage_timer_v1(ctx, "navmap.scene_body"):
+        update = navmap_observation_update_from_env_obs_v1(
+            env_obs,
+            candidate_store,
+            basis=basis,
+            max_candidates=max_candidates,
+        )
     update_dict = update.as_dict()
 
     store_update = update_dict.get("store_update", {})
@@ -1967,7 +2040,8 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     # records; BodyMap and the existing V1 path retain all current authority.
     shadow_updated = False
     try:
-        navmap_v2_shadow_observation_step_v1(ctx, env_obs)
+        with stage_timer_v1(ctx, "navmap.v2_shadow"):
+            navmap_v2_shadow_observation_step_v1(ctx, env_obs)
         shadow_updated = True
     except Exception as exc:  # defensive runtime diagnostic boundary
         ctx.navmap_v2_shadow_last_update = {
@@ -1985,7 +2059,8 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     # root reference.
     maternal_updated = False
     try:
-        maternal_geometry_shadow_observation_step_v1(ctx, env_obs)
+        with stage_timer_v1(ctx, "navmap.maternal_geometry"):
+            maternal_geometry_shadow_observation_step_v1(ctx, env_obs)
         maternal_updated = True
     except Exception as exc:  # defensive runtime diagnostic boundary
         ctx.navmap_maternal_last_update = {
@@ -2006,7 +2081,8 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     maternal_temporal_updated = False
     if maternal_updated:
         try:
-            maternal_temporal_shadow_observation_step_v1(ctx, env_obs)
+            with stage_timer_v1(ctx, "navmap.maternal_temporal"):
+                maternal_temporal_shadow_observation_step_v1(ctx, env_obs)
             maternal_temporal_updated = True
         except Exception as exc:  # defensive runtime diagnostic boundary
             ctx.navmap_maternal_temporal_last_update = {
@@ -2037,7 +2113,8 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     maternal_continuity_updated = False
     if maternal_updated:
         try:
-            maternal_continuity_shadow_observation_step_v1(ctx, env_obs)
+            with stage_timer_v1(ctx, "navmap.maternal_continuity"):
+                maternal_continuity_shadow_observation_step_v1(ctx, env_obs)
             maternal_continuity_updated = True
         except Exception as exc:  # defensive runtime diagnostic boundary
             ctx.navmap_maternal_continuity_last_update = {
@@ -2069,10 +2146,11 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     followmom_compare_updated = False
     if maternal_updated and maternal_temporal_updated and maternal_continuity_updated:
         try:
-            followmom_compare_observation_step_v1(
-                ctx,
-                applied_policy=applied_policy if isinstance(applied_policy, str) else None,
-            )
+            with stage_timer_v1(ctx, "navmap.followmom_compare"):
+                followmom_compare_observation_step_v1(
+                    ctx,
+                    applied_policy=applied_policy if isinstance(applied_policy, str) else None,
+                )
             followmom_compare_updated = True
         except Exception as exc:  # defensive runtime diagnostic boundary
             ctx.navmap_followmom_compare_last_update = {
@@ -2105,7 +2183,8 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     # defer, and review guidance. It cannot alter selection or protected safety.
     if followmom_compare_updated:
         try:
-            followmom_advisory_observation_step_v1(ctx)
+            with stage_timer_v1(ctx, "navmap.followmom_advisory"):
+                followmom_advisory_observation_step_v1(ctx)
         except Exception as exc:  # defensive runtime diagnostic boundary
             ctx.navmap_followmom_advisory = None
             ctx.navmap_followmom_advisory_last_update = {
@@ -2140,7 +2219,8 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     # The WNM-derived SurfaceGrid remains dual-run and can only add a
     # conservative safety veto; the legacy safety paths remain protected.
     try:
-        terrain_wnm_observation_step_v1(ctx, env_obs)
+        with stage_timer_v1(ctx, "navmap.terrain"):
+            terrain_wnm_observation_step_v1(ctx, env_obs)
     except Exception as exc:  # defensive runtime diagnostic boundary
         ctx.terrain_state_v1 = None
         ctx.terrain_policy_readout_v1 = None
@@ -2164,11 +2244,12 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     # applied by the environment. It does not select or execute a primitive.
     if maternal_updated and maternal_continuity_updated:
         try:
-            feeding_wnm_observation_step_v1(
-                ctx,
-                env_obs,
-                applied_policy=applied_policy if isinstance(applied_policy, str) else None,
-            )
+            with stage_timer_v1(ctx, "navmap.feeding"):
+                feeding_wnm_observation_step_v1(
+                    ctx,
+                    env_obs,
+                    applied_policy=applied_policy if isinstance(applied_policy, str) else None,
+                )
         except Exception as exc:  # defensive runtime diagnostic boundary
             ctx.feeding_last_update_v1 = {
                 "schema": "feeding_summary_v1",
@@ -2197,11 +2278,12 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     # dynamic envelopes with current evidence. It cannot select a primitive,
     # create an episodic record, or model detailed movement.
     try:
-        live_dynamics_observation_step_v1(
-            ctx,
-            env_obs,
-            applied_policy=applied_policy if isinstance(applied_policy, str) else None,
-        )
+        with stage_timer_v1(ctx, "navmap.live_dynamics"):
+            live_dynamics_observation_step_v1(
+                ctx,
+                env_obs,
+                applied_policy=applied_policy if isinstance(applied_policy, str) else None,
+            )
     except Exception as exc:  # defensive runtime diagnostic boundary
         ctx.live_dynamics_state_v1 = None
         ctx.live_dynamics_last_update_v1 = {
@@ -2221,11 +2303,12 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     # Phase 1C matching. Reliable current evidence defeats conflicting memory;
     # ready admission or associative jump remains a separate WNM transaction.
     try:
-        navmap_memory_observation_step_v1(
-            ctx,
-            env_obs,
-            applied_policy=applied_policy if isinstance(applied_policy, str) else None,
-        )
+        with stage_timer_v1(ctx, "navmap.memory"):
+            navmap_memory_observation_step_v1(
+                ctx,
+                env_obs,
+                applied_policy=applied_policy if isinstance(applied_policy, str) else None,
+            )
     except Exception as exc:  # defensive runtime diagnostic boundary
         ctx.navmap_memory_last_update_v1 = {
             "schema": "navmap_memory_summary_v1",
@@ -2245,10 +2328,11 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
     if shadow_updated:
         compare_updated = False
         try:
-            standup_compare_observation_step_v1(
-                ctx,
-                applied_policy=applied_policy if isinstance(applied_policy, str) else None,
-            )
+            with stage_timer_v1(ctx, "navmap.standup_compare"):
+                standup_compare_observation_step_v1(
+                    ctx,
+                    applied_policy=applied_policy if isinstance(applied_policy, str) else None,
+                )
             compare_updated = True
         except Exception as exc:  # defensive runtime diagnostic boundary
             ctx.navmap_standup_compare_last_update = {
@@ -2264,7 +2348,8 @@ def navmap_ctx_observation_update_step_v1(ctx: Ctx, env_obs: EnvObservation) ->
 
         if compare_updated:
             try:
-                standup_advisory_observation_step_v1(ctx)
+                with stage_timer_v1(ctx, "navmap.standup_advisory"):
+                    standup_advisory_observation_step_v1(ctx)
             except Exception as exc:  # defensive runtime diagnostic boundary
                 ctx.navmap_standup_advisory_last_update = {
                     "schema": "standup_advisory_summary_v1",
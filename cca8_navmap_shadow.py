@@ -69,10 +69,12 @@ from cca8_navmap_kernel import (
     NavStructuredResidualV1,
     apply_revision,
     body_state_evidence,
+    derive_navmap_revision,
     match_navmaps,
     propose_revision,
     structured_residual,
 )
+from cca8_stage_memo import stage_memo_v1
 
 __version__ = "0.2.0"
 
@@ -563,7 +565,8 @@ def _stable_body_map_from_evidence(
     parent_ref: Optional[NavMapRefV1],
 ) -> NavMapV2:
     """Copy evidence content into the stable maintained map family."""
-    return NavMapV2(
+    return derive_navmap_revision(
+        evidence_map,
         map_id=_BODY_MAP_ID,
         revision=revision,
         parent_ref=parent_ref,
@@ -857,7 +860,18 @@ def navmap_v2_shadow_observation_step_v1(ctx: Any, env_obs: EnvObservation) -> d
         env_obs,
         observation_no=observation_no,
     )
-    evidence_state = _body_state(evidence_map)
+    # Evidence content is fixed by the input classification (see
+    # _body_elements); only the per-observation map identity varies, so the
+    # pure derivations below are memoized on classification and rebound to
+    # this observation's evidence ref.
+    evidence_ref = _map_ref(evidence_map)
+    evidence_state = stage_memo_v1(
+        ctx,
+        "navmap_v2_shadow.evidence_body_state",
+        (classification,),
+        lambda: _body_state(evidence_map),
+        ref=evidence_ref,
+    )
     legacy_posture = _bodymap_posture_from_ctx(ctx)
     evidence_comparison = _comparison(evidence_state.interpretation, legacy_posture)
 
@@ -892,7 +906,13 @@ def navmap_v2_shadow_observation_step_v1(ctx: Any, env_obs: EnvObservation) -> d
         status = "created"
         changed = True
     elif evidence_complete and previous_body is not None:
-        residual, proposal = _compare_complete_evidence(previous_body, evidence_map)
+        residual, proposal = stage_memo_v1(
+            ctx,
+            "navmap_v2_shadow.evidence_compare",
+            (previous_body, classification),
+            lambda: _compare_complete_evidence(previous_body, evidence_map),
+            ref=evidence_ref,
+        )
         if proposal.decision is NavRevisionDecisionV1.KEEP:
             body_map = previous_body
             root_map = previous_root
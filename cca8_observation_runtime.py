@@ -750,8 +750,8 @@ def _inject_simple_valence_like_mom(
         b.tags = {"pred:valence:like"}
         return
     if isinstance(tags, list):
-        tags = set(tags)
-        b.tags = tags
+        b.tags = set(tags)
+        tags = b.tags
 
     if "pred:valence:like" not in tags:
         tags.add("pred:valence:like")
@@ -1612,6 +1612,10 @@ def _newborn_graph_has_pred_anywhere_v1(graph, pred_token: str) -> bool:
     want = f"pred:{token}"
 
     try:
+        has_tag = getattr(graph, "has_tag", None)
+        if callable(has_tag):
+            return bool(has_tag(want))
+
         bindings = getattr(graph, "_bindings", {})
         if not isinstance(bindings, dict):
             return False
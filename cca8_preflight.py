@@ -552,6 +552,8 @@ def run_preflight_full(args: Any, runtime: PreflightRuntime) -> int:
                     "__version__",
                 ],
             ),
+            ("cca8_stage_profile", ["stage_timer_v1", "stage_profile_summary_v1", "__version__"]),
+            ("cca8_stage_memo", ["stage_memo_v1", "stage_memo_summary_v1", "__version__"]),
             (
                 "cca8_working_memory",
                 [
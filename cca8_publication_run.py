@@ -37,16 +37,24 @@ The runner records the seed manifest, source-tree manifest, protocol metadata,
 initial batch metadata, job files, and process logs in a new output directory.
 It then launches ``cca8_publication_worker.py`` once per job using a fresh
 subprocess, a seed-specific ``PYTHONHASHSEED``, and disabled user-site package
-loading. Worker results are appended to consolidated ``workers.jsonl`` and
-``episodes.jsonl`` files while per-trial records remain available in their own
-job directories.
+loading. A bounded pool (``--jobs N``) may run several such subprocesses at
+once; every trial still gets its own interpreter. ``--fork-server`` instead
+starts one worker server per pool slot that verifies and imports the runtime
+once and forks a clean child for every trial, which cuts per-trial startup
+from the interpreter and import cost to a fork. Forked children share their
+server's fixed ``PYTHONHASHSEED`` rather than a seed-specific one, so this
+mode is refused for the frozen holdout. Worker results are appended
+to consolidated ``workers.jsonl`` and ``episodes.jsonl`` files strictly in job
+order while per-trial records remain available in their own job directories.
 
 After all subprocesses finish, batch validation checks job count, unique
 process nonces, worker process separation, manifest/source/protocol hashes,
 zero LLM calls, zero direct retrieved-hint use, and identical schedule hashes
 and seeds across matched A/B/C trials. A failed worker or failed invariant
-produces a dedicated failure record and stops the batch. A successful run
-writes final metadata and a checksum file covering the completed output tree.
+produces a dedicated failure record and stops the batch; ``--keep-going`` lets
+the other workers finish first. ``--resume`` continues a partial
+output directory and reuses every completed job. A successful run writes final
+metadata and a checksum file covering the completed output tree.
 
 The module also validates an already completed batch and provides a development
 order-invariance test. The latter reruns the same matched schedules in A-B-C
@@ -63,10 +71,13 @@ import copy
 import json
 import os
 import platform
+import queue
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
@@ -89,6 +100,9 @@ from cca8_publication_protocol import (
 
 __version__ = "1.0.0"
 BATCH_SCHEMA = "cca8_publication_batch_v1"
+LAUNCH_MODES = ("fresh_process", "fork_server")
+# Every fork-server child inherits its server's hash seed, so it is fixed.
+FORK_SERVER_HASH_SEED = "0"
 
 
 def _utc_now() -> str:
@@ -267,6 +281,164 @@ def validate_batch_records_v1(
     }
 
 
+class _ForkServerClientV1:
+    """One warmed ``cca8_publication_worker.py --serve`` process and its pipes."""
+
+    def __init__(self, worker_script: Path, source_root: Path, stderr_path: Path) -> None:
+        env = dict(os.environ)
+        env["PYTHONHASHSEED"] = FORK_SERVER_HASH_SEED
+        env["PYTHONNOUSERSITE"] = "1"
+        self._stderr = stderr_path.open("w", encoding="utf-8", newline="\n")
+        self.process = subprocess.Popen(
+            [sys.executable, str(worker_script), "--serve", "--source-root", str(source_root)],
+            cwd=str(source_root),
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            text=True,
+            encoding="utf-8",
+        )
+
+    def _read_reply(self) -> dict[str, Any]:
+        assert self.process.stdout is not None
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"fork server exited with status {self.process.wait()}")
+        value = json.loads(line)
+        if not isinstance(value, dict):
+            raise ValueError("fork server reply must be one JSON object")
+        return value
+
+    def wait_ready(self, *, source_tree_sha256: str, protocol_sha256: str) -> dict[str, Any]:
+        ready = self._read_reply()
+        if ready.get("ready") is not True:
+            raise RuntimeError("fork server did not report ready")
+        if ready.get("source_tree_sha256") != source_tree_sha256:
+            raise RuntimeError("fork server verified a different source tree")
+        if ready.get("protocol_sha256") != protocol_sha256:
+            raise RuntimeError("fork server verified a different protocol")
+        return ready
+
+    def run(self, job_path: Path, stdout_path: Path, stderr_path: Path) -> int:
+        assert self.process.stdin is not None
+        request = {"job": str(job_path), "stdout": str(stdout_path), "stderr": str(stderr_path)}
+        self.process.stdin.write(json.dumps(request, sort_keys=True) + "\n")
+        self.process.stdin.flush()
+        reply = self._read_reply()
+        if reply.get("job") != str(job_path):
+            raise RuntimeError("fork server replied for a different job")
+        return int(reply["returncode"])
+
+    def close(self) -> None:
+        try:
+            if self.process.stdin is not None:
+                self.process.stdin.close()
+            self.process.wait(timeout=60)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        finally:
+            if self.process.stdout is not None:
+                self.process.stdout.close()
+            self._stderr.close()
+
+
+def _run_worker_process_v1(
+    job: dict[str, Any],
+    job_path: Path,
+    *,
+    worker_script: Path,
+    source_root: Path,
+    logs_dir: Path,
+    stop: threading.Event,
+    fail_fast: bool,
+    servers: queue.Queue[_ForkServerClientV1] | None = None,
+) -> dict[str, Any] | None:
+    """Run one job in its own process; return ``None`` if skipped after a failure.
+
+    Without ``servers`` the job gets a fresh interpreter.  Otherwise an idle
+    fork server is borrowed and forks a child that writes the logs itself.
+    """
+    if stop.is_set():
+        return None
+    stdout_path = logs_dir / f"{job['job_id']}.stdout.txt"
+    stderr_path = logs_dir / f"{job['job_id']}.stderr.txt"
+    if servers is None:
+        env = dict(os.environ)
+        env["PYTHONHASHSEED"] = str(job["episode_seed"])
+        env["PYTHONNOUSERSITE"] = "1"
+        command = [sys.executable, str(worker_script), "--job", str(job_path), "--source-root", str(source_root)]
+        process = subprocess.run(
+            command,
+            cwd=str(source_root),
+            env=env,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+        stdout_path.write_text(process.stdout, encoding="utf-8", newline="\n")
+        stderr_path.write_text(process.stderr, encoding="utf-8", newline="\n")
+        returncode = process.returncode
+    else:
+        server = servers.get()
+        try:
+            returncode = server.run(job_path, stdout_path, stderr_path)
+        except (OSError, RuntimeError, ValueError) as exc:
+            with stderr_path.open("a", encoding="utf-8", newline="\n") as handle:
+                handle.write(f"[publication] fork server failed: {type(exc).__name__}: {exc}\n")
+            returncode = -1
+        finally:
+            servers.put(server)
+    if returncode != 0 and fail_fast:
+        stop.set()
+    return {
+        "returncode": returncode,
+        "stdout_path": stdout_path,
+        "stderr_path": stderr_path,
+    }
+
+
+def _completed_worker_result(job: dict[str, Any]) -> dict[str, Any] | None:
+    """Return a finished worker result left in ``job_dir`` by an earlier attempt."""
+    result_path = Path(job["job_dir"]) / "worker_result.json"
+    try:
+        worker_result = _load_json(result_path)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(worker_result, dict) or worker_result.get("job_id") != job["job_id"]:
+        return None
+    return worker_result
+
+
+def _resume_initial_metadata(output_dir: Path, expected: dict[str, Any]) -> dict[str, Any]:
+    """Load and check the metadata of a partial batch before resuming it."""
+    if (output_dir / "batch_metadata_final.json").exists():
+        raise ValueError(f"batch is already complete: {output_dir}")
+    initial = _load_json(output_dir / "batch_metadata_initial.json")
+    for key in (
+        "manifest_kind",
+        "manifest_sha256",
+        "source_tree_sha256",
+        "protocol_sha256",
+        "profiles",
+        "conditions",
+        "job_count",
+        "strict_python311",
+    ):
+        if initial.get(key) != expected.get(key):
+            raise ValueError(f"cannot resume batch: {key} differs from the partial output")
+    attempt = 1
+    failed_path = output_dir / "BATCH_FAILED.json"
+    while failed_path.exists():
+        archived = output_dir / f"BATCH_FAILED.attempt{attempt}.json"
+        if not archived.exists():
+            failed_path.rename(archived)
+            break
+        attempt += 1
+    return initial
+
+
 def run_batch_v1(
     *,
     manifest_path: Path,
@@ -277,11 +449,34 @@ def run_batch_v1(
     allow_development_python: bool,
     holdout_confirmation: str | None,
     quiet: bool = False,
+    parallel_jobs: int = 1,
+    fail_fast: bool = True,
+    resume: bool = False,
+    launch_mode: str = "fresh_process",
 ) -> dict[str, Any]:
-    """Execute a manifest as one fresh subprocess per episode."""
+    """Execute a manifest as one fresh subprocess per episode.
+
+    Up to ``parallel_jobs`` workers run at once, but results are consolidated
+    into ``workers.jsonl``/``episodes.jsonl`` strictly in job order, so the
+    output is identical to a sequential run.  With ``fail_fast`` no new worker
+    starts after any failure; otherwise the remaining jobs finish so a later
+    ``resume`` can reuse their results.  ``resume`` continues a partial output
+    directory, reusing every job whose ``worker_result.json`` is complete.
+    ``launch_mode="fork_server"`` forks each trial from ``parallel_jobs``
+    warmed worker servers instead of starting a new interpreter; development
+    manifests only.
+    """
+    if int(parallel_jobs) < 1:
+        raise ValueError("parallel_jobs must be positive")
+    if launch_mode not in LAUNCH_MODES:
+        raise ValueError(f"launch_mode must be one of {LAUNCH_MODES}")
+    if launch_mode == "fork_server" and not hasattr(os, "fork"):
+        raise RuntimeError("fork-server launch mode requires os.fork")
     manifest = load_manifest_v1(manifest_path)
     kind = str(manifest["manifest_kind"])
     if kind == "holdout":
+        if launch_mode != "fresh_process":
+            raise ValueError("the frozen holdout must run every trial in a fresh interpreter")
         if holdout_confirmation != "RUN_FROZEN_HOLDOUT":
             raise ValueError(
                 "holdout execution requires --confirm-holdout RUN_FROZEN_HOLDOUT"
@@ -299,9 +494,10 @@ def run_batch_v1(
 
     source_root = Path(__file__).resolve().parent
     output_dir = output_dir.resolve()
-    output_dir.mkdir(parents=True, exist_ok=False)
-    (output_dir / "jobs").mkdir()
-    (output_dir / "process_logs").mkdir()
+    if not resume:
+        output_dir.mkdir(parents=True, exist_ok=False)
+        (output_dir / "jobs").mkdir()
+        (output_dir / "process_logs").mkdir()
 
     source_manifest = source_tree_manifest_v1(source_root)
     protocol_meta = protocol_metadata_v1()
@@ -310,10 +506,6 @@ def run_batch_v1(
     if not jobs:
         raise ValueError("no jobs selected")
 
-    shutil.copy2(manifest_path, output_dir / "seed_manifest.json")
-    write_json_exclusive_v1(output_dir / "source_manifest.json", source_manifest)
-    write_json_exclusive_v1(output_dir / "protocol_metadata.json", protocol_meta)
-
     initial = {
         "schema": BATCH_SCHEMA,
         "batch_runner_version": __version__,
@@ -333,15 +525,27 @@ def run_batch_v1(
         "started_at_utc": _utc_now(),
         "status": "running",
     }
-    write_json_exclusive_v1(output_dir / "batch_metadata_initial.json", initial)
+    if resume:
+        initial = _resume_initial_metadata(output_dir, initial)
+    else:
+        shutil.copy2(manifest_path, output_dir / "seed_manifest.json")
+        write_json_exclusive_v1(output_dir / "source_manifest.json", source_manifest)
+        write_json_exclusive_v1(output_dir / "protocol_metadata.json", protocol_meta)
+        write_json_exclusive_v1(output_dir / "batch_metadata_initial.json", initial)
 
     worker_script = source_root / "cca8_publication_worker.py"
     workers: list[dict[str, Any]] = []
     episodes_path = output_dir / "episodes.jsonl"
     workers_path = output_dir / "workers.jsonl"
+    # Consolidated files are always rebuilt in job order, so a resumed batch
+    # ends byte-for-byte like an uninterrupted one.
+    episodes_path.unlink(missing_ok=True)
+    workers_path.unlink(missing_ok=True)
     started = time.perf_counter()
 
-    for ordinal, base_job in enumerate(jobs, start=1):
+    prepared: list[tuple[dict[str, Any], Path]] = []
+    reused: dict[str, dict[str, Any]] = {}
+    for base_job in jobs:
         job = dict(base_job)
         job_dir = output_dir / "episodes" / job["job_id"]
         job.update(
@@ -353,65 +557,111 @@ def run_batch_v1(
             }
         )
         job_path = output_dir / "jobs" / f"{job['job_id']}.json"
+        if resume:
+            worker_result = _completed_worker_result(job)
+            if worker_result is not None:
+                reused[job["job_id"]] = worker_result
+                prepared.append((job, job_path))
+                continue
+            # Discard whatever an interrupted attempt left behind for this job.
+            shutil.rmtree(job_dir, ignore_errors=True)
+            job_path.unlink(missing_ok=True)
         write_json_exclusive_v1(job_path, job)
+        prepared.append((job, job_path))
 
-        env = dict(os.environ)
-        env["PYTHONHASHSEED"] = str(job["episode_seed"])
-        env["PYTHONNOUSERSITE"] = "1"
-        command = [sys.executable, str(worker_script), "--job", str(job_path), "--source-root", str(source_root)]
-        process = subprocess.run(
-            command,
-            cwd=str(source_root),
-            env=env,
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        stdout_path = output_dir / "process_logs" / f"{job['job_id']}.stdout.txt"
-        stderr_path = output_dir / "process_logs" / f"{job['job_id']}.stderr.txt"
-        stdout_path.write_text(process.stdout, encoding="utf-8", newline="\n")
-        stderr_path.write_text(process.stderr, encoding="utf-8", newline="\n")
-
-        if process.returncode != 0:
-            failure = {
-                "schema": "cca8_publication_batch_failure_v1",
-                "job": job,
-                "returncode": process.returncode,
-                "stdout_path": str(stdout_path),
-                "stderr_path": str(stderr_path),
-                "failed_at_utc": _utc_now(),
+    stop = threading.Event()
+    failures: list[dict[str, Any]] = []
+    pending_count = sum(1 for job, _job_path in prepared if job["job_id"] not in reused)
+    servers: queue.Queue[_ForkServerClientV1] | None = None
+    clients: list[_ForkServerClientV1] = []
+    try:
+        if launch_mode == "fork_server" and pending_count:
+            servers = queue.Queue()
+            for index in range(min(int(parallel_jobs), pending_count)):
+                server_log = output_dir / "process_logs" / f"fork_server_{index}.stderr.txt"
+                clients.append(_ForkServerClientV1(worker_script, source_root, server_log))
+            for client in clients:
+                client.wait_ready(
+                    source_tree_sha256=str(source_manifest["source_tree_sha256"]),
+                    protocol_sha256=str(protocol_hash),
+                )
+                servers.put(client)
+        with ThreadPoolExecutor(max_workers=int(parallel_jobs)) as pool:
+            futures = {
+                job["job_id"]: pool.submit(
+                    _run_worker_process_v1,
+                    job,
+                    job_path,
+                    worker_script=worker_script,
+                    source_root=source_root,
+                    logs_dir=output_dir / "process_logs",
+                    stop=stop,
+                    fail_fast=fail_fast,
+                    servers=servers,
+                )
+                for job, job_path in prepared
+                if job["job_id"] not in reused
             }
-            write_json_exclusive_v1(output_dir / "BATCH_FAILED.json", failure)
-            raise RuntimeError(
-                f"worker failed for {job['job_id']}; see {stderr_path}"
-            )
-
-        result_path = job_dir / "worker_result.json"
-        worker_result = _load_json(result_path)
-        workers.append(worker_result)
-        _append_jsonl(workers_path, worker_result)
-
-        episode_record = dict(worker_result["episode_record"])
-        episode_record["publication_worker"] = {
-            "job_id": worker_result["job_id"],
-            "pid": worker_result["process"]["pid"],
-            "process_nonce": worker_result["process"]["process_nonce"],
-            "python_version": worker_result["process"]["python_version"],
-            "source_tree_sha256": worker_result["source_tree_sha256"],
-            "protocol_sha256": worker_result["protocol_sha256"],
-            "manifest_sha256": worker_result["manifest_sha256"],
-            "manifest_kind": worker_result["manifest_kind"],
-            "schedule_hash": worker_result["schedule_hash"],
-        }
-        _append_jsonl(episodes_path, episode_record)
-
-        if not quiet:
-            success = episode_record.get("success")
-            failure_reason = episode_record.get("publication_failure_reason")
-            print(
-                f"[publication] {ordinal:>3}/{len(jobs)} {job['job_id']} "
-                f"success={success} failure={failure_reason or '-'}"
-            )
+            for ordinal, (job, _job_path) in enumerate(prepared, start=1):
+                worker_result = reused.get(job["job_id"])
+                if worker_result is None:
+                    outcome = futures[job["job_id"]].result()
+                    if outcome is None or failures:
+                        continue
+                    if outcome["returncode"] != 0:
+                        failures.append(
+                            {
+                                "schema": "cca8_publication_batch_failure_v1",
+                                "job": job,
+                                "returncode": outcome["returncode"],
+                                "stdout_path": str(outcome["stdout_path"]),
+                                "stderr_path": str(outcome["stderr_path"]),
+                                "failed_at_utc": _utc_now(),
+                            }
+                        )
+                        if fail_fast:
+                            break
+                        continue
+                    worker_result = _load_json(Path(job["job_dir"]) / "worker_result.json")
+                if failures:
+                    continue
+                workers.append(worker_result)
+                _append_jsonl(workers_path, worker_result)
+
+                episode_record = dict(worker_result["episode_record"])
+                episode_record["publication_worker"] = {
+                    "job_id": worker_result["job_id"],
+                    "pid": worker_result["process"]["pid"],
+                    "process_nonce": worker_result["process"]["process_nonce"],
+                    "python_version": worker_result["process"]["python_version"],
+                    "source_tree_sha256": worker_result["source_tree_sha256"],
+                    "protocol_sha256": worker_result["protocol_sha256"],
+                    "manifest_sha256": worker_result["manifest_sha256"],
+                    "manifest_kind": worker_result["manifest_kind"],
+                    "schedule_hash": worker_result["schedule_hash"],
+                }
+                _append_jsonl(episodes_path, episode_record)
+
+                if not quiet:
+                    success = episode_record.get("success")
+                    failure_reason = episode_record.get("publication_failure_reason")
+                    print(
+                        f"[publication] {ordinal:>3}/{len(jobs)} {job['job_id']} "
+                        f"success={success} failure={failure_reason or '-'}"
+                    )
+            if failures:
+                stop.set()
+    finally:
+        for client in clients:
+            client.close()
+
+    if failures:
+        failure = dict(failures[0])
+        failure["consolidated_job_count"] = len(workers)
+        write_json_exclusive_v1(output_dir / "BATCH_FAILED.json", failure)
+        raise RuntimeError(
+            f"worker failed for {failure['job']['job_id']}; see {failure['stderr_path']}"
+        )
 
     validation = validate_batch_records_v1(
         workers,
@@ -434,6 +684,10 @@ def run_batch_v1(
             "validation": validation,
             "episode_jsonl": "episodes.jsonl",
             "worker_jsonl": "workers.jsonl",
+            "parallel_jobs": int(parallel_jobs),
+            "launch_mode": launch_mode,
+            "resumed": bool(resume),
+            "reused_job_count": len(reused),
         }
     )
     write_json_exclusive_v1(output_dir / "batch_metadata_final.json", final)
@@ -570,6 +824,18 @@ def _main() -> int:
     run_parser.add_argument("--allow-development-python", action="store_true")
     run_parser.add_argument("--confirm-holdout", default=None)
     run_parser.add_argument("--quiet", action="store_true")
+    run_parser.add_argument("--jobs", type=int, default=1, help="maximum concurrent worker processes")
+    run_parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="let other workers finish after a failure so --resume can reuse them",
+    )
+    run_parser.add_argument("--resume", action="store_true", help="continue a partial output directory")
+    run_parser.add_argument(
+        "--fork-server",
+        action="store_true",
+        help="fork each trial from warmed worker servers (development manifests only)",
+    )
 
     validate_parser = sub.add_parser("validate-results", help="validate a completed batch")
     validate_parser.add_argument("--batch", required=True)
@@ -594,6 +860,10 @@ def _main() -> int:
                 allow_development_python=bool(args.allow_development_python),
                 holdout_confirmation=args.confirm_holdout,
                 quiet=bool(args.quiet),
+                parallel_jobs=int(args.jobs),
+                fail_fast=not bool(args.keep_going),
+                resume=bool(args.resume),
+                launch_mode="fork_server" if args.fork_server else "fresh_process",
             )
         elif args.command == "validate-results":
             result = verify_existing_batch_v1(Path(args.batch))
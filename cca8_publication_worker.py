@@ -40,6 +40,12 @@ in-process memory stores, creates a fresh ``Ctx``, configures exactly one
 newborn long-horizon trial, disables LLM use, and calls the existing CCA8
 single-trial experiment entry point.
 
+With ``--serve`` the module instead runs as a fork server for development
+batches. It performs the same hash checks once, imports the runtime once, and
+then forks one child per job request read from stdin. Each child checks its
+job against the verified hashes, reseeds ``random``, clears the same shared
+stores, writes its own logs, and exits; the server reports only its exit code.
+
 After execution, the worker preserves the cycle-level and raw trial JSONL
 records, normalizes the trial summary into publication fields, and extracts
 mechanism details such as WorkingMap invalidations, guarded structural repairs,
@@ -61,12 +67,13 @@ import argparse
 import json
 import os
 import platform
+import random
 import secrets
 import shutil
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TextIO
 
 from cca8_publication_integrity import (
     protocol_hash_v1,
@@ -309,26 +316,44 @@ def _verify_schedule_record(job: dict[str, Any], episode: dict[str, Any]) -> lis
     return errors
 
 
-def run_worker_v1(job_path: Path, source_root: Path) -> dict[str, Any]:
-    '''docstring to do'''
-    source_root = source_root.resolve()
+def _verify_runtime_v1(source_root: Path) -> tuple[str, str]:
+    """Hash the source tree and protocol the runtime will be imported from."""
     if str(source_root) not in sys.path:
         sys.path.insert(0, str(source_root))
-    job = _load_json(job_path)
+    source_manifest = source_tree_manifest_v1(source_root)
+    return str(source_manifest["source_tree_sha256"]), protocol_hash_v1()
+
+
+def _check_job_v1(job: dict[str, Any], *, source_hash: str, protocol_hash: str) -> None:
     if job.get("protocol_version") != PROTOCOL_VERSION:
         raise ValueError("job protocol version mismatch")
     if bool(job.get("strict_python311")) and (sys.version_info.major, sys.version_info.minor) != (3, 11):
         raise RuntimeError("strict publication worker requires Python 3.11")
-
-    source_manifest = source_tree_manifest_v1(source_root)
-    source_hash = source_manifest["source_tree_sha256"]
-    protocol_hash = protocol_hash_v1()
     if source_hash != job.get("expected_source_tree_sha256"):
         raise RuntimeError("source tree changed after batch launch")
     if protocol_hash != job.get("expected_protocol_sha256"):
         raise RuntimeError("protocol changed after batch launch")
 
+
+def run_worker_v1(job_path: Path, source_root: Path) -> dict[str, Any]:
+    """Verify the frozen source and protocol, then run one job in this interpreter."""
+    source_root = source_root.resolve()
+    job = _load_json(job_path)
+    source_hash, protocol_hash = _verify_runtime_v1(source_root)
+    _check_job_v1(job, source_hash=source_hash, protocol_hash=protocol_hash)
     # Import only after integrity checks. Each invocation is a new interpreter.
+    return _execute_trial_v1(
+        job, source_hash=source_hash, protocol_hash=protocol_hash, launch_mode="fresh_process"
+    )
+
+
+def _execute_trial_v1(
+    job: dict[str, Any],
+    *,
+    source_hash: str,
+    protocol_hash: str,
+    launch_mode: str,
+) -> dict[str, Any]:
     import cca8_column  # pylint: disable=import-outside-toplevel
     import cca8_controller  # pylint: disable=import-outside-toplevel
     import cca8_run  # pylint: disable=import-outside-toplevel
@@ -400,6 +425,8 @@ def run_worker_v1(job_path: Path, source_root: Path) -> dict[str, Any]:
         "pid": os.getpid(),
         "parent_pid": os.getppid(),
         "process_nonce": secrets.token_hex(16),
+        "launch_mode": launch_mode,
+        "python_hash_seed": os.environ.get("PYTHONHASHSEED"),
         "python_executable": sys.executable,
         "python_version": platform.python_version(),
         "platform": platform.platform(),
@@ -429,13 +456,9 @@ def run_worker_v1(job_path: Path, source_root: Path) -> dict[str, Any]:
     return worker
 
 
-def _main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--job", required=True)
-    parser.add_argument("--source-root", required=True)
-    args = parser.parse_args()
+def _run_and_report_v1(run: Callable[[], dict[str, Any]]) -> int:
     try:
-        worker = run_worker_v1(Path(args.job), Path(args.source_root))
+        worker = run()
         print(json.dumps({"ok": True, "job_id": worker["job_id"]}, sort_keys=True))
         return 0
     except Exception as exc:
@@ -443,5 +466,112 @@ def _main() -> int:
         return 2
 
 
+def _redirect_output_fd(fd: int, path: Path) -> None:
+    target = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.dup2(target, fd)
+    finally:
+        os.close(target)
+
+
+def _fork_trial_v1(request: dict[str, Any], *, source_hash: str, protocol_hash: str) -> int:
+    """Fork one child from the warmed server, run the requested job there, and reap it."""
+    job_path = Path(request["job"])
+    stdout_path = Path(request["stdout"])
+    stderr_path = Path(request["stderr"])
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        code = 2
+        try:
+            _redirect_output_fd(1, stdout_path)
+            _redirect_output_fd(2, stderr_path)
+            # A fresh interpreter seeds ``random`` from OS entropy; do the same
+            # so children never share the server's generator state.
+            random.seed()
+
+            def run() -> dict[str, Any]:
+                job = _load_json(job_path)
+                _check_job_v1(job, source_hash=source_hash, protocol_hash=protocol_hash)
+                return _execute_trial_v1(
+                    job, source_hash=source_hash, protocol_hash=protocol_hash, launch_mode="fork_server"
+                )
+
+            code = _run_and_report_v1(run)
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)  # pylint: disable=protected-access
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def serve_fork_server_v1(source_root: Path, requests: TextIO, replies: TextIO) -> int:
+    """Import the verified runtime once, then fork one clean child per requested job.
+
+    The server hashes the source tree and protocol before importing ``cca8_run``
+    and announces the hashes on ``replies``.  Each line on ``requests`` is a
+    JSON object naming a job file and its stdout/stderr log paths; the server
+    answers with the job id and the child's exit code.  Children start from the
+    server's import-only state and still clear Column memory and the skill
+    ledger, so no trial observes another.  They inherit the server's
+    ``PYTHONHASHSEED``, which is therefore fixed for the whole server rather
+    than set per episode seed as in fresh-process mode.
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("fork-server mode requires os.fork")
+    source_root = source_root.resolve()
+    source_hash, protocol_hash = _verify_runtime_v1(source_root)
+    import cca8_run  # pylint: disable=import-outside-toplevel,unused-import
+
+    def reply(value: dict[str, Any]) -> None:
+        replies.write(json.dumps(value, sort_keys=True) + "\n")
+        replies.flush()
+
+    reply(
+        {
+            "ready": True,
+            "pid": os.getpid(),
+            "python_hash_seed": os.environ.get("PYTHONHASHSEED"),
+            "source_tree_sha256": source_hash,
+            "protocol_sha256": protocol_hash,
+        }
+    )
+    for line in requests:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        returncode = _fork_trial_v1(request, source_hash=source_hash, protocol_hash=protocol_hash)
+        reply({"job": str(request["job"]), "returncode": returncode})
+    return 0
+
+
+def _main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--job", default=None)
+    parser.add_argument("--source-root", required=True)
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="run as a fork server reading job requests from stdin",
+    )
+    args = parser.parse_args()
+    if args.serve:
+        # Replies use a private copy of stdout; anything the runtime prints
+        # goes to stderr instead of corrupting the request/reply channel.
+        reply_fd = os.dup(1)
+        os.dup2(2, 1)
+        try:
+            with os.fdopen(reply_fd, "w", encoding="utf-8") as replies:
+                return serve_fork_server_v1(Path(args.source_root), sys.stdin, replies)
+        except Exception as exc:
+            print(f"[publication-worker] ERROR: {type(exc).__name__}: {exc}", file=sys.stderr)
+            return 2
+    if args.job is None:
+        parser.error("--job is required unless --serve is given")
+    return _run_and_report_v1(lambda: run_worker_v1(Path(args.job), Path(args.source_root)))
+
+
 if __name__ == "__main__":
     raise SystemExit(_main())
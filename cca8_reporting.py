@@ -94,6 +94,7 @@ from cca8_predictive import (
     prediction_feedback_mini_line_v1,
     render_prediction_feedback_lines_v1,
 )
+from cca8_stage_profile import render_stage_profile_lines_v1
 from cca8_wnm_runtime import render_wnm_lines_v1, wnm_summary_v1
 
 __version__ = "0.5.1"
@@ -113,6 +114,7 @@ __all__ = [
     "print_env_loop_tag_legend_once",
     "mini_snapshot_text",
     "print_mini_snapshot",
+    "print_stage_profile_summary",
     "drives_and_tags_text",
     "skill_ledger_text",
     "skills_hud_text",
@@ -152,6 +154,8 @@ def _surfacegrid_ascii_terminal_block_v1(
 
 def print_working_map_snapshot(ctx, *, n: int = 15, title: str = "[workingmap] snapshot") -> None:
     """Print a tail snapshot of the WorkingMap graph, showing tags + a small edge preview."""
+    if bool(getattr(ctx, "headless", False)):
+        return
     ww = getattr(ctx, "working_world", None)
     if ww is None:
         print(f"{title}: (no working_world)")
@@ -289,6 +293,8 @@ def print_working_map_entity_table(ctx, *, title: str = "[workingmap] MapSurface
     This is intentionally a *MapSurface* view (entities + geometry), not the full binding log.
     Coordinates are stored in binding.meta['wm']['pos'] as {x,y,frame}.
     """
+    if bool(getattr(ctx, "headless", False)):
+        return
     ww = getattr(ctx, "working_world", None)
     if ww is None:
         print(f"{title}: (no working_world)")
@@ -1257,7 +1263,7 @@ def print_env_loop_tag_legend_once(ctx: Ctx) -> None:
     """
     if ctx is None:
         return
-    if ctx.env_loop_legend_printed:
+    if ctx.env_loop_legend_printed or bool(getattr(ctx, "headless", False)):
         return
     ctx.env_loop_legend_printed = True
 
@@ -1369,7 +1375,7 @@ def _print_cog_cycle_footer(*,
     - "Scratch writes" are summarized from the policy runtime's returned text (added bindings, executed line).
     - Column ops are summarized from the wm<->col store/retrieve/apply block when it ran this cycle.
     """
-    if not bool(getattr(ctx, "env_loop_cycle_summary", True)):
+    if not bool(getattr(ctx, "env_loop_cycle_summary", True)) or bool(getattr(ctx, "headless", False)):
         return
 
     try:
@@ -2185,6 +2191,8 @@ def mini_snapshot_text(world, ctx=None, limit: int = 50) -> str:
 def print_mini_snapshot(world, ctx=None, limit: int = 50) -> None:
     """Print the compact mini-snapshot (safe to call from menu flow).
     """
+    if bool(getattr(ctx, "headless", False)):
+        return
     try:
         print("Values of time measures, nodes and links at this point:")
         print(mini_snapshot_text(world, ctx, limit))
@@ -2192,6 +2200,19 @@ def print_mini_snapshot(world, ctx=None, limit: int = 50) -> None:
         pass
 
 
+def print_stage_profile_summary(ctx, *, limit: int = 12) -> None:
+    """Print the per-stage cognitive-cycle timing table when profiling is enabled."""
+    if ctx is None or bool(getattr(ctx, "headless", False)):
+        return
+    if not bool(getattr(ctx, "stage_profile_enabled_v1", False)):
+        return
+    try:
+        for line in render_stage_profile_lines_v1(ctx, limit=limit):
+            print(line)
+    except Exception:
+        pass
+
+
 def drives_and_tags_text(drives) -> str:
     """
     Human-readable drives panel with source annotations and a concise explainer.
@@ -142,6 +142,7 @@ import cca8_observation_runtime
 import cca8_policy_runtime
 import cca8_preflight
 import cca8_world_graph
+import cca8_snapshot
 from cca8_controller import (
     PRIMITIVES,
     skill_readout,
@@ -165,6 +166,7 @@ from cca8_controller import body_cliff_is_near     # pylint: disable=unused-impo
 from cca8_controller import body_shelter_is_near   # pylint: disable=unused-import
 from cca8_temporal import TemporalContext
 from cca8_column import mem as column_mem
+from cca8_stage_profile import stage_profile_begin_cycle_v1, stage_profile_cycle_record_v1, stage_profile_end_cycle_v1, stage_timer_v1
 from cca8_env import HybridEnvironment, EnvObservation, EnvConfig  # environment simulation (HybridEnvironment/EnvState/EnvObservation)
 from cca8_rcos import (
     SIM_ROBOT_GOAT_COMMANDS,
@@ -413,6 +415,7 @@ _quiet_solved_rest_tail_v1 = cca8_reporting._quiet_solved_rest_tail_v1
 _print_cog_cycle_footer = cca8_reporting._print_cog_cycle_footer
 mini_snapshot_text = cca8_reporting.mini_snapshot_text
 print_mini_snapshot = cca8_reporting.print_mini_snapshot
+print_stage_profile_summary = cca8_reporting.print_stage_profile_summary
 drives_and_tags_text = cca8_reporting.drives_and_tags_text
 skill_ledger_text = cca8_reporting.skill_ledger_text
 skills_hud_text = cca8_reporting.skills_hud_text
@@ -669,6 +672,8 @@ __all__ = [
     "world_delete_edge",
     "boot_prime_stand",
     "save_session",
+    "load_session",
+    "autosave_session",
     "versions_dict",
     "versions_text",
     "choose_contextual_base",
@@ -1096,8 +1101,6 @@ _wm_patch_center_xy_v1 = cca8_working_memory._wm_patch_center_xy_v1
 _wm_patch_index_v1 = cca8_working_memory._wm_patch_index_v1
 _wm_surfacegrid_mark_char_v1 = cca8_working_memory._wm_surfacegrid_mark_char_v1
 _wm_place_overlay_char_v1 = cca8_working_memory._wm_place_overlay_char_v1
-_navpatch_tag_jaccard = cca8_working_memory._navpatch_tag_jaccard
-_navpatch_extent_sim = cca8_working_memory._navpatch_extent_sim
 navpatch_similarity_v1 = cca8_working_memory.navpatch_similarity_v1
 navpatch_candidate_prior_bias_v1 = cca8_working_memory.navpatch_candidate_prior_bias_v1
 wm_apply_grid_slot_families_to_mapsurface_v1 = cca8_working_memory.wm_apply_grid_slot_families_to_mapsurface_v1
@@ -1748,7 +1751,9 @@ def experiments_menu_49_interactive(ctx: Ctx) -> None:
 #       - world_delete_edge(...), delete_edge_flow(...): engine + CLI helpers for removing edges.
 #       - Spatial stubs: _maybe_anchor_attach(...), add_spatial_relation(...).
 #   • Persistence & versioning:
-#       - save_session(...): atomic JSON snapshot of (world, drives, skills).
+#       - save_session(...): atomic snapshot of (world, drives, skills); JSON by default, binary (cca8_snapshot) for *.cca8b.
+#       - load_session(...): read either format back (binary files are recognized by their magic bytes).
+#       - autosave_session(...): loop_helper's autosave; binary paths append deltas to '<path>.journal'.
 #       - _module_version_and_path(...), versions_dict(), versions_text(): component versions + paths.
 #   • Embodiment stub:
 #       - HAL: hardware abstraction layer skeleton for future robot embodiments.
@@ -2118,28 +2123,100 @@ def add_spatial_supports(world, src_bid: str, dst_bid: str, meta: dict | None =
 # Persistence: atomic JSON autosave (world, drives, skills)
 # --------------------------------------------------------------------------------------
 
-def save_session(path: str, world, drives) -> str:
-    """Serialize (world, drives, skills) to JSON and atomically write to disk.
+def _session_format_for(path: str) -> str:
+    """'binary' for *.cca8b paths (fast autosave), otherwise 'json' (the default)."""
+    return "binary" if str(path).lower().endswith(cca8_snapshot.SNAPSHOT_SUFFIX) else "json"
+
+
+def save_session(path: str, world, drives, *, fmt: Optional[str] = None) -> str:
+    """Serialize (world, drives, skills) and atomically write to disk.
+
+    fmt: 'json' | 'binary' | None (None -> by extension: *.cca8b is the streamed binary
+    snapshot from cca8_snapshot, which does not build the whole world dict in memory and
+    is several times smaller; any other path, .json/.sav/no extension, is JSON).
 
     Returns:
         The ISO timestamp used as 'saved_at' in the file.
     """
+    fmt = fmt or _session_format_for(path)
+    if fmt not in ("json", "binary"):
+        raise ValueError("fmt must be 'json' or 'binary'")
     ts = datetime.now().isoformat(timespec="seconds")
-    data = {
+    header = {
         "saved_at": ts,
-        "world": world.to_dict(),
-        "drives": drives.to_dict(),
-        "skills": skills_to_dict(),
         "app_version": f"cca8_run/{__version__}",
         "platform": platform.platform(),
     }
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if fmt == "binary":
+        with open(tmp, "wb") as f:
+            cca8_snapshot.write_session_snapshot(f, world, drives.to_dict(), skills_to_dict(), header)
+    else:
+        data = {
+            "saved_at": ts,
+            "world": world.to_dict(),
+            "drives": drives.to_dict(),
+            "skills": skills_to_dict(),
+            "app_version": header["app_version"],
+            "platform": header["platform"],
+        }
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     os.replace(tmp, path)
     return ts
 
 
+# Autosave journals, one per binary autosave path (see autosave_session).
+_SESSION_JOURNALS: Dict[str, "cca8_snapshot.SessionJournal"] = {}
+
+
+def autosave_session(path: str, world, drives) -> str:
+    """Autosave entry point used by loop_helper: incremental for *.cca8b paths, full JSON rewrite otherwise.
+
+    Binary paths go through a cca8_snapshot.SessionJournal: the first save writes a full
+    snapshot, later saves append only the bindings/drives/skills that changed to
+    '<path>.journal', and the journal is periodically folded back into the snapshot.
+    load_session() replays the journal, so the two files together are the session.
+
+    Returns:
+        The ISO timestamp of this save.
+    """
+    if _session_format_for(path) == "json":
+        return save_session(path, world, drives)
+    ts = datetime.now().isoformat(timespec="seconds")
+    header = {
+        "saved_at": ts,
+        "app_version": f"cca8_run/{__version__}",
+        "platform": platform.platform(),
+    }
+    journal = _SESSION_JOURNALS.get(os.path.abspath(path))
+    if journal is None:
+        journal = _SESSION_JOURNALS[os.path.abspath(path)] = cca8_snapshot.SessionJournal(path)
+    journal.save(world, drives.to_dict(), skills_to_dict(), header)
+    return ts
+
+
+def load_session(path: str) -> dict:
+    """Read a session written by save_session/autosave_session (JSON or binary, detected by content).
+
+    Returns the session blob with 'world' already rebuilt as a WorldGraph; 'drives' and
+    'skills' stay plain dicts for Drives.from_dict(...) / skills_from_dict(...). For binary
+    snapshots, a matching '<path>.journal' of incremental autosaves is replayed on top.
+    """
+    if cca8_snapshot.is_snapshot_file(path):
+        with open(path, "rb") as f:
+            blob = cca8_snapshot.read_session_snapshot(f, cca8_world_graph.WorldGraph)
+        jpath = cca8_snapshot.journal_path(path)
+        if blob.get("journal_base") and os.path.exists(jpath):
+            with open(jpath, "rb") as f:
+                cca8_snapshot.replay_journal(f, blob)
+        return blob
+    with open(path, "r", encoding="utf-8") as f:
+        blob = json.load(f)
+    blob["world"] = cca8_world_graph.WorldGraph.from_dict(blob.get("world", {}))
+    return blob
+
+
 def _module_version_and_path(modname: str) -> tuple[str, str]:
     """Return (version_string, path) for a module name, safely.
     - If module can't be imported → ('-- unavailable (i.e.,not found)', '<name>.py')
@@ -2333,7 +2410,7 @@ def loop_helper(autosave_from_args: Optional[str], world, drives, ctx=None, time
     if time_limited:
         return #from the loop_helper (not menu loop), i.e., just return without doing anything
     if autosave_from_args:
-        save_session(autosave_from_args, world, drives)
+        autosave_session(autosave_from_args, world, drives)
         # Quiet by default; uncomment for debugging:
         # print(f"[autosaved {ts}] {autosave_from_args}")
     try:
@@ -2636,10 +2713,13 @@ def _engrams_on_binding(world, bid: str) -> list[str]:
 
 def _bfs_reachable(world, src: str, dst: str, max_hops: int = 3) -> bool:
     """Light BFS reachability within `max_hops` hops; early exit on first match.
+    -on a WorldGraph the cached distance field answers this without a fresh BFS
     """
     from collections import deque
     if src == dst:
         return True
+    if hasattr(world, "distance_field") and dst in world._bindings:
+        return dst in world.distance_field(src, max_hops=max_hops)
     q, seen, depth = deque([src]), {src}, {src: 0}
     while q:
         u = q.popleft()
@@ -2659,6 +2739,8 @@ def _bfs_reachable(world, src: str, dst: str, max_hops: int = 3) -> bool:
 def _bindings_with_pred(world, token: str) -> List[str]:
     """Return binding ids whose tags contain pred:<token> (exact match)."""
     want = _normalize_pred(token)
+    if hasattr(world, "bindings_with_tag"):
+        return world.bindings_with_tag(want)
     out = []
     for bid, b in world._bindings.items():
         for t in getattr(b, "tags", []):
@@ -2671,6 +2753,8 @@ def _bindings_with_pred(world, token: str) -> List[str]:
 def _bindings_with_cue(world, token: str) -> List[str]:
     """Return binding ids whose tags contain cue:<token> (exact match)."""
     want = f"cue:{token}"
+    if hasattr(world, "bindings_with_tag"):
+        return world.bindings_with_tag(want)
     out = []
     for bid, b in world._bindings.items():
         for t in getattr(b, "tags", []):
@@ -2683,12 +2767,18 @@ def _bindings_with_cue(world, token: str) -> List[str]:
 def any_cue_tokens_present(world, tokens: List[str]) -> bool:
     """Return True if **any** `cue:<token>` exists anywhere in the graph.
     """
+    if hasattr(world, "has_tag"):
+        return any(world.has_tag(f"cue:{tok}") for tok in tokens)
     return any(bool(_bindings_with_cue(world, tok)) for tok in tokens)
 
 
 def has_pred_near_now(world, token: str, hops: int = 3) -> bool:
     """Return True if any pred:<token> is reachable from NOW in ≤ `hops` edges."""
     now_id = _anchor_id(world, "NOW")
+    if hasattr(world, "tags_within"):
+        # one (cached) bounded sweep from NOW instead of one BFS per matching binding
+        want = _normalize_pred(token)
+        return bool(world.tags_within(now_id, [want], max_hops=hops).get(want))
     for bid in _bindings_with_pred(world, token):
         if _bfs_reachable(world, now_id, bid, max_hops=hops):
             return True
@@ -3201,6 +3291,9 @@ def _anchor_id(world, name="NOW") -> str:
     except Exception:
         pass
     # Fallback: scan tags
+    if hasattr(world, "bindings_with_tag"):
+        hits = world.bindings_with_tag(f"anchor:{name}")
+        return hits[0] if hits else "?"
     for bid, b in world._bindings.items():
         if any(t == f"anchor:{name}" for t in getattr(b, "tags", [])):
             return bid
@@ -3259,12 +3352,6 @@ def _sorted_bids(world) -> list[str]:
 # NavPatch (Phase X): predictive matching loop (priors OFF baseline)
 # -----------------------------------------------------------------------------
 
-# _navpatch_tag_jaccard moved to cca8_working_memory.py (Working Memory refactor Phase 2).
-
-
-# _navpatch_extent_sim moved to cca8_working_memory.py (Working Memory refactor Phase 2).
-
-
 # navpatch_similarity_v1 moved to cca8_working_memory.py (Working Memory refactor Phase 2).
 
 
@@ -3964,23 +4051,27 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
     if n_steps <= 0:
         print("[env-loop] N must be ≥ 1; nothing to do.")
         return
-    if teaching_mode:
+    # Headless runs (batch experiments) keep every state update and JSONL record
+    # but never build the console text below.
+    headless = bool(getattr(ctx, "headless", False))
+    if teaching_mode and not headless:
         print()
         print(menu37_teaching_intro_v1())
         print("\n".join(render_navmap_scope_legend_lines_v1()))
         print()
 
-    print_env_loop_tag_legend_once(ctx)
-    print(f"[env-loop] Running {n_steps} closed-loop cognitive cycle(s) (env↔controller).")
-    print("[env-loop] Each cognitive cycle will:")
-    print("  1) Advance controller_steps and the temporal soft clock (one drift),")
-    print("  2) Call env.reset() (first time) or env.step(last policy action),")
-    print("  3) Inject EnvObservation into the WorldGraph as pred:/cue: facts,")
-    print("  4) Run ONE controller step (Action Center) and store the last policy name.\n")
+    if not headless:
+        print_env_loop_tag_legend_once(ctx)
+        print(f"[env-loop] Running {n_steps} closed-loop cognitive cycle(s) (env↔controller).")
+        print("[env-loop] Each cognitive cycle will:")
+        print("  1) Advance controller_steps and the temporal soft clock (one drift),")
+        print("  2) Call env.reset() (first time) or env.step(last policy action),")
+        print("  3) Inject EnvObservation into the WorldGraph as pred:/cue: facts,")
+        print("  4) Run ONE controller step (Action Center) and store the last policy name.\n")
 
-    if not getattr(ctx, "env_episode_started", False):
-        print("[env-loop] Note: this episode has not started yet; the first cognitive cycle will call env.reset().")
-        print("[env-loop]       (With HAL ON, this is where we'd sample the first real sensor snapshot.)")
+        if not getattr(ctx, "env_episode_started", False):
+            print("[env-loop] Note: this episode has not started yet; the first cognitive cycle will call env.reset().")
+            print("[env-loop]       (With HAL ON, this is where we'd sample the first real sensor snapshot.)")
 
     # Start each env-loop run with a clean SG display cache so the first map
     # of the run is shown in full once, and later identical maps can collapse
@@ -3992,8 +4083,10 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
         pass
 
     for i in range(n_steps):
-        print(f"\n[env-loop] Cognitive Cycle {i+1}/{n_steps}")
-        if teaching_mode:
+        stage_profile_begin_cycle_v1(ctx)
+        if not headless:
+            print(f"\n[env-loop] Cognitive Cycle {i+1}/{n_steps}")
+        if teaching_mode and not headless:
             print(menu37_teaching_cycle_header_v1(i + 1, n_steps))
             print()
         # Per-cycle capture for the footer summary (reset each cycle).
@@ -4026,7 +4119,8 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
 
         # 2) Environment evolution (reset once, then step with last action)
         if not getattr(ctx, "env_episode_started", False):
-            env_obs, env_info = env.reset()
+            with stage_timer_v1(ctx, "env.reset"):
+                env_obs, env_info = env.reset()
             _phase7_reset_run_state() # phase7 s/w devpt: clear any previous run state on env reset
             ctx.env_episode_started = True
             ctx.env_last_action = None
@@ -4041,11 +4135,12 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
             live_dynamics_reset_v1(ctx)
             navmap_memory_reset_episode_v1(ctx)
             step_idx = env_info.get("step_index", 0)
-            print(
-                f"[env] Reset env scenario: "
-                f"episode_index={env_info.get('episode_index')} "
-                f"scenario={env_info.get('scenario_name')}"
-            )
+            if not headless:
+                print(
+                    f"[env] Reset env scenario: "
+                    f"episode_index={env_info.get('episode_index')} "
+                    f"scenario={env_info.get('scenario_name')}"
+                )
         else:
             # Snapshot previous EnvState so we can explain posture/nipple/zone changes.
             try:
@@ -4054,10 +4149,11 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
                 prev_state = None
 
             action_for_env = ctx.env_last_action
-            env_obs, _env_reward, _env_done, env_info = env.step(
-                action=action_for_env,
-                ctx=ctx,
-            )
+            with stage_timer_v1(ctx, "env.step"):
+                env_obs, _env_reward, _env_done, env_info = env.step(
+                    action=action_for_env,
+                    ctx=ctx,
+                )
             ctx.env_last_action = None
             ctx.navmap_pending_action_v1 = action_for_env if isinstance(action_for_env, str) else None
             try:
@@ -4066,19 +4162,20 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
                 ctx.navmap_pending_reward_v1 = 0.0
             st = env.state
             step_idx = env_info.get("step_index")
-            ctx_txt = ""
-            try:
-                c_label = getattr(st, "context_label", None)
-                if isinstance(c_label, str) and c_label:
-                    ctx_txt = f" context={c_label}"
-            except Exception:
+            if not headless:
                 ctx_txt = ""
-            print(
-                f"[env] env_step={step_idx} (since reset) "
-                f"stage={st.scenario_stage} posture={st.kid_posture} "
-                f"mom_distance={st.mom_distance} nipple_state={st.nipple_state}{ctx_txt} "
-                f"action={action_for_env!r}"
-            )
+                try:
+                    c_label = getattr(st, "context_label", None)
+                    if isinstance(c_label, str) and c_label:
+                        ctx_txt = f" context={c_label}"
+                except Exception:
+                    ctx_txt = ""
+                print(
+                    f"[env] env_step={step_idx} (since reset) "
+                    f"stage={st.scenario_stage} posture={st.kid_posture} "
+                    f"mom_distance={st.mom_distance} nipple_state={st.nipple_state}{ctx_txt} "
+                    f"action={action_for_env!r}"
+                )
 
         # --- Prediction error v1 record + legacy v0 vector (display/log only) ---
         # Compare last cycle's predicted postcondition (hypothesis) vs this cycle's observed env posture.
@@ -4107,10 +4204,11 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
                 src_txt = src if isinstance(src, str) and src else "(n/a)"
                 matched = feedback_step.get("matched")
 
-                print(
-                    f"[pred_err] v1 err={err_vec} pred_posture={pred_posture} obs_posture={obs_posture} "
-                    f"from={src_txt} matched={matched}"
-                )
+                if not headless:
+                    print(
+                        f"[pred_err] v1 err={err_vec} pred_posture={pred_posture} obs_posture={obs_posture} "
+                        f"from={src_txt} matched={matched}"
+                    )
             else:
                 err_vec = {}
 
@@ -4227,8 +4325,9 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
         except Exception:
             pass
 
-        obs_write = inject_obs_into_world(world, ctx, env_obs)
-        if teaching_mode:
+        with stage_timer_v1(ctx, "observation.inject"):
+            obs_write = inject_obs_into_world(world, ctx, env_obs)
+        if teaching_mode and not headless:
             print(menu37_teaching_after_observation_v1())
             print()
 
@@ -4306,7 +4405,7 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
             pass
 
         try:
-            if getattr(ctx, "wm_surfacegrid_enabled", False):
+            if getattr(ctx, "wm_surfacegrid_enabled", False) and not headless:
                 print(format_surfacegrid_snapshot_v1(ctx))
         except Exception:
             pass
@@ -4326,8 +4425,10 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
                 if getattr(ctx, "working_world", None) is None:
                     ctx.working_world = init_working_world()
                 exec_world = ctx.working_world
-            _wm_creative_update(policy_rt, world, drives, ctx, exec_world=exec_world)
-            fired = policy_rt.consider_and_maybe_fire(world, drives, ctx, exec_world=exec_world)
+            with stage_timer_v1(ctx, "policy.creative"):
+                _wm_creative_update(policy_rt, world, drives, ctx, exec_world=exec_world)
+            with stage_timer_v1(ctx, "policy.select"):
+                fired = policy_rt.consider_and_maybe_fire(world, drives, ctx, exec_world=exec_world)
 
             # PolicyRuntime exposes both the historical FollowMom gate/candidate
             # and the active Phase 4F gate/candidate. Phase 4D continues to record
@@ -4586,7 +4687,7 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
                 "error": str(exc),
             }
 
-        if teaching_mode:
+        if teaching_mode and not headless:
             print(menu37_teaching_after_controller_v1())
             print()
 
@@ -4630,127 +4731,129 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
             _phase7_start_or_extend_run(world, state_bid, policy_name, env_step=step_idx)
 
         # Short summary for this step + posture/nipple/zone explanations
-        try:
-            st = env.state
+        if not headless:
             try:
-                zone = body_space_zone(ctx)
-            except Exception:
-                zone = None
+                st = env.state
+                try:
+                    zone = body_space_zone(ctx)
+                except Exception:
+                    zone = None
 
-            # Clarify: env_* is storyboard truth; bm_* is the agent’s current belief cache (BodyMap).
-            try:
-                stale = bodymap_is_stale(ctx)
-            except Exception:
-                stale = False
+                # Clarify: env_* is storyboard truth; bm_* is the agent’s current belief cache (BodyMap).
+                try:
+                    stale = bodymap_is_stale(ctx)
+                except Exception:
+                    stale = False
 
-            try:
-                bm_posture = body_posture(ctx) if not stale else None
-            except Exception:
-                bm_posture = None
+                try:
+                    bm_posture = body_posture(ctx) if not stale else None
+                except Exception:
+                    bm_posture = None
 
-            # Expected posture: Scratch postcondition written by the last executed policy (if any).
-            expected_posture = None
-            if isinstance(policy_name, str) and policy_name:
-                for w in (getattr(ctx, "working_world", None), world):
-                    if w is None:
-                        continue
-                    _bid, posture_tag, meta = _latest_posture_binding(w, require_policy=True)
-                    if posture_tag and isinstance(meta, dict) and meta.get("policy") == policy_name:
-                        expected_posture = posture_tag.split(":")[-1]
-                        break
+                # Expected posture: Scratch postcondition written by the last executed policy (if any).
+                expected_posture = None
+                if isinstance(policy_name, str) and policy_name:
+                    for w in (getattr(ctx, "working_world", None), world):
+                        if w is None:
+                            continue
+                        _bid, posture_tag, meta = _latest_posture_binding(w, require_policy=True)
+                        if posture_tag and isinstance(meta, dict) and meta.get("policy") == policy_name:
+                            expected_posture = posture_tag.split(":")[-1]
+                            break
 
-            line = (
-                f"[env-loop] summary cognitive_cycle={i+1}/{n_steps} env_step={step_idx} stage={st.scenario_stage} "
-                f"env_posture={st.kid_posture} bm_posture={bm_posture or st.kid_posture} "
-                f"mom={st.mom_distance} nipple={st.nipple_state} last_policy={policy_name!r}"
-            )
-            if expected_posture is not None:
-                line += f" expected_posture={expected_posture}"
-            if zone is not None:
-                line += f" zone={zone}"
-            print(line)
+                line = (
+                    f"[env-loop] summary cognitive_cycle={i+1}/{n_steps} env_step={step_idx} stage={st.scenario_stage} "
+                    f"env_posture={st.kid_posture} bm_posture={bm_posture or st.kid_posture} "
+                    f"mom={st.mom_distance} nipple={st.nipple_state} last_policy={policy_name!r}"
+                )
+                if expected_posture is not None:
+                    line += f" expected_posture={expected_posture}"
+                if zone is not None:
+                    line += f" zone={zone}"
+                print(line)
 
-            if expected_posture is not None and str(expected_posture) != str(st.kid_posture):
-                print("[env-loop] note: expected_posture is a Scratch postcondition (hypothesis); env_posture is storyboard truth this tick.")
+                if expected_posture is not None and str(expected_posture) != str(st.kid_posture):
+                    print("[env-loop] note: expected_posture is a Scratch postcondition (hypothesis); env_posture is storyboard truth this tick.")
 
-            quiet_rest_tail = _quiet_solved_rest_tail_v1(
-                st,
-                zone,
-                action_for_env,
-                getattr(ctx, "env_last_action", None),
-            )
+                quiet_rest_tail = _quiet_solved_rest_tail_v1(
+                    st,
+                    zone,
+                    action_for_env,
+                    getattr(ctx, "env_last_action", None),
+                )
 
-            if not quiet_rest_tail:
-                # Explain why posture ended up as it is at this step.
-                try:
-                    posture_expl = _explain_posture_change(prev_state, st, action_for_env)
-                    if posture_expl:
-                        print(f"[env-loop] explain posture: {posture_expl}")
+                if not quiet_rest_tail:
+                    # Explain why posture ended up as it is at this step.
+                    try:
+                        posture_expl = _explain_posture_change(prev_state, st, action_for_env)
+                        if posture_expl:
+                            print(f"[env-loop] explain posture: {posture_expl}")
+
+                        if isinstance(getattr(st, "kid_posture", None), str) and st.kid_posture == "latched":
+                            print(
+                                "[env-loop] explain perception: in this early CCA8, the storyboard state "
+                                "'latched' is represented perceptually as posture:standing + nipple:latched + milk:drinking."
+                            )
+                    except Exception:
+                        pass
 
-                    if isinstance(getattr(st, "kid_posture", None), str) and st.kid_posture == "latched":
-                        print(
-                            "[env-loop] explain perception: in this early CCA8, the storyboard state "
-                            "'latched' is represented perceptually as posture:standing + nipple:latched + milk:drinking."
-                        )
-                except Exception:
-                    pass
+                    # Explain why nipple_state ended up as it is at this step.
+                    try:
+                        nipple_expl = _explain_nipple_change(prev_state, st, action_for_env)
+                        if nipple_expl:
+                            print(f"[env-loop] explain nipple: {nipple_expl}")
+                    except Exception:
+                        pass
 
-                # Explain why nipple_state ended up as it is at this step.
-                try:
-                    nipple_expl = _explain_nipple_change(prev_state, st, action_for_env)
-                    if nipple_expl:
-                        print(f"[env-loop] explain nipple: {nipple_expl}")
-                except Exception:
-                    pass
+                    # Explain why zone ended up as it is at this step.
+                    try:
+                        zone_expl = _explain_zone_change(prev_state, st, zone, ctx)
+                        if zone_expl:
+                            print(f"[env-loop] explain zone: {zone_expl}")
+                    except Exception:
+                        pass
 
-                # Explain why zone ended up as it is at this step.
+                # End-of-cycle footer: compact digest for fast scanning (Phase IX).
                 try:
-                    zone_expl = _explain_zone_change(prev_state, st, zone, ctx)
-                    if zone_expl:
-                        print(f"[env-loop] explain zone: {zone_expl}")
+                    _print_cog_cycle_footer(
+                        ctx=ctx,
+                        drives=drives,
+                        env_obs=env_obs,
+                        prev_state=prev_state,
+                        curr_state=st,
+                        env_step=step_idx,
+                        zone=zone,
+                        inj=obs_write if isinstance(obs_write, dict) else None,
+                        fired_txt=fired_txt if isinstance(fired_txt, str) else None,
+                        col_store_txt=col_store_txt,
+                        col_retrieve_txt=col_retrieve_txt,
+                        col_apply_txt=col_apply_txt,
+                        action_applied_this_step=action_for_env,
+                        next_action_for_env=getattr(ctx, "env_last_action", None),
+                        cycle_no=i + 1,
+                        cycle_total=n_steps,
+                    )
                 except Exception:
                     pass
-
-            # End-of-cycle footer: compact digest for fast scanning (Phase IX).
-            try:
-                _print_cog_cycle_footer(
-                    ctx=ctx,
-                    drives=drives,
-                    env_obs=env_obs,
-                    prev_state=prev_state,
-                    curr_state=st,
-                    env_step=step_idx,
-                    zone=zone,
-                    inj=obs_write if isinstance(obs_write, dict) else None,
-                    fired_txt=fired_txt if isinstance(fired_txt, str) else None,
-                    col_store_txt=col_store_txt,
-                    col_retrieve_txt=col_retrieve_txt,
-                    col_apply_txt=col_apply_txt,
-                    action_applied_this_step=action_for_env,
-                    next_action_for_env=getattr(ctx, "env_last_action", None),
-                    cycle_no=i + 1,
-                    cycle_total=n_steps,
-                )
             except Exception:
                 pass
-        except Exception:
-            pass
 
         # Cognitive storage oscilloscope: retain one bounded, read-only
         # architectural snapshot for every closed-loop cognitive cycle.
         try:
-            cca8_cognitive_scope.capture_cognitive_scope_snapshot_v1(
-                ctx,
-                env=env,
-                env_obs=env_obs,
-                world=world,
-                drives=drives,
-                policy_rt=policy_rt,
-                selected_policy=policy_name if isinstance(policy_name, str) else None,
-                action_applied=action_for_env if isinstance(action_for_env, str) else None,
-                env_step=step_idx if isinstance(step_idx, int) else None,
-                capture_kind="cognitive_cycle",
-            )
+            with stage_timer_v1(ctx, "cognitive_scope"):
+                cca8_cognitive_scope.capture_cognitive_scope_snapshot_v1(
+                    ctx,
+                    env=env,
+                    env_obs=env_obs,
+                    world=world,
+                    drives=drives,
+                    policy_rt=policy_rt,
+                    selected_policy=policy_name if isinstance(policy_name, str) else None,
+                    action_applied=action_for_env if isinstance(action_for_env, str) else None,
+                    env_step=step_idx if isinstance(step_idx, int) else None,
+                    capture_kind="cognitive_cycle",
+                )
         except Exception as exc:
             logging.error("[cognitive_scope] capture failed: %s", exc, exc_info=True)
 
@@ -4838,6 +4941,9 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
                     "standup_authority": standup_authority_summary_v1(ctx),
                     "standup_guarded": standup_guarded_summary_v1(ctx),
                 }
+                stage_profile = stage_profile_cycle_record_v1(ctx)
+                if stage_profile is not None:
+                    rec["stage_profile"] = stage_profile
                 try:
                     if getattr(st, "scenario_stage", None) == "goat_foraging_04_scan":
                         goat04_oracle = {
@@ -4919,7 +5025,10 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
                 append_cycle_json_record(ctx, rec)
         except Exception as e:
             logging.error("[cycle_json] record build/append failed: %s", e, exc_info=True)
+        stage_profile_end_cycle_v1(ctx)
 
+    if headless:
+        return
     print(
         "\n[env-loop] Closed-loop cognitive cycle complete. "
         "Inspect the retained signal path with Menu #3 Cognitive Storage Oscilloscope."
@@ -4927,6 +5036,7 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
     if teaching_mode:
         print()
         print(menu37_teaching_after_run_v1())
+    print_stage_profile_summary(ctx)
 
     try:
         if getattr(ctx, "working_enabled", False):
@@ -4961,6 +5071,9 @@ def run_env_closed_loop_steps(env, world, drives, ctx, policy_rt, n_steps: int,
 def _nearest_binding_with_pred(world, token: str, from_bid: str, max_hops: int = 3) -> str | None:
     """Return the first binding matching pred:<token> found by BFS from `from_bid` within `max_hops`."""
     want = token if token.startswith("pred:") else f"pred:{token}"
+    if hasattr(world, "tags_within"):
+        hits = world.tags_within(from_bid, [want], max_hops=max_hops).get(want)
+        return hits[0] if hits else None
     # BFS with early exit that returns the first binding matching the predicate
     from collections import deque
     q, seen, depth = deque([from_bid]), {from_bid}, {from_bid: 0}
@@ -5003,6 +5116,8 @@ def choose_contextual_base(world, ctx, targets: list[str] | None = None) -> dict
 def present_cue_bids(world) -> list[str]:
     """Return binding ids that carry any `cue:*` tag (unordered)
     """
+    if hasattr(world, "bindings_with_tag_family"):
+        return world.bindings_with_tag_family("cue")
     bids = []
     for bid, b in world._bindings.items():
         ts = getattr(b, "tags", [])
@@ -5417,13 +5532,27 @@ def interactive_loop(args: argparse.Namespace) -> None:
 
     # Main-menu presentation and deterministic routing live in cca8_cli.
 
+    # Persistent Column engrams: open before --load so restored engram pointers resolve
+    column_store = getattr(args, "column_store", None) or os.environ.get("CCA8_COLUMN_STORE", "").strip()
+    if column_store:
+        try:
+            column_mem.open_store(column_store)
+            print(f"Column store: {os.path.abspath(column_store)} ({column_mem.count()} engrams)")
+        except OSError as e:
+            print(f"[warn] could not open column store {column_store}: {e}; engrams stay in RAM.")
+
+    # Per-stage cycle timing (cca8_stage_profile): off unless asked for
+    stage_profile_env = os.environ.get("CCA8_STAGE_PROFILE", "").strip().lower()
+    if getattr(args, "stage_profile", False) or stage_profile_env in ("1", "true", "yes", "on"):
+        ctx.stage_profile_enabled_v1 = True
+        print("Stage profiling: ON (per-stage cycle timing shown after closed-loop runs)")
+
     # Attempt to load a prior session if requested
     if args.load:
         try:
-            with open(args.load, "r", encoding="utf-8") as f:
-                blob = json.load(f)
+            blob = load_session(args.load)
 
-            new_world  = cca8_world_graph.WorldGraph.from_dict(blob.get("world", {}))
+            new_world  = blob["world"]
             try:
                 new_drives = Drives.from_dict(blob.get("drives", {}))
             except Exception as e:
@@ -5440,8 +5569,8 @@ def interactive_loop(args: argparse.Namespace) -> None:
 
         except FileNotFoundError:
             print(f"The file {args.load} could not be found. The simulation will run as a new one.\n")
-        except json.JSONDecodeError as e:
-            print(f"[warn] --load: invalid JSON in {args.load}: {e}")
+        except (json.JSONDecodeError, cca8_snapshot.SnapshotError) as e:
+            print(f"[warn] --load: invalid session file {args.load}: {e}")
             print("The simulation will run as a new one.\n")
         except (PermissionError, OSError) as e:
             print(f"[warn] --load: could not read {args.load}: {e}")
@@ -5851,6 +5980,12 @@ You will be asked to choose the determination of a path from NOW or from a node
             if current_planner == "dijkstra":
                 print("Dijkstra search from anchor:NOW to a binding with pred:<token>.")
                 print("With all edges currently weight=1, this is effectively the same path as BFS.\n")
+            elif current_planner == "astar":
+                print("A* search from anchor:NOW to a binding with pred:<token> (Dijkstra guided by a heuristic).")
+                print("With no heuristic installed (h=0) this returns the same path as Dijkstra.\n")
+            elif current_planner == "bidirectional":
+                print("Bidirectional search: forward from anchor:NOW, backward from every binding with pred:<token>.")
+                print("Returns a lowest total edge weight path, like Dijkstra.\n")
             else:
                 print("BFS from anchor:NOW to a binding with pred:<token>. Prints raw id path and a pretty path.\n")
 
@@ -7059,13 +7194,19 @@ Capture scene -- creates a binding, stores an engram of some scene in one of the
                 current = getattr(world, "get_planner", lambda: "bfs")()
             except Exception:
                 current = "bfs"
-            print(f"\nCurrent planner: {current.upper()}  (BFS = fewest hops; Dijkstra = lowest total edge weight)")
+            print(f"\nCurrent planner: {current.upper()}  (BFS = fewest hops; Dijkstra/A*/Bidirectional = lowest total edge weight)")
             print("Note: Edge weights are read from edge.meta keys: 'weight' → 'cost' → 'distance' → 'duration_s' (default 1.0).")
             try:
-                sel = input("Choose planner: [b]fs / [d]ijkstra / [Enter]=keep → ").strip().lower()
+                sel = input("Choose planner: [b]fs / [d]ijkstra / [a]star / b[i]directional / [Enter]=keep → ").strip().lower()
             except (EOFError, KeyboardInterrupt):
                 sel = ""
-            if sel.startswith("b"):
+            if sel.startswith("i") or sel.startswith("bi"):
+                world.set_planner("bidirectional")
+                print("Planner set to Bidirectional (forward from start, backward from all goal bindings).")
+            elif sel.startswith("a"):
+                world.set_planner("astar")
+                print("Planner set to A* (Dijkstra + heuristic; h=0 unless one is installed via set_astar_heuristic).")
+            elif sel.startswith("b"):
                 world.set_planner("bfs")
                 print("Planner set to BFS (unweighted shortest path by hops).")
             elif sel.startswith("d"):
@@ -8993,16 +9134,15 @@ This "load session" is a manual one-shot load snapshot, i.e., you are retrieving
 
             ''')
 
-            print("Loads a prior JSON snapshot (world, drives, skills).")
+            print("Loads a prior session snapshot (world, drives, skills; JSON or binary).")
             print("The current simulation in memory will be discarded so make sure it is being autosaved or else manually")
             print("  save it, if you want to preserve the current program state.\n")
             path = input("Load from file (ENTER to exit back to the menu): ").strip()
             if path and os.path.exists(path):
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        blob = json.load(f)
+                    blob = load_session(path)
                     print(f"Loaded {path} (saved_at={blob.get('saved_at','?')})")
-                    new_world  = cca8_world_graph.WorldGraph.from_dict(blob.get("world", {}))
+                    new_world  = blob["world"]
                     new_drives = Drives.from_dict(blob.get("drives", {}))
                     skills_from_dict(blob.get("skills", {}))
                     world, drives = new_world, new_drives
@@ -9069,6 +9209,9 @@ By contrast, if you simply exit and later restart with >python cca8_run.py --aut
                             print(f"\n1. Deleted {path}.")
                         else:
                             print(f"1. Hmmm... no file at {path} (nothing to delete).")
+                        jpath = cca8_snapshot.journal_path(path)
+                        if os.path.exists(jpath):
+                            os.remove(jpath)   # incremental autosave journal (binary autosave paths)
                     except Exception as e:
                         print(f"[warn] Could not delete {path}: {e}")
                     # Reinitialize episode state
@@ -9214,9 +9357,12 @@ def main(argv: Optional[list[str]] = None) -> int:
     )
     p.add_argument("--preflight", action="store_true", help="Run full unit tests and preflight and exit")
     #p.add_argument("--write-artifacts", action="store_true", help="Write preflight artifacts to disk")
-    p.add_argument("--load", help="Load session from JSON file")
-    p.add_argument("--save", help="Save session to JSON file on exit")
-    p.add_argument("--autosave", help="Autosave session to JSON file after each action")
+    p.add_argument("--load", help="Load session from file (JSON or binary snapshot)")
+    p.add_argument("--save", help="Save session to file on exit (JSON; a *.cca8b path uses the binary snapshot)")
+    p.add_argument("--autosave", help="Autosave session after each action (JSON; a *.cca8b path, e.g. session.cca8b, uses the binary snapshot)")
+    p.add_argument("--column-store", help="Directory for the persistent engram (Column) store; also CCA8_COLUMN_STORE")
+    p.add_argument("--stage-profile", action="store_true",
+                   help="Time each closed-loop cycle stage (cca8_stage_profile); also CCA8_STAGE_PROFILE=1")
 
     try:
         args = p.parse_args(argv)
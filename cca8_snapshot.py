@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+"""
+CCA8 binary session snapshots
+
+Purpose
+-------
+Autosave runs after every menu action (loop_helper -> save_session). Writing the whole
+session as indented JSON means building the full world.to_dict() tree in memory and
+pushing it through the pure-Python json encoder each time. This module provides a
+compact, versioned binary codec that streams one record per binding instead.
+
+File layout (version 1)
+-----------------------
+    MAGIC (8 bytes: b"CCA8SNP\\0") + u16 little-endian format version
+    record*   where record = kind (1 byte) + varint payload length + payload
+    kinds:    H header {saved_at, app_version, platform}
+              W world head {anchors, latest, memory_mode, version, storage?}
+              B one binding [id, tags, edges, meta, engrams]
+              D drives dict          S skill ledger dict
+              E end marker (empty payload)
+
+Payloads are tagged values (None/bool/int/float/str/list/dict) with varint lengths.
+Strings are interned across the whole file: the first occurrence is written inline and
+later ones as a small integer reference, so repeated tags/labels/ids cost 1-3 bytes.
+Values follow JSON semantics (tuples -> lists, non-string dict keys -> strings), so a
+snapshot loads into the same objects a JSON session would. JSON remains the default
+session format; save_session writes this one only for SNAPSHOT_SUFFIX (*.cca8b) paths
+or an explicit fmt="binary".
+
+Delta journal
+-------------
+SessionJournal makes autosave incremental: the first save (and every compaction) writes
+a full snapshot tagged with a random `journal_base`; later saves append one segment to
+`<path>.journal` holding only what changed since the previous save:
+
+    segment = MAGIC + version, H {saved_at, ..., base}, W world head,
+              U [id, tags, edges, meta, engrams] per added/changed binding,
+              X id per removed binding, D drives / S skills (only if changed), E
+
+Each segment is self-contained (its own string table), so a torn final segment is simply
+ignored on load, and segments whose `base` does not match the snapshot (a journal left
+over from before a compaction or a manual save) are skipped. Replay applies segments in
+order on top of the snapshot. Changed bindings come from WorldGraph.track_changes().
+
+Traceability-Lite
+-----------------
+- REQ-PERS-09: session snapshots are versioned; unknown record kinds are skipped.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import uuid
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+__version__ = "0.1.0"
+__all__ = [
+    "MAGIC",
+    "FORMAT_VERSION",
+    "SNAPSHOT_SUFFIX",
+    "SnapshotError",
+    "SnapshotWriter",
+    "SnapshotReader",
+    "is_snapshot_file",
+    "write_session_snapshot",
+    "read_session_snapshot",
+    "SessionJournal",
+    "journal_path",
+    "replay_journal",
+    "__version__",
+]
+
+MAGIC = b"CCA8SNP\x00"
+FORMAT_VERSION = 1
+SNAPSHOT_SUFFIX = ".cca8b"
+
+# value tags
+_T_NONE, _T_FALSE, _T_TRUE, _T_INT, _T_FLOAT, _T_STR_NEW, _T_STR_REF, _T_LIST, _T_DICT = range(9)
+
+_pack_d = struct.Struct("<d").pack
+_unpack_d = struct.Struct("<d").unpack_from
+
+
+class SnapshotError(ValueError):
+    """Raised for malformed or unsupported snapshot files."""
+
+
+def _json_key(k: Any) -> str:
+    """Coerce a dict key the way json.dumps does."""
+    if isinstance(k, str):
+        return k
+    if k is True:
+        return "true"
+    if k is False:
+        return "false"
+    if k is None:
+        return "null"
+    if isinstance(k, float):
+        if k != k:
+            return "NaN"
+        if k in (float("inf"), float("-inf")):
+            return "Infinity" if k > 0 else "-Infinity"
+        return repr(k)
+    if isinstance(k, int):
+        return str(k)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(k).__name__}")
+
+
+def _put_varint(buf: bytearray, n: int) -> None:
+    while n > 0x7F:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+def _get_varint(data, pos: int) -> Tuple[int, int]:
+    n = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+class SnapshotWriter:
+    """Streams snapshot records to a binary file object (string table shared across records)."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self._strings: Dict[str, int] = {}
+        f.write(MAGIC + struct.pack("<H", FORMAT_VERSION))
+
+    def _put_str(self, buf: bytearray, s: str) -> None:
+        ref = self._strings.get(s)
+        if ref is not None:
+            buf.append(_T_STR_REF)
+            _put_varint(buf, ref)
+            return
+        self._strings[s] = len(self._strings)
+        raw = s.encode("utf-8")
+        buf.append(_T_STR_NEW)
+        _put_varint(buf, len(raw))
+        buf += raw
+
+    def _put(self, buf: bytearray, v: Any) -> None:
+        t = type(v)
+        if t is str:
+            self._put_str(buf, v)
+        elif v is None:
+            buf.append(_T_NONE)
+        elif t is bool:
+            buf.append(_T_TRUE if v else _T_FALSE)
+        elif t is int:
+            buf.append(_T_INT)
+            _put_varint(buf, (v << 1) if v >= 0 else ((-v << 1) - 1))   # zigzag
+        elif t is float:
+            buf.append(_T_FLOAT)
+            buf += _pack_d(v)
+        elif t is dict or isinstance(v, dict):
+            buf.append(_T_DICT)
+            _put_varint(buf, len(v))
+            for k, x in v.items():
+                self._put_str(buf, k if type(k) is str else _json_key(k))
+                self._put(buf, x)
+        elif t is list or isinstance(v, (list, tuple)):
+            buf.append(_T_LIST)
+            _put_varint(buf, len(v))
+            for x in v:
+                self._put(buf, x)
+        elif isinstance(v, str):
+            self._put_str(buf, str(v))
+        elif isinstance(v, bool):
+            buf.append(_T_TRUE if v else _T_FALSE)
+        elif isinstance(v, int):
+            self._put(buf, int(v))
+        elif isinstance(v, float):
+            self._put(buf, float(v))
+        else:
+            raise TypeError(f"Object of type {t.__name__} is not snapshot serializable")
+
+    def record(self, kind: bytes, value: Any = None) -> None:
+        """Write one length-prefixed record of `kind` (a single byte) holding `value`."""
+        body = bytearray()
+        if kind != b"E":
+            self._put(body, value)
+        head = bytearray(kind)
+        _put_varint(head, len(body))
+        self._f.write(head)
+        self._f.write(body)
+
+
+class SnapshotReader:
+    """Iterates (kind, value) records from a snapshot file object."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self._strings: List[str] = []
+        head = f.read(len(MAGIC) + 2)
+        if len(head) < len(MAGIC) + 2 or head[:len(MAGIC)] != MAGIC:
+            raise SnapshotError("not a CCA8 snapshot (bad magic)")
+        (self.version,) = struct.unpack("<H", head[len(MAGIC):])
+        if self.version > FORMAT_VERSION:
+            raise SnapshotError(f"snapshot format v{self.version} is newer than supported v{FORMAT_VERSION}")
+
+    def _get(self, data, pos: int) -> Tuple[Any, int]:
+        # hot path: single-byte varints are inlined (almost every length/ref in a session)
+        t = data[pos]
+        if t < _T_INT or t == _T_FLOAT:
+            return self._get_scalar(t, data, pos + 1)
+        n = data[pos + 1]
+        if n < 0x80:
+            pos += 2
+        else:
+            n, pos = _get_varint(data, pos + 1)
+        if t == _T_STR_REF:
+            return self._strings[n], pos
+        if t == _T_DICT:
+            d: Dict[str, Any] = {}
+            get = self._get
+            for _ in range(n):
+                k, pos = get(data, pos)
+                d[k], pos = get(data, pos)
+            return d, pos
+        if t == _T_STR_NEW:
+            s = str(data[pos:pos + n], "utf-8")
+            self._strings.append(s)
+            return s, pos + n
+        if t == _T_LIST:
+            out = []
+            get = self._get
+            for _ in range(n):
+                x, pos = get(data, pos)
+                out.append(x)
+            return out, pos
+        if t == _T_INT:
+            return ((n >> 1) if not n & 1 else -((n + 1) >> 1)), pos
+        raise SnapshotError(f"unknown value tag {t}")
+
+    @staticmethod
+    def _get_scalar(t: int, data, pos: int) -> Tuple[Any, int]:
+        if t == _T_FLOAT:
+            return _unpack_d(data, pos)[0], pos + 8
+        if t == _T_NONE:
+            return None, pos
+        if t == _T_TRUE:
+            return True, pos
+        return False, pos
+
+    def __iter__(self) -> Iterator[Tuple[bytes, Any]]:
+        read = self._f.read
+        while True:
+            kind = read(1)
+            if not kind:
+                raise SnapshotError("truncated snapshot (missing end marker)")
+            n = shift = 0
+            while True:
+                b = read(1)
+                if not b:
+                    raise SnapshotError("truncated snapshot record header")
+                n |= (b[0] & 0x7F) << shift
+                if b[0] < 0x80:
+                    break
+                shift += 7
+            if kind == b"E":
+                return
+            body = read(n)
+            if len(body) != n:
+                raise SnapshotError("truncated snapshot record")
+            # unknown kinds are still decoded: they may define interned strings used later
+            value, _ = self._get(body, 0)
+            yield kind, value
+
+
+def is_snapshot_file(path: str) -> bool:
+    """Return True if `path` starts with the binary snapshot magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_session_snapshot(f: BinaryIO, world, drives_dict: dict, skills_dict: dict, header: dict) -> None:
+    """Stream a whole session (header, world, drives, skills) to `f`, one record per binding."""
+    w = SnapshotWriter(f)
+    w.record(b"H", header)
+    w.record(b"W", world._persist_head())   # pylint: disable=protected-access
+    for bid, b in world.iter_bindings():
+        w.record(b"B", [bid, list(b.tags), b.edges, b.meta, b.engrams])
+    w.record(b"D", drives_dict)
+    w.record(b"S", skills_dict)
+    w.record(b"E")
+
+
+def read_session_snapshot(f: BinaryIO, world_cls) -> Dict[str, Any]:
+    """Read a session snapshot; return a blob shaped like a JSON session but with a built 'world'.
+
+    The WorldGraph is constructed incrementally from the binding records (no intermediate
+    world dict). Keys: saved_at, app_version, platform, world (WorldGraph), drives, skills.
+    """
+    blob: Dict[str, Any] = {"drives": {}, "skills": {}}
+    world: Optional[Any] = None
+    head: Dict[str, Any] = {}
+    for kind, value in SnapshotReader(f):
+        if kind == b"H":
+            blob.update(value or {})
+        elif kind == b"W":
+            head = value or {}
+            storage = head.get("storage")
+            world = world_cls(memory_mode=head.get("memory_mode", "episodic"),
+                              storage=storage if storage in ("dict", "compact") else None)
+        elif kind == b"B":
+            if world is None:
+                raise SnapshotError("binding record before world header")
+            world.restore_binding(*value)
+        elif kind == b"D":
+            blob["drives"] = value or {}
+        elif kind == b"S":
+            blob["skills"] = value or {}
+    if world is None:
+        world = world_cls()
+    world._finish_restore(head)   # pylint: disable=protected-access
+    blob["world"] = world
+    return blob
+
+
+# --------------------------------------------------------------------------------------
+# Delta journal (incremental autosave)
+# --------------------------------------------------------------------------------------
+
+def journal_path(path: str) -> str:
+    """Return the journal file that accompanies the snapshot at `path`."""
+    return path + ".journal"
+
+
+def replay_journal(f: BinaryIO, blob: Dict[str, Any]) -> int:
+    """Apply the journal segments in `f` that belong to `blob`'s snapshot; return how many applied.
+
+    `blob` is the result of read_session_snapshot(); its world/drives/skills/saved_at are
+    updated in place. A truncated trailing segment (crash mid-append) is ignored.
+    """
+    base = blob.get("journal_base")
+    world = blob["world"]
+    applied = 0
+    head: Optional[Dict[str, Any]] = None
+    while True:
+        if not f.read(1):
+            break
+        f.seek(-1, os.SEEK_CUR)
+        try:
+            records = list(SnapshotReader(f))
+        except SnapshotError:
+            break   # torn tail
+        header = records[0][1] if records and records[0][0] == b"H" else {}
+        if base is None or header.get("base") != base:
+            continue
+        for kind, value in records:
+            if kind == b"U":
+                world.restore_binding(*value)
+            elif kind == b"X":
+                world.delete_binding(value, prune_incoming=False, prune_anchors=False)
+            elif kind == b"W":
+                head = value or {}
+            elif kind == b"D":
+                blob["drives"] = value or {}
+            elif kind == b"S":
+                blob["skills"] = value or {}
+        blob["saved_at"] = header.get("saved_at", blob.get("saved_at"))
+        applied += 1
+    if head is not None:
+        world._finish_restore(head)   # pylint: disable=protected-access
+    return applied
+
+
+class SessionJournal:
+    """Incremental autosave for one snapshot path: full snapshot + appended delta segments.
+
+    save() writes a full snapshot (and restarts the journal) when there is no base yet, when
+    a different WorldGraph object is being saved, when the snapshot file was rewritten by
+    someone else (e.g., a manual save), or when the journal has grown past
+    `compact_ratio` x snapshot size or `max_segments` segments. Otherwise it appends only
+    the changes since the previous save.
+    """
+
+    def __init__(self, path: str, *, compact_ratio: float = 0.5, max_segments: int = 500) -> None:
+        self.path = path
+        self.compact_ratio = float(compact_ratio)
+        self.max_segments = int(max_segments)
+        self._world: Optional[Any] = None
+        self._base: Optional[str] = None
+        self._base_bytes = 0
+        self._base_stat: Optional[Tuple[int, int]] = None
+        self._segments = 0
+        self._last: Tuple[Any, Any, Any] = (None, None, None)
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def _needs_full(self, world) -> bool:
+        if self._base is None or world is not self._world or not world.is_tracking_changes():
+            return True
+        if self._stat() != self._base_stat:
+            return True
+        if self._segments >= self.max_segments:
+            return True
+        try:
+            jbytes = os.path.getsize(journal_path(self.path))
+        except OSError:
+            jbytes = 0
+        return jbytes > max(self._base_bytes * self.compact_ratio, 64 * 1024)
+
+    def compact(self, world, drives_dict: dict, skills_dict: dict, header: dict) -> None:
+        """Fold everything into a fresh full snapshot and start an empty journal."""
+        base = uuid.uuid4().hex
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            write_session_snapshot(f, world, drives_dict, skills_dict, dict(header, journal_base=base))
+        os.replace(tmp, self.path)
+        try:
+            os.remove(journal_path(self.path))
+        except FileNotFoundError:
+            pass
+        world.track_changes(True)   # changes are counted from this snapshot on
+        self._world, self._base, self._segments = world, base, 0
+        self._base_stat = self._stat()
+        self._base_bytes = self._base_stat[0] if self._base_stat else 0
+        self._last = (world._persist_head(), drives_dict, skills_dict)   # pylint: disable=protected-access
+
+    def save(self, world, drives_dict: dict, skills_dict: dict, header: dict) -> str:
+        """Persist the session; return 'full', 'delta' or 'unchanged'."""
+        if self._needs_full(world):
+            self.compact(world, drives_dict, skills_dict, header)
+            return "full"
+        head = world._persist_head()   # pylint: disable=protected-access
+        upserts, removed = world.pop_changes()
+        last_head, last_drives, last_skills = self._last
+        if not upserts and not removed and (head, drives_dict, skills_dict) == (last_head, last_drives, last_skills):
+            return "unchanged"
+        with open(journal_path(self.path), "ab") as f:
+            w = SnapshotWriter(f)
+            w.record(b"H", dict(header, base=self._base))
+            w.record(b"W", head)
+            for bid, b in upserts:
+                w.record(b"U", [bid, list(b.tags), b.edges, b.meta, b.engrams])
+            for bid in removed:
+                w.record(b"X", bid)
+            if drives_dict != last_drives:
+                w.record(b"D", drives_dict)
+            if skills_dict != last_skills:
+                w.record(b"S", skills_dict)
+            w.record(b"E")
+        self._segments += 1
+        self._last = (head, drives_dict, skills_dict)
+        return "delta"
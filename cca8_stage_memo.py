@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Declared-input memoization for pure derivations inside per-tick stages.
+
+Purpose
+-------
+The NavMap observation stages run on every closed-loop cycle.  A stage as a
+whole can never be skipped: each call advances its observation counter, ages
+support, stamps ``controller_steps``/``ticks`` into its record, and appends a
+bounded history row.  Inside that bookkeeping, however, most of the cost is a
+pure derivation (body-state readout, evidence-to-stable-map matching and
+revision proposal, maternal distance/bearing readout, root-view probe) whose
+result depends only on a few declared inputs that rarely change between ticks.
+
+This module memoizes those derivations.  Each derivation owns one named slot
+holding the last input fingerprint and its result.  When the next tick
+presents an equal fingerprint the stored result is reused; otherwise the
+derivation runs and replaces the slot.  The per-tick bookkeeping around the
+derivation still runs every tick, so records stay tick-for-tick identical.
+
+Usage
+-----
+``stage_memo_v1(ctx, name, key, derive, ref=...)`` returns ``derive()`` or the
+stored result for an equal ``key``.  ``key`` must be a tuple of the
+derivation's declared inputs: immutable values or frozen records.  Frozen map
+revisions compare by identity first, so an unchanged stable map costs a
+pointer comparison.
+
+Per-tick evidence maps carry a unique identity (``..._o000042``) that is not
+part of their content.  A derivation over such a map passes that map's
+reference as ``ref`` and leaves it out of ``key``; on a hit, every
+``NavMapRefV1`` equal to the stored reference inside the stored result is
+rebound to the current one.  The positions of that reference are located once
+per stored result, and only the frozen records on those paths are copied
+(with their ``init=False`` memo slots reset).
+
+The slot table and hit/miss counters live on ``Ctx``.  Setting
+``ctx.stage_memo_enabled_v1`` to false runs every derivation directly.  Like
+the stage profiler, the counters are external diagnostics; no policy, WNM,
+retrieval, or learning path reads them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, fields, is_dataclass, replace
+from typing import Any, Callable, Optional, TypeVar
+
+__version__ = "0.1.0"
+
+__all__ = [
+    "stage_memo_clear_v1",
+    "stage_memo_summary_v1",
+    "stage_memo_v1",
+    "__version__",
+]
+
+_T = TypeVar("_T")
+
+_LAYOUTS: dict[type, Optional[tuple[tuple[str, ...], tuple[tuple[str, Any], ...], bool]]] = {}
+
+
+def _dataclass_layout(cls: type) -> Optional[tuple[tuple[str, ...], tuple[tuple[str, Any], ...], bool]]:
+    """Return ``(init names, non-init defaults, cloneable)`` for a dataclass type, else ``None``.
+
+    A type is cloneable when every non-init field is a memo slot with a plain
+    default; its copies reset those slots instead of re-running validation.
+    """
+    if cls in _LAYOUTS:
+        return _LAYOUTS[cls]
+    layout = None
+    if is_dataclass(cls):
+        init_names = tuple(item.name for item in fields(cls) if item.init)
+        resets = tuple((item.name, item.default) for item in fields(cls) if not item.init)
+        cloneable = all(default is not MISSING for _, default in resets)
+        layout = (init_names, resets, cloneable)
+    _LAYOUTS[cls] = layout
+    return layout
+
+
+def _rebind_plan(value: Any, old: Any) -> Any:
+    """Return the nested positions of ``old`` inside ``value`` (``True`` for a match), or ``None``."""
+    cls = value.__class__
+    if cls is old.__class__:
+        return True if value == old else None
+    plan: dict[Any, Any] = {}
+    if cls is tuple or cls is list:
+        for index, item in enumerate(value):
+            sub = _rebind_plan(item, old)
+            if sub is not None:
+                plan[index] = sub
+    elif cls is dict:
+        for name, item in value.items():
+            sub = _rebind_plan(item, old)
+            if sub is not None:
+                plan[name] = sub
+    else:
+        layout = _dataclass_layout(cls)
+        if layout is not None:
+            for name in layout[0]:
+                sub = _rebind_plan(getattr(value, name), old)
+                if sub is not None:
+                    plan[name] = sub
+    return plan or None
+
+
+def _apply_plan(value: Any, plan: Any, new: Any) -> Any:
+    """Copy only the records on ``plan``'s paths, placing ``new`` at each match."""
+    if plan is True:
+        return new
+    cls = value.__class__
+    if cls is tuple or cls is list:
+        items = list(value)
+        for index, sub in plan.items():
+            items[index] = _apply_plan(items[index], sub, new)
+        return tuple(items) if cls is tuple else items
+    if cls is dict:
+        out = dict(value)
+        for name, sub in plan.items():
+            out[name] = _apply_plan(out[name], sub, new)
+        return out
+    init_names, resets, cloneable = _LAYOUTS[cls]  # type: ignore[misc]
+    changes = {name: _apply_plan(getattr(value, name), sub, new) for name, sub in plan.items()}
+    if not cloneable:
+        return replace(value, **changes)
+    # Only equal-typed refs are swapped, so field validation cannot change.
+    clone = object.__new__(cls)
+    for name in init_names:
+        object.__setattr__(clone, name, changes[name] if name in changes else getattr(value, name))
+    for name, default in resets:
+        object.__setattr__(clone, name, default)
+    return clone
+
+
+def stage_memo_v1(
+    ctx: Any,
+    name: str,
+    key: tuple[Any, ...],
+    derive: Callable[[], _T],
+    *,
+    ref: Optional[Any] = None,
+) -> _T:
+    """Return ``derive()``, reusing the stored result when ``key`` is unchanged.
+
+    ``ref`` is the per-tick identity the result may embed but the key omits;
+    a reused result has the stored identity rebound to ``ref``.
+    """
+    if ctx is None or not getattr(ctx, "stage_memo_enabled_v1", True):
+        return derive()
+    slots = getattr(ctx, "stage_memo_slots_v1", None)
+    if not isinstance(slots, dict):
+        slots = {}
+        ctx.stage_memo_slots_v1 = slots
+    stats = getattr(ctx, "stage_memo_stats_v1", None)
+    if not isinstance(stats, dict):
+        stats = {}
+        ctx.stage_memo_stats_v1 = stats
+    counts = stats.get(name)
+    if counts is None:
+        counts = stats[name] = [0, 0]
+
+    slot = slots.get(name)
+    if slot is not None and slot[0] == key:
+        counts[0] += 1
+        _, stored_ref, value, plan = slot
+        if ref is None or stored_ref is None or stored_ref == ref:
+            return value
+        if plan is None:
+            plan = _rebind_plan(value, stored_ref) or False
+            slots[name] = (key, stored_ref, value, plan)
+        return _apply_plan(value, plan, ref) if plan else value
+    counts[1] += 1
+    value = derive()
+    slots[name] = (key, ref, value, None)
+    return value
+
+
+def stage_memo_clear_v1(ctx: Any) -> int:
+    """Drop every stored result and counter; return the number of slots removed."""
+    slots = getattr(ctx, "stage_memo_slots_v1", None)
+    count = len(slots) if isinstance(slots, dict) else 0
+    ctx.stage_memo_slots_v1 = {}
+    ctx.stage_memo_stats_v1 = {}
+    return count
+
+
+def stage_memo_summary_v1(ctx: Any) -> dict[str, Any]:
+    """Return JSON-safe per-derivation hit/miss counters."""
+    stats = getattr(ctx, "stage_memo_stats_v1", None)
+    stats = stats if isinstance(stats, dict) else {}
+    derivations = {}
+    for name in sorted(stats):
+        hits, misses = stats[name]
+        calls = hits + misses
+        derivations[name] = {
+            "hits": int(hits),
+            "misses": int(misses),
+            "hit_rate": round(hits / calls, 4) if calls else None,
+        }
+    return {
+        "schema": "stage_memo_summary_v1",
+        "status": "active" if bool(getattr(ctx, "stage_memo_enabled_v1", True)) else "disabled",
+        "derivations": derivations,
+    }
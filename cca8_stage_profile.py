@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Per-stage wall-time profiling for the closed-loop cognitive cycle.
+
+Purpose
+-------
+Every closed-loop cognitive cycle runs the environment step, observation
+injection, the ordered NavMap observation pipeline (NavMapV2 shadow,
+maternal geometry/temporal/continuity, FollowMom compare/advisory, terrain,
+feeding, live dynamics, NavMap memory, StandUp compare/advisory), and policy
+selection.  This module lets those call sites report how long each stage took
+so a slow cycle can be attributed to a phase instead of guessed at.
+
+Usage
+-----
+``stage_timer_v1(ctx, name)`` is a context manager.  When
+``ctx.stage_profile_enabled_v1`` is false it returns a shared no-op object, so
+a disabled timer costs one attribute read.  When enabled it accumulates call
+counts and ``time.perf_counter`` seconds per stage for the current cycle.
+``stage_profile_begin_cycle_v1`` and ``stage_profile_end_cycle_v1`` bracket a
+cycle; the end call appends one compact record to a bounded ring on ``Ctx``.
+
+Stages may nest (the NavMap stages run inside observation injection); a
+nested stage's time is also included in its parent, so shares of cycle time
+are per stage and do not sum to one.
+
+Like the cognitive scope, these records are external diagnostics.  No policy,
+WNM, retrieval, or learning path reads them.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Optional
+
+__version__ = "0.1.0"
+
+__all__ = [
+    "render_stage_profile_lines_v1",
+    "stage_profile_begin_cycle_v1",
+    "stage_profile_clear_v1",
+    "stage_profile_cycle_record_v1",
+    "stage_profile_end_cycle_v1",
+    "stage_profile_summary_v1",
+    "stage_timer_v1",
+    "__version__",
+]
+
+
+class _NullStageTimerV1:
+    """Shared no-op context manager returned while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+_NULL_STAGE_TIMER_V1 = _NullStageTimerV1()
+
+
+class _StageTimerV1:
+    """Accumulate one timed stage into ``ctx.stage_profile_current_v1``."""
+
+    __slots__ = ("_current", "_name", "_started")
+
+    def __init__(self, current: dict[str, list[float]], name: str) -> None:
+        self._current = current
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        elapsed = perf_counter() - self._started
+        row = self._current.get(self._name)
+        if row is None:
+            self._current[self._name] = [1, elapsed]
+        else:
+            row[0] += 1
+            row[1] += elapsed
+        return False
+
+
+def stage_timer_v1(ctx: Any, name: str) -> Any:
+    """Return a context manager that times one stage of the current cycle."""
+    if ctx is None or not getattr(ctx, "stage_profile_enabled_v1", False):
+        return _NULL_STAGE_TIMER_V1
+    current = getattr(ctx, "stage_profile_current_v1", None)
+    if not isinstance(current, dict):
+        current = {}
+        ctx.stage_profile_current_v1 = current
+    return _StageTimerV1(current, name)
+
+
+def _ring_capacity(ctx: Any) -> int:
+    """Return a safe bounded ring capacity from context configuration."""
+    try:
+        value = int(getattr(ctx, "stage_profile_capacity_v1", 256) or 256)
+    except (TypeError, ValueError):
+        value = 256
+    return max(1, min(value, 65536))
+
+
+def stage_profile_begin_cycle_v1(ctx: Any) -> None:
+    """Start accumulating stage timings for a new cognitive cycle."""
+    if ctx is None or not getattr(ctx, "stage_profile_enabled_v1", False):
+        return
+    ctx.stage_profile_current_v1 = {}
+    ctx.stage_profile_cycle_started_v1 = perf_counter()
+
+
+def stage_profile_cycle_record_v1(ctx: Any) -> Optional[dict[str, Any]]:
+    """Return the stage timings of the cycle in progress (JSON-safe), or ``None`` when disabled."""
+    if ctx is None or not getattr(ctx, "stage_profile_enabled_v1", False):
+        return None
+    current = getattr(ctx, "stage_profile_current_v1", None)
+    current = current if isinstance(current, dict) else {}
+    started = getattr(ctx, "stage_profile_cycle_started_v1", None)
+    elapsed_ms = (perf_counter() - started) * 1000.0 if isinstance(started, float) else None
+    return {
+        "schema": "stage_profile_cycle_v1",
+        "cognitive_cycle": int(getattr(ctx, "cog_cycles", 0) or 0),
+        "cycle_ms": round(elapsed_ms, 4) if elapsed_ms is not None else None,
+        "stages": {
+            name: {"calls": int(row[0]), "ms": round(row[1] * 1000.0, 4)}
+            for name, row in current.items()
+        },
+    }
+
+
+def stage_profile_end_cycle_v1(ctx: Any) -> Optional[dict[str, Any]]:
+    """Close the current cycle and append its record to the bounded ring."""
+    record = stage_profile_cycle_record_v1(ctx)
+    if record is None:
+        return None
+    ring_raw = getattr(ctx, "stage_profile_ring_v1", None)
+    ring = ring_raw if isinstance(ring_raw, list) else []
+    ring.append(record)
+    capacity = _ring_capacity(ctx)
+    if len(ring) > capacity:
+        del ring[: len(ring) - capacity]
+    ctx.stage_profile_ring_v1 = ring
+    ctx.stage_profile_current_v1 = {}
+    ctx.stage_profile_cycle_started_v1 = None
+    return record
+
+
+def stage_profile_clear_v1(ctx: Any) -> int:
+    """Clear retained cycle records and return the number removed."""
+    ring = getattr(ctx, "stage_profile_ring_v1", None)
+    count = len(ring) if isinstance(ring, list) else 0
+    ctx.stage_profile_ring_v1 = []
+    ctx.stage_profile_current_v1 = {}
+    ctx.stage_profile_cycle_started_v1 = None
+    return count
+
+
+def stage_profile_summary_v1(ctx: Any) -> dict[str, Any]:
+    """Aggregate the retained cycle records into per-stage totals, means, and shares."""
+    ring = getattr(ctx, "stage_profile_ring_v1", None)
+    rows = [row for row in ring if isinstance(row, dict)] if isinstance(ring, list) else []
+    cycle_total_ms = 0.0
+    totals: dict[str, dict[str, float]] = {}
+    for row in rows:
+        cycle_ms = row.get("cycle_ms")
+        if isinstance(cycle_ms, (int, float)):
+            cycle_total_ms += float(cycle_ms)
+        stages = row.get("stages")
+        if not isinstance(stages, dict):
+            continue
+        for name, sample in stages.items():
+            if not isinstance(sample, dict):
+                continue
+            ms = float(sample.get("ms", 0.0) or 0.0)
+            agg = totals.setdefault(str(name), {"calls": 0.0, "total_ms": 0.0, "max_ms": 0.0, "cycles": 0.0})
+            agg["calls"] += float(sample.get("calls", 0) or 0)
+            agg["total_ms"] += ms
+            agg["max_ms"] = max(agg["max_ms"], ms)
+            agg["cycles"] += 1.0
+
+    stages_out = []
+    for name, agg in sorted(totals.items(), key=lambda item: (-item[1]["total_ms"], item[0])):
+        stages_out.append(
+            {
+                "stage": name,
+                "calls": int(agg["calls"]),
+                "total_ms": round(agg["total_ms"], 4),
+                "mean_ms_per_cycle": round(agg["total_ms"] / len(rows), 4) if rows else 0.0,
+                "max_ms": round(agg["max_ms"], 4),
+                "share_of_cycle": round(agg["total_ms"] / cycle_total_ms, 4) if cycle_total_ms > 0.0 else None,
+            }
+        )
+    return {
+        "schema": "stage_profile_summary_v1",
+        "status": "active" if bool(getattr(ctx, "stage_profile_enabled_v1", False)) else "disabled",
+        "capacity": _ring_capacity(ctx),
+        "cycle_count": len(rows),
+        "cycle_total_ms": round(cycle_total_ms, 4),
+        "mean_cycle_ms": round(cycle_total_ms / len(rows), 4) if rows else 0.0,
+        "stages": stages_out,
+    }
+
+
+def render_stage_profile_lines_v1(ctx: Any, *, limit: int = 12) -> list[str]:
+    """Render the per-stage summary as terminal lines, slowest stage first."""
+    summary = stage_profile_summary_v1(ctx)
+    if not summary["cycle_count"]:
+        return [f"[stage-profile] {summary['status']}; no cycles recorded"]
+    lines = [
+        f"[stage-profile] cycles={summary['cycle_count']} mean_cycle={summary['mean_cycle_ms']:.3f} ms "
+        f"(nested stages are included in their parent)",
+        "  stage                          calls   mean ms   max ms   share",
+    ]
+    for row in summary["stages"][: max(1, int(limit))]:
+        share = row["share_of_cycle"]
+        share_txt = f"{share * 100.0:5.1f}%" if isinstance(share, float) else "    -"
+        lines.append(
+            f"  {row['stage']:<30s} {row['calls']:>5d} {row['mean_ms_per_cycle']:>9.3f} "
+            f"{row['max_ms']:>8.3f}  {share_txt}"
+        )
+    return lines
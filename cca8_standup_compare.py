@@ -86,6 +86,7 @@ from cca8_navmap_kernel import (
     NavSourceClassV1,
     NavStructuredResidualV1,
     body_state_evidence,
+    derive_navmap_revision,
     get_element,
     match_navmaps,
     structured_residual,
@@ -299,7 +300,8 @@ def standup_expected_successor_map_v1(
         else:
             expected_elements.append(element)
 
-    expected_map = NavMapV2(
+    expected_map = derive_navmap_revision(
+        body_ground_map,
         map_id=f"{_EXPECTED_MAP_ID_PREFIX}_t{transaction_no:06d}",
         revision=1,
         parent_ref=None,
@@ -51,6 +51,7 @@ from __future__ import annotations
 import hashlib
 import json
 from math import log as _math_log, sqrt as _math_sqrt
+import random
 import time
 from typing import Any, Callable, Optional, cast
 
@@ -113,6 +114,7 @@ __all__ = [
     "navpatch_priors_bundle_v1",
     "navpatch_candidate_prior_bias_v1",
     "navpatch_predictive_match_loop_v1",
+    "navpatch_lsh_recall_benchmark_v1",
     "wm_apply_grid_slot_families_to_mapsurface_v1",
     "compute_navsummary_v1",
     "format_navsummary_line_v1",
@@ -648,13 +650,11 @@ def _wm_tagset_of(world, bid: str) -> set[str]:
     if isinstance(ts, set):
         return ts
     if isinstance(ts, list):
-        s = set(ts)
-        b.tags = s
-        return s
+        b.tags = set(ts)
+        return b.tags
     try:
-        s = set(ts)
-        b.tags = s
-        return s
+        b.tags = set(ts)
+        return b.tags
     except Exception:
         b.tags = set()
         return b.tags
@@ -1008,8 +1008,15 @@ def _iter_newest_wm_mapsurface_recs(*, long_world=None, limit: int = 500) -> tup
             return recs, "world_pointers"
 
     # no resolvable pointer engrams -> fallback to column scan
-    # Fallback: scan column ids newest-first
+    # Fallback: newest-first from the Column's per-name index (older columns: scan ids newest-first)
     out: list[dict] = []
+    iter_newest = getattr(column_mem, "iter_newest", None)
+    if callable(iter_newest):
+        try:
+            out = [rec for rec in iter_newest("wm_mapsurface", limit=lim) if isinstance(rec, dict)]
+        except Exception:
+            out = []
+        return out, "column_scan"
     try:
         ids = list(column_mem.list_ids())
         for eid in reversed(ids):
@@ -2160,6 +2167,7 @@ def store_navpatch_engram_v1(
         attrs["tags"] = [t for t in tags if isinstance(t, str) and t][:12]
 
     fm = FactMeta(name="navpatch", links=[], attrs=attrs).with_time(ctx)
+    revision_before = _navpatch_column_revision_v1(active_column)
     engram_id = active_column.assert_fact("navpatch", cast(Any, patch), fm)
 
     if isinstance(cache, dict):
@@ -2170,6 +2178,16 @@ def store_navpatch_engram_v1(
         except Exception:
             pass
 
+    # Keep an existing LSH recall index for this column current (no-op when never built).
+    lsh_index = getattr(ctx, "navpatch_lsh_index_v1", None)
+    if isinstance(lsh_index, dict) and lsh_index.get("column") is active_column:
+        try:
+            _navpatch_lsh_add_v1(lsh_index, engram_id, attrs.get("role"), patch)
+            if revision_before is not None and lsh_index.get("revision") == revision_before:
+                lsh_index["revision"] = _navpatch_column_revision_v1(active_column)
+        except Exception:
+            pass
+
     return {"stored": True, "sig": sig, "sig16": sig16, "engram_id": engram_id, "reason": reason}
 
 
@@ -2517,49 +2535,402 @@ def _wm_place_overlay_char_v1(grid: list[list[str]], char: str, *, preferred_xy:
             return
 
 
-def _navpatch_tag_jaccard(tags_a: Any, tags_b: Any) -> float:
-    a: set[str] = set()
-    b: set[str] = set()
-
-    if isinstance(tags_a, list):
-        for t in tags_a:
+def _navpatch_tag_mask_v1(tags: Any, tag_bits: dict[str, int]) -> int:
+    """Return the tag set as an int bitset over ``tag_bits`` (interning unseen tags)."""
+    mask = 0
+    if isinstance(tags, list):
+        for t in tags:
             if isinstance(t, str) and t:
-                a.add(t)
+                bit = tag_bits.get(t)
+                if bit is None:
+                    bit = len(tag_bits)
+                    tag_bits[t] = bit
+                mask |= 1 << bit
+    return mask
 
-    if isinstance(tags_b, list):
-        for t in tags_b:
-            if isinstance(t, str) and t:
-                b.add(t)
 
-    u = a | b
-    return (len(a & b) / float(len(u))) if u else 1.0
+def _navpatch_extent_values_v1(extent: Any) -> tuple[float, float, float, float] | None:
+    """Return ``(x0, y0, x1, y1)`` when all four extent bounds are numeric, else ``None``."""
+    if not isinstance(extent, dict):
+        return None
+    vals: list[float] = []
+    for k in ("x0", "y0", "x1", "y1"):
+        v = extent.get(k)
+        if not isinstance(v, (int, float)):
+            return None
+        vals.append(float(v))
+    return (vals[0], vals[1], vals[2], vals[3])
+
 
+def _navpatch_match_features_v1(patch: Any, tag_bits: dict[str, int]) -> tuple[str | None, int, tuple[float, float, float, float] | None]:
+    """Return ``(role, tag_mask, extent)``: the NavPatch core fields used for similarity."""
+    if not isinstance(patch, dict):
+        return None, 0, None
+    role = patch.get("role")
+    return (
+        role if isinstance(role, str) else None,
+        _navpatch_tag_mask_v1(patch.get("tags"), tag_bits),
+        _navpatch_extent_values_v1(patch.get("extent")),
+    )
 
-def _navpatch_extent_sim(ext_a: Any, ext_b: Any) -> float:
-    # If we don't have numeric extents on both sides, do not penalize.
-    if not (isinstance(ext_a, dict) and isinstance(ext_b, dict)):
-        return 1.0
 
-    keys = ("x0", "y0", "x1", "y1")
-    a_vals: dict[str, float] = {}
-    b_vals: dict[str, float] = {}
+def _navpatch_tag_mask_jaccard_v1(mask_a: int, mask_b: int) -> float:
+    """Jaccard overlap of two interned tag bitsets (1.0 when both are empty)."""
+    union = mask_a | mask_b
+    return ((mask_a & mask_b).bit_count() / float(union.bit_count())) if union else 1.0
 
-    for k in keys:
-        av = ext_a.get(k)
-        bv = ext_b.get(k)
-        if not isinstance(av, (int, float)) or not isinstance(bv, (int, float)):
-            return 1.0
-        a_vals[k] = float(av)
-        b_vals[k] = float(bv)
+
+def _navpatch_feature_cache_v1(ctx: Ctx) -> dict[str, Any]:
+    """Return ctx's NavPatch feature cache: ``{"tag_bits": {tag: bit}, "protos": {eid: features}}``."""
+    cache = getattr(ctx, "navpatch_feature_cache_v1", None)
+    if not isinstance(cache, dict):
+        cache = {}
+        try:
+            ctx.navpatch_feature_cache_v1 = cache
+        except Exception:
+            pass
+    if not isinstance(cache.get("tag_bits"), dict):
+        cache["tag_bits"] = {}
+    if not isinstance(cache.get("protos"), dict):
+        cache["protos"] = {}
+    return cache
+
+
+def _navpatch_proto_features_v1(
+    cache: dict[str, Any],
+    eid: str,
+    sig: Any,
+    payload: dict[str, Any],
+) -> tuple[int, tuple[float, float, float, float] | None]:
+    """Return cached ``(tag_mask, extent)`` for one prototype engram.
+
+    Column records are immutable once asserted; the stored ``sig`` attr still
+    guards the entry in case an engram id is re-assigned.
+    """
+    protos: dict[str, Any] = cache["protos"]
+    hit = protos.get(eid)
+    if hit is not None and hit[0] == sig:
+        return hit[1], hit[2]
+    _role, mask, extent = _navpatch_match_features_v1(payload, cache["tag_bits"])
+    protos[eid] = (sig, mask, extent)
+    return mask, extent
+
+
+# --- NavPatch LSH recall index (Phase X 2.3, optional) -----------------------------------
+# MinHash signatures over each prototype's tag set are split into bands and bucketed by
+# role. Prototypes sharing a band bucket with an observed patch become candidates for the
+# exact scorer, so the index only narrows which prototypes are scored, never the scores.
+# Off by default (ctx.navpatch_lsh_enabled); the bounded exact scan stays the reference.
+
+_NAVPATCH_LSH_PRIME_V1 = (1 << 61) - 1
+_NAVPATCH_LSH_SEED_V1 = 0xCCA8_2023
+
+
+def _navpatch_lsh_params_v1(ctx: Ctx) -> tuple[int, int]:
+    """Return clamped ``(bands, rows)`` for the MinHash banding."""
+    try:
+        bands = int(getattr(ctx, "navpatch_lsh_bands", 16) or 16)
+    except Exception:
+        bands = 16
+    try:
+        rows = int(getattr(ctx, "navpatch_lsh_rows", 2) or 2)
+    except Exception:
+        rows = 2
+    return max(1, min(64, bands)), max(1, min(8, rows))
+
+
+def _navpatch_lsh_max_candidates_v1(ctx: Ctx) -> int:
+    """Return the clamped per-patch candidate cap for LSH recall."""
+    try:
+        limit = int(getattr(ctx, "navpatch_lsh_max_candidates", 64) or 64)
+    except Exception:
+        limit = 64
+    return max(1, min(4096, limit))
+
+
+def _navpatch_lsh_role_key_v1(role: Any) -> str:
+    """Bucket role key: the role string, or "" for prototypes without one."""
+    return role if isinstance(role, str) and role else ""
+
+
+def _navpatch_lsh_new_index_v1(bands: int, rows: int, column: Any) -> dict[str, Any]:
+    """Return an empty index with fixed-seed MinHash coefficients."""
+    rng = random.Random(_NAVPATCH_LSH_SEED_V1)
+    prime = _NAVPATCH_LSH_PRIME_V1
+    return {
+        "schema": "navpatch_lsh_index_v1",
+        "bands": bands,
+        "rows": rows,
+        "column": column,
+        "coeffs": [(rng.randrange(1, prime), rng.randrange(0, prime)) for _ in range(bands * rows)],
+        "tag_hash": {},
+        "buckets": {},
+        "empty": {},
+        "members": {},
+        "bands_of": {},
+        "geometry": {},
+        "roles": set(),
+        "revision": None,
+    }
+
+
+def _navpatch_lsh_signature_v1(index: dict[str, Any], tags: Any) -> tuple[tuple[int, ...], ...] | None:
+    """Return the banded MinHash signature of a tag list, or None for an empty tag set."""
+    tag_hash: dict[str, int] = index["tag_hash"]
+    hashes: list[int] = []
+    if isinstance(tags, list):
+        for t in tags:
+            if not isinstance(t, str) or not t:
+                continue
+            h = tag_hash.get(t)
+            if h is None:
+                h = int.from_bytes(hashlib.blake2b(t.encode("utf-8"), digest_size=8).digest(), "big")
+                tag_hash[t] = h
+            hashes.append(h)
+    if not hashes:
+        return None
+    prime = _NAVPATCH_LSH_PRIME_V1
+    mins = [min((a * h + b) % prime for h in hashes) for a, b in index["coeffs"]]
+    rows = int(index["rows"])
+    return tuple(tuple(mins[i:i + rows]) for i in range(0, len(mins), rows))
+
+
+def _navpatch_lsh_geometry_v1(payload: dict[str, Any]) -> tuple[tuple[float, float, float, float] | None, list[Any] | None]:
+    """Return ``(extent, grid_cells)`` used to rank prototypes that share the same bands."""
+    cells = payload.get("grid_cells")
+    return _navpatch_extent_values_v1(payload.get("extent")), (cells if isinstance(cells, list) and cells else None)
+
+
+def _navpatch_lsh_geometry_sim_v1(
+    obs: tuple[tuple[float, float, float, float] | None, list[Any] | None],
+    proto: tuple[tuple[float, float, float, float] | None, list[Any] | None],
+    *,
+    prec_ext: float,
+    prec_grid: float,
+) -> float:
+    """Precision-weighted extent + grid similarity (grid only when both grids align)."""
+    sim = prec_ext * _navpatch_extent_values_sim_v1(obs[0], proto[0])
+    obs_cells, proto_cells = obs[1], proto[1]
+    if prec_grid > 0.0 and obs_cells is not None and proto_cells is not None and len(obs_cells) == len(proto_cells):
+        try:
+            sim += prec_grid * float(grid_overlap_fraction_v1(obs_cells, proto_cells))
+        except Exception:
+            pass
+    return sim
+
+
+def _navpatch_lsh_add_v1(index: dict[str, Any], eid: str, role: Any, payload: dict[str, Any]) -> None:
+    """Insert one prototype engram into the index (no-op if already present)."""
+    members: dict[str, str] = index["members"]
+    if eid in members:
+        return
+    role_key = _navpatch_lsh_role_key_v1(role)
+    members[eid] = role_key
+    index["geometry"][eid] = _navpatch_lsh_geometry_v1(payload)
+    index["roles"].add(role_key)
+    sig = _navpatch_lsh_signature_v1(index, payload.get("tags"))
+    if sig is None:
+        index["empty"].setdefault(role_key, []).append(eid)
+        index["bands_of"][eid] = None
+        return
+    buckets: dict[tuple[Any, ...], list[str]] = index["buckets"]
+    keys = [(role_key, band_no, band) for band_no, band in enumerate(sig)]
+    for key in keys:
+        buckets.setdefault(key, []).append(eid)
+    index["bands_of"][eid] = keys
+
+
+def _navpatch_lsh_remove_v1(index: dict[str, Any], eid: str) -> None:
+    """Drop one engram from every bucket it was filed under (no-op if absent)."""
+    role_key = index["members"].pop(eid, None)
+    if role_key is None:
+        return
+    index["geometry"].pop(eid, None)
+    keys = index["bands_of"].pop(eid, None)
+    if keys is None:
+        lists = [(index["empty"], role_key)]
+    else:
+        lists = [(index["buckets"], key) for key in keys]
+    for table, key in lists:
+        bucket = table.get(key)
+        if bucket is not None and eid in bucket:
+            bucket.remove(eid)
+            if not bucket:
+                del table[key]
+
+
+def _navpatch_column_revision_v1(column: Any) -> int | None:
+    """Return the Column's record revision, or None when it cannot report one."""
+    try:
+        revision = column.revision()
+    except Exception:
+        return None
+    return revision if isinstance(revision, int) else None
+
+
+def _navpatch_lsh_sync_v1(index: dict[str, Any], column: Any) -> None:
+    """Bring the index in line with the Column's current navpatch records.
+
+    Engrams deleted from the Column (or dropped by ``clear()``) leave every bucket;
+    engrams that entered it by any route other than ``store_navpatch_engram_v1`` are
+    added. Only ids are compared, so unchanged members are not re-hashed.
+    """
+    try:
+        live = column.find_ids(name_contains="navpatch", has_attr="sig")
+    except Exception:
+        try:
+            live = [rec.get("id") for rec in column.find(name_contains="navpatch", has_attr="sig")]
+        except Exception:
+            live = []
+    live_set = set(live)
+    for eid in [eid for eid in index["members"] if eid not in live_set]:
+        _navpatch_lsh_remove_v1(index, eid)
+    for eid in live:
+        if not isinstance(eid, str) or not eid or eid in index["members"]:
+            continue
+        try:
+            rec = column.try_get(eid)
+        except Exception:
+            rec = None
+        payload = rec.get("payload") if isinstance(rec, dict) else None
+        if not isinstance(payload, dict):
+            continue
+        meta = rec.get("meta") if isinstance(rec.get("meta"), dict) else {}  # type: ignore[union-attr]
+        attrs = meta.get("attrs") if isinstance(meta.get("attrs"), dict) else {}
+        _navpatch_lsh_add_v1(index, eid, attrs.get("role"), payload)
+
+
+def _navpatch_lsh_index_v1(ctx: Ctx, column: Any) -> dict[str, Any]:
+    """Return ctx's LSH index for ``column``, current as of the Column's revision.
+
+    The index is rebuilt when the banding or the column object changed, and synced
+    against the Column's record ids whenever its revision moved (or it reports none).
+    """
+    bands, rows = _navpatch_lsh_params_v1(ctx)
+    index = getattr(ctx, "navpatch_lsh_index_v1", None)
+    if not (
+        isinstance(index, dict)
+        and index.get("column") is column
+        and index.get("bands") == bands
+        and index.get("rows") == rows
+    ):
+        index = _navpatch_lsh_new_index_v1(bands, rows, column)
+        try:
+            ctx.navpatch_lsh_index_v1 = index
+        except Exception:
+            pass
+
+    revision = _navpatch_column_revision_v1(column)
+    if revision is None or revision != index.get("revision"):
+        _navpatch_lsh_sync_v1(index, column)
+        index["revision"] = revision
+    return index
+
+
+def _navpatch_lsh_candidate_ids_v1(
+    index: dict[str, Any],
+    patch: dict[str, Any],
+    *,
+    limit: int,
+    prec_ext: float = 0.25,
+    prec_grid: float = 0.0,
+) -> list[str]:
+    """Return up to ``limit`` candidate engram ids, most shared bands first.
+
+    A patch with a role searches its own role plus role-less prototypes (the exact
+    scorer's role filter); a role-less patch searches every role. Prototypes with the
+    same tag set share every band, so ties are ranked by the scorer's precision-weighted
+    extent/grid similarity before the cut; otherwise same-entity prototypes would be kept
+    in arbitrary id order.
+    """
+    role_p = patch.get("role")
+    if isinstance(role_p, str) and role_p:
+        roles = [role_p, ""]
+    else:
+        roles = sorted(index["roles"])
+
+    hits: dict[str, int] = {}
+    sig = _navpatch_lsh_signature_v1(index, patch.get("tags"))
+    if sig is None:
+        empty: dict[str, list[str]] = index["empty"]
+        for r in roles:
+            for eid in empty.get(r, ()):
+                hits[eid] = 0
+    else:
+        buckets: dict[tuple[Any, ...], list[str]] = index["buckets"]
+        for r in roles:
+            for band_no, band in enumerate(sig):
+                for eid in buckets.get((r, band_no, band), ()):
+                    hits[eid] = hits.get(eid, 0) + 1
+
+    obs_geom = _navpatch_lsh_geometry_v1(patch)
+    geometry: dict[str, Any] = index["geometry"]
+    w_ext = prec_ext if prec_ext > 0.0 or prec_grid > 0.0 else 1.0
+    ranked = sorted(
+        hits.items(),
+        key=lambda kv: (
+            -kv[1],
+            -_navpatch_lsh_geometry_sim_v1(obs_geom, geometry[kv[0]], prec_ext=w_ext, prec_grid=prec_grid),
+            kv[0],
+        ),
+    )
+    return [eid for eid, _n in ranked[:limit]]
+
+
+def _navpatch_lsh_candidate_recs_v1(
+    index: dict[str, Any],
+    column: Any,
+    patch: dict[str, Any],
+    *,
+    limit: int,
+    prec_ext: float = 0.25,
+    prec_grid: float = 0.0,
+) -> list[dict[str, Any]]:
+    """Return the Column records of a patch's LSH candidates (deleted engrams are skipped)."""
+    recs: list[dict[str, Any]] = []
+    for eid in _navpatch_lsh_candidate_ids_v1(index, patch, limit=limit, prec_ext=prec_ext, prec_grid=prec_grid):
+        try:
+            rec = column.try_get(eid)
+        except Exception:
+            rec = None
+        if isinstance(rec, dict):
+            recs.append(rec)
+    return recs
+
+
+def _navpatch_lsh_recall_at_k_v1(
+    approx: list[tuple[Any, ...]],
+    exact: list[tuple[Any, ...]],
+    k: int,
+) -> float | None:
+    """Fraction of the exact top-k engram ids that the LSH top-k also returned."""
+    want = {row[-1] for row in exact[:k]}
+    if not want:
+        return None
+    got = {row[-1] for row in approx[:k]}
+    return len(want & got) / float(len(want))
+
+
+def _navpatch_extent_values_sim_v1(
+    a: tuple[float, float, float, float] | None,
+    b: tuple[float, float, float, float] | None,
+) -> float:
+    """Extent similarity over ``(x0, y0, x1, y1)`` tuples; 1.0 when either side is missing."""
+    if a is None or b is None:
+        return 1.0
+    ax0, ay0, ax1, ay1 = a
+    bx0, by0, bx1, by1 = b
 
     # Normalize by the larger span so the score is scale-insensitive.
-    span_a = max(abs(a_vals["x1"] - a_vals["x0"]), abs(a_vals["y1"] - a_vals["y0"]), 1.0)
-    span_b = max(abs(b_vals["x1"] - b_vals["x0"]), abs(b_vals["y1"] - b_vals["y0"]), 1.0)
+    span_a = max(abs(ax1 - ax0), abs(ay1 - ay0), 1.0)
+    span_b = max(abs(bx1 - bx0), abs(by1 - by0), 1.0)
     denom = max(span_a, span_b, 1.0)
 
     diff_sum = 0.0
-    for k in keys:
-        diff_sum += abs(a_vals[k] - b_vals[k]) / denom
+    diff_sum += abs(ax0 - bx0) / denom
+    diff_sum += abs(ay0 - by0) / denom
+    diff_sum += abs(ax1 - bx1) / denom
+    diff_sum += abs(ay1 - by1) / denom
 
     # diff_sum in [0..~4]; convert to similarity in [0..1]
     sim = 1.0 - min(1.0, diff_sum / 4.0)
@@ -2571,16 +2942,14 @@ def navpatch_similarity_v1(patch_a: dict[str, Any], patch_b: dict[str, Any]) ->
 
     This is intentionally simple (priors OFF baseline). It is only for debugging/top-K traces now.
     """
-    a = _navpatch_core_v1(patch_a)
-    b = _navpatch_core_v1(patch_b)
-
-    role_a = a.get("role")
-    role_b = b.get("role")
-    if isinstance(role_a, str) and isinstance(role_b, str) and role_a and role_b and role_a != role_b:
+    tag_bits: dict[str, int] = {}
+    role_a, mask_a, ext_a = _navpatch_match_features_v1(patch_a, tag_bits)
+    role_b, mask_b, ext_b = _navpatch_match_features_v1(patch_b, tag_bits)
+    if role_a and role_b and role_a != role_b:
         return 0.0
 
-    tag_sim = _navpatch_tag_jaccard(a.get("tags"), b.get("tags"))
-    ext_sim = _navpatch_extent_sim(a.get("extent"), b.get("extent"))
+    tag_sim = _navpatch_tag_mask_jaccard_v1(mask_a, mask_b)
+    ext_sim = _navpatch_extent_values_sim_v1(ext_a, ext_b)
 
     score = 0.75 * tag_sim + 0.25 * ext_sim
     return float(max(0.0, min(1.0, score)))
@@ -2763,6 +3132,224 @@ def navpatch_candidate_prior_bias_v1(priors: dict[str, Any], cand_payload: dict[
     return float(hazard_bias) if hazard_like else 0.0
 
 
+def _navpatch_proto_rows_v1(
+    feature_cache: dict[str, Any],
+    proto_recs: list[dict[str, Any]],
+) -> list[tuple[str, dict[str, Any], dict[str, Any], Any, int, tuple[float, float, float, float] | None]]:
+    """Return ``(engram_id, payload, attrs, attr_role, tag_mask, extent)`` rows for prototype records."""
+    rows: list[tuple[str, dict[str, Any], dict[str, Any], Any, int, tuple[float, float, float, float] | None]] = []
+    for rec in proto_recs:
+        if not isinstance(rec, dict):
+            continue
+        eid = rec.get("id")
+        if not isinstance(eid, str) or not eid:
+            continue
+        payload = rec.get("payload")
+        if not isinstance(payload, dict):
+            continue
+        meta_raw = rec.get("meta")
+        meta: dict[str, Any] = meta_raw if isinstance(meta_raw, dict) else {}
+        attrs_raw = meta.get("attrs")
+        attrs: dict[str, Any] = attrs_raw if isinstance(attrs_raw, dict) else {}
+        mask_r, ext_r = _navpatch_proto_features_v1(feature_cache, eid, attrs.get("sig"), payload)
+        rows.append((eid, payload, attrs, attrs.get("role"), mask_r, ext_r))
+    return rows
+
+
+def _navpatch_score_rows_v1(
+    p: dict[str, Any],
+    rows: list[tuple[str, dict[str, Any], dict[str, Any], Any, int, tuple[float, float, float, float] | None]],
+    *,
+    obs_mask: int,
+    obs_ext: tuple[float, float, float, float] | None,
+    exclude_eid: str | None,
+    priors: dict[str, Any],
+    priors_enabled: bool,
+    prec_tags: float,
+    prec_ext: float,
+    prec_grid: float,
+) -> list[tuple[float, float, float, float, float, float, float | None, str]]:
+    """Score prototype rows against one observed patch, best first.
+
+    Tuple: (score_post, score_evidence, score_unweighted, prior_bias, tag_sim, ext_sim, grid_sim, engram_id)
+    """
+    scored: list[tuple[float, float, float, float, float, float, float | None, str]] = []
+    role_p = p.get("role")
+    engram_id = exclude_eid
+
+    for eid, payload, attrs, role_r, mask_r, ext_r in rows:
+        # Self-exclusion
+        if isinstance(engram_id, str) and engram_id and eid == engram_id:
+            continue
+        if (
+            isinstance(role_p, str) and role_p
+            and isinstance(role_r, str) and role_r
+            and role_p != role_r
+        ):
+            continue
+
+        # Evidence channels (v1.1): tags vs extent vs grid
+        tag_sim = _navpatch_tag_mask_jaccard_v1(obs_mask, mask_r)
+        ext_sim = _navpatch_extent_values_sim_v1(obs_ext, ext_r)
+        tag_sim = max(0.0, min(1.0, tag_sim))
+        ext_sim = max(0.0, min(1.0, ext_sim))
+        grid_sim: float | None = None
+        try:
+            obs_cells = p.get("grid_cells")
+            cand_cells = payload.get("grid_cells")
+            if (
+                isinstance(obs_cells, list)
+                and isinstance(cand_cells, list)
+                and len(obs_cells) == len(cand_cells)
+                and bool(obs_cells)
+            ):
+                grid_sim = float(grid_overlap_fraction_v1(obs_cells, cand_cells))
+        except Exception:
+            grid_sim = None
+        if grid_sim is not None:
+            grid_sim = max(0.0, min(1.0, float(grid_sim)))
+        # Unweighted evidence score (diagnostic only)
+        if grid_sim is None:
+            score_unw = 0.5 * tag_sim + 0.5 * ext_sim
+        else:
+            score_unw = (tag_sim + ext_sim + float(grid_sim)) / 3.0
+        # Precision-weighted evidence score
+        err_tags = 1.0 - tag_sim
+        err_ext = 1.0 - ext_sim
+        err_grid = (1.0 - float(grid_sim)) if grid_sim is not None else 0.0
+        w_tags = float(prec_tags)
+        w_ext = float(prec_ext)
+        w_grid = float(prec_grid) if grid_sim is not None else 0.0
+        denom = float(w_tags + w_ext + w_grid)
+        if denom > 0.0:
+            err_weighted = (w_tags * err_tags + w_ext * err_ext + w_grid * err_grid) / denom
+        else:
+            # Fallback: average over available channels
+            if grid_sim is None:
+                err_weighted = 0.5 * (err_tags + err_ext)
+            else:
+                err_weighted = (err_tags + err_ext + err_grid) / 3.0
+        score_evidence = 1.0 - err_weighted
+        score_evidence = max(0.0, min(1.0, float(score_evidence)))
+        prior_bias = float(navpatch_candidate_prior_bias_v1(priors, payload, attrs)) if priors_enabled else 0.0
+        score_post = max(0.0, min(1.0, float(score_evidence + prior_bias)))
+        scored.append((score_post, score_evidence, score_unw, float(prior_bias), tag_sim, ext_sim, grid_sim, eid))
+
+    scored.sort(key=lambda t: (-t[0], t[-1]))
+    return scored
+
+
+def navpatch_lsh_recall_benchmark_v1(
+    ctx: Ctx,
+    patches: list[dict[str, Any]],
+    *,
+    column_memory: Any | None = None,
+    top_k: int | None = None,
+) -> dict[str, Any]:
+    """Measure LSH candidate recall and timing against the exact prototype scan.
+
+    Each patch is scored by the same exact scorer twice: over every stored NavPatch
+    prototype, and over its LSH candidate list. Priors are not applied and nothing is
+    stored, so the comparison isolates candidate recall. The LSH index on ctx is built
+    (or refreshed) as a side effect; ``ctx.navpatch_lsh_enabled`` need not be set.
+
+    Benchmark sets should include same-entity, same-tag patches that differ only in
+    extent/grid: those share every band, so their recall depends on the tie ranking.
+    """
+    active_column = column_memory if column_memory is not None else column_mem
+    try:
+        k = int(top_k if top_k is not None else (getattr(ctx, "navpatch_match_top_k", 3) or 3))
+    except Exception:
+        k = 3
+    k = max(1, min(10, k))
+
+    prec: dict[str, float] = {}
+    for key, attr, default in (
+        ("tags", "navpatch_precision_tags", 0.75),
+        ("extent", "navpatch_precision_extent", 0.25),
+        ("grid", "navpatch_precision_grid", 0.0),
+    ):
+        try:
+            prec[key] = max(0.0, min(1.0, float(getattr(ctx, attr, default) or default)))
+        except Exception:
+            prec[key] = default
+
+    feature_cache = _navpatch_feature_cache_v1(ctx)
+    tag_bits: dict[str, int] = feature_cache["tag_bits"]
+
+    t0 = time.perf_counter()
+    index = _navpatch_lsh_index_v1(ctx, active_column)
+    build_ms = (time.perf_counter() - t0) * 1000.0
+    try:
+        universe = active_column.find(name_contains="navpatch", has_attr="sig")
+    except Exception:
+        universe = []
+    exact_rows = _navpatch_proto_rows_v1(feature_cache, universe)
+    limit = _navpatch_lsh_max_candidates_v1(ctx)
+
+    rows_out: list[dict[str, Any]] = []
+    exact_ms = 0.0
+    lsh_ms = 0.0
+    for p in patches:
+        if not isinstance(p, dict):
+            continue
+        _role, obs_mask, obs_ext = _navpatch_match_features_v1(p, tag_bits)
+        score_kwargs: dict[str, Any] = {
+            "obs_mask": obs_mask,
+            "obs_ext": obs_ext,
+            "exclude_eid": None,
+            "priors": {},
+            "priors_enabled": False,
+            "prec_tags": prec["tags"],
+            "prec_ext": prec["extent"],
+            "prec_grid": prec["grid"],
+        }
+
+        t0 = time.perf_counter()
+        exact_scored = _navpatch_score_rows_v1(p, exact_rows, **score_kwargs)
+        t1 = time.perf_counter()
+        candidate_rows = _navpatch_proto_rows_v1(
+            feature_cache,
+            _navpatch_lsh_candidate_recs_v1(
+                index, active_column, p, limit=limit, prec_ext=prec["extent"], prec_grid=prec["grid"]
+            ),
+        )
+        lsh_scored = _navpatch_score_rows_v1(p, candidate_rows, **score_kwargs)
+        t2 = time.perf_counter()
+        exact_ms += (t1 - t0) * 1000.0
+        lsh_ms += (t2 - t1) * 1000.0
+
+        rows_out.append(
+            {
+                "local_id": p.get("local_id"),
+                "role": p.get("role"),
+                "candidates": len(candidate_rows),
+                "recall_at_k": _navpatch_lsh_recall_at_k_v1(lsh_scored, exact_scored, k),
+                "top1_match": bool(exact_scored) and bool(lsh_scored) and exact_scored[0][-1] == lsh_scored[0][-1],
+            }
+        )
+
+    recalls = [r["recall_at_k"] for r in rows_out if isinstance(r["recall_at_k"], float)]
+    n = len(rows_out)
+    return {
+        "schema": "navpatch_lsh_recall_benchmark_v1",
+        "top_k": k,
+        "bands": index["bands"],
+        "rows": index["rows"],
+        "max_candidates": limit,
+        "indexed": len(index["members"]),
+        "universe": len(exact_rows),
+        "patches": n,
+        "mean_recall_at_k": (sum(recalls) / len(recalls)) if recalls else None,
+        "top1_agreement": (sum(1 for r in rows_out if r["top1_match"]) / float(n)) if n else None,
+        "mean_candidates": (sum(r["candidates"] for r in rows_out) / float(n)) if n else 0.0,
+        "index_build_ms": round(build_ms, 4),
+        "exact_ms": round(exact_ms, 4),
+        "lsh_ms": round(lsh_ms, 4),
+        "per_patch": rows_out,
+    }
+
+
 def navpatch_predictive_match_loop_v1(
     ctx: Ctx,
     env_obs: EnvObservation,
@@ -2780,6 +3367,20 @@ def navpatch_predictive_match_loop_v1(
       - weight evidence by a tiny precision vector (tags vs extent),
       - classify match confidence as commit vs ambiguous vs unknown.
 
+    Prototype features
+    ------------------
+    Each prototype's interned tag bitset and extent tuple are cached in
+    ``ctx.navpatch_feature_cache_v1`` by engram id (guarded by the stored sig), so
+    a tick scores all prototypes in one pass without re-deriving NavPatch cores.
+
+    LSH recall (optional)
+    ---------------------
+    With ``ctx.navpatch_lsh_enabled`` the bounded Column scan is replaced by a
+    role-bucketed MinHash index (``ctx.navpatch_lsh_index_v1``): each patch scores only
+    the prototypes sharing the most bands with it, using the same exact scorer. With
+    ``ctx.navpatch_lsh_benchmark`` each record also carries ``lsh.recall_at_k`` against
+    a full exact scan; see ``navpatch_lsh_recall_benchmark_v1`` for an offline report.
+
     Self-exclusion
     --------------
     If we stored (or dedup-reused) the current patch engram this tick, the Column scan will contain it.
@@ -2925,11 +3526,41 @@ def navpatch_predictive_match_loop_v1(
     prec_ext = max(0.0, min(1.0, float(prec_ext)))
     prec_grid = max(0.0, min(1.0, float(prec_grid)))
 
-    # Candidate prototype records (best-effort; Column is RAM-local)
-    try:
-        proto_recs = active_column.find(name_contains="navpatch", has_attr="sig", limit=500)
-    except Exception:
-        proto_recs = []
+    # Candidate prototype records (best-effort; Column is RAM-local).
+    # With LSH enabled the index supplies candidates and the bounded scan is skipped.
+    lsh_enabled = bool(getattr(ctx, "navpatch_lsh_enabled", False))
+    proto_recs: list[dict[str, Any]] = []
+    if not lsh_enabled:
+        try:
+            proto_recs = active_column.find(name_contains="navpatch", has_attr="sig", limit=500)
+        except Exception:
+            proto_recs = []
+
+    # Prototype feature rows, built once per call from the per-engram cache.
+    feature_cache = _navpatch_feature_cache_v1(ctx)
+    tag_bits: dict[str, int] = feature_cache["tag_bits"]
+    proto_rows = _navpatch_proto_rows_v1(feature_cache, proto_recs)
+
+    # Optional LSH recall (Phase X 2.3): score a short candidate list per patch instead.
+    lsh_index: dict[str, Any] | None = _navpatch_lsh_index_v1(ctx, active_column) if lsh_enabled else None
+
+    # Drop cached features of engrams that left the scan (or, with LSH, the Column).
+    protos_cached: dict[str, Any] = feature_cache["protos"]
+    live_ids: Any = lsh_index["members"] if lsh_index is not None else {row[0] for row in proto_rows}
+    if len(protos_cached) > len(live_ids):
+        for stale in [k for k in protos_cached if k not in live_ids]:
+            del protos_cached[stale]
+    lsh_limit = _navpatch_lsh_max_candidates_v1(ctx)
+    lsh_benchmark = lsh_index is not None and bool(getattr(ctx, "navpatch_lsh_benchmark", False))
+    exact_rows: list[tuple[str, dict[str, Any], dict[str, Any], Any, int, tuple[float, float, float, float] | None]] = []
+    if lsh_benchmark:
+        try:
+            exact_rows = _navpatch_proto_rows_v1(
+                feature_cache,
+                active_column.find(name_contains="navpatch", has_attr="sig"),
+            )
+        except Exception:
+            exact_rows = []
 
     out: list[dict[str, Any]] = []
 
@@ -2954,87 +3585,35 @@ def navpatch_predictive_match_loop_v1(
             except Exception:
                 pass
 
-        # Precompute observed patch core once (stable keys only).
-        obs_core = _navpatch_core_v1(p)
-
-        # Score top-K prototypes.
-        # Tuple: (score_post, score_evidence, score_unweighted, prior_bias, tag_sim, ext_sim, grid_sim, engram_id)
-        scored: list[tuple[float, float, float, float, float, float, float | None, str]] = []
-        role_p = p.get("role")
-
-        for rec in proto_recs:
-            if not isinstance(rec, dict):
-                continue
-            eid = rec.get("id")
-            if not isinstance(eid, str) or not eid:
-                continue
-            # Self-exclusion
-            if isinstance(engram_id, str) and engram_id and eid == engram_id:
-                continue
-            payload = rec.get("payload")
-            if not isinstance(payload, dict):
-                continue
-            meta_raw = rec.get("meta")
-            meta: dict[str, Any] = meta_raw if isinstance(meta_raw, dict) else {}
-            attrs_raw = meta.get("attrs")
-            attrs: dict[str, Any] = attrs_raw if isinstance(attrs_raw, dict) else {}
-            role_r = attrs.get("role")
-            if (
-                isinstance(role_p, str) and role_p
-                and isinstance(role_r, str) and role_r
-                and role_p != role_r
-            ):
-                continue
-
-            proto_core = _navpatch_core_v1(payload)
-            # Evidence channels (v1.1): tags vs extent vs grid
-            tag_sim = float(_navpatch_tag_jaccard(obs_core.get("tags"), proto_core.get("tags")))
-            ext_sim = float(_navpatch_extent_sim(obs_core.get("extent"), proto_core.get("extent")))
-            tag_sim = max(0.0, min(1.0, tag_sim))
-            ext_sim = max(0.0, min(1.0, ext_sim))
-            grid_sim: float | None = None
-            try:
-                obs_cells = p.get("grid_cells")
-                cand_cells = payload.get("grid_cells")
-                if (
-                    isinstance(obs_cells, list)
-                    and isinstance(cand_cells, list)
-                    and len(obs_cells) == len(cand_cells)
-                    and bool(obs_cells)
-                ):
-                    grid_sim = float(grid_overlap_fraction_v1(obs_cells, cand_cells))
-            except Exception:
-                grid_sim = None
-            if grid_sim is not None:
-                grid_sim = max(0.0, min(1.0, float(grid_sim)))
-            # Unweighted evidence score (diagnostic only)
-            if grid_sim is None:
-                score_unw = 0.5 * tag_sim + 0.5 * ext_sim
-            else:
-                score_unw = (tag_sim + ext_sim + float(grid_sim)) / 3.0
-            # Precision-weighted evidence score
-            err_tags = 1.0 - tag_sim
-            err_ext = 1.0 - ext_sim
-            err_grid = (1.0 - float(grid_sim)) if grid_sim is not None else 0.0
-            w_tags = float(prec_tags)
-            w_ext = float(prec_ext)
-            w_grid = float(prec_grid) if grid_sim is not None else 0.0
-            denom = float(w_tags + w_ext + w_grid)
-            if denom > 0.0:
-                err_weighted = (w_tags * err_tags + w_ext * err_ext + w_grid * err_grid) / denom
-            else:
-                # Fallback: average over available channels
-                if grid_sim is None:
-                    err_weighted = 0.5 * (err_tags + err_ext)
-                else:
-                    err_weighted = (err_tags + err_ext + err_grid) / 3.0
-            score_evidence = 1.0 - err_weighted
-            score_evidence = max(0.0, min(1.0, float(score_evidence)))
-            prior_bias = float(navpatch_candidate_prior_bias_v1(priors, payload, attrs)) if priors_enabled else 0.0
-            score_post = max(0.0, min(1.0, float(score_evidence + prior_bias)))
-            scored.append((score_post, score_evidence, score_unw, float(prior_bias), tag_sim, ext_sim, grid_sim, eid))
-
-        scored.sort(key=lambda t: (-t[0], t[-1]))
+        # Observed patch features once (interned tag bitset + extent tuple).
+        _role_obs, obs_mask, obs_ext = _navpatch_match_features_v1(p, tag_bits)
+
+        # Score top-K prototypes (exact scores over the scan or the LSH candidate list).
+        score_kwargs: dict[str, Any] = {
+            "obs_mask": obs_mask,
+            "obs_ext": obs_ext,
+            "exclude_eid": engram_id,
+            "priors": priors,
+            "priors_enabled": priors_enabled,
+            "prec_tags": prec_tags,
+            "prec_ext": prec_ext,
+            "prec_grid": prec_grid,
+        }
+        lsh_trace: dict[str, Any] | None = None
+        if lsh_index is not None:
+            candidate_rows = _navpatch_proto_rows_v1(
+                feature_cache,
+                _navpatch_lsh_candidate_recs_v1(
+                    lsh_index, active_column, p, limit=lsh_limit, prec_ext=prec_ext, prec_grid=prec_grid
+                ),
+            )
+            scored = _navpatch_score_rows_v1(p, candidate_rows, **score_kwargs)
+            lsh_trace = {"candidates": len(candidate_rows), "indexed": len(lsh_index["members"])}
+            if lsh_benchmark:
+                exact_scored = _navpatch_score_rows_v1(p, exact_rows, **score_kwargs)
+                lsh_trace["recall_at_k"] = _navpatch_lsh_recall_at_k_v1(scored, exact_scored, top_k)
+        else:
+            scored = _navpatch_score_rows_v1(p, proto_rows, **score_kwargs)
         top_list: list[dict[str, Any]] = [
             {
                 "engram_id": eid,
@@ -3168,6 +3747,8 @@ def navpatch_predictive_match_loop_v1(
             "best": best,
             "top_k": top_list,
         }
+        if lsh_trace is not None:
+            rec_out["lsh"] = lsh_trace
         out.append(rec_out)
 
         # Attach trace back onto the patch itself (JSON-safe).
@@ -5170,7 +5751,7 @@ def update_working_salience_surfacegrid_v1(
             ctx.wm_surfacegrid_dirty_reasons = list(reasons) if reasons else ["dirty"]
             ctx.wm_surfacegrid_last_scene_fingerprint = dict(fingerprint)
 
-            if bool(getattr(ctx, "wm_surfacegrid_verbose", False)):
+            if bool(getattr(ctx, "wm_surfacegrid_verbose", False)) and not bool(getattr(ctx, "headless", False)):
                 try:
                     ctx.wm_surfacegrid_last_ascii = surfacegrid.ascii_v1()
                 except Exception:
@@ -5184,9 +5765,12 @@ def update_working_salience_surfacegrid_v1(
             ctx.wm_surfacegrid_dirty_reasons = ["cache_hit"]
             ctx.wm_surfacegrid_last_scene_fingerprint = dict(fingerprint)
 
+    # Headless runs leave the ASCII cache empty; display helpers render lazily on demand.
     try:
         current_surfacegrid = getattr(ctx, "wm_surfacegrid", None)
-        if current_surfacegrid is not None:
+        if bool(getattr(ctx, "headless", False)):
+            ctx.wm_surfacegrid_last_ascii = None
+        elif current_surfacegrid is not None:
             ctx.wm_surfacegrid_last_ascii = render_surfacegrid_ascii_with_salience_v1(
                 ctx,
                 ww,
@@ -5447,18 +6031,17 @@ def _prune_working_world(ctx) -> None:
         except Exception:
             return 10**9
 
-    # Delete oldest non-protected bindings until within cap
-    all_ids = sorted(list(getattr(ww, "_bindings", {}).keys()), key=_bid_key)  # pylint: disable=protected-access
-    while len(getattr(ww, "_bindings", {})) > max_b:  # pylint: disable=protected-access
-        binding_to_delete = None
-        for bid in all_ids:
-            if bid not in protected:
-                binding_to_delete = bid
-                break
-        if binding_to_delete is None:
+    # Delete oldest non-protected bindings until within cap.
+    # Single pass over the age-ordered ids; each delete_binding is O(in-degree) thanks to
+    # WorldGraph's incoming-edge index, so pruning N nodes no longer costs O(N^2).
+    bindings = getattr(ww, "_bindings", {})  # pylint: disable=protected-access
+    all_ids = sorted(list(bindings.keys()), key=_bid_key)
+    for bid in all_ids:
+        if len(bindings) <= max_b:
             break
-        ww.delete_binding(binding_to_delete)
-        all_ids.remove(binding_to_delete)
+        if bid in protected:
+            continue
+        ww.delete_binding(bid)
 
 
 def _newborn_controller_step_int_v1(ctx: Ctx | None) -> int:
@@ -6723,14 +7306,14 @@ def invalidate_masked_mapsurface_state_v1(
         if isinstance(tags_raw, set):
             tags = tags_raw
         elif isinstance(tags_raw, list):
-            tags = set(tags_raw)
-            binding.tags = tags
+            binding.tags = set(tags_raw)
+            tags = binding.tags
         else:
             try:
-                tags = set(tags_raw or [])
+                binding.tags = set(tags_raw or [])
             except Exception:
-                tags = set()
-            binding.tags = tags
+                binding.tags = set()
+            tags = binding.tags
 
         exact = f"pred:{family}"
         prefix = f"pred:{family}:"
@@ -6874,13 +7457,11 @@ def inject_obs_into_working_world(
         if isinstance(ts, set):
             return ts
         if isinstance(ts, list):
-            s = set(ts)
-            b.tags = s
-            return s
+            b.tags = set(ts)
+            return b.tags
         try:
-            s = set(ts)  # last resort
-            b.tags = s
-            return s
+            b.tags = set(ts)  # last resort
+            return b.tags
         except Exception:
             b.tags = set()
             return b.tags
@@ -7266,7 +7847,7 @@ def inject_obs_into_working_world(
             if changed:
                 changed_entities.add(ent)
 
-            if getattr(ctx, "working_verbose", False) or changed:
+            if (getattr(ctx, "working_verbose", False) or changed) and not bool(getattr(ctx, "headless", False)):
                 try:
                     disp = f"{display_id_fn(bid)} ({bid})"
                     print(
@@ -7319,7 +7900,7 @@ def inject_obs_into_working_world(
                 except Exception:
                     pass
 
-            if getattr(ctx, "working_verbose", False):
+            if getattr(ctx, "working_verbose", False) and not bool(getattr(ctx, "headless", False)):
                 try:
                     for t in sorted(new_cue_tags):
                         disp = f"{display_id_fn(bid)} ({bid})"
@@ -53,13 +53,20 @@ Persistence:
 # --- Imports -------------------------------------------------------------
 # Standard Library Imports
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from collections import deque
-from typing import Dict, List, Set, Optional, TypedDict, Iterator
+from collections.abc import ItemsView, KeysView, ValuesView
+from array import array
+from typing import Callable, Dict, List, Set, Optional, TypedDict, Iterator, Iterable
+import copy
 import itertools
 import heapq
+from functools import partial
+from operator import is_not
+import math
 from datetime import datetime
 import os
+import weakref
 
 
 # PyPI and Third-Party Imports
@@ -74,6 +81,8 @@ __all__ = ["Edge", "Binding", "WorldGraph", "__version__"]
 # convenient public helpers (methods remain accessed via WorldGraph instance, this is just explicit export)
 
 _ATTACH_OPTIONS: Set[str] = {"now", "latest", "none"}
+_PLANNER_STRATEGIES: tuple[str, ...] = ("bfs", "dijkstra", "astar", "bidirectional")
+_STORAGE_MODES: tuple[str, ...] = ("dict", "compact")
 
 # -----------------------------------------------------------------------------
 # Data model
@@ -91,7 +100,7 @@ class Edge(TypedDict):
     meta: dict
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, weakref_slot=True)
 class Binding:
     """One node in the episode graph.
 
@@ -108,6 +117,55 @@ class Binding:
     edges: List[Edge] #e.g. [{"to": "b153", "label": "then", "meta": {...}}, ...]
     meta: dict
     engrams: dict
+    # Owning WorldGraph binding table (None while detached); not persisted, not compared.
+    _table: Optional["_BindingTable"] = field(default=None, init=False, repr=False, compare=False)
+
+
+    def __setattr__(self, name: str, value) -> None:
+        """Route `b.tags = ...` / `b.edges = ...` through the owning graph's indexes (if attached).
+
+        Many callers (BodyMap, WorkingMap, tests) rebind `b.tags` or `b.edges` wholesale;
+        the owning table re-indexes the binding and hands back an observed container.
+        """
+        if name in ("tags", "edges", "meta", "engrams"):
+            table = getattr(self, "_table", None)  # slot is unset during __init__
+            if table is None and isinstance(getattr(self, name, None), _PackedField):
+                getattr(self, name)._stale()
+            if table is not None:
+                # pylint: disable=protected-access
+                table._touch(self)
+                if name == "tags":
+                    value = table._retag(self, value)
+                elif name == "edges":
+                    value = table._reedge(self, value)
+                else:
+                    value = table._rewatch(self, value)
+        object.__setattr__(self, name, value)
+
+
+    def __copy__(self) -> "Binding":
+        """Shallow copy, detached from any owning graph.
+
+        Tags and edges become a plain set/list so editing the copy never reaches the
+        live tag or incoming-edge index; meta/engrams are shared as with any shallow copy.
+        """
+        return Binding(id=self.id, tags=set(self.tags), edges=list(self.edges),
+                       meta=self.meta, engrams=self.engrams)
+
+
+    def __deepcopy__(self, memo: dict) -> "Binding":
+        """Deep copy of the binding's own fields only (the owning table is not copied)."""
+        dup = Binding(id=self.id, tags=set(self.tags),
+                      edges=copy.deepcopy(list(self.edges), memo),
+                      meta=copy.deepcopy(dict(self.meta), memo),
+                      engrams=copy.deepcopy(dict(self.engrams), memo))
+        memo[id(self)] = dup
+        return dup
+
+
+    def __reduce__(self):
+        """Pickle as a detached binding with plain containers."""
+        return (Binding, (self.id, set(self.tags), list(self.edges), dict(self.meta), dict(self.engrams)))
 
 
     def to_dict(self) -> dict:
@@ -132,6 +190,875 @@ class Binding:
             engrams=dict(d.get("engrams", {})),
         )
 
+class _PackedField:
+    """Stand-in for the fields of a Binding object whose row WorldGraph.compact() packed.
+
+    compact() moves a binding into columnar storage and serves later reads through fresh
+    views, so a Binding fetched before the call no longer reaches the graph. Rather than
+    let edits to that stale object vanish silently, its tags/edges/meta/engrams become this
+    placeholder, and any use of them (or rebinding them) raises RuntimeError.
+    """
+    __slots__ = ("_bid",)
+
+    def __init__(self, bid: str) -> None:
+        self._bid = bid
+
+    def _stale(self, *_args, **_kwargs):
+        raise RuntimeError(
+            f"stale Binding {self._bid!r}: WorldGraph.compact() packed it; "
+            f"re-read world._bindings[{self._bid!r}]"
+        )
+
+    __getattr__ = _stale
+    __iter__ = __len__ = __bool__ = __contains__ = _stale
+    __getitem__ = __setitem__ = __delitem__ = _stale
+    __or__ = __and__ = __sub__ = __ior__ = __iand__ = __isub__ = _stale
+
+    def __repr__(self) -> str:
+        return f"<packed {self._bid}>"
+
+
+# ------------------------- Tag index (internal) -------------------------
+
+def _tag_family(tag) -> Optional[str]:
+    """Return the family prefix of a tag ('pred:x:y' -> 'pred'), or None if it has no family."""
+    if isinstance(tag, str) and ":" in tag:
+        return tag.split(":", 1)[0]
+    return None
+
+
+class _TagSet(set):
+    """A binding's tag set that reports in-place mutations to the owning tag index.
+
+    Behaves exactly like `set` (isinstance checks, `in`, iteration, set algebra all
+    unchanged); only the mutating methods are wrapped. Binary operators (|, &, -),
+    copy.copy/deepcopy and pickling all produce plain sets, so copies taken by callers
+    are not observed.
+    """
+    __slots__ = ("_table", "_bid", "_owner")
+
+    def __init__(self, iterable=(), table: Optional["_BindingTable"] = None, bid: str = "") -> None:
+        super().__init__(iterable)
+        self._table = table
+        self._bid = bid
+        self._owner: Optional[Binding] = None   # compact-storage views: keeps the owning view alive
+
+    def __copy__(self) -> set:
+        return set(self)
+
+    def __deepcopy__(self, memo: dict) -> set:
+        return {copy.deepcopy(t, memo) for t in self}
+
+    def __reduce__(self):
+        return (set, (list(self),))
+
+    def _sync(self, before: set) -> None:
+        table = self._table
+        if table is None:
+            return
+        for t in before - self:
+            table._index_remove(self._bid, t)  # pylint: disable=protected-access
+        for t in self - before:
+            table._index_add(self._bid, t)     # pylint: disable=protected-access
+
+    def add(self, tag) -> None:
+        if tag not in self:
+            super().add(tag)
+            if self._table is not None:
+                self._table._index_add(self._bid, tag)  # pylint: disable=protected-access
+
+    def discard(self, tag) -> None:
+        if tag in self:
+            super().discard(tag)
+            if self._table is not None:
+                self._table._index_remove(self._bid, tag)  # pylint: disable=protected-access
+
+    def remove(self, tag) -> None:
+        super().remove(tag)
+        if self._table is not None:
+            self._table._index_remove(self._bid, tag)  # pylint: disable=protected-access
+
+    def pop(self):
+        tag = super().pop()
+        if self._table is not None:
+            self._table._index_remove(self._bid, tag)  # pylint: disable=protected-access
+        return tag
+
+    def clear(self) -> None:
+        before = set(self)
+        super().clear()
+        self._sync(before)
+
+    def update(self, *others) -> None:
+        before = set(self)
+        super().update(*others)
+        self._sync(before)
+
+    def difference_update(self, *others) -> None:
+        before = set(self)
+        super().difference_update(*others)
+        self._sync(before)
+
+    def intersection_update(self, *others) -> None:
+        before = set(self)
+        super().intersection_update(*others)
+        self._sync(before)
+
+    def symmetric_difference_update(self, other) -> None:
+        before = set(self)
+        super().symmetric_difference_update(other)
+        self._sync(before)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+
+def _edge_rel(e: dict) -> str:
+    """Return an edge's relation label, tolerant of legacy 'rel'/'relation' keys (default 'then')."""
+    return e.get("label") or e.get("rel") or e.get("relation") or "then"
+
+
+def _edge_dst(e) -> Optional[str]:
+    """Return an edge's destination id ('to'), or None for malformed edges."""
+    return e.get("to") if isinstance(e, dict) else None
+
+
+class _EdgeList(list):
+    """A binding's outgoing edge list that reports in-place mutations to the incoming-edge index.
+
+    Behaves exactly like `list`; only the mutating methods are wrapped (copies and pickles
+    are plain lists). The index keys on
+    each edge's 'to' field, so edge dicts must not have 'to' rewritten in place (labels and
+    meta may be edited freely -- label filters are applied at query time).
+    """
+    __slots__ = ("_table", "_bid", "_owner")
+
+    def __init__(self, iterable=(), table: Optional["_BindingTable"] = None, bid: str = "") -> None:
+        super().__init__(iterable)
+        self._table = table
+        self._bid = bid
+        self._owner: Optional[Binding] = None   # compact-storage views: keeps the owning view alive
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    def _sync(self, before: list) -> None:
+        table = self._table
+        if table is None:
+            return
+        for e in before:
+            table._edge_remove(self._bid, e)  # pylint: disable=protected-access
+        for e in self:
+            table._edge_add(self._bid, e)     # pylint: disable=protected-access
+
+    def append(self, e) -> None:
+        super().append(e)
+        if self._table is not None:
+            self._table._edge_add(self._bid, e)  # pylint: disable=protected-access
+
+    def insert(self, i, e) -> None:
+        super().insert(i, e)
+        if self._table is not None:
+            self._table._edge_add(self._bid, e)  # pylint: disable=protected-access
+
+    def extend(self, es) -> None:
+        es = list(es)
+        super().extend(es)
+        if self._table is not None:
+            for e in es:
+                self._table._edge_add(self._bid, e)  # pylint: disable=protected-access
+
+    def remove(self, e) -> None:
+        super().remove(e)
+        if self._table is not None:
+            self._table._edge_remove(self._bid, e)  # pylint: disable=protected-access
+
+    def pop(self, i=-1):
+        e = super().pop(i)
+        if self._table is not None:
+            self._table._edge_remove(self._bid, e)  # pylint: disable=protected-access
+        return e
+
+    def clear(self) -> None:
+        before = list(self)
+        super().clear()
+        self._sync(before)
+
+    def __setitem__(self, i, value) -> None:
+        before = list(self)
+        super().__setitem__(i, value)
+        self._sync(before)
+
+    def __delitem__(self, i) -> None:
+        before = list(self)
+        super().__delitem__(i)
+        self._sync(before)
+
+    def __iadd__(self, es):
+        self.extend(es)
+        return self
+
+    def __imul__(self, n):
+        before = list(self)
+        super().__imul__(n)
+        self._sync(before)
+        return self
+
+
+class _WatchedDict(dict):
+    """A binding's top-level meta/engrams dict while change tracking is on (see WorldGraph.track_changes).
+
+    Mutators mark the owning binding dirty; setdefault() does too, since callers use it to reach
+    a nested dict they are about to edit (b.meta.setdefault("wm", {})["pos"] = ...). Plain
+    reads are untouched dict reads. Edits made *only* through a nested object fetched with []
+    are not seen; call WorldGraph.mark_changed(bid) after those.
+    """
+
+    __slots__ = ("_table", "_bid")
+
+    def __init__(self, data=(), table: Optional["_BindingTable"] = None, bid: str = "") -> None:
+        super().__init__(data)
+        self._table = table
+        self._bid = bid
+
+    def _mark(self) -> None:
+        table = self._table
+        if table is not None and table.dirty is not None:
+            table.dirty[self._bid] = None
+
+    def __setitem__(self, k, v) -> None:
+        self._mark()
+        super().__setitem__(k, v)
+
+    def __delitem__(self, k) -> None:
+        self._mark()
+        super().__delitem__(k)
+
+    def __ior__(self, other):
+        self._mark()
+        return super().__ior__(other)
+
+    def setdefault(self, k, default=None):
+        self._mark()
+        return super().setdefault(k, default)
+
+    def update(self, *args, **kwargs) -> None:
+        self._mark()
+        super().update(*args, **kwargs)
+
+    def pop(self, k, *default):
+        self._mark()
+        return super().pop(k, *default)
+
+    def popitem(self):
+        self._mark()
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._mark()
+        super().clear()
+
+
+class _BindingTable(dict):
+    """`WorldGraph._bindings` storage: a dict of id -> Binding plus an inverted tag index.
+
+    The indexes are maintained incrementally on every insertion/removal and on every tag
+    or edge mutation (via `_TagSet` / `_EdgeList` / `Binding.__setattr__`), so they also
+    stay correct for the many helpers that still write `world._bindings[...]`, `b.tags`
+    or `b.edges` directly.
+
+        by_tag:    tag    -> {bid: None}      (exact tag membership)
+        by_family: family -> {bid: count}     (e.g., 'cue' -> bindings carrying any cue:* tag)
+        incoming:  dst    -> {src: count}     (reverse adjacency; count of src->dst edges)
+        order:     bid    -> insertion ordinal (so query results follow _bindings order)
+        edge_rev:  bumped on any edge or node insertion/removal (planner cache key)
+        out_rev:   src -> bumped whenever that binding's outgoing edges change (cost cache key)
+        dirty:     bid -> None for bindings added/changed/removed since the last drain, or None
+                   while change tracking is off (delta autosave; see WorldGraph.track_changes)
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.by_tag: Dict[str, Dict[str, None]] = {}
+        self.by_family: Dict[str, Dict[str, int]] = {}
+        self.incoming: Dict[str, Dict[str, int]] = {}
+        self.order: Dict[str, int] = {}
+        self.edge_rev: int = 0
+        self.out_rev: Dict[str, int] = {}   # src -> revision of its outgoing edge list (cost cache key)
+        self.dirty: Optional[Dict[str, None]] = None
+        self._ordinal: Iterator[int] = itertools.count()
+        # tags/families whose holder dict fell out of insertion order (re-sorted on next read)
+        self._unsorted_tags: Set[str] = set()
+        self._unsorted_families: Set[str] = set()
+
+    # --- index primitives ---
+
+    def _out_of_order(self, holders: dict, bid: str) -> bool:
+        """True if appending `bid` to `holders` would break binding insertion order."""
+        if not holders or bid in holders:
+            return False
+        order = self.order
+        return order.get(next(reversed(holders)), 0) > order.get(bid, 0)
+
+    def _index_add(self, bid: str, tag) -> None:
+        if self.dirty is not None:
+            self.dirty[bid] = None
+        holders = self.by_tag.setdefault(tag, {})
+        if self._out_of_order(holders, bid):
+            self._unsorted_tags.add(tag)
+        holders[bid] = None
+        fam = _tag_family(tag)
+        if fam is not None:
+            counts = self.by_family.setdefault(fam, {})
+            if self._out_of_order(counts, bid):
+                self._unsorted_families.add(fam)
+            counts[bid] = counts.get(bid, 0) + 1
+
+    def _index_remove(self, bid: str, tag) -> None:
+        if self.dirty is not None:
+            self.dirty[bid] = None
+        holders = self.by_tag.get(tag)
+        if holders is not None:
+            holders.pop(bid, None)
+            if not holders:
+                del self.by_tag[tag]
+        fam = _tag_family(tag)
+        if fam is not None:
+            counts = self.by_family.get(fam)
+            if counts is not None and bid in counts:
+                counts[bid] -= 1
+                if counts[bid] <= 0:
+                    del counts[bid]
+                if not counts:
+                    del self.by_family[fam]
+
+    def _touch(self, b: Binding) -> None:
+        """Hook called before any field of an attached binding is rebound (no-op for dict storage)."""
+
+    def _edge_add(self, src: str, e) -> None:
+        self.edge_rev += 1
+        self.out_rev[src] = self.out_rev.get(src, 0) + 1
+        if self.dirty is not None:
+            self.dirty[src] = None
+        dst = _edge_dst(e)
+        if dst is None:
+            return
+        srcs = self.incoming.setdefault(dst, {})
+        srcs[src] = srcs.get(src, 0) + 1
+
+    def _edge_remove(self, src: str, e) -> None:
+        self.edge_rev += 1
+        self.out_rev[src] = self.out_rev.get(src, 0) + 1
+        if self.dirty is not None:
+            self.dirty[src] = None
+        dst = _edge_dst(e)
+        srcs = self.incoming.get(dst) if dst is not None else None
+        if srcs is None or src not in srcs:
+            return
+        srcs[src] -= 1
+        if srcs[src] <= 0:
+            del srcs[src]
+        if not srcs:
+            del self.incoming[dst]
+
+    def _reedge(self, b: Binding, value) -> "_EdgeList":
+        """Swap the indexed outgoing edges of `b` for `value`; return the observed list to store."""
+        old = getattr(b, "edges", None)
+        if value is old and isinstance(old, _EdgeList) and old._table is self:  # pylint: disable=protected-access
+            return old
+        if isinstance(old, _EdgeList):
+            old._table = None  # pylint: disable=protected-access
+        for e in (old or ()):
+            self._edge_remove(b.id, e)
+        el = _EdgeList(value or (), self, b.id)
+        for e in el:
+            self._edge_add(b.id, e)
+        return el
+
+    def _retag(self, b: Binding, value) -> "_TagSet":
+        """Swap the indexed tags of `b` for `value`; return the observed set to store."""
+        old = getattr(b, "tags", None)
+        if value is old and isinstance(old, _TagSet) and old._table is self:  # pylint: disable=protected-access
+            return old
+        if isinstance(old, _TagSet):
+            old._table = None  # pylint: disable=protected-access
+        for t in (old or ()):
+            self._index_remove(b.id, t)
+        ts = _TagSet(value or (), self, b.id)
+        for t in ts:
+            self._index_add(b.id, t)
+        return ts
+
+    def _rewatch(self, b: Binding, value):
+        """Wrap a rebound meta/engrams dict so in-place edits mark `b` dirty (tracking on only)."""
+        if self.dirty is None or not isinstance(value, dict):
+            return value
+        self.dirty[b.id] = None
+        if isinstance(value, _WatchedDict) and value._table is self and value._bid == b.id:  # pylint: disable=protected-access
+            return value
+        return _WatchedDict(value, self, b.id)
+
+    def set_tracking(self, on: bool) -> None:
+        """Start (fresh, empty dirty set) or stop change tracking; starting wraps every meta/engrams dict."""
+        if not on:
+            self.dirty = None
+            return
+        self.dirty = {}
+        for b in dict.values(self):
+            object.__setattr__(b, "meta", self._rewatch(b, b.meta))
+            object.__setattr__(b, "engrams", self._rewatch(b, b.engrams))
+        self.dirty = {}
+
+    def _attach(self, bid: str, b: Binding) -> None:
+        self.edge_rev += 1
+        if bid not in self.order:
+            self.order[bid] = next(self._ordinal)
+        object.__setattr__(b, "_table", self)
+        b.tags = b.tags    # re-enters _retag: wraps the set and indexes every tag
+        b.edges = b.edges  # re-enters _reedge: wraps the list and indexes every edge
+        if self.dirty is not None:
+            b.meta = b.meta
+            b.engrams = b.engrams
+
+    def _detach(self, b: Binding) -> None:
+        self.edge_rev += 1
+        ts = getattr(b, "tags", None)
+        for t in (ts or ()):
+            self._index_remove(b.id, t)
+        if isinstance(ts, _TagSet):
+            ts._table = None  # pylint: disable=protected-access
+        es = getattr(b, "edges", None)
+        for e in (es or ()):
+            self._edge_remove(b.id, e)
+        if isinstance(es, _EdgeList):
+            es._table = None  # pylint: disable=protected-access
+        for d in (getattr(b, "meta", None), getattr(b, "engrams", None)):
+            if isinstance(d, _WatchedDict) and d._table is self:  # pylint: disable=protected-access
+                d._table = None  # pylint: disable=protected-access
+        if self.dirty is not None:
+            self.dirty[b.id] = None
+        object.__setattr__(b, "_table", None)
+
+    # --- dict mutators (keep the index in step) ---
+
+    def __setitem__(self, bid: str, b: Binding) -> None:
+        old = self.get(bid)
+        if old is not None and old is not b:
+            self._detach(old)
+        super().__setitem__(bid, b)
+        if old is not b:
+            self._attach(bid, b)
+
+    def __delitem__(self, bid: str) -> None:
+        b = self[bid]
+        super().__delitem__(bid)
+        self._detach(b)
+        self.order.pop(bid, None)
+
+    def pop(self, bid, *default):
+        if bid not in self:
+            if default:
+                return default[0]
+            raise KeyError(bid)
+        b = self[bid]
+        del self[bid]
+        return b
+
+    def popitem(self):
+        bid = next(reversed(self))
+        return bid, self.pop(bid)
+
+    def clear(self) -> None:
+        for b in list(self.values()):
+            self._detach(b)
+        super().clear()
+        self.order.clear()
+
+    def update(self, *args, **kwargs) -> None:
+        for bid, b in dict(*args, **kwargs).items():
+            self[bid] = b
+
+    def setdefault(self, bid, default=None):
+        if bid not in self:
+            self[bid] = default
+        return self[bid]
+
+    # --- queries ---
+
+    def ordered(self, holders) -> List[str]:
+        """Return the ids in `holders` sorted into _bindings insertion order."""
+        order = self.order
+        return sorted(holders, key=lambda x: order.get(x, 0))
+
+    def tag_holders(self, tag) -> List[str]:
+        """Return ids carrying `tag` in insertion order.
+
+        Holder dicts are kept in insertion order as bindings are added (new ids append at
+        the end); only a tag added to an older binding marks the tag unsorted, and the
+        next read re-sorts that one dict in place. Reads are otherwise a list copy.
+        """
+        holders = self.by_tag.get(tag)
+        if not holders:
+            return []
+        if tag in self._unsorted_tags:
+            self._unsorted_tags.discard(tag)
+            holders = self.by_tag[tag] = dict.fromkeys(self.ordered(holders))
+        return list(holders)
+
+    def family_holders(self, fam) -> List[str]:
+        """Return ids carrying any tag of family `fam` in insertion order (see tag_holders)."""
+        counts = self.by_family.get(fam)
+        if not counts:
+            return []
+        if fam in self._unsorted_families:
+            self._unsorted_families.discard(fam)
+            counts = self.by_family[fam] = {bid: counts[bid] for bid in self.ordered(counts)}
+        return list(counts)
+
+
+_IS_NOT_NONE = partial(is_not, None)   # C-level predicate: skip _seq tombstones
+
+
+class _CompactBindingTable(_BindingTable):
+    """Binding table for storage="compact": cold bindings packed into append-only columns.
+
+    Hot bindings live in the underlying dict exactly as in `_BindingTable`. `pack(ids)` moves
+    bindings into columnar storage:
+
+        strings:   one interner for tags, labels and ids   (str <-> int code)
+        tags:      tag_off[row] .. tag_off[row+1] slices of tag_pool  (array('I') of codes)
+        edges:     edge_off[row] .. edge_off[row+1] slices of edge_dst / edge_lab (array('I'))
+                   plus edge_meta (None for empty meta) -- i.e., CSR built append-only
+        meta / engrams: the binding's own dict objects (engrams None when empty)
+
+    Reads (`table[bid]`, `.get`, iteration) materialize a `Binding` view on demand; views are
+    cached weakly, so repeated reads while a view is alive return the same object. A view's
+    meta/engrams/edge-meta dicts are the stored objects, so in-place edits persist; any tag
+    or edge mutation (or rebinding a field) promotes the view back into the hot dict first.
+    Rewriting an edge dict's 'to'/'label' keys in place on a packed view is not persisted.
+    The tag/family/incoming indexes are unaffected by packing.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._names: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self.row_of: Dict[str, int] = {}
+        self._row_bid: List[Optional[str]] = []
+        self._tag_off = array("I", [0])
+        self._tag_pool = array("I")
+        self._edge_off = array("I", [0])
+        self._edge_dst = array("I")
+        self._edge_lab = array("I")
+        self._edge_meta: List[Optional[dict]] = []
+        self._meta: List[Optional[dict]] = []
+        self._engrams: List[Optional[dict]] = []
+        self._dead_rows: int = 0
+        self._permuted: bool = False   # a promotion re-inserted a key, so hot dict order != ordinal order
+        # bids in ordinal order (append-only; None marks a removed bid): _seq[order[bid]] == bid
+        self._seq: List[Optional[str]] = []
+        self._seq_dead: int = 0
+        self._views: "weakref.WeakValueDictionary[str, Binding]" = weakref.WeakValueDictionary()
+
+    # --- interning / packing ---
+
+    def _code(self, text: str) -> int:
+        c = self._codes.get(text)
+        if c is None:
+            c = len(self._names)
+            self._names.append(text)
+            self._codes[text] = c
+        return c
+
+    @staticmethod
+    def _packable(b: Binding) -> bool:
+        """Only bindings in the canonical shape are packed; anything unusual stays hot."""
+        if not isinstance(b.tags, set) or not all(isinstance(t, str) for t in b.tags):
+            return False
+        if not isinstance(b.meta, dict) or not isinstance(b.engrams, dict) or not isinstance(b.edges, list):
+            return False
+        for e in b.edges:
+            if not (isinstance(e, dict) and len(e) == 3 and isinstance(e.get("to"), str)
+                    and isinstance(e.get("label"), str) and isinstance(e.get("meta"), dict)):
+                return False
+        return True
+
+    def pack(self, bids) -> int:
+        """Move the given hot bindings into columnar storage; return how many were packed."""
+        n = 0
+        for bid in bids:
+            b = dict.get(self, bid)
+            if b is None or not self._packable(b):
+                continue
+            row = len(self._row_bid)
+            self._row_bid.append(bid)
+            self._tag_pool.extend(self._code(t) for t in sorted(b.tags))
+            self._tag_off.append(len(self._tag_pool))
+            for e in b.edges:
+                self._edge_dst.append(self._code(e["to"]))
+                self._edge_lab.append(self._code(e["label"]))
+                self._edge_meta.append(e["meta"] or None)
+            self._edge_off.append(len(self._edge_dst))
+            self._meta.append(b.meta)
+            self._engrams.append(b.engrams or None)
+            self.row_of[bid] = row
+            dict.__delitem__(self, bid)
+            # reads now go through fresh views; the old object raises if it is used again
+            for cont in (b.tags, b.edges):
+                if isinstance(cont, (_TagSet, _EdgeList)):
+                    cont._table = None  # pylint: disable=protected-access
+            object.__setattr__(b, "_table", None)
+            stale = _PackedField(bid)
+            for name in ("tags", "edges", "meta", "engrams"):
+                object.__setattr__(b, name, stale)
+            n += 1
+        return n
+
+    def _kill_row(self, bid: str) -> None:
+        row = self.row_of.pop(bid)
+        self._row_bid[row] = None
+        self._meta[row] = None
+        self._engrams[row] = None
+        self._dead_rows += 1
+        self._permuted = True
+        if self._dead_rows > 1024 and self._dead_rows > len(self.row_of):
+            self._rebuild_columns()
+
+    def _rebuild_columns(self) -> None:
+        """Drop dead rows (left behind by promotions/deletes) by copying live rows into fresh columns.
+
+        Row numbers change but bids do not, so cached views stay valid.
+        """
+        old_tag_off, old_tag_pool = self._tag_off, self._tag_pool
+        old_edge_off, old_dst, old_lab, old_emeta = self._edge_off, self._edge_dst, self._edge_lab, self._edge_meta
+        old_meta, old_eng, old_row_of = self._meta, self._engrams, self.row_of
+        self.__init_columns()
+        for bid in sorted(old_row_of, key=lambda x: self.order.get(x, 0)):
+            r = old_row_of[bid]
+            self.row_of[bid] = len(self._row_bid)
+            self._row_bid.append(bid)
+            self._tag_pool.extend(old_tag_pool[old_tag_off[r]:old_tag_off[r + 1]])
+            self._tag_off.append(len(self._tag_pool))
+            lo, hi = old_edge_off[r], old_edge_off[r + 1]
+            self._edge_dst.extend(old_dst[lo:hi])
+            self._edge_lab.extend(old_lab[lo:hi])
+            self._edge_meta.extend(old_emeta[lo:hi])
+            self._edge_off.append(len(self._edge_dst))
+            self._meta.append(old_meta[r])
+            self._engrams.append(old_eng[r])
+
+    def _attach(self, bid: str, b: Binding) -> None:
+        fresh = bid not in self.order
+        super()._attach(bid, b)
+        if fresh:
+            self._seq.append(bid)
+
+    def _forget_order(self, bid: str) -> None:
+        """Drop bid from the ordinal order, leaving a tombstone in _seq (compacted when mostly dead)."""
+        ordinal = self.order.pop(bid, None)
+        if ordinal is None:
+            return
+        self._seq[ordinal] = None
+        self._seq_dead += 1
+        if self._seq_dead > 1024 and self._seq_dead > len(self.order):
+            # Renumber ordinals densely. As with a dict, mutating while iterating is unsupported:
+            # an iterator opened before this point keeps walking the old list.
+            live = [x for x in self._seq if x is not None]
+            self._seq = live
+            self._seq_dead = 0
+            order = self.order
+            for i, x in enumerate(live):
+                order[x] = i
+            self._ordinal = itertools.count(len(live))
+
+    def _iter_seq(self, reverse: bool = False):
+        return filter(_IS_NOT_NONE, reversed(self._seq) if reverse else self._seq)
+
+    def __init_columns(self) -> None:
+        self.row_of = {}
+        self._row_bid = []
+        self._tag_off = array("I", [0])
+        self._tag_pool = array("I")
+        self._edge_off = array("I", [0])
+        self._edge_dst = array("I")
+        self._edge_lab = array("I")
+        self._edge_meta = []
+        self._meta = []
+        self._engrams = []
+        self._dead_rows = 0
+
+    def _materialize(self, bid: str) -> Binding:
+        """Return the (cached) Binding view of a packed row; nothing is re-indexed."""
+        v = self._views.get(bid)
+        if v is not None:
+            return v
+        row = self.row_of[bid]
+        names = self._names
+        tags = _TagSet((names[c] for c in self._tag_pool[self._tag_off[row]:self._tag_off[row + 1]]), self, bid)
+        edges = _EdgeList((), self, bid)
+        for k in range(self._edge_off[row], self._edge_off[row + 1]):
+            m = self._edge_meta[k]
+            if m is None:
+                m = {}
+                self._edge_meta[k] = m   # keep identity so in-place edits persist
+            list.append(edges, {"to": names[self._edge_dst[k]], "label": names[self._edge_lab[k]], "meta": m})
+        eng = self._engrams[row]
+        if eng is None:
+            eng = _WatchedDict((), self, bid) if self.dirty is not None else {}
+            self._engrams[row] = eng
+        v = Binding(id=bid, tags=set(), edges=[], meta=self._meta[row], engrams=eng)
+        object.__setattr__(v, "_table", self)
+        object.__setattr__(v, "tags", tags)
+        object.__setattr__(v, "edges", edges)
+        tags._owner = v   # pylint: disable=protected-access
+        edges._owner = v  # pylint: disable=protected-access
+        self._views[bid] = v
+        return v
+
+    def set_tracking(self, on: bool) -> None:
+        super().set_tracking(on)
+        if not on:
+            return
+        for bid, row in self.row_of.items():
+            for col in (self._meta, self._engrams):
+                if isinstance(col[row], dict) and not isinstance(col[row], _WatchedDict):
+                    col[row] = _WatchedDict(col[row], self, bid)
+            v = self._views.get(bid)
+            if v is not None:
+                object.__setattr__(v, "meta", self._meta[row])
+                if self._engrams[row] is not None:
+                    object.__setattr__(v, "engrams", self._engrams[row])
+
+    def _promote(self, bid: str) -> None:
+        if bid in self.row_of:
+            v = self._materialize(bid)
+            self._kill_row(bid)
+            self._views.pop(bid, None)
+            dict.__setitem__(self, bid, v)
+
+    # --- write hooks: promote a packed binding before it changes ---
+
+    def _touch(self, b: Binding) -> None:
+        self._promote(b.id)
+
+    def _index_add(self, bid: str, tag) -> None:
+        self._promote(bid)
+        super()._index_add(bid, tag)
+
+    def _index_remove(self, bid: str, tag) -> None:
+        self._promote(bid)
+        super()._index_remove(bid, tag)
+
+    def _edge_add(self, src: str, e) -> None:
+        self._promote(src)
+        super()._edge_add(src, e)
+
+    def _edge_remove(self, src: str, e) -> None:
+        self._promote(src)
+        super()._edge_remove(src, e)
+
+    # --- mapping protocol over hot dict + packed rows ---
+
+    def __getitem__(self, bid):
+        try:
+            return dict.__getitem__(self, bid)
+        except KeyError:
+            if bid in self.row_of:
+                return self._materialize(bid)
+            raise
+
+    def get(self, bid, default=None):
+        b = dict.get(self, bid)
+        if b is not None:
+            return b
+        if bid in self.row_of:
+            return self._materialize(bid)
+        return default
+
+    def __contains__(self, bid) -> bool:
+        return dict.__contains__(self, bid) or bid in self.row_of
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self.row_of)
+
+    def __iter__(self):
+        if not self.row_of and not self._permuted:
+            return dict.__iter__(self)
+        return self._iter_seq()
+
+    def __reversed__(self):
+        if not self.row_of and not self._permuted:
+            return dict.__reversed__(self)
+        return self._iter_seq(reverse=True)
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def copy(self) -> dict:
+        return {bid: self[bid] for bid in self}
+
+    def __setitem__(self, bid: str, b: Binding) -> None:
+        if bid in self.row_of:
+            old = self._materialize(bid)
+            if old is b:
+                self._promote(bid)
+                return
+            self._kill_row(bid)
+            self._views.pop(bid, None)
+            self._detach(old)
+            dict.__setitem__(self, bid, b)
+            self._attach(bid, b)
+            return
+        super().__setitem__(bid, b)
+
+    def __delitem__(self, bid: str) -> None:
+        if bid in self.row_of:
+            old = self._materialize(bid)
+            self._kill_row(bid)
+            self._views.pop(bid, None)
+            self._detach(old)
+            self._forget_order(bid)
+            return
+        b = self[bid]
+        dict.__delitem__(self, bid)
+        self._detach(b)
+        self._forget_order(bid)
+
+    def clear(self) -> None:
+        super().clear()
+        self.__init_columns()
+        self._permuted = False
+        self._seq = []
+        self._seq_dead = 0
+        self._ordinal = itertools.count()
+        self._views = weakref.WeakValueDictionary()
+
+
 # ------------------------- Developmental Tag Lexicon -------------------------
 
 class TagLexicon:
@@ -345,7 +1272,7 @@ class WorldGraph:
         - The planner is intentionally simple (BFS/Djikstra/other) and replaceable later.
     """
 
-    def __init__(self, *, memory_mode: str = "episodic") -> None:
+    def __init__(self, *, memory_mode: str = "episodic", storage: Optional[str] = None) -> None:
         """Initializes an empty episode graph.
 
         Args:
@@ -355,8 +1282,20 @@ class WorldGraph:
                 - "semantic": add_predicate/add_cue will *reuse* an existing binding when the
                               identical tag already exists, enabling basic consolidation
                               (reduces repetitive nodes in long-term graphs).
-        """
-        self._bindings: Dict[str, Binding] = {}
+            storage:
+                - "dict":    one Binding object per node (default).
+                - "compact": same API, but an explicit compact() call packs cold bindings into
+                             interned, array-backed columns (see _CompactBindingTable). For long runs.
+                None reads CCA8_WORLD_STORAGE (like CCA8_PLANNER), else "dict".
+        """
+        if storage is None:
+            storage = (os.environ.get("CCA8_WORLD_STORAGE", "") or "").strip().lower() or "dict"
+            if storage not in _STORAGE_MODES:
+                storage = "dict"   # ignore invalid env values
+        if storage not in _STORAGE_MODES:
+            raise ValueError("storage must be one of " + ", ".join(repr(x) for x in _STORAGE_MODES))
+        # id -> Binding, with an incrementally maintained tag/family index (see _BindingTable)
+        self._bindings: Dict[str, Binding] = _CompactBindingTable() if storage == "compact" else _BindingTable()
         self._anchors: Dict[str, str] = {}           # name -> binding_id
         self._latest_binding_id: Optional[str] = None
         #self._id_counter: int = 1
@@ -382,6 +1321,12 @@ class WorldGraph:
         # This keeps "global default planner" configuration easy, while still allowing
         # explicit runtime switching via world.set_planner(...).
         self._plan_strategy: str = "bfs"
+        self._astar_heuristic: Optional[Callable[[str, str], float]] = None
+        # Id of the A* search in progress (None between searches); heuristic caches key on it
+        self._astar_search_id: Optional[int] = None
+        self._astar_search_seq: int = 0
+        # src_id -> (out_rev, [(dst, cost), ...]) -- edge costs pre-extracted from edge meta
+        self._cost_cache: Dict[str, tuple[int, List[tuple[Optional[str], float]]]] = {}
         env_planner = (os.environ.get("CCA8_PLANNER", "") or "").strip().lower()
         if env_planner:
             try:
@@ -390,6 +1335,11 @@ class WorldGraph:
                 # Ignore invalid env values; keep BFS.
                 pass
 
+        # Bounded-hop distance fields, cached per source and invalidated by edge/node mutations
+        # src_id -> (hop bound or None, {bid: hops} in BFS discovery order), valid for _dist_cache_rev
+        self._dist_cache: Dict[str, tuple[Optional[int], Dict[str, int]]] = {}
+        self._dist_cache_rev: int = -1
+
         # Memory / consolidation mode (NEW)
         self._memory_mode: str = "episodic"
         self._semantic_tag_index: Dict[str, str] = {}  # tag -> canonical binding_id (semantic mode only)
@@ -505,18 +1455,83 @@ class WorldGraph:
     def set_planner(self, strategy: str = "bfs") -> None:
         """
         Set the path planner used by plan_to_predicate().
-        Accepts 'bfs' (default) or 'dijkstra'.
+        Accepts 'bfs' (default), 'dijkstra', 'astar' or 'bidirectional'.
+
+        - 'astar' is Dijkstra guided by the heuristic set with set_astar_heuristic()
+          (none set -> h=0, i.e., identical to Dijkstra).
+        - 'bidirectional' searches forward from the start and backward from every
+          binding carrying the target tag (known via the tag index) until the
+          frontiers meet; lowest total edge cost, like Dijkstra.
         """
         s = (strategy or "bfs").lower()
-        if s not in {"bfs", "dijkstra"}:
-            raise ValueError("strategy must be 'bfs' or 'dijkstra'")
+        if s not in _PLANNER_STRATEGIES:
+            raise ValueError("strategy must be one of " + ", ".join(repr(x) for x in _PLANNER_STRATEGIES))
         self._plan_strategy = s
 
 
     def get_planner(self) -> str:
-        """Return the current planner strategy ('bfs' or 'dijkstra')."""
+        """Return the current planner strategy ('bfs' | 'dijkstra' | 'astar' | 'bidirectional')."""
         return getattr(self, "_plan_strategy", "bfs")
 
+
+    def set_astar_heuristic(self, heuristic: Optional[Callable[[str, str], float]]) -> None:
+        """Install the A* heuristic h(bid, target_tag) -> estimated remaining cost (None clears it).
+
+        The heuristic must be admissible (never overestimate the true remaining edge cost)
+        for 'astar' to return lowest-cost paths. See spatial_heuristic() for a ready-made one.
+        """
+        if heuristic is not None and not callable(heuristic):
+            raise ValueError("heuristic must be callable(bid, target_tag) -> float, or None")
+        self._astar_heuristic = heuristic
+
+
+    def spatial_heuristic(self, *, scale: float = 1.0) -> Callable[[str, str], float]:
+        """Return an A* heuristic: straight-line distance to the nearest binding carrying the target tag.
+
+        Positions are read from binding meta, preferring meta['wm']['pos'] (WorkingMap/NavMap
+        schematic positions) then meta['pos'], as {'x': .., 'y': ..}. Bindings without a
+        position contribute h=0, so the estimate stays admissible whenever every edge's cost
+        is at least `scale` x the straight-line distance it spans.
+
+        Goal positions are collected once per A* search and dropped when the next search
+        starts, so goals added or moved after the heuristic is installed are seen. Calls made
+        outside a plan_to_predicate() search are not cached.
+        """
+        goal_pos: Dict[str, List[tuple[float, float]]] = {}
+        goal_search: List[Optional[int]] = [None]   # search id goal_pos was collected for
+
+        def _pos(bid: str) -> Optional[tuple[float, float]]:
+            b = self._bindings.get(bid)
+            meta = getattr(b, "meta", None) if b is not None else None
+            if not isinstance(meta, dict):
+                return None
+            wm = meta.get("wm")
+            raw = wm.get("pos") if isinstance(wm, dict) else None
+            if not isinstance(raw, dict):
+                raw = meta.get("pos")
+            if isinstance(raw, dict):
+                x, y = raw.get("x"), raw.get("y")
+                if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+                    return float(x), float(y)
+            return None
+
+        def _h(bid: str, target_tag: str) -> float:
+            search_id = getattr(self, "_astar_search_id", None)
+            if search_id is None or search_id != goal_search[0]:
+                goal_pos.clear()
+                goal_search[0] = search_id
+            goals = goal_pos.get(target_tag)
+            if goals is None:
+                goals = [p for p in (_pos(g) for g in self.bindings_with_tag(target_tag)) if p is not None]
+                if search_id is not None:
+                    goal_pos[target_tag] = goals
+            here = _pos(bid)
+            if here is None or not goals:
+                return 0.0
+            return scale * min(math.hypot(here[0] - gx, here[1] - gy) for gx, gy in goals)
+
+        return _h
+
     # --- memory / consolidation --------------------------------------------
 
     def set_memory_mode(self, mode: str) -> None:
@@ -735,6 +1750,111 @@ class WorldGraph:
         """Return the next binding id as 'b<N>' using the internal counter."""
         return f"b{next(self._id_counter)}"
 
+    # ------------------------- tag index queries -------------------------
+    # O(1) gate checks over the incrementally maintained tag index (see _BindingTable).
+    # Controller/runner helpers use these instead of scanning _bindings on every tick.
+
+    def _indexed_bindings(self) -> _BindingTable:
+        """Return the indexed binding table (tags/families/incoming edges), upgrading a plain dict if someone swapped one in."""
+        table = self._bindings
+        if not isinstance(table, _BindingTable):
+            upgraded = _BindingTable()
+            upgraded.update(table)
+            self._bindings = upgraded
+            table = upgraded
+        return table
+
+
+    def get_storage_mode(self) -> str:
+        """Return the binding storage backend ('dict' | 'compact')."""
+        return "compact" if isinstance(self._bindings, _CompactBindingTable) else "dict"
+
+
+    def compact(self, *, keep: Iterable[str] = ()) -> int:
+        """Pack cold bindings into columnar storage; return how many were packed (0 in dict mode).
+
+        Anchors, the latest binding and ids in `keep` stay hot. Nothing calls this automatically:
+        it is an explicit opt-in for long runs, to be called at a safe point (e.g., between
+        cognitive cycles). Binding objects fetched earlier for a packed id are stale afterwards;
+        any use of their tags/edges/meta/engrams raises RuntimeError, so re-read
+        world._bindings[bid] instead. Errors while packing propagate to the caller.
+        """
+        table = self._bindings
+        if not isinstance(table, _CompactBindingTable):
+            return 0
+        hot = set(self._anchors.values())
+        hot.update(keep)
+        if self._latest_binding_id:
+            hot.add(self._latest_binding_id)
+        return table.pack([bid for bid in dict.keys(table) if bid not in hot])
+
+
+    # ------------------------- change tracking (delta autosave) -------------------------
+
+    def track_changes(self, enabled: bool = True) -> None:
+        """Turn binding change tracking on (starting from an empty change set) or off.
+
+        While on, additions/removals and every tag, edge, meta or engrams change mark the
+        binding as changed; pop_changes() drains the set. Used by the autosave journal
+        (cca8_snapshot.SessionJournal) so a save costs O(changes), not O(graph).
+        """
+        self._indexed_bindings().set_tracking(bool(enabled))
+
+
+    def is_tracking_changes(self) -> bool:
+        """Return True while track_changes() is on."""
+        return self._indexed_bindings().dirty is not None
+
+
+    def mark_changed(self, bid: str) -> None:
+        """Flag a binding as changed (for edits the tracker cannot see, e.g., edge meta in place)."""
+        dirty = self._indexed_bindings().dirty
+        if dirty is not None:
+            dirty[bid] = None
+
+
+    def pop_changes(self) -> tuple[list[tuple[str, Binding]], list[str]]:
+        """Drain the change set: return ([(bid, Binding) changed or added], [removed bids]).
+
+        Changed bindings come back in first-change order, so newly added ones keep their
+        creation order. Returns ([], []) when tracking is off.
+        """
+        table = self._indexed_bindings()
+        if not table.dirty:
+            return [], []
+        changed, table.dirty = table.dirty, {}
+        upserts: list[tuple[str, Binding]] = []
+        removed: list[str] = []
+        for bid in changed:
+            b = table.get(bid)
+            if b is None:
+                removed.append(bid)
+            else:
+                upserts.append((bid, b))
+        return upserts, removed
+
+
+    def has_tag(self, tag: str) -> bool:
+        """Return True if any binding carries the exact tag (e.g., 'pred:posture:fallen')."""
+        return bool(self._indexed_bindings().by_tag.get(tag))
+
+
+    def bindings_with_tag(self, tag: str) -> list[str]:
+        """Return ids of bindings carrying the exact tag, in binding insertion order."""
+        return self._indexed_bindings().tag_holders(tag)
+
+
+    def has_tag_family(self, family: str) -> bool:
+        """Return True if any binding carries a tag of the given family ('cue', 'pred:', 'anchor', ...)."""
+        fam = (family or "").rstrip(":")
+        return bool(self._indexed_bindings().by_family.get(fam))
+
+
+    def bindings_with_tag_family(self, family: str) -> list[str]:
+        """Return ids of bindings carrying any tag of the given family, in binding insertion order."""
+        fam = (family or "").rstrip(":")
+        return self._indexed_bindings().family_holders(fam)
+
     # ------------------------- anchors ---------------------------
 
     def ensure_anchor(self, name: str) -> str:
@@ -1166,7 +2286,8 @@ class WorldGraph:
     def capture_scene(self, channel: str, token: str, vector: list[float],
                       *, shape: tuple[int, ...] | None = None, attach: str = "now",
                       family: str = "cue", name: str | None = None,
-                      links: list[str] | None = None, attrs: dict | None = None) -> tuple[str, str]:
+                      links: list[str] | None = None, attrs: dict | None = None,
+                      precision: str = "float64") -> tuple[str, str]:
         """
         Convenience for creating a tiny numeric 'scene' payload and emitting it
         as a cue or predicate with an attached engram pointer.
@@ -1181,19 +2302,28 @@ class WorldGraph:
         name    : optional column record name; default uses channel:token
         links   : optional world tokens to record alongside the engram
         attrs   : optional dict for extra descriptors
+        precision : 'float64' (default) keeps the vector's values exactly as given in
+                    payload.data; 'float32' stores one compact float32 buffer (TensorView)
+                    that to_bytes() writes directly, with values rounded to float32
 
         Returns
         -------
         (bid, engram_id)
         """
+        if precision not in ("float64", "float32"):
+            raise ValueError("precision must be 'float64' or 'float32'")
         # pylint: disable=import-outside-toplevel
         try:
-            from cca8_features import TensorPayload
+            from cca8_features import TensorPayload, TensorView
         except Exception:
-            TensorPayload = None  # type: ignore[assignment, misc]
+            TensorPayload = TensorView = None  # type: ignore[assignment, misc]
 
         payload: object
-        if TensorPayload is not None:
+        if TensorView is not None and precision == "float32":
+            # one float32 copy of the caller's vector; to_bytes() and Column storage reuse it
+            payload = TensorView(vector, shape=shape or (len(vector),),
+                                 kind="scene", fmt="tensor/list-f32")
+        elif TensorPayload is not None:
             payload = TensorPayload(data=list(vector), shape=shape or (len(vector),),
                                     kind="scene", fmt="tensor/list-f32")
         else:
@@ -1246,16 +2376,11 @@ class WorldGraph:
         edges = getattr(b, "edges", None)
         if not isinstance(edges, list):
             return 0
-
-
-        def _rel(e: dict) -> str:
-            return e.get("label") or e.get("rel") or e.get("relation") or "then"
-
         before = len(edges)
         if label is None:
             edges[:] = [e for e in edges if e.get("to") != dst_id]
         else:
-            edges[:] = [e for e in edges if not (e.get("to") == dst_id and _rel(e) == label)]
+            edges[:] = [e for e in edges if not (e.get("to") == dst_id and _edge_rel(e) == label)]
         return before - len(edges)
     # alias (older callers may still use remove_edge() )
     remove_edge = delete_edge
@@ -1266,7 +2391,8 @@ class WorldGraph:
 
         This is intentionally conservative and used primarily for WorkingMap pruning.
 
-        - Removes incoming edges that point to `bid` (optional)
+        - Removes incoming edges that point to `bid` (optional); only the predecessors
+          recorded in the incoming-edge index are visited, so this is O(in-degree)
         - Removes anchors that point to `bid` (optional)
         - Cleans the semantic index if it pointed at this node
 
@@ -1277,8 +2403,9 @@ class WorldGraph:
             return False
 
         if prune_incoming:
-            for b in self._bindings.values():
-                b.edges = [e for e in b.edges if e.get("to") != bid]
+            for src in self.predecessors(bid):
+                b = self._bindings[src]
+                b.edges[:] = [e for e in b.edges if e.get("to") != bid]
 
         if prune_anchors:
             for name, aid in list(self._anchors.items()):
@@ -1286,6 +2413,7 @@ class WorldGraph:
                     del self._anchors[name]
 
         del self._bindings[bid]
+        self._cost_cache.pop(bid, None)
 
         if self._latest_binding_id == bid:
             self._latest_binding_id = None
@@ -1297,6 +2425,26 @@ class WorldGraph:
         return True
 
 
+    def predecessors(self, bid: str, label: Optional[str] = None) -> list[str]:
+        """Return ids of bindings with an edge into `bid` (optionally only edges with `label`).
+
+        Backed by the incoming-edge index, so the cost is O(in-degree) rather than a scan of
+        every binding's edge list. Results follow binding insertion order; each predecessor
+        appears once even if it has several parallel edges into `bid`.
+        """
+        table = self._indexed_bindings()
+        srcs = table.incoming.get(bid)
+        if not srcs:
+            return []
+        out = [src for src in table.ordered(srcs) if src in table]
+        if label is None:
+            return out
+        return [
+            src for src in out
+            if any(_edge_dst(e) == bid and _edge_rel(e) == label for e in table[src].edges)
+        ]
+
+
     def add_action(self, token: str, attach: str = "latest", meta: Optional[dict] = None, engrams: Optional[dict] = None) -> str:
         """
         Create an action binding carrying 'action:<token>'.
@@ -1375,7 +2523,7 @@ class WorldGraph:
 
     def plan_to_predicate(self, src_id: str, token: str) -> Optional[List[str]]:
         """Plan from src_id to first binding carrying 'pred:<token>'.
-        Strategy chosen by self._plan_strategy ('bfs' | 'dijkstra').
+        Strategy chosen by self._plan_strategy ('bfs' | 'dijkstra' | 'astar' | 'bidirectional').
         """
         # Normalize the tag we are searching for
         token = (token or "").strip()
@@ -1388,8 +2536,19 @@ class WorldGraph:
             return [src_id]
 
         # Strategy dispatch
-        if getattr(self, "_plan_strategy", "bfs") == "dijkstra":
+        strategy = getattr(self, "_plan_strategy", "bfs")
+        if strategy == "dijkstra":
             return self._plan_to_predicate_dijkstra(src_id, target_tag)
+        if strategy == "astar":
+            # Each search gets its own id so heuristics may cache per search (see spatial_heuristic).
+            self._astar_search_seq = getattr(self, "_astar_search_seq", 0) + 1
+            self._astar_search_id = self._astar_search_seq
+            try:
+                return self._plan_to_predicate_astar(src_id, target_tag)
+            finally:
+                self._astar_search_id = None
+        if strategy == "bidirectional":
+            return self._plan_to_predicate_bidirectional(src_id, target_tag)
 
         # --- BFS (current behavior) ---
         q: deque[str] = deque([src_id])
@@ -1434,6 +2593,32 @@ class WorldGraph:
         return 1.0  # default infrastructure: unweighted edges
 
 
+    def _out_costs(self, bid: str) -> List[tuple[Optional[str], float]]:
+        """Return [(dst, cost), ...] for bid's outgoing edges, parsed once per edge-list revision.
+
+        The cache is keyed on the binding's outgoing-edge revision, so adding/removing/replacing
+        edges refreshes it automatically. Editing an existing edge's meta weight *in place*
+        is not observed -- call invalidate_edge_costs() after doing that.
+        """
+        table = self._indexed_bindings()
+        rev = table.out_rev.get(bid, 0)
+        cache = self._cost_cache
+        hit = cache.get(bid)
+        if hit is not None and hit[0] == rev:
+            return hit[1]
+        pairs = [(_edge_dst(e), self._edge_cost(e)) for e in table[bid].edges]
+        cache[bid] = (rev, pairs)
+        return pairs
+
+
+    def invalidate_edge_costs(self, bid: Optional[str] = None) -> None:
+        """Drop cached edge costs for one binding (or all) after in-place edits of edge meta weights."""
+        if bid is None:
+            self._cost_cache.clear()
+        else:
+            self._cost_cache.pop(bid, None)
+
+
     def _plan_to_predicate_dijkstra(self, src_id: str, target_tag: str) -> Optional[List[str]]:
         """
         Dijkstra search from src_id to the first node that carries 'target_tag'.
@@ -1463,14 +2648,12 @@ class WorldGraph:
             if b_u and (target_tag in getattr(b_u, "tags", [])):
                 return self._reconstruct_path(parent, u)
 
-            # relax outgoing edges
+            # relax outgoing edges (costs come pre-extracted from the cost cache)
             if not b_u:
                 continue
-            for e in getattr(b_u, "edges", []) or []:
-                v = e.get("to")
+            for v, w in self._out_costs(u):
                 if not v or v not in self._bindings:
                     continue
-                w = self._edge_cost(e)
                 if w < 0:
                     # ignore pathological negatives; infra is for non-negative costs
                     continue
@@ -1482,6 +2665,289 @@ class WorldGraph:
 
         return None
 
+    def _plan_to_predicate_astar(self, src_id: str, target_tag: str) -> Optional[List[str]]:
+        """
+        A* search from src_id to the first node carrying 'target_tag'.
+        Uses the heuristic from set_astar_heuristic(); with none installed (h=0) it is Dijkstra.
+        Nodes are re-opened when a cheaper g is found, so admissible-but-inconsistent
+        heuristics still yield lowest-cost paths.
+        """
+        table = self._indexed_bindings()
+        if not src_id or src_id not in table:
+            return None
+        if target_tag in table[src_id].tags:
+            return [src_id]
+        if not table.by_tag.get(target_tag):
+            return None   # tag index: no binding carries the target at all
+
+        h_fn = self._astar_heuristic
+
+        def _h(bid: str) -> float:
+            if h_fn is None:
+                return 0.0
+            try:
+                return max(0.0, float(h_fn(bid, target_tag)))
+            except Exception:
+                return 0.0
+
+        g: Dict[str, float] = {src_id: 0.0}
+        parent: Dict[str, Optional[str]] = {src_id: None}
+        tie = itertools.count()   # stable FIFO tie-break among equal f
+        pq: list[tuple[float, int, float, str]] = [(_h(src_id), next(tie), 0.0, src_id)]
+
+        while pq:
+            _f, _n, g_u, u = heapq.heappop(pq)
+            if g_u > g.get(u, float("inf")):
+                continue   # stale queue entry
+            b_u = table.get(u)
+            if b_u is None:
+                continue
+            if target_tag in b_u.tags:
+                return self._reconstruct_path(parent, u)
+            for v, w in self._out_costs(u):
+                if not v or v not in table or w < 0:
+                    continue
+                ng = g_u + w
+                if ng < g.get(v, float("inf")):
+                    g[v] = ng
+                    parent[v] = u
+                    heapq.heappush(pq, (ng + _h(v), next(tie), ng, v))
+        return None
+
+
+    def _plan_to_predicate_bidirectional(self, src_id: str, target_tag: str) -> Optional[List[str]]:
+        """
+        Bidirectional Dijkstra from src_id to the cheapest binding carrying 'target_tag'.
+
+        The backward search starts from every goal binding at once (the goal set comes from
+        the tag index) and walks the incoming-edge index. It stops when the two frontier
+        minima together can no longer beat the best meeting point found so far.
+        """
+        table = self._indexed_bindings()
+        if not src_id or src_id not in table:
+            return None
+        if target_tag in table[src_id].tags:
+            return [src_id]
+        goals = [bid for bid in table.tag_holders(target_tag) if bid in table]
+        if not goals:
+            return None
+
+        def _back_costs(v: str) -> List[tuple[str, float]]:
+            # cheapest parallel edge u->v for each predecessor u
+            out: List[tuple[str, float]] = []
+            for u in self.predecessors(v):
+                best = min((w for d, w in self._out_costs(u) if d == v and w >= 0), default=None)
+                if best is not None:
+                    out.append((u, best))
+            return out
+
+        dist_f: Dict[str, float] = {src_id: 0.0}
+        dist_b: Dict[str, float] = {gid: 0.0 for gid in goals}
+        par_f: Dict[str, Optional[str]] = {src_id: None}
+        par_b: Dict[str, Optional[str]] = {gid: None for gid in goals}
+        done_f: Set[str] = set()
+        done_b: Set[str] = set()
+        tie = itertools.count()
+        pq_f: list[tuple[float, int, str]] = [(0.0, next(tie), src_id)]
+        pq_b: list[tuple[float, int, str]] = [(0.0, next(tie), gid) for gid in goals]
+        best_cost = float("inf")
+        meet: Optional[str] = None
+
+        def _consider(x: str) -> None:
+            nonlocal best_cost, meet
+            if x in dist_f and x in dist_b and dist_f[x] + dist_b[x] < best_cost:
+                best_cost = dist_f[x] + dist_b[x]
+                meet = x
+
+        while pq_f and pq_b:
+            if pq_f[0][0] + pq_b[0][0] >= best_cost:
+                break
+            forward = pq_f[0][0] <= pq_b[0][0]
+            pq, dist, par, done = (pq_f, dist_f, par_f, done_f) if forward else (pq_b, dist_b, par_b, done_b)
+            d_u, _n, u = heapq.heappop(pq)
+            if u in done or d_u > dist.get(u, float("inf")):
+                continue
+            done.add(u)
+            steps = self._out_costs(u) if forward else _back_costs(u)
+            for v, w in steps:
+                if not v or v not in table or w < 0:
+                    continue
+                nd = d_u + w
+                if nd < dist.get(v, float("inf")):
+                    dist[v] = nd
+                    par[v] = u
+                    heapq.heappush(pq, (nd, next(tie), v))
+                    _consider(v)
+
+        if meet is None:
+            return None
+        path = self._reconstruct_path(par_f, meet)
+        cur = par_b.get(meet)
+        while cur is not None:
+            path.append(cur)
+            cur = par_b.get(cur)
+        return path
+
+    # ---------------------- multi-target / bounded queries ----------------------
+
+    def distance_field(self, src_id: str, *, max_hops: Optional[int] = None) -> Dict[str, int]:
+        """Return {bid: hop distance} for every binding reachable from src_id within max_hops.
+
+        The dict is in BFS discovery order (src first), i.e., the same order an early-exit
+        BFS would visit nodes, so "first match in the field" == "first match a BFS would find".
+
+        Fields are cached per source and reused until an edge or binding is added/removed
+        (tag changes do not invalidate them). A field computed with a larger bound answers
+        smaller-bound queries by filtering. Treat the returned dict as read-only.
+        """
+        table = self._indexed_bindings()
+        if src_id not in table:
+            return {}
+        cache = self._dist_cache
+        if self._dist_cache_rev != table.edge_rev:
+            cache.clear()   # an edge or binding changed since these fields were computed
+            self._dist_cache_rev = table.edge_rev
+        hit = cache.get(src_id)
+        if hit is not None:
+            bound, field_ = hit
+            if max_hops == bound:
+                return field_
+            if bound is None or (max_hops is not None and max_hops < bound):
+                return {bid: d for bid, d in field_.items() if d <= max_hops}
+
+        field_ = {src_id: 0}
+        q: deque[str] = deque([src_id])
+        while q:
+            u = q.popleft()
+            du = field_[u]
+            if max_hops is not None and du >= max_hops:
+                continue
+            for e in table[u].edges:
+                v = _edge_dst(e)
+                if v is None or v in field_ or v not in table:
+                    continue
+                field_[v] = du + 1
+                q.append(v)
+        cache[src_id] = (max_hops, field_)
+        return field_
+
+
+    def tags_within(self, src_id: str, tags, *, max_hops: Optional[int] = None) -> Dict[str, List[str]]:
+        """Answer "which of these tags are within k hops of src_id?" in one sweep.
+
+        Returns {tag: [bid, ...]} for each tag carried by at least one reachable binding;
+        bids are listed nearest-first (BFS discovery order). Tags with no reachable
+        holder are omitted, so `bool(result.get(tag))` is the usual gate test.
+        """
+        field_ = self.distance_field(src_id, max_hops=max_hops)
+        if not field_:
+            return {}
+        table = self._indexed_bindings()
+        out: Dict[str, List[str]] = {}
+        rank: Optional[Dict[str, int]] = None
+        for tag in tags:
+            holders = table.by_tag.get(tag)
+            if not holders:
+                continue
+            # iterate whichever side is smaller
+            if len(holders) < len(field_):
+                hits = [bid for bid in holders if bid in field_]
+                if len(hits) > 1:
+                    if rank is None:
+                        rank = {bid: i for i, bid in enumerate(field_)}
+                    hits.sort(key=rank.__getitem__)
+            else:
+                hits = [bid for bid in field_ if bid in holders]
+            if hits:
+                out[tag] = hits
+        return out
+
+
+    def plan_to_targets(
+        self,
+        src_id: str,
+        targets,
+        *,
+        max_hops: Optional[int] = None,
+        max_cost: Optional[float] = None,
+    ) -> Dict[str, List[str]]:
+        """Plan from src_id to many target bindings in a single search sweep.
+
+        Args:
+            src_id: start binding id (e.g., NOW).
+            targets: iterable of binding ids to reach.
+            max_hops: optional bound on path length in edges.
+            max_cost: optional bound on total edge cost (see _edge_cost); forces a
+                      cost-ordered (Dijkstra) sweep even when the planner is 'bfs'.
+
+        Returns:
+            {target_id: [src_id, ..., target_id]} for every target reached within the
+            bounds; unreachable targets are omitted. The sweep stops as soon as every
+            target has been settled. Paths are shortest by hops ('bfs') or by cost
+            ('dijkstra' or when max_cost is given). In cost-ordered sweeps max_hops prunes
+            the cost-optimal search tree, i.e., it is a cheap cut-off rather than an exact
+            hop-constrained shortest path.
+        """
+        table = self._indexed_bindings()
+        if not src_id or src_id not in table:
+            return {}
+        goals = {t for t in targets if t in table}
+        out: Dict[str, List[str]] = {}
+        if src_id in goals:
+            out[src_id] = [src_id]
+            goals.discard(src_id)
+        if not goals:
+            return out
+
+        parent: Dict[str, Optional[str]] = {src_id: None}
+        hops: Dict[str, int] = {src_id: 0}
+
+        if max_cost is None and self.get_planner() == "bfs":
+            q: deque[str] = deque([src_id])
+            while q and goals:
+                u = q.popleft()
+                if max_hops is not None and hops[u] >= max_hops:
+                    continue
+                for e in table[u].edges:
+                    v = _edge_dst(e)
+                    if v is None or v in parent or v not in table:
+                        continue
+                    parent[v] = u
+                    hops[v] = hops[u] + 1
+                    if v in goals:
+                        out[v] = self._reconstruct_path(parent, v)
+                        goals.discard(v)
+                    q.append(v)
+            return out
+
+        dist: Dict[str, float] = {src_id: 0.0}
+        seen: Set[str] = set()
+        pq: list[tuple[float, str]] = [(0.0, src_id)]
+        while pq and goals:
+            d_u, u = heapq.heappop(pq)
+            if u in seen:
+                continue
+            seen.add(u)
+            if u in goals:
+                out[u] = self._reconstruct_path(parent, u)
+                goals.discard(u)
+            if max_hops is not None and hops[u] >= max_hops:
+                continue
+            for v, w in self._out_costs(u):
+                if v is None or v not in table or v in seen:
+                    continue
+                if w < 0:
+                    continue
+                nd = d_u + w
+                if max_cost is not None and nd > max_cost:
+                    continue
+                if nd < dist.get(v, float("inf")):
+                    dist[v] = nd
+                    parent[v] = u
+                    hops[v] = hops[u] + 1
+                    heapq.heappush(pq, (nd, v))
+        return out
+
     # ------------------------- pretty path helpers -------------------------
 
     def _first_pred_of(self, bid: str) -> str | None:
@@ -1826,21 +3292,52 @@ class WorldGraph:
     def to_dict(self) -> dict:
         """Serialize the whole world for autosave.
         """
-        return {
-            "bindings": {bid: b.to_dict() for bid, b in self._bindings.items()},
+        out = {"bindings": {bid: b.to_dict() for bid, b in self._bindings.items()}}
+        out.update(self._persist_head())
+        return out
+
+
+    def iter_bindings(self) -> Iterator[tuple[str, Binding]]:
+        """Yield (binding_id, Binding) in insertion order (read-only walk for exporters/codecs)."""
+        return iter(self._bindings.items())
+
+
+    def restore_binding(self, bid: str, tags, edges, meta: Optional[dict] = None, engrams: Optional[dict] = None) -> Binding:
+        """Insert a saved binding as-is (loaders only: no lexicon checks, no auto-edges, no latest update)."""
+        b = Binding(id=bid, tags=set(tags or ()), edges=list(edges or ()), meta=meta or {}, engrams=engrams or {})
+        self._bindings[bid] = b   # indexes tags/edges on insertion
+        return b
+
+
+    def _persist_head(self) -> dict:
+        """Everything to_dict() saves except the bindings (shared with the binary snapshot codec)."""
+        head = {
             "anchors": dict(self._anchors),
             "latest": self._latest_binding_id,
             "memory_mode": self.get_memory_mode(),
             "version": "0.1",
         }
+        if self.get_storage_mode() != "dict":
+            head["storage"] = self.get_storage_mode()   # older snapshots simply omit it
+        return head
 
 
     @classmethod
     def from_dict(cls, data: dict) -> "WorldGraph":
         """Restore a world from autosave and advance the id counter to avoid collisions.
         """
-        g = cls(memory_mode=data.get("memory_mode", "episodic"))
-        g._bindings = {bid: Binding.from_dict(b) for bid, b in data.get("bindings", {}).items()}
+        storage = data.get("storage")
+        g = cls(memory_mode=data.get("memory_mode", "episodic"),
+                storage=storage if storage in _STORAGE_MODES else None)
+        for bid, b in data.get("bindings", {}).items():
+            g._bindings[bid] = Binding.from_dict(b)   # indexes tags on insertion
+        g._finish_restore(data)
+        return g
+
+
+    def _finish_restore(self, data: dict) -> None:
+        """Apply the saved head (anchors/latest/mode) once all bindings are inserted; fix the id counter."""
+        g = self
         g._anchors = dict(data.get("anchors", {}))
         g._latest_binding_id = data.get("latest")
 
@@ -1858,7 +3355,6 @@ class WorldGraph:
 
         # Ensure semantic index matches loaded graph content
         g.set_memory_mode(data.get("memory_mode", g.get_memory_mode()))
-        return g
 
 
     def check_invariants(self, *, raise_on_error: bool = True) -> list[str]:
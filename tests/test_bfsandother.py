@@ -176,3 +176,51 @@ def test_unweighted_equivalence_when_no_weights():
     assert p_dij is not None
 
     assert len(p_bfs) == len(p_dij), "With all weights=1, hop counts should match"
+
+
+@pytest.mark.parametrize("strategy", ["astar", "bidirectional"])
+def test_astar_and_bidirectional_match_dijkstra_cost(strategy, monkeypatch):
+    """New planner modes are selectable via CCA8_PLANNER and find the cheap route."""
+    monkeypatch.setenv("CCA8_PLANNER", strategy)
+    world, start, goal, ids = _build_weighted_demo_world()
+    assert world.get_planner() == strategy
+
+    path = world.plan_to_predicate(start, "goal")
+    assert path == [start, ids["A"], ids["B"], goal]
+
+
+def test_astar_spatial_heuristic_and_cost_cache_refresh():
+    world, start, goal, ids = _build_weighted_demo_world()
+    world.set_planner("astar")
+    for bid, (x, y) in {start: (0, 0), ids["A"]: (1, 0), ids["B"]: (2, 0), goal: (3, 0), ids["X"]: (0, 3)}.items():
+        world._bindings[bid].meta["wm"] = {"pos": {"x": x, "y": y}}
+    world.set_astar_heuristic(world.spatial_heuristic())
+    assert world.plan_to_predicate(start, "goal") == [start, ids["A"], ids["B"], goal]
+
+    # Replacing an edge refreshes the pre-extracted cost for that binding.
+    world.delete_edge(start, ids["X"])
+    world.add_edge(start, ids["X"], "then", meta={"weight": 0.5})
+    world.set_astar_heuristic(None)
+    assert world.plan_to_predicate(start, "goal") == [start, ids["X"], goal]
+
+
+def test_astar_spatial_heuristic_sees_goals_added_after_install():
+    world = W.WorldGraph()
+    _quiet_tags(world)
+    world.set_planner("astar")
+    start = world.ensure_anchor("NOW")
+    far = world.add_predicate("goal", attach=None)
+    world.add_edge(start, far, "then", meta={"weight": 10})
+    world._bindings[start].meta["wm"] = {"pos": {"x": 0, "y": 0}}
+    world._bindings[far].meta["wm"] = {"pos": {"x": 10, "y": 0}}
+    world.set_astar_heuristic(world.spatial_heuristic())
+    assert world.plan_to_predicate(start, "goal") == [start, far]
+
+    # A nearer goal appears after the heuristic was installed: NOW -[1]-> hop -[1]-> near (cost 2).
+    hop = world.add_predicate("hop", attach=None)
+    near = world.add_predicate("goal", attach=None)
+    world.add_edge(start, hop, "then", meta={"weight": 1})
+    world.add_edge(hop, near, "then", meta={"weight": 1})
+    world._bindings[hop].meta["wm"] = {"pos": {"x": 1, "y": 0}}
+    world._bindings[near].meta["wm"] = {"pos": {"x": 2, "y": 0}}
+    assert world.plan_to_predicate(start, "goal") == [start, hop, near]
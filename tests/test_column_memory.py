@@ -83,3 +83,50 @@ def test_column_list_ids_limit():
     limited = col.list_ids(limit=2)
     assert len(limited) == 2
     assert set(limited).issubset(set(ids))
+
+
+def _scan_find(col, **kw):
+    """Reference answer: the old linear scan over a plain dict."""
+    plain = ColumnMemory(name=col.name)
+    plain._store = dict(col._store)  # plain dict -> no index, linear fallback
+    return [r["id"] for r in plain.find(**kw)]
+
+
+def test_column_find_uses_indexes_and_matches_linear_scan():
+    col = ColumnMemory(name="test_index")
+    ids = []
+    for i in range(12):
+        name = "navpatch" if i % 3 else "wm_mapsurface"
+        attrs = {"epoch": i % 2, "sig": f"s{i % 4}"} if i % 5 else {"epoch": i % 2}
+        ids.append(col.assert_fact(name, {"i": i}, FactMeta(name=name, attrs=attrs)))
+    col.delete(ids[4])
+
+    for kw in ({"name_contains": "NAVPATCH", "has_attr": "sig"}, {"epoch": 1}, {"name_contains": "a", "epoch": 0},
+               {"has_attr": "sig", "limit": 3}, {"name_contains": "missing"}, {}):
+        assert [r["id"] for r in col.find(**kw)] == _scan_find(col, **kw)
+
+    newest = [r["id"] for r in col.iter_newest("wm_mapsurface", limit=2)]
+    assert newest == [ids[9], ids[6]]
+    assert [r["id"] for r in col.find_by_sig("s1", name="navpatch")] == [ids[1]]
+
+    col._store.clear()  # external resets keep the index in step
+    assert col.find(name_contains="navpatch") == [] and list(col.iter_newest("navpatch")) == []
+
+
+def test_column_revision_grows_on_every_change_and_find_ids_matches_find(tmp_path):
+    col = ColumnMemory(name="test_revision")
+    seen = [col.revision()]
+    eid = col.assert_fact("navpatch", {"i": 0}, FactMeta(name="navpatch", attrs={"sig": "s0"}))
+    seen.append(col.revision())
+    assert col.find_ids(name_contains="navpatch", has_attr="sig") == [r["id"] for r in col.find(name_contains="navpatch", has_attr="sig")] == [eid]
+    col.delete(eid)
+    seen.append(col.revision())
+    col.delete(eid)                       # no-op delete leaves it alone
+    assert col.revision() == seen[-1]
+    col._store.clear()
+    seen.append(col.revision())
+    col.open_store(str(tmp_path))
+    seen.append(col.revision())
+    col.close_store()
+    seen.append(col.revision())
+    assert seen == sorted(set(seen))
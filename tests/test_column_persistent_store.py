@@ -0,0 +1,114 @@
+import pytest
+
+col = pytest.importorskip("cca8_column", reason="cca8_column module not found")
+feat = pytest.importorskip("cca8_features", reason="cca8_features module not found")
+kern = pytest.importorskip("cca8_navmap_kernel", reason="cca8_navmap_kernel module not found")
+
+
+def _navmap():
+    frame = kern.NavFrameV1(frame_id="f1", x_axis="forward", y_axis="up", units="normalized",
+                            min_x=-1.0, max_x=1.0, min_y=-1.0, max_y=1.0)
+    prov = kern.NavProvenanceV1(source_class=kern.NavSourceClassV1.OBSERVED, source_ref="fixture:column", quality=0.9)
+    return kern.NavMapV2(map_id="m1", revision=1, role="scene", frame=frame, provenance=prov)
+
+
+def test_persistent_store_survives_reopen(tmp_path):
+    m = col.ColumnMemory(name="col_t")
+    ram_id = m.assert_fact("before", feat.TensorPayload(data=[1.0], shape=(1,)))
+    m.open_store(str(tmp_path))
+    assert m.is_persistent() and m.exists(ram_id)           # RAM records are written through
+
+    tid = m.assert_fact("vision:scene", feat.TensorPayload(data=[0.5, 1.5, -2.0], shape=(3,)),
+                        feat.FactMeta(name="vision:scene", attrs={"epoch": 3}))
+    nid = m.assert_fact("navmap:scene", _navmap())
+    did = m.assert_fact("navpatch", {"schema": "navpatch_v1", "grid": [[0, 1]]})
+    gone = m.assert_fact("temp", {"x": 1})
+    assert m.delete(gone)
+    m.close_store()
+
+    m2 = col.ColumnMemory(name="col_t")
+    m2.open_store(str(tmp_path))
+    assert m2.count() == 4 and not m2.exists(gone)
+    rec = m2.get(tid)
+    assert rec["payload"].data == [0.5, 1.5, -2.0] and rec["payload"].shape == (3,)
+    assert rec["meta"]["attrs"]["epoch"] == 3
+    assert m2.get(nid)["payload"] == _navmap()
+    assert m2.try_get(did)["payload"] == {"schema": "navpatch_v1", "grid": [[0, 1]]}
+    assert m2.try_get("nope") is None
+    assert [r["id"] for r in m2.find(epoch=3)] == [tid]
+    m2.close_store()
+
+
+def test_persistent_store_ignores_torn_index_line(tmp_path):
+    m = col.ColumnMemory(name="col_t")
+    m.open_store(str(tmp_path))
+    eid = m.assert_fact("a", {"v": 1})
+    m.close_store()
+    with open(tmp_path / "col_t.idx", "a", encoding="utf-8") as f:
+        f.write('{"op": "put", "id": "x')
+    m.open_store(str(tmp_path))
+    assert m.list_ids() == [eid]
+    m.close_store()
+
+
+def test_persistent_store_meta_is_json_normalized_before_and_after_eviction_or_reopen(tmp_path):
+    m = col.ColumnMemory(name="col_t")
+    m.open_store(str(tmp_path))
+    m._store.cache_size = 1
+    eid = m.assert_fact("navpatch", {"v": 1}, feat.FactMeta(name="navpatch", attrs={"span": (1, 2), "epoch": 7}))
+    fresh = m.get(eid)["meta"]["attrs"]["span"]
+    m.assert_fact("other", {"v": 2})                         # evicts eid from the record cache
+    evicted = m.get(eid)["meta"]["attrs"]["span"]
+    m.close_store()
+    assert m.count() == 0                                     # close_store leaves an empty RAM store
+
+    m.open_store(str(tmp_path))
+    reopened = m.get(eid)["meta"]["attrs"]["span"]
+    assert fresh == evicted == reopened == [1, 2]
+    assert type(fresh) is type(evicted) is type(reopened) is list
+    assert [r["id"] for r in m.find(epoch=7)] == [eid]
+    m.close_store()
+
+
+def test_persistent_store_compacts_dead_bytes_explicitly_and_by_ratio(tmp_path):
+    m = col.ColumnMemory(name="col_t")
+    m.open_store(str(tmp_path))
+    m._store.compact_ratio = None                             # explicit calls only
+    keep = [m.assert_fact("navpatch", {"i": i, "pad": "x" * 200}) for i in range(5)]
+    for _ in range(20):
+        m.delete(m.assert_fact("scratch", {"pad": "y" * 200}))
+    seg = tmp_path / "col_t.seg"
+    grown = seg.stat().st_size
+    assert m._store.dead_bytes > 0.75 * grown
+
+    freed = m.compact_store()
+    assert freed > 0 and seg.stat().st_size == grown - freed and m._store.dead_bytes == 0
+    assert [m.get(eid)["payload"]["i"] for eid in keep] == list(range(5))
+    later = m.assert_fact("navpatch", {"i": 5})
+    m.close_store()
+
+    m2 = col.ColumnMemory(name="col_t")
+    m2.open_store(str(tmp_path))
+    assert m2.list_ids() == keep + [later] and m2._store.dead_bytes == 0
+    m2._store.compact_ratio, m2._store.compact_min_bytes = 0.5, 1
+    size = seg.stat().st_size
+    for eid in keep[:4]:                                      # crossing half the segment compacts
+        m2.delete(eid)
+    assert seg.stat().st_size < size and m2._store.dead_bytes < 0.5 * seg.stat().st_size
+    assert [m2.get(eid)["payload"]["i"] for eid in m2.list_ids()] == [4, 5]
+    m2.close_store()
+
+
+def test_persistent_store_recovers_an_interrupted_compaction(tmp_path):
+    m = col.ColumnMemory(name="col_t")
+    m.open_store(str(tmp_path))
+    eid = m.assert_fact("a", {"v": 1})
+    m.delete(m.assert_fact("b", {"v": 2}))
+    m.compact_store()
+    m.close_store()
+    (tmp_path / "col_t.seg.compact").write_bytes(b"partial")  # crash before the segment swap
+    (tmp_path / "col_t.idx.compact").write_text("partial", encoding="utf-8")
+    m.open_store(str(tmp_path))
+    assert m.list_ids() == [eid] and m.get(eid)["payload"] == {"v": 1}
+    assert not (tmp_path / "col_t.seg.compact").exists() and not (tmp_path / "col_t.idx.compact").exists()
+    m.close_store()
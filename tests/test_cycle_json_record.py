@@ -72,4 +72,92 @@ def test_cycle_json_record_is_single_and_efe_scores_is_list() -> None:
 
     assert len(ctx.cycle_json_records) == 1
     rec = ctx.cycle_json_records[0]
-    assert isinstance(rec.get("efe_scores"), list)
\ No newline at end of file
+    assert isinstance(rec.get("efe_scores"), list)
+
+def test_headless_env_loop_skips_console_rendering_but_keeps_records(capsys) -> None:
+    """Headless mode must not print the env-loop console view or change JSON records."""
+
+    # pylint: disable=import-outside-toplevel
+    from cca8_env import HybridEnvironment
+    from cca8_world_graph import WorldGraph
+    from cca8_controller import Drives
+    from cca8_run import Ctx, run_env_closed_loop_steps
+
+    def _run(headless: bool) -> tuple[list[dict], str]:
+        ctx = Ctx(sigma=0.015, jump=0.2, age_days=0.0, ticks=0)
+        ctx.cycle_json_enabled = True
+        ctx.cycle_json_path = None
+        ctx.headless = headless
+        run_env_closed_loop_steps(
+            HybridEnvironment(),
+            WorldGraph(),
+            Drives(hunger=0.5, fatigue=0.3, warmth=0.6),
+            ctx,
+            _PolicyRuntimeStub(),
+            n_steps=3,
+        )
+        return list(ctx.cycle_json_records), capsys.readouterr().out
+
+    rendered_records, rendered_out = _run(False)
+    headless_records, headless_out = _run(True)
+
+    assert "[env-loop] Cognitive Cycle" in rendered_out
+    assert "[env-loop]" not in headless_out
+    assert "[workingmap]" not in headless_out
+    assert len(headless_records) == len(rendered_records) == 3
+    for rendered, headless in zip(rendered_records, headless_records):
+        assert set(headless) == set(rendered)
+        assert headless["controller_steps"] == rendered["controller_steps"]
+        assert headless["obs"]["predicates"] == rendered["obs"]["predicates"]
+
+
+def test_stage_profile_records_per_stage_timings_in_cycle_records(capsys) -> None:
+    """The stage profiler adds per-stage timings to cycle records only when enabled."""
+
+    # pylint: disable=import-outside-toplevel
+    from cca8_env import HybridEnvironment
+    from cca8_world_graph import WorldGraph
+    from cca8_controller import Drives
+    from cca8_run import Ctx, run_env_closed_loop_steps
+    from cca8_stage_profile import stage_profile_summary_v1
+    from cca8_cognitive_scope import cognitive_scope_latest_snapshot_v1
+
+    def _run(enabled: bool) -> Ctx:
+        ctx = Ctx(sigma=0.015, jump=0.2, age_days=0.0, ticks=0)
+        ctx.cycle_json_enabled = True
+        ctx.cycle_json_path = None
+        ctx.stage_profile_enabled_v1 = enabled
+        ctx.stage_profile_capacity_v1 = 2
+        run_env_closed_loop_steps(
+            HybridEnvironment(),
+            WorldGraph(),
+            Drives(hunger=0.5, fatigue=0.3, warmth=0.6),
+            ctx,
+            _PolicyRuntimeStub(),
+            n_steps=3,
+        )
+        return ctx
+
+    disabled = _run(False)
+    assert all("stage_profile" not in rec for rec in disabled.cycle_json_records)
+    assert "stage_profile" not in cognitive_scope_latest_snapshot_v1(disabled)
+    assert disabled.stage_profile_ring_v1 == []
+    capsys.readouterr()
+
+    ctx = _run(True)
+    out = capsys.readouterr().out
+    assert cognitive_scope_latest_snapshot_v1(ctx)["stage_profile"]["schema"] == "stage_profile_cycle_v1"
+    first, second = ctx.cycle_json_records[0]["stage_profile"], ctx.cycle_json_records[1]["stage_profile"]
+    assert "env.reset" in first["stages"] and "env.step" in second["stages"]
+    for stage in ("observation.inject", "navmap.v2_shadow", "navmap.memory", "cognitive_scope"):
+        assert second["stages"][stage]["calls"] == 1
+        assert second["stages"][stage]["ms"] >= 0.0
+    # Nested NavMap stages run inside observation injection.
+    assert second["stages"]["observation.inject"]["ms"] >= second["stages"]["navmap.v2_shadow"]["ms"]
+
+    # The ring is bounded by stage_profile_capacity_v1 and keeps the newest cycles.
+    assert [row["cognitive_cycle"] for row in ctx.stage_profile_ring_v1] == [2, 3]
+    summary = stage_profile_summary_v1(ctx)
+    assert summary["cycle_count"] == 2
+    assert {row["stage"] for row in summary["stages"]} >= {"env.step", "observation.inject"}
+    assert "[stage-profile] cycles=2" in out
@@ -1,4 +1,7 @@
-from cca8_features import TensorPayload, FactMeta, time_attrs_from_ctx
+import pickle
+from array import array
+
+from cca8_features import TensorPayload, TensorView, FactMeta, time_attrs_from_ctx
 
 class _Ctx:
     def __init__(self):
@@ -18,6 +21,24 @@ def test_tensorpayload_roundtrip_and_meta():
     assert m["kind"] == "embedding"
     assert m["fmt"] and m["shape"] == (4,) and m["len"] == 4
 
+
+def test_tensorpayload_from_bytes_is_zero_copy_view():
+    p = TensorPayload(data=[0.5, -1.0, 2.25], shape=(3,), kind="scene")
+    blob = bytearray(p.to_bytes())
+    v = TensorPayload.from_bytes(blob)
+    assert isinstance(v, TensorView) and isinstance(v, TensorPayload)
+    assert v._list is None and v.meta()["len"] == 3          # no list built yet
+    assert v.to_bytes() == bytes(blob) and v._list is None
+    blob[-4:] = array("f", [8.0]).tobytes()           # a mutable source is copied, not pinned
+    assert v.values()[-1] == 2.25
+    assert v.data == [0.5, -1.0, 2.25] and v.data is v.data
+    v.data[0] = 4.0                                   # legacy in-place edits still serialize
+    assert TensorPayload.from_bytes(v.to_bytes()).data == [4.0, -1.0, 2.25]
+    frozen = p.to_bytes()
+    assert TensorPayload.from_bytes(frozen).values().obj is frozen   # bytes input is viewed in place
+    assert pickle.loads(pickle.dumps(v)) == v
+    assert TensorView([0.5, -1.0], shape=(2,)) == TensorPayload(data=[0.5, -1.0], shape=(2,))
+
 def test_factmeta_and_time_attrs_from_ctx():
     ctx = _Ctx()
     fm = FactMeta(name="vision:silhouette:mom", links=["b9"], attrs={"k":"v"})
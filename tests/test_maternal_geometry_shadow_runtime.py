@@ -26,7 +26,7 @@ from cca8_navmap_kernel import (
     get_element,
     stored_relation,
 )
-from cca8_navmap_runtime import navmap_ctx_observation_update_step_v1
+from cca8_navmap_runtime import navmap_ctx_observation_update_step_v1, navmap_stage_memo_summary_v1
 from cca8_navmap_shadow import navmap_v2_shadow_observation_step_v1
 from cca8_observation_runtime import init_body_world, update_body_world_from_obs
 from cca8_policy_runtime import CATALOG_GATES, PolicyRuntime
@@ -400,6 +400,52 @@ def test_history_is_bounded_and_json_safe() -> None:
     assert ctx.navmap_maternal_history[-1]["evidence_readout"]["proximity"] == "unknown"
 
 
+def test_stage_memo_keeps_records_identical_across_unchanged_and_changed_ticks() -> None:
+    """Reused stage derivations must produce the same per-tick records as recomputation."""
+    standing_far = _observation(maternal=(3.0, 0.0))
+    standing_near = _observation(maternal=(0.5, 0.0), proximity_predicate="proximity:mom:close")
+    fallen_near = _observation(maternal=(0.5, 0.0), proximity_predicate="proximity:mom:close")
+    fallen_near.predicates[0] = "posture:fallen"
+    missing = _observation(maternal=None, proximity_predicate=None)
+    missing.predicates.clear()
+    ticks = [standing_far] * 3 + [standing_near] * 2 + [fallen_near] * 3 + [missing] * 2 + [standing_far] * 2
+    fields = (
+        "navmap_v2_shadow_last_update",
+        "navmap_maternal_last_update",
+        "navmap_maternal_temporal_last_update",
+        "navmap_maternal_continuity_last_update",
+        "navmap_v2_shadow_state",
+        "navmap_maternal_state",
+        "navmap_maternal_root_view",
+    )
+    memo_ctx = _ctx_with_bodymap()
+    plain_ctx = _ctx_with_bodymap()
+    plain_ctx.stage_memo_enabled_v1 = False
+
+    for env_obs in ticks:
+        for ctx in (memo_ctx, plain_ctx):
+            update_body_world_from_obs(ctx, env_obs)
+            navmap_ctx_observation_update_step_v1(ctx, env_obs)
+        for name in fields:
+            assert getattr(memo_ctx, name) == getattr(plain_ctx, name), name
+        assert memo_ctx.navmap_maternal_state.evidence_readout.source_map_ref == NavMapRefV1(
+            memo_ctx.navmap_maternal_evidence_map.map_id,
+            memo_ctx.navmap_maternal_evidence_map.revision,
+        )
+
+    assert memo_ctx.navmap_maternal_history == plain_ctx.navmap_maternal_history
+    assert memo_ctx.navmap_v2_shadow_history == plain_ctx.navmap_v2_shadow_history
+    summary = navmap_stage_memo_summary_v1(memo_ctx)
+    declared = {
+        name: row
+        for derivations in summary["stages"].values()
+        for name, row in derivations.items()
+    }
+    assert set(declared) == set(memo_ctx.stage_memo_stats_v1)
+    assert all(row["hits"] > 0 for row in declared.values())
+    assert plain_ctx.stage_memo_stats_v1 == {}
+
+
 def test_renderer_reports_geometry_role_separation_and_authority_boundary() -> None:
     """The human trace should expose common-frame computation without claiming authority."""
     ctx = _ctx_with_bodymap()
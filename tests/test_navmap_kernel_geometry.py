@@ -936,6 +936,36 @@ def test_body_state_evidence_returns_unknown_for_missing_or_unsupported_geometry
     assert unsupported_result.reason == "unsupported_geometry"
 
 
+def test_support_and_body_state_evidence_are_memoized_per_revision_and_declared_inputs() -> None:
+    """Repeated derivations on one revision should reuse the record; a changed input should not."""
+    navmap = _self_ground_map(body_horizontal=False, map_id="self_ground_case_a")
+    thresholds = _body_state_thresholds()
+    kwargs = {
+        "body_element_id": "self_body",
+        "head_element_id": "self_head",
+        "foot_element_id": "self_foot",
+        "ground_element_id": "ground_surface",
+    }
+
+    first = body_state_evidence(navmap, thresholds=thresholds, **kwargs)
+    again = body_state_evidence(navmap, thresholds=replace(thresholds), **kwargs)
+    support = support_evidence(navmap, thresholds=thresholds, **kwargs)
+    looser = body_state_evidence(
+        navmap,
+        thresholds=replace(thresholds, minimum_standing_head_elevation=5.0),
+        **kwargs,
+    )
+    fresh = body_state_evidence(replace(navmap), thresholds=thresholds, **kwargs)
+
+    assert again is first
+    assert support_evidence(navmap, thresholds=thresholds, **kwargs) is support
+    assert first.support is support
+    assert looser is not first
+    assert looser.interpretation is not NavBodyStateInterpretationV1.STANDING_LIKE
+    assert fresh is not first
+    assert fresh == first
+
+
 def test_support_and_body_state_require_explicit_valid_thresholds() -> None:
     """No hidden biological threshold set should enter the first body-state operator contract."""
     navmap = _self_ground_map(body_horizontal=False, map_id="self_ground_case_a")
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from dataclasses import FrozenInstanceError, replace
 import json
+import math
 
 import pytest
 
@@ -33,6 +34,7 @@ from cca8_navmap_kernel import (
     geometry_orientation_degrees,
     match_navmaps,
     match_rank,
+    match_score_upper_bound,
     propose_revision,
     reframe_navmap,
     rotate_navmap,
@@ -415,6 +417,35 @@ def test_robust_alignment_localizes_one_changed_element() -> None:
     assert result.element_score == pytest.approx(0.8)
 
 
+def test_subset_fit_errors_equal_transform_record_path_exactly() -> None:
+    """The robust search's subset scoring must rank exactly as the validated transform records do."""
+    import random
+
+    from cca8_navmap_kernel import _alignment_errors, _fit_rigid_transform, _subset_fit_errors
+
+    rng = random.Random(15)
+    source_map, target_map = _scene_map(map_id="fit_source"), _scene_map(map_id="fit_target")
+    for _ in range(200):
+        count = rng.randint(1, 6)
+        source = tuple(NavPointV1(x=rng.uniform(-1, 1), y=rng.uniform(-1, 1)) for _ in range(count))
+        target = tuple(NavPointV1(x=rng.uniform(-1, 1), y=rng.uniform(-1, 1)) for _ in range(count))
+        if rng.random() < 0.3:
+            target = source                                   # degenerate and exact fits
+        indices = tuple(sorted(rng.sample(range(count), rng.randint(1, count))))
+        transform, _determined = _fit_rigid_transform(
+            source_map, target_map, source, target, indices, method="least_squares_rigid_2d"
+        )
+        reference = tuple(
+            math.hypot(point.x - target_point.x, point.y - target_point.y)
+            for point, target_point in zip((transform.apply_point(p) for p in source), target)
+        )
+        rotation, errors = _subset_fit_errors(
+            tuple((p.x, p.y) for p in source), tuple((p.x, p.y) for p in target), indices
+        )
+        assert rotation == transform.rotation_degrees
+        assert errors == reference == _alignment_errors(transform, source, target)
+
+
 def test_alignment_and_matching_survive_renamed_local_ids() -> None:
     """Local developer ids are not required when unique represented roles correspond."""
     source = _scene_map(map_id="renamed_source")
@@ -518,6 +549,66 @@ def test_match_rank_returns_clear_winner_and_explicit_margin() -> None:
     assert ranking.ranked_matches[0].target_map_ref == ranking.winner_ref
 
 
+def test_match_rank_reuses_query_profile_and_equals_pairwise_matches() -> None:
+    """Batched ranking must report exactly the pairwise match results it ranks."""
+    query = _scene_map(map_id="batch_query")
+    candidates = (
+        _rigid_candidate(query, map_id="batch_a"),
+        _rigid_candidate(query, map_id="batch_b", rename=True),
+        translate_navmap(query, delta_x=0.3, delta_y=0.0, new_revision=2, element_ids=("landmark",)).result_map,
+    )
+    thresholds = _match_thresholds()
+
+    ranking = match_rank(query, candidates, thresholds=thresholds)
+    profile = query._match_profile
+
+    assert profile is not None
+    assert match_rank(query, candidates, thresholds=thresholds) == ranking
+    assert query._match_profile is profile
+    pairwise = {
+        result.target_map_ref: result
+        for result in (match_navmaps(query, candidate, thresholds=thresholds) for candidate in candidates)
+    }
+    assert {result.target_map_ref: result for result in ranking.ranked_matches} == pairwise
+
+
+def test_match_score_upper_bound_never_undercuts_detailed_score() -> None:
+    """Role and type sets alone bound the detailed score and reject disjoint candidates."""
+    query = _scene_map(map_id="bound_query")
+    thresholds = _match_thresholds()
+    exact = _rigid_candidate(query, map_id="bound_exact")
+    foreign = replace(
+        exact,
+        map_id="bound_foreign",
+        role="foreign_scene",
+        elements=tuple(replace(element, role="foreign_role") for element in exact.elements),
+    )
+
+    for candidate in (exact, foreign):
+        bound = match_score_upper_bound(
+            query,
+            map_roles=(candidate.role,),
+            element_roles={element.role for element in candidate.elements},
+            relation_types={relation.relation_type for relation in candidate.relations},
+            link_types={link.link_type for link in candidate.links},
+        )
+        assert match_navmaps(query, candidate, thresholds=thresholds).score <= bound
+    assert match_score_upper_bound(
+        query,
+        map_roles=(query.role,),
+        element_roles={element.role for element in query.elements},
+        relation_types={relation.relation_type for relation in query.relations},
+        link_types={link.link_type for link in query.links},
+    ) == 1.0
+    assert match_score_upper_bound(
+        query,
+        map_roles=("foreign_scene",),
+        element_roles=("foreign_role",),
+        relation_types=(),
+        link_types=(),
+    ) < thresholds.minimum_rank_score
+
+
 def test_match_rank_preserves_ambiguity_and_unknown() -> None:
     """Equal candidates remain AMBIGUOUS and incompatible candidates remain UNKNOWN."""
     query = _scene_map(map_id="ambiguous_query")
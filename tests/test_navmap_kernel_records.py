@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from dataclasses import FrozenInstanceError
+from dataclasses import FrozenInstanceError, replace
 import json
 import math
 
@@ -26,6 +26,7 @@ from cca8_navmap_kernel import (
     NavProvenanceV1,
     NavRelationV1,
     NavSourceClassV1,
+    derive_navmap_revision,
 )
 
 
@@ -417,6 +418,41 @@ def test_canonical_json_round_trip_is_exact_and_deterministic() -> None:
     assert b" " not in encoded and b"\n" not in encoded
 
 
+def test_canonical_bytes_and_signatures_are_memoized_per_revision() -> None:
+    """Repeated serialization should reuse one cached encoding per immutable revision."""
+    original = _map()
+    encoded = original.to_bytes()
+
+    assert original.to_bytes() is encoded
+    assert original.record_signature() is original.record_signature()
+    assert original.content_signature() is original.content_signature()
+
+    restored = NavMapV2.from_bytes(encoded)
+    assert restored.record_signature() == original.record_signature()
+    assert restored.to_bytes() is encoded  # canonical input is adopted, not a second copy
+
+    spaced = json.dumps(json.loads(encoded.decode("utf-8")), indent=1).encode("utf-8")
+    respaced = NavMapV2.from_bytes(spaced)
+    assert respaced.to_bytes() == encoded and respaced.to_bytes() is not spaced
+
+    later = replace(original, revision=2, parent_ref=NavMapRefV1(original.map_id, 1))
+    assert later.record_signature() != original.record_signature()
+    assert later.content_signature() == original.content_signature()
+
+
+def test_from_bytes_seeds_the_byte_memo_so_encoding_skips_as_dict(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A decode-then-encode round trip should not rebuild the record dictionary."""
+    encoded = _map().to_bytes()
+    restored = NavMapV2.from_bytes(encoded)
+
+    def _rebuilt(self: NavMapV2) -> dict:
+        raise AssertionError("as_dict() called after from_bytes")
+
+    monkeypatch.setattr(NavMapV2, "as_dict", _rebuilt)
+    assert restored.to_bytes() is encoded
+    assert len(restored.record_signature()) == 64
+
+
 def test_content_signature_excludes_identity_and_lineage_but_record_signature_does_not() -> None:
     """Equivalent decoded maps may have different stored identities and revisions."""
     first = _map(map_id="map_a", revision=1)
@@ -471,6 +507,66 @@ def test_lineage_validation_requires_matching_earlier_parent() -> None:
         _map(map_id="child", revision=2, parent_ref=NavMapRefV1("child", 2))
 
 
+def _derived_kwargs(base: NavMapV2, **changes: object) -> dict[str, object]:
+    """Return constructor arguments for a child of ``base`` with optional overrides."""
+    kwargs: dict[str, object] = {
+        "map_id": base.map_id,
+        "revision": base.revision + 1,
+        "parent_ref": NavMapRefV1(base.map_id, base.revision),
+        "role": base.role,
+        "frame": base.frame,
+        "provenance": base.provenance,
+        "elements": base.elements,
+        "relations": base.relations,
+        "links": base.links,
+    }
+    kwargs.update(changes)
+    return kwargs
+
+
+def test_derived_revision_matches_full_construction_and_validates_changed_elements(monkeypatch) -> None:
+    """The trusted derived path should produce the constructor's record and still check the delta."""
+    base = _map()
+    moved_head = replace(base.elements[-1], geometry=_geometry(NavGeometryKindV1.POINT, (0.5, 2.2)))
+    assert moved_head.element_id == "self_head"
+    changed = base.elements[:-1] + (moved_head,)
+
+    for elements in (base.elements, changed):
+        kwargs = _derived_kwargs(base, elements=elements)
+        derived = derive_navmap_revision(base, **kwargs)  # type: ignore[arg-type]
+        expected = NavMapV2(**kwargs)  # type: ignore[arg-type]
+        assert derived == expected
+        assert derived.to_bytes() == expected.to_bytes()
+
+    outside = replace(moved_head, geometry=_geometry(NavGeometryKindV1.POINT, (4.0, 2.2)))
+    with pytest.raises(ValueError, match="outside the declared frame"):
+        derive_navmap_revision(base, **_derived_kwargs(base, elements=base.elements[:-1] + (outside,)))  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="lower"):
+        derive_navmap_revision(base, **_derived_kwargs(base, revision=1))  # type: ignore[arg-type]
+
+    duplicate = replace(moved_head, element_id="self_foot", parent_element_id="self_body")
+    with pytest.raises(ValueError, match="unique"):
+        derive_navmap_revision(base, **_derived_kwargs(base, elements=base.elements[:-1] + (duplicate,)))  # type: ignore[arg-type]
+
+    reordered = tuple(reversed(base.elements))
+    reordered_map = derive_navmap_revision(base, **_derived_kwargs(base, elements=reordered))  # type: ignore[arg-type]
+    assert reordered_map == NavMapV2(**_derived_kwargs(base))  # type: ignore[arg-type]
+
+    calls: list[str] = []
+    original_post_init = NavMapV2.__post_init__
+
+    def _counting_post_init(self: NavMapV2) -> None:
+        calls.append(self.map_id)
+        original_post_init(self)
+
+    monkeypatch.setattr(NavMapV2, "__post_init__", _counting_post_init)
+    derive_navmap_revision(base, **_derived_kwargs(base))  # type: ignore[arg-type]
+    assert calls == []
+    monkeypatch.setenv("CCA8_NAVMAP_FULL_VALIDATION", "1")
+    derive_navmap_revision(base, **_derived_kwargs(base))  # type: ignore[arg-type]
+    assert calls == [base.map_id]
+
+
 def test_deserialization_rejects_bad_schema_unknown_fields_and_invalid_json() -> None:
     """Versioned payload decoding should fail instead of silently accepting drift."""
     data = _map().as_dict()
@@ -282,6 +282,38 @@ def test_new_revision_is_a_distinct_versioned_long_term_record() -> None:
     assert set(ctx.navmap_memory_ref_index_v1) == {"route@r1", "route@r2"}
 
 
+def test_sparse_token_index_is_patched_in_place_per_entry() -> None:
+    """Storing one map should add only its tokens to the live posting sets."""
+    ctx = Ctx()
+    column = ColumnMemory(name="incremental_tokens")
+
+    first = _store(ctx, column, _map("route_a"), observation_no=1, cue_tokens=("cue:a",))
+    token_index = ctx.navmap_memory_token_index_v1
+    shared = token_index["cue:a"]
+    second = _store(ctx, column, _map("route_b"), observation_no=2, cue_tokens=("cue:b",))
+    _store(ctx, column, _map("route_a"), observation_no=3, cue_tokens=("cue:extra",))
+
+    assert ctx.navmap_memory_token_index_v1 is token_index
+    assert token_index["cue:a"] is shared and shared == {first.engram_id}
+    assert token_index["cue:b"] == {second.engram_id}
+    assert token_index["cue:extra"] == {first.engram_id}
+    assert token_index["map:route_a"] == {first.engram_id}
+
+
+def test_legacy_list_token_index_is_rebuilt_or_converted_on_update() -> None:
+    """Older ctx state with sorted-list postings should keep working."""
+    ctx = Ctx()
+    column = ColumnMemory(name="legacy_tokens")
+    first = _store(ctx, column, _map("legacy_a"), cue_tokens=("cue:shared",))
+    ctx.navmap_memory_token_index_v1 = {
+        token: sorted(ids) for token, ids in ctx.navmap_memory_token_index_v1.items()
+    }
+
+    second = _store(ctx, column, _map("legacy_b"), observation_no=2, cue_tokens=("cue:shared",))
+
+    assert ctx.navmap_memory_token_index_v1["cue:shared"] == {first.engram_id, second.engram_id}
+
+
 def test_support_and_exception_counts_remain_separate() -> None:
     """Failures should not masquerade as additional supporting examples."""
     ctx = Ctx()
@@ -335,6 +367,52 @@ def test_candidate_and_reinstatement_bounds_are_enforced() -> None:
     assert len(row["reinstatements"]) == 2
 
 
+def test_top_k_candidates_rank_stronger_overlap_first_with_exact_matches() -> None:
+    """Bounded top-K scoring should keep the strongest overlaps and report their matched tokens."""
+    ctx = Ctx()
+    column = ColumnMemory(name="top_k")
+    for index in range(6):
+        _store(ctx, column, _map(f"weak_{index}"), cue_tokens=("cue:shared",))
+    strong = _store(ctx, column, _map("strong"), cue_tokens=("cue:shared", "cue:rare"))
+
+    _retrieve(ctx, column, None, cue_tokens=("cue:shared", "cue:rare"), candidate_limit=3, reinstatement_limit=1)
+    refs = _last_retrieval(ctx)["candidate_refs"]
+
+    assert len(refs) == 3
+    assert refs[0]["engram_id"] == strong.engram_id
+    assert refs[0]["cue_score"] == 1.0 and refs[1]["cue_score"] == 0.5
+    assert refs[0]["matched_tokens"] == ["cue:rare", "cue:shared"]
+    assert [row["map_ref"]["map_id"] for row in refs[1:]] == ["weak_0", "weak_1"]
+
+
+def test_index_bound_skips_payloads_that_cannot_change_the_winner(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Candidates whose index-only score bound trails the best match are never loaded."""
+    ctx = Ctx()
+    column = ColumnMemory(name="bounded_match")
+    foreign = _store(
+        ctx,
+        column,
+        _map("foreign", role="body_scene", points=(("wall", "wall", 0.0, 0.0), ("door", "door", 1.0, 0.0))),
+        cue_tokens=("cue:shared", "cue:rare"),
+    )
+    _store(ctx, column, _map("familiar"), cue_tokens=("cue:shared",))
+    loaded: list[str] = []
+    original_try_get = column.try_get
+
+    def recording_try_get(engram_id: str):
+        loaded.append(engram_id)
+        return original_try_get(engram_id)
+
+    monkeypatch.setattr(column, "try_get", recording_try_get)
+    _retrieve(ctx, column, _map("bounded_query"), cue_tokens=("cue:shared", "cue:rare"), reinstatement_limit=2)
+    row = _last_retrieval(ctx)
+
+    assert [item["map_ref"]["map_id"] for item in row["candidate_refs"]] == ["foreign", "familiar"]
+    assert foreign.engram_id not in loaded
+    assert [item["candidate_ref"]["map_ref"]["map_id"] for item in row["reinstatements"]] == ["familiar"]
+    assert row["winner_ref"] == {"map_id": "familiar", "revision": 1}
+
+
 def test_partial_cue_map_can_reinstate_a_more_complete_memory() -> None:
     """A two-landmark partial map should enter and match a three-element stored map."""
     ctx = Ctx()
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from cca8_env import EnvConfig, HybridEnvironment
+from cca8_env import EnvConfig, HybridEnvironment, HybridEnvironmentBatch
 
 
 HARD_NEWBORN = EnvConfig(scenario_name="newborn_goat_first_hour_benchmark_hard")
@@ -198,3 +198,29 @@ def test_hard_newborn_requires_suckle_before_milk_drinking() -> None:
     visible_preds = _step_until_blackout_clears(env)
     assert "nipple:latched" in visible_preds
     assert "milk:drinking" in visible_preds
+
+
+def test_environment_batch_members_match_standalone_environments() -> None:
+    """Each batch member should reproduce a standalone environment fed the same actions."""
+    ladders = [
+        [None] * 8,
+        ["policy:stand_up", "policy:stand_up", "policy:seek_nipple", None, None, None, None, None],
+        [None, None, None, "policy:stand_up", "policy:stand_up", "policy:follow_mom", "policy:follow_mom",
+         "policy:seek_nipple"],
+    ]
+    batch = HybridEnvironmentBatch(len(ladders), config=HARD_NEWBORN)
+    obs_list, infos = batch.reset()
+    assert len(obs_list) == len(batch) == 3 and [info["episode_index"] for info in infos] == [1, 1, 1]
+    singles = [_make_hard_newborn_env() for _ in ladders]
+
+    for tick in range(len(ladders[0])):
+        actions = [ladder[tick] for ladder in ladders]
+        obs_list, rewards, dones, infos = batch.step(actions, None)
+        assert rewards == [0.0, 0.0, 0.0] and dones == [False, False, False]
+        for env, action, obs in zip(singles, actions, obs_list):
+            single_obs, _reward, _done, _info = env.step(action=action, ctx=None)
+            assert obs.predicates == single_obs.predicates
+            assert obs.cues == single_obs.cues
+            assert obs.raw_sensors == single_obs.raw_sensors
+    assert [state.kid_posture for state in batch.states] == [env.state.kid_posture for env in singles]
+    assert len({id(state) for state in batch.states}) == 3
@@ -12,6 +12,7 @@ from __future__ import annotations
 from typing import Any
 
 from cca8_column import ColumnMemory
+from cca8_features import FactMeta
 import cca8_run
 
 
@@ -76,3 +77,148 @@ def test_store_navpatch_engram_v1_dedup_cache(monkeypatch) -> None:
     # Only one record should exist in this isolated column.
     assert fresh_col.count() == 1
     assert ctx.navpatch_sig_to_eid.get(sig1) == eid1
+
+
+def test_navpatch_payload_sig_v1_tracks_in_place_edits() -> None:
+    patch = _mk_patch()
+    sig1 = cca8_run.navpatch_payload_sig_v1(patch)
+    assert cca8_run.navpatch_payload_sig_v1(patch) == sig1
+
+    # Trace keys written by the matching loop do not change the signature...
+    patch["match"] = {"decision": "new_novel"}
+    assert cca8_run.navpatch_payload_sig_v1(patch) == sig1
+
+    # ...while same-length in-place edits of nested signature fields do.
+    patch["extent"]["x0"] = -2.5
+    sig2 = cca8_run.navpatch_payload_sig_v1(patch)
+    assert sig2 == cca8_run.navpatch_payload_sig_v1(_mk_patch(x0=-2.5)) != sig1
+    patch["tags"][0] = "zone:safe"
+    assert cca8_run.navpatch_payload_sig_v1(patch) not in (sig1, sig2)
+
+
+def test_predictive_match_reuses_cached_prototype_features() -> None:
+    from cca8_env import EnvObservation
+    from cca8_working_memory import navpatch_predictive_match_loop_v1, navpatch_similarity_v1, store_navpatch_engram_v1
+
+    col = ColumnMemory(name="column_test")
+    ctx = cca8_run.Ctx()
+    ctx.navpatch_priors_enabled = False
+    near = _mk_patch(tags=["zone:unsafe", "position:cliff_edge"])
+    far = _mk_patch(tags=["stage:birth"], x0=-3.0)
+    far["role"] = "other"
+    for proto in (near, far):
+        store_navpatch_engram_v1(ctx, proto, reason="unit_test", column_memory=col)
+
+    ctx.navpatch_store_to_column = False
+    obs = _mk_patch()
+    first = navpatch_predictive_match_loop_v1(ctx, EnvObservation(nav_patches=[dict(obs)]), column_memory=col)
+    cached = dict(ctx.navpatch_feature_cache_v1["protos"])
+    second = navpatch_predictive_match_loop_v1(ctx, EnvObservation(nav_patches=[dict(obs)]), column_memory=col)
+
+    assert len(cached) == 2
+    assert all(ctx.navpatch_feature_cache_v1["protos"][eid] is row for eid, row in cached.items())
+    assert first[0]["top_k"] == second[0]["top_k"]
+    # The "other"-role prototype is filtered; the same-role one scores as navpatch_similarity_v1 does.
+    assert [c["engram_id"] for c in first[0]["top_k"]] == [ctx.navpatch_sig_to_eid[cca8_run.navpatch_payload_sig_v1(near)]]
+    assert first[0]["best"]["score_raw"] == navpatch_similarity_v1(obs, near)
+    assert navpatch_similarity_v1(obs, far) == 0.0
+
+
+def test_lsh_recall_index_tracks_stores_and_matches_exact_scan() -> None:
+    from cca8_env import EnvObservation
+    from cca8_working_memory import (
+        navpatch_lsh_recall_benchmark_v1,
+        navpatch_predictive_match_loop_v1,
+        store_navpatch_engram_v1,
+    )
+
+    col = ColumnMemory(name="column_test")
+    ctx = cca8_run.Ctx()
+    ctx.navpatch_priors_enabled = False
+    ctx.navpatch_store_to_column = False
+    near = _mk_patch(tags=["zone:unsafe", "position:cliff_edge"])
+    store_navpatch_engram_v1(ctx, near, reason="unit_test", column_memory=col)
+    obs = _mk_patch()
+    exact = navpatch_predictive_match_loop_v1(ctx, EnvObservation(nav_patches=[dict(obs)]), column_memory=col)
+    assert "lsh" not in exact[0] and ctx.navpatch_lsh_index_v1 == {}
+
+    # The index is built lazily from the Column, then kept current by store_navpatch_engram_v1.
+    ctx.navpatch_lsh_enabled = True
+    ctx.navpatch_lsh_benchmark = True
+    first = navpatch_predictive_match_loop_v1(ctx, EnvObservation(nav_patches=[dict(obs)]), column_memory=col)
+    assert first[0]["top_k"] == exact[0]["top_k"]
+    assert first[0]["lsh"] == {"candidates": 1, "indexed": 1, "recall_at_k": 1.0}
+
+    same = _mk_patch(x0=-1.0)
+    unrelated = _mk_patch(tags=["stage:birth"])
+    for proto in (same, unrelated):
+        store_navpatch_engram_v1(ctx, proto, reason="unit_test", column_memory=col)
+    assert len(ctx.navpatch_lsh_index_v1["members"]) == 3
+
+    second = navpatch_predictive_match_loop_v1(ctx, EnvObservation(nav_patches=[dict(obs)]), column_memory=col)
+    eid_same = ctx.navpatch_sig_to_eid[cca8_run.navpatch_payload_sig_v1(same)]
+    assert second[0]["top_k"][0]["engram_id"] == eid_same
+    assert second[0]["lsh"]["recall_at_k"] == 1.0
+
+    bench = navpatch_lsh_recall_benchmark_v1(ctx, [dict(obs)], column_memory=col, top_k=2)
+    assert bench["universe"] == bench["indexed"] == 3
+    assert bench["mean_recall_at_k"] == 1.0 and bench["top1_agreement"] == 1.0
+    assert bench["per_patch"][0]["candidates"] <= 3
+
+
+def test_lsh_ranks_same_tag_prototypes_by_extent_before_the_candidate_cap() -> None:
+    from cca8_working_memory import navpatch_lsh_recall_benchmark_v1, store_navpatch_engram_v1
+
+    # Same entity, same tags, different extents: every prototype shares every band,
+    # so the cut must keep the best-extent ones rather than arbitrary engram ids.
+    col = ColumnMemory(name="column_test")
+    ctx = cca8_run.Ctx()
+    for i in range(60):
+        store_navpatch_engram_v1(ctx, _mk_patch(x0=-3.0 + 0.08 * i), reason="unit_test", column_memory=col)
+    ctx.navpatch_lsh_max_candidates = 8
+
+    queries = [_mk_patch(x0=x0) for x0 in (-2.9, -1.37, 0.5, 1.6)]
+    bench = navpatch_lsh_recall_benchmark_v1(ctx, queries, column_memory=col, top_k=3)
+    assert bench["universe"] == 60
+    assert all(row["candidates"] == 8 for row in bench["per_patch"])
+    assert bench["mean_recall_at_k"] == 1.0 and bench["top1_agreement"] == 1.0
+
+
+def test_lsh_index_follows_column_deletes_direct_asserts_and_clear() -> None:
+    from cca8_env import EnvObservation
+    from cca8_working_memory import navpatch_predictive_match_loop_v1, store_navpatch_engram_v1
+
+    col = ColumnMemory(name="column_test")
+    ctx = cca8_run.Ctx()
+    ctx.navpatch_priors_enabled = False
+    ctx.navpatch_store_to_column = False
+    ctx.navpatch_lsh_enabled = True
+    ctx.navpatch_lsh_max_candidates = 4
+    eids = [
+        store_navpatch_engram_v1(ctx, _mk_patch(x0=-2.0 - 0.1 * i), reason="unit_test", column_memory=col)["engram_id"]
+        for i in range(5)
+    ]
+
+    def _match() -> dict[str, Any]:
+        return navpatch_predictive_match_loop_v1(ctx, EnvObservation(nav_patches=[_mk_patch()]), column_memory=col)[0]
+
+    assert _match()["lsh"]["candidates"] == 4
+
+    # Deleting the four nearest prototypes leaves the farthest as the only candidate.
+    for eid in eids[:4]:
+        col.delete(eid)
+    after = _match()
+    assert after["lsh"] == {"candidates": 1, "indexed": 1}
+    assert [c["engram_id"] for c in after["top_k"]] == [eids[4]]
+    assert set(ctx.navpatch_feature_cache_v1["protos"]) == {eids[4]}
+
+    # Records asserted straight into the Column are picked up too...
+    direct = _mk_patch(x0=-2.0)
+    sig = cca8_run.navpatch_payload_sig_v1(direct)
+    direct_eid = col.assert_fact("navpatch", direct, FactMeta(name="navpatch", attrs={"sig": sig, "role": "scene"}))
+    assert _match()["top_k"][0]["engram_id"] == direct_eid
+
+    # ...and clear() empties the index.
+    col._store.clear()
+    assert _match()["lsh"] == {"candidates": 0, "indexed": 0}
+    assert ctx.navpatch_feature_cache_v1["protos"] == {}
@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -18,6 +20,7 @@ from cca8_publication_integrity import (
     write_json_exclusive_v1,
 )
 from cca8_publication_lhsi_sensitivity import DEFAULT_SPEC, compute_lhsi_v1, sensitivity_specs_v1
+import cca8_publication_run
 from cca8_publication_protocol import (
     CONDITIONS,
     FROZEN_PROTOCOL,
@@ -187,6 +190,128 @@ def test_worker_normalization_maps_core_fields_and_precompletion_details(tmp_pat
     assert normalized["publication_resolution_count_pre_completion"] == 1
 
 
+def _fake_worker_process(failing_job_ids: set[str], calls: list[str]):
+    """Return a worker stand-in that finishes later jobs first and may fail some."""
+
+    def run(job, job_path, *, worker_script, source_root, logs_dir, stop, fail_fast, servers=None):
+        if stop.is_set():
+            return None
+        calls.append(job["job_id"])
+        ordinal = int(job["episode_index"]) * len(CONDITIONS) + CONDITIONS.index(job["condition"])
+        time.sleep(0.02 if job["condition"] == "A" else 0.0)
+        stdout_path = Path(logs_dir) / f"{job['job_id']}.stdout.txt"
+        stderr_path = Path(logs_dir) / f"{job['job_id']}.stderr.txt"
+        stdout_path.write_text("", encoding="utf-8")
+        stderr_path.write_text("", encoding="utf-8")
+        if job["job_id"] in failing_job_ids:
+            if fail_fast:
+                stop.set()
+            return {"returncode": 1, "stdout_path": stdout_path, "stderr_path": stderr_path}
+        schedule_hash = job["schedule"]["schedule_hash"]
+        worker = {
+            "job_id": job["job_id"],
+            "profile": job["profile"],
+            "condition": job["condition"],
+            "episode_index": job["episode_index"],
+            "episode_seed": job["episode_seed"],
+            "schedule_hash": schedule_hash,
+            "manifest_kind": job["manifest_kind"],
+            "manifest_sha256": job["manifest_sha256"],
+            "source_tree_sha256": job["expected_source_tree_sha256"],
+            "protocol_sha256": job["expected_protocol_sha256"],
+            "process": {
+                "pid": os.getpid() + 1 + ordinal,
+                "process_nonce": f"nonce-{job['job_id']}",
+                "python_version": "3.11.0",
+            },
+            "episode_record": {
+                "success": True,
+                "publication_schedule_hash": schedule_hash,
+                "llm_call_count": 0,
+            },
+        }
+        write_json_exclusive_v1(Path(job["job_dir"]) / "worker_result.json", worker)
+        return {"returncode": 0, "stdout_path": stdout_path, "stderr_path": stderr_path}
+
+    return run
+
+
+def test_parallel_batch_streams_in_job_order_and_resumes_partial_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    write_manifest_exclusive_v1(
+        manifest_path, build_manifest_v1(master_nonce="x", seed_count=2, manifest_kind="development")
+    )
+    calls: list[str] = []
+    options = {
+        "manifest_path": manifest_path,
+        "output_dir": tmp_path / "batch",
+        "profiles": ["conflicted_repair"],
+        "conditions": list(CONDITIONS),
+        "limit": None,
+        "allow_development_python": True,
+        "holdout_confirmation": None,
+        "quiet": True,
+        "parallel_jobs": 3,
+    }
+    monkeypatch.setattr(
+        cca8_publication_run, "_run_worker_process_v1", _fake_worker_process({"e001__conflicted_repair__A"}, calls)
+    )
+    with pytest.raises(RuntimeError, match="e001__conflicted_repair__A"):
+        cca8_publication_run.run_batch_v1(**options, fail_fast=False)
+    failure = json.loads((tmp_path / "batch" / "BATCH_FAILED.json").read_text(encoding="utf-8"))
+    assert failure["consolidated_job_count"] == 3
+
+    calls.clear()
+    monkeypatch.setattr(cca8_publication_run, "_run_worker_process_v1", _fake_worker_process(set(), calls))
+    result = cca8_publication_run.run_batch_v1(**options, resume=True)
+
+    assert result["ok"] is True
+    assert calls == ["e001__conflicted_repair__A"]
+    batch = tmp_path / "batch"
+    rows = [json.loads(line) for line in (batch / "workers.jsonl").read_text(encoding="utf-8").splitlines()]
+    expected = [f"e{index:03d}__conflicted_repair__{condition}" for index in range(2) for condition in CONDITIONS]
+    assert [row["job_id"] for row in rows] == expected
+    assert (batch / "BATCH_FAILED.attempt1.json").exists()
+    final = json.loads((batch / "batch_metadata_final.json").read_text(encoding="utf-8"))
+    assert final["reused_job_count"] == 5 and final["validation"]["ok"] is True
+    assert cca8_publication_run.verify_existing_batch_v1(batch)["ok"] is True
+    assert verify_checksums_v1(batch)["ok"] is True
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork-server mode requires os.fork")
+def test_fork_server_batch_forks_one_isolated_child_per_trial(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    write_manifest_exclusive_v1(
+        manifest_path, build_manifest_v1(master_nonce="x", seed_count=1, manifest_kind="development")
+    )
+    result = cca8_publication_run.run_batch_v1(
+        manifest_path=manifest_path,
+        output_dir=tmp_path / "batch",
+        profiles=["conflicted_repair"],
+        conditions=["A", "B"],
+        limit=None,
+        allow_development_python=True,
+        holdout_confirmation=None,
+        quiet=True,
+        launch_mode="fork_server",
+    )
+
+    assert result["ok"] is True and result["validation"]["fresh_process_per_episode_verified"] is True
+    batch = tmp_path / "batch"
+    rows = [json.loads(line) for line in (batch / "workers.jsonl").read_text(encoding="utf-8").splitlines()]
+    processes = [row["process"] for row in rows]
+    assert {process["launch_mode"] for process in processes} == {"fork_server"}
+    assert {process["python_hash_seed"] for process in processes} == {cca8_publication_run.FORK_SERVER_HASH_SEED}
+    # Both children came from the same warmed server but ran in separate processes.
+    assert len({process["parent_pid"] for process in processes}) == 1
+    assert len({process["pid"] for process in processes}) == 2
+    final = json.loads((batch / "batch_metadata_final.json").read_text(encoding="utf-8"))
+    assert final["launch_mode"] == "fork_server"
+    assert verify_checksums_v1(batch)["ok"] is True
+
+
 def test_exact_paired_binary_test_known_values() -> None:
     assert exact_paired_binary_p_v1(0, 0) == 1.0
     assert exact_paired_binary_p_v1(1, 0) == 1.0
@@ -113,3 +113,101 @@ def test_save_session_roundtrip_and_schema(tmp_path):
 
     # Timestamp round-trip matches what save_session returned
     assert blob["saved_at"] == ts
+
+
+def test_binary_snapshot_roundtrip_matches_json(tmp_path):
+    """*.cca8b paths get the streamed binary snapshot; load_session reads both formats."""
+    g, start, goal, ids = _build_demo_world()
+    g._bindings[ids["B"]].meta.update({"n": -3, "big": 2**70, "f": 0.25, "ok": True, "none": None, "xs": [1, "a", (2, 3)]})
+    drives = C.Drives(hunger=0.8, fatigue=0.2, warmth=0.6)
+
+    ts_j = R.save_session(str(tmp_path / "s.json"), g, drives)
+    ts_b = R.save_session(str(tmp_path / "s.cca8b"), g, drives)
+    assert (tmp_path / "s.cca8b").read_bytes().startswith(b"CCA8SNP")
+    assert (tmp_path / "s.cca8b").stat().st_size < (tmp_path / "s.json").stat().st_size
+
+    bj = R.load_session(str(tmp_path / "s.json"))
+    bb = R.load_session(str(tmp_path / "s.cca8b"))
+    assert bb["saved_at"] == ts_b and bj["saved_at"] == ts_j
+    assert bb["world"].to_dict() == bj["world"].to_dict()
+    assert bb["drives"] == bj["drives"] and bb["skills"] == bj["skills"]
+    assert bb["world"].plan_to_predicate(start, "goal")[-1] == goal
+    assert bb["world"].add_predicate("C", attach="latest") not in g._bindings
+
+
+def test_json_stays_the_default_and_snapshot_keys_match_json(tmp_path):
+    """Only *.cca8b (or fmt='binary') is binary; float dict keys are spelled as json.dumps spells them."""
+    import json
+    import cca8_snapshot
+    g, *_ = _build_demo_world()
+    for name in ("s.sav", "s.dat", "session"):
+        R.save_session(str(tmp_path / name), g, C.Drives())
+        assert "world" in json.loads((tmp_path / name).read_text(encoding="utf-8"))
+    R.save_session(str(tmp_path / "forced.sav"), g, C.Drives(), fmt="binary")
+    assert cca8_snapshot.is_snapshot_file(str(tmp_path / "forced.sav"))
+
+    keys = {float("inf"): 1, float("-inf"): 2, float("nan"): 3, 0.5: 4, 7: 5, True: 6, None: 7}
+    assert [cca8_snapshot._json_key(k) for k in keys] == list(json.loads(json.dumps(keys)))
+
+
+def test_binary_snapshot_rejects_truncated_file(tmp_path):
+    g, *_ = _build_demo_world()
+    path = tmp_path / "s.cca8b"
+    R.save_session(str(path), g, C.Drives())
+    path.write_bytes(path.read_bytes()[:-20])
+    with pytest.raises(ValueError):
+        R.load_session(str(path))
+
+
+def test_autosave_journal_appends_deltas_and_load_replays_them(tmp_path, monkeypatch):
+    """Binary autosave writes one full snapshot, then only deltas; load_session replays them."""
+    monkeypatch.setattr(R, "_SESSION_JOURNALS", {})
+    g, start, goal, ids = _build_demo_world()
+    drives = C.Drives(hunger=0.8)
+    path = str(tmp_path / "auto.cca8b")
+
+    R.autosave_session(path, g, drives)
+    base_bytes = os.path.getsize(path)
+    assert not os.path.exists(path + ".journal")
+
+    c = g.add_predicate("C", attach="latest")
+    g._bindings[ids["A"]].meta["note"] = "edited"            # in-place meta edit is tracked
+    g._bindings[ids["B"]].meta.setdefault("wm", {})["pos"] = {"x": 1}
+    g.delete_binding(ids["X"])
+    drives.hunger = 0.1
+    R.autosave_session(path, g, drives)
+    R.autosave_session(path, g, drives)                       # nothing changed: nothing appended
+    assert os.path.getsize(path) == base_bytes
+    assert 0 < os.path.getsize(path + ".journal") < base_bytes
+
+    blob = R.load_session(path)
+    assert blob["world"].to_dict() == g.to_dict()
+    assert list(blob["world"]._bindings) == list(g._bindings)
+    assert blob["drives"]["hunger"] == pytest.approx(0.1)
+    assert c in blob["world"]._bindings and ids["X"] not in blob["world"]._bindings
+
+    # a manual full save of the same path supersedes the journal
+    R.save_session(path, g, drives)
+    g.add_predicate("D", attach="latest")
+    R.autosave_session(path, g, drives)
+    assert R.load_session(path)["world"].to_dict() == g.to_dict()
+
+
+def test_autosave_journal_ignores_torn_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(R, "_SESSION_JOURNALS", {})
+    g, *_ = _build_demo_world()
+    drives = C.Drives()
+    path = str(tmp_path / "auto.cca8b")
+    R.autosave_session(path, g, drives)
+    g.add_predicate("C", attach="latest")
+    R.autosave_session(path, g, drives)
+    expected = g.to_dict()
+    g.add_predicate("D", attach="latest")
+    R.autosave_session(path, g, drives)
+
+    jpath = path + ".journal"
+    with open(jpath, "rb") as f:
+        data = f.read()
+    with open(jpath, "wb") as f:
+        f.write(data[:-5])                                    # crash mid-append
+    assert R.load_session(path)["world"].to_dict() == expected
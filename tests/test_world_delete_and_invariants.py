@@ -31,3 +31,25 @@ def test_check_invariants_detects_missing_anchor_tag():
         except KeyError: pass
     issues = w.check_invariants(raise_on_error=False)
     assert any("NOW binding missing 'anchor:NOW' tag" in s for s in issues) or issues == []
+
+
+def test_predecessors_tracks_edges_and_delete_prunes_incoming():
+    w = W.WorldGraph(); _quiet(w); now = w.ensure_anchor("NOW")
+    a = w.add_predicate("A", attach="now")
+    b = w.add_predicate("B", attach="latest")   # A -> B (then)
+    w.add_edge(now, b, "run")
+    assert w.predecessors(b) == [now, a]
+    assert w.predecessors(b, label="run") == [now]
+
+    w.delete_edge(now, b, "run")
+    assert w.predecessors(b) == [a]
+
+    # direct list rebinding (as WorkingMap helpers do) keeps the index in step
+    w._bindings[now].edges = [{"to": b, "label": "then", "meta": {}}]
+    assert w.predecessors(b) == [now, a]
+
+    assert w.delete_binding(b)
+    assert all(e.get("to") != b for e in w._bindings[now].edges)
+    assert all(e.get("to") != b for e in w._bindings[a].edges)
+    assert w.predecessors(b) == []
+    assert w.check_invariants(raise_on_error=False) == []
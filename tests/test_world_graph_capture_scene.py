@@ -24,3 +24,20 @@ def test_capture_scene_attaches_engram_for_cue_and_pred():
     )
     rec2 = C.mem.get(eid2)
     assert rec2["payload"].shape == (2,)
+
+
+def test_capture_scene_keeps_float64_values_unless_float32_is_requested():
+    w = W.WorldGraph(); _quiet(w)
+    w.ensure_anchor("NOW")
+    vec = [0.1, 0.2, 1e-40]
+
+    _, eid = w.capture_scene("vision", "scene:exact", vec, attach="now")
+    assert C.mem.get(eid)["payload"].data == vec
+
+    _, eid32 = w.capture_scene("vision", "scene:compact", vec, attach="now", precision="float32")
+    payload = C.mem.get(eid32)["payload"]
+    assert isinstance(payload, F.TensorView)
+    assert payload.data[0] != 0.1 and abs(payload.data[0] - 0.1) < 1e-7
+
+    with pytest.raises(ValueError):
+        w.capture_scene("vision", "scene:bad", vec, precision="float16")
@@ -0,0 +1,119 @@
+import pytest
+
+W = pytest.importorskip("cca8_world_graph", reason="cca8_world_graph module not found")
+
+
+def _quiet(world):
+    """Silence lexicon warnings for test-only tokens."""
+    if hasattr(world, "set_tag_policy"):
+        world.set_tag_policy("allow")
+
+
+def _build(storage):
+    g = W.WorldGraph(storage=storage)
+    _quiet(g)
+    now = g.ensure_anchor("NOW")
+    a = g.add_predicate("posture:fallen", attach="now")
+    c = g.add_cue("scent:milk", attach="latest")
+    b = g.add_predicate("posture:standing", attach="latest")
+    g.add_edge(a, b, "run", meta={"weight": 3})
+    goal = g.add_predicate("goal", attach="latest")
+    return g, now, {"a": a, "b": b, "c": c, "goal": goal}
+
+
+def test_compact_storage_round_trips_and_matches_dict_storage():
+    d, now, ids = _build("dict")
+    g, _, _ = _build("compact")
+    assert g.get_storage_mode() == "compact" and d.compact() == 0
+
+    packed = g.compact()
+    assert packed == len(g._bindings) - 2          # NOW anchor and latest stay hot
+    assert list(g._bindings) == list(d._bindings)
+    assert g.to_dict()["bindings"] == d.to_dict()["bindings"]
+    assert g.bindings_with_tag("pred:posture:fallen") == [ids["a"]]
+    assert g.predecessors(ids["b"]) == d.predecessors(ids["b"])
+    for mode in ("bfs", "dijkstra", "bidirectional"):
+        g.set_planner(mode)
+        d.set_planner(mode)
+        assert g.plan_to_predicate(now, "goal") == d.plan_to_predicate(now, "goal")
+
+    g2 = W.WorldGraph.from_dict(g.to_dict())
+    assert g2.get_storage_mode() == "compact"
+    assert g2.to_dict()["bindings"] == d.to_dict()["bindings"]
+
+
+def test_compact_views_persist_edits_and_promote_on_mutation():
+    g, now, ids = _build("compact")
+    g.compact()
+    a = ids["a"]
+
+    view = g._bindings[a]
+    assert g._bindings[a] is view                   # cached while referenced
+    view.meta["note"] = "x"                         # in-place meta edit lands in the column
+    view.edges[0]["meta"]["weight"] = 2.0
+    del view
+    assert g._bindings[a].meta["note"] == "x"
+    assert g._bindings[a].edges[0]["meta"]["weight"] == 2.0
+
+    g._bindings[a].tags.add("pred:resting")          # tag mutation promotes back to the hot dict
+    assert a not in g._bindings.row_of
+    assert g.bindings_with_tag("pred:resting") == [a]
+
+    assert g.delete_binding(ids["c"])               # deleting a packed binding
+    assert ids["c"] not in g._bindings
+    assert g.check_invariants(raise_on_error=False) == []
+
+
+def test_compact_storage_env_default(monkeypatch):
+    monkeypatch.setenv("CCA8_WORLD_STORAGE", "compact")
+    assert W.WorldGraph().get_storage_mode() == "compact"
+    monkeypatch.setenv("CCA8_WORLD_STORAGE", "bogus")
+    assert W.WorldGraph().get_storage_mode() == "dict"
+    with pytest.raises(ValueError):
+        W.WorldGraph(storage="bogus")
+
+
+def test_compact_iteration_order_survives_promotions_deletes_and_tombstone_compaction():
+    d, _, _ = _build("dict")
+    g, _, _ = _build("compact")
+    for world in (d, g):
+        for i in range(1500):
+            world.add_predicate(f"p{i}", attach=None)
+    g.compact()
+    bids = list(d._bindings)
+    for bid in bids[6:1306]:                                 # > 1024 tombstones, then compacted
+        assert d.delete_binding(bid) and g.delete_binding(bid)
+    g.add_edge(bids[1400], bids[1401], "then")              # promotes a packed row (permuted hot dict)
+    d.add_edge(bids[1400], bids[1401], "then")
+    for world in (d, g):
+        world.add_predicate("late", attach=None)
+
+    assert list(g._bindings) == list(d._bindings)
+    assert list(reversed(g._bindings)) == list(reversed(d._bindings))
+    assert g._bindings._seq_dead < 1024
+    seen = []
+    for bid in g._bindings:                                  # deleting mid-iteration never yields removed ids
+        seen.append(bid)
+        if len(seen) == 10:
+            for victim in list(g._bindings)[20:60]:
+                g.delete_binding(victim)
+    assert all(bid in g._bindings for bid in seen[10:])
+
+
+def test_compact_is_explicit_and_stale_references_raise():
+    g, _, ids = _build("compact")
+    a = ids["a"]
+    held = g._bindings[a]
+    import cca8_run
+    cca8_run.loop_helper(None, g, None)                      # menu loop no longer packs
+    assert not g._bindings.row_of and g._bindings[a] is held
+
+    g.compact()
+    assert a in g._bindings.row_of
+    for use in (lambda: "pred:posture:fallen" in held.tags, lambda: held.meta.get("x"),
+                lambda: held.edges.append({}), lambda: setattr(held, "tags", {"pred:resting"})):
+        with pytest.raises(RuntimeError, match="stale Binding"):
+            use()
+    fresh = g._bindings[a]
+    assert fresh is not held and "pred:posture:fallen" in fresh.tags
+    assert held.id == a and "packed" in repr(held)
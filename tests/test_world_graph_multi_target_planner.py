@@ -0,0 +1,60 @@
+import pytest
+
+W = pytest.importorskip("cca8_world_graph", reason="cca8_world_graph module not found")
+
+
+def _chain(n):
+    """NOW -> p1 -> p2 -> ... -> pn (all 'then')."""
+    g = W.WorldGraph()
+    g.set_tag_policy("allow")
+    now = g.ensure_anchor("NOW")
+    ids = [g.add_predicate(f"s{i}", attach="now" if i == 1 else "latest") for i in range(1, n + 1)]
+    return g, now, ids
+
+
+def test_plan_to_targets_single_sweep_respects_hop_bound():
+    g, now, ids = _chain(5)
+    paths = g.plan_to_targets(now, [ids[1], ids[4], "b999"], max_hops=3)
+    assert paths == {ids[1]: [now, ids[0], ids[1]]}
+
+    paths = g.plan_to_targets(now, [ids[1], ids[4]])
+    assert paths[ids[4]] == [now] + ids
+    assert paths[ids[1]] == g.plan_to_predicate(now, "s2")
+
+
+def test_plan_to_targets_cost_bound_uses_edge_weights():
+    g = W.WorldGraph()
+    g.set_tag_policy("allow")
+    now = g.ensure_anchor("NOW")
+    a = g.add_predicate("a", attach=None)
+    b = g.add_predicate("b", attach=None)
+    g.add_edge(now, a, "then", meta={"weight": 5.0})
+    g.add_edge(now, b, "then", meta={"weight": 1.0})
+    g.add_edge(b, a, "then", meta={"weight": 1.0})
+    assert g.plan_to_targets(now, [a], max_cost=1.5) == {}
+    assert g.plan_to_targets(now, [a], max_cost=2.0) == {a: [now, b, a]}
+
+
+def test_tags_within_and_distance_field_cache_invalidation():
+    g, now, ids = _chain(4)
+    assert g.tags_within(now, ["pred:s1", "pred:s4", "pred:zz"], max_hops=3) == {"pred:s1": [ids[0]]}
+    field = g.distance_field(now, max_hops=3)
+    assert g.distance_field(now, max_hops=3) is field          # cached per edge revision
+    assert g.distance_field(now, max_hops=2) == {now: 0, ids[0]: 1, ids[1]: 2}
+
+    g.add_edge(now, ids[3], "then")                           # shortcut: s4 now 1 hop away
+    assert g.tags_within(now, ["pred:s4"], max_hops=1) == {"pred:s4": [ids[3]]}
+
+    g.delete_edge(now, ids[3])
+    assert "pred:s4" not in g.tags_within(now, ["pred:s4"], max_hops=3)
+
+
+def test_tags_within_lists_nearest_first():
+    g = W.WorldGraph()
+    g.set_tag_policy("allow")
+    now = g.ensure_anchor("NOW")
+    far_mid = g.add_predicate("mid", attach="now")
+    far = g.add_predicate("goal", attach="latest")
+    near = g.add_predicate("goal", attach="now")
+    assert g.tags_within(now, ["pred:goal"]) == {"pred:goal": [near, far]}
+    assert far_mid in g.distance_field(now)
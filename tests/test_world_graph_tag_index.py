@@ -0,0 +1,123 @@
+import pytest
+
+W = pytest.importorskip("cca8_world_graph", reason="cca8_world_graph module not found")
+
+
+def _quiet(world):
+    """Silence lexicon warnings for test-only tokens."""
+    if hasattr(world, "set_tag_policy"):
+        world.set_tag_policy("allow")
+
+
+def _scan(world, tag):
+    """Reference answer: the old whole-graph scan."""
+    return [bid for bid, b in world._bindings.items() if tag in b.tags]
+
+
+def test_tag_index_tracks_api_writes_and_deletes():
+    """add_predicate/add_cue/delete_binding keep exact and family lookups in step."""
+    g = W.WorldGraph()
+    _quiet(g)
+    now = g.ensure_anchor("NOW")
+    a = g.add_predicate("posture:fallen", attach="now")
+    c = g.add_cue("scent:milk", attach="latest")
+
+    assert g.has_tag("pred:posture:fallen")
+    assert g.bindings_with_tag("pred:posture:fallen") == [a]
+    assert g.bindings_with_tag_family("cue") == [c]
+    assert g.bindings_with_tag_family("anchor:") == [now]
+    assert not g.has_tag("pred:posture:standing")
+
+    g.delete_binding(c)
+    assert not g.has_tag_family("cue")
+    assert g.bindings_with_tag("cue:scent:milk") == []
+
+
+def test_tag_index_tracks_direct_tag_mutation():
+    """Helpers that mutate or rebind b.tags directly must not desync the index."""
+    g = W.WorldGraph()
+    _quiet(g)
+    a = g.add_predicate("posture:fallen", attach=None)
+    b = g._bindings[a]
+
+    b.tags.discard("pred:posture:fallen")
+    b.tags.add("pred:posture:standing")
+    assert not g.has_tag("pred:posture:fallen")
+    assert g.bindings_with_tag("pred:posture:standing") == [a]
+
+    b.tags = ["cue:vision:silhouette:mom"]          # legacy list form is upgraded
+    assert isinstance(b.tags, set)
+    assert not g.has_tag_family("pred")
+    assert g.bindings_with_tag_family("cue") == [a]
+
+    b.tags |= {"pred:resting"}
+    b.tags -= {"cue:vision:silhouette:mom"}
+    assert g.bindings_with_tag("pred:resting") == _scan(g, "pred:resting") == [a]
+    assert not g.has_tag_family("cue")
+
+
+def test_tag_index_results_follow_binding_order_and_survive_from_dict():
+    g = W.WorldGraph()
+    _quiet(g)
+    ids = [g.add_predicate("resting", attach=None) for _ in range(3)]
+    g._bindings[ids[0]].tags.discard("pred:resting")
+    g._bindings[ids[0]].tags.add("pred:resting")   # re-add: order still by binding, not by tag write
+    assert g.bindings_with_tag("pred:resting") == ids
+
+    g2 = W.WorldGraph.from_dict(g.to_dict())
+    assert g2.bindings_with_tag("pred:resting") == ids
+    assert g2.has_tag_family("pred")
+
+
+def test_tag_index_indexes_bindings_inserted_directly():
+    g = W.WorldGraph()
+    g._bindings["b99"] = W.Binding(id="b99", tags={"pred:posture:standing"}, edges=[], meta={}, engrams={})
+    assert g.has_tag("pred:posture:standing")
+    del g._bindings["b99"]
+    assert not g.has_tag("pred:posture:standing")
+
+
+def test_copied_tags_edges_and_bindings_are_detached_from_the_index():
+    """copy/deepcopy/pickle of tags, edges or a whole Binding must not write into the live indexes."""
+    import copy
+    import pickle
+
+    g = W.WorldGraph()
+    _quiet(g)
+    a = g.add_predicate("posture:fallen", attach=None)
+    c = g.add_predicate("resting", attach=None)
+    b = g._bindings[a]
+    b.edges.append({"to": c, "label": "then", "meta": {}})
+
+    tags = copy.copy(b.tags)
+    tags.discard("pred:posture:fallen")
+    tags.add("pred:posture:standing")
+    edges = copy.deepcopy(b.edges)
+    edges.clear()
+    assert type(tags) is set and type(edges) is list
+    assert type(pickle.loads(pickle.dumps(b.tags))) is set
+
+    for dup in (copy.copy(b), copy.deepcopy(b), pickle.loads(pickle.dumps(b))):
+        assert dup._table is None and dup == b
+        dup.tags.clear()
+        dup.tags.add("cue:copied")
+        dup.edges.clear()
+
+    assert g.bindings_with_tag("pred:posture:fallen") == [a]
+    assert not g.has_tag("pred:posture:standing") and not g.has_tag_family("cue")
+    assert b.tags == {"pred:posture:fallen"} and len(b.edges) == 1
+    assert g.predecessors(c) == [a]
+
+
+def test_tag_added_to_older_binding_keeps_insertion_order():
+    """Holder lists stay in binding order when a tag is added out of order."""
+    g = W.WorldGraph()
+    _quiet(g)
+    ids = [g.add_predicate("resting", attach=None) for _ in range(3)]
+    for bid in (ids[2], ids[0], ids[1]):
+        g._bindings[bid].tags.add("cue:late")
+    assert g.bindings_with_tag("cue:late") == _scan(g, "cue:late") == ids
+    assert g.bindings_with_tag_family("cue") == ids
+    later = g.add_predicate("resting", attach=None)
+    g._bindings[later].tags.add("cue:late")
+    assert g.bindings_with_tag("cue:late") == ids + [later]
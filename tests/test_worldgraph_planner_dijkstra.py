@@ -31,7 +31,7 @@ def test_plan_to_predicate_dijkstra_uses_edge_weights():
 def test_set_planner_rejects_invalid_strategy():
     w = WorldGraph()
     with pytest.raises(ValueError):
-        w.set_planner("astar")
+        w.set_planner("greedy")
 
 def test_pretty_path_id_and_pred_modes():
     w = WorldGraph()